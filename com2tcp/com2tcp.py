@@ -1,57 +1,256 @@
-import serial
 import time
 import socket
 import threading
 import argparse
 import sys
 
+try:
+    import selectors
+except ImportError:
+    selectors = None
 
-def listen_to_tcp(tcp_conn, serial_conn):
-    while True:
-        tcp_data = tcp_conn.recv(1024)
-        if len(data) > 0:
-            serial_conn.writelines(tcp_data)
-            print("Data on tcp: " + str(tcp_data))
-        time.sleep(0.001)
+# The most bytes moved in one go
+CHUNK_SIZE = 4096
 
+# Serial ports can only be waited on alongside sockets on platforms where they are file descriptors
+CAN_SELECT_ON_SERIAL = selectors is not None and sys.platform != "win32"
 
-if __name__ == "__main__":
-    parser = argparse.ArgumentParser(description="Transfers data between a COM port and a TCP port.")
-    parser.add_argument("tcp_port", help="The port to send TCP messages to. (e.g. 57677)", type=int)
-    parser.add_argument("com_port", help="The COM port to send serial messages to. (e.g. COM2)")
-    parser.add_argument('-b', "--baud", help="The baud rate to communicate on the COM port.", default=9600)
+# Times transfers, which must not jump with the wall clock
+_clock = getattr(time, "monotonic", time.time)
+
+
+class TransferCounter(object):
+    """
+    Counts the data moved in one direction across a bridge, and its latency: how long it took from reading the data to
+    having written all of it to the other side. Only one thread records transfers, so no locking is needed.
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.bytes = 0
+        self.chunks = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+        self._reported_bytes = 0
+
+    def record(self, number_of_bytes, latency):
+        self.bytes += number_of_bytes
+        self.chunks += 1
+        self.total_latency += latency
+        self.max_latency = max(self.max_latency, latency)
+
+    def report(self, interval):
+        """
+        Describe the transfers since the last report.
+
+        :param interval: seconds since the last report
+        :return: description of the rate and latency
+        """
+        rate = (self.bytes - self._reported_bytes) / interval
+        self._reported_bytes = self.bytes
+        mean_latency = self.total_latency / self.chunks if self.chunks else 0.0
+        return "{}: {:.0f} B/s, {} B in {} chunks, latency mean {:.3f} ms max {:.3f} ms".format(
+            self.name, rate, self.bytes, self.chunks, mean_latency * 1000, self.max_latency * 1000)
+
+
+class Bridge(object):
+    """
+    Transfers data between one serial port and one TCP connection.
+    """
+
+    def __init__(self, serial_conn, tcp_conn, name, verbose=False):
+        self.serial_conn = serial_conn
+        self.tcp_conn = tcp_conn
+        self.name = name
+        self.verbose = verbose
+        self.serial_to_tcp = TransferCounter("{} serial->tcp".format(name))
+        self.tcp_to_serial = TransferCounter("{} tcp->serial".format(name))
+        self.open = True
+
+    def read_serial(self, block):
+        """
+        Read whatever is waiting on the serial port.
+
+        :param block: True to wait for at least one byte, False if data is known to be waiting
+        :return: the data
+        """
+        waiting = self.serial_conn.in_waiting
+        if waiting == 0 and block:
+            data = self.serial_conn.read(1)
+            return data + self.serial_conn.read(min(self.serial_conn.in_waiting, CHUNK_SIZE))
+        return self.serial_conn.read(min(max(waiting, 1), CHUNK_SIZE))
+
+    def forward_serial(self, block=False):
+        """
+        Pass whatever is waiting on the serial port on to the TCP connection.
+
+        :param block: True to wait for at least one byte, False if data is known to be waiting
+        """
+        # Data known to be waiting is timed from the start of the read; a blocking read is only timed from when it
+        # returns, as it mostly waits for data to arrive
+        start = None if block else _clock()
+        data = self.read_serial(block)
+        if data:
+            if start is None:
+                start = _clock()
+            self.tcp_conn.sendall(data)
+            self.serial_to_tcp.record(len(data), _clock() - start)
+            if self.verbose:
+                print("Data on serial: " + repr(data))
+
+    def forward_tcp(self, block=False):
+        """
+        Pass whatever is waiting on the TCP connection on to the serial port.
+
+        :param block: True if the read waits for data to arrive, False if data is known to be waiting
+        """
+        start = None if block else _clock()
+        data = self.tcp_conn.recv(CHUNK_SIZE)
+        if not data:
+            print("TCP connection for {} closed".format(self.name))
+            self.open = False
+            return
+        if start is None:
+            start = _clock()
+        self.serial_conn.write(data)
+        self.tcp_to_serial.record(len(data), _clock() - start)
+        if self.verbose:
+            print("Data on tcp: " + repr(data))
+
+    def report(self, interval):
+        return [self.serial_to_tcp.report(interval), self.tcp_to_serial.report(interval)]
+
+    def close(self):
+        self.open = False
+        self.tcp_conn.close()
+        self.serial_conn.close()
+
+
+def run_with_selector(bridges, report_interval):
+    """
+    Move data across all the bridges in one thread, waiting on every serial port and socket at once.
+    """
+    selector = selectors.DefaultSelector()
+    for bridge in bridges:
+        selector.register(bridge.serial_conn.fileno(), selectors.EVENT_READ, bridge.forward_serial)
+        selector.register(bridge.tcp_conn, selectors.EVENT_READ, bridge.forward_tcp)
+
+    last_report = time.time()
+    while any(bridge.open for bridge in bridges):
+        timeout = None if report_interval is None else max(0.0, last_report + report_interval - time.time())
+        for key, _ in selector.select(timeout):
+            key.data()
+
+        for bridge in bridges:
+            if not bridge.open and bridge.tcp_conn.fileno() != -1:
+                selector.unregister(bridge.serial_conn.fileno())
+                selector.unregister(bridge.tcp_conn)
+                bridge.close()
+
+        if report_interval is not None and time.time() - last_report >= report_interval:
+            last_report = _report(bridges, last_report)
+
+
+def run_with_threads(bridges, report_interval):
+    """
+    Move data across all the bridges with a thread per direction blocking on its read, for platforms where serial
+    ports can not be waited on with select.
+    """
+    def serial_loop(bridge):
+        while bridge.open:
+            bridge.forward_serial(block=True)
+
+    def tcp_loop(bridge):
+        while bridge.open:
+            bridge.forward_tcp(block=True)
+
+    for bridge in bridges:
+        for loop in (serial_loop, tcp_loop):
+            thread = threading.Thread(target=loop, args=(bridge,))
+            thread.daemon = True
+            thread.start()
+
+    last_report = time.time()
+    while any(bridge.open for bridge in bridges):
+        time.sleep(1 if report_interval is None else report_interval)
+        if report_interval is not None:
+            last_report = _report(bridges, last_report)
+
+
+def _report(bridges, last_report):
+    now = time.time()
+    for bridge in bridges:
+        for line in bridge.report(now - last_report):
+            print(line)
+    return now
+
+
+def parse_pair(pair):
+    """
+    Parse a bridge given on the command line as TCP_PORT:COM_PORT.
+    """
+    tcp_port, _, com_port = pair.partition(":")
+    if not com_port:
+        raise argparse.ArgumentTypeError("Expected TCP_PORT:COM_PORT but got {}".format(pair))
+    return int(tcp_port), com_port
+
+
+def main():
+    # Only needed to open the ports, so the bridge can be used without pyserial installed
+    import serial
+
+    parser = argparse.ArgumentParser(description="Transfers data between COM ports and TCP ports.")
+    parser.add_argument("tcp_port", help="The port to send TCP messages to. (e.g. 57677)", type=int, nargs="?")
+    parser.add_argument("com_port", help="The COM port to send serial messages to. (e.g. COM2)", nargs="?")
+    parser.add_argument('-p', "--pair", help="An extra TCP_PORT:COM_PORT pair to bridge (e.g. 57678:COM3). "
+                                             "Can be given more than once.",
+                        type=parse_pair, action="append", default=[])
+    parser.add_argument('-b', "--baud", help="The baud rate to communicate on the COM ports.", default=9600)
+    parser.add_argument("--host", help="The host to connect to the TCP ports on.", default="localhost")
+    parser.add_argument('-r', "--report-interval", help="Seconds between reports of data rates and latency.",
+                        type=float, default=None)
+    parser.add_argument('-v', "--verbose", help="Print all data transferred.", action="store_true")
 
     args = parser.parse_args()
 
-    try:
-        tcp_conn = socket.create_connection(('localhost', args.tcp_port))
-    except Exception as e:
-        print("Failed to connect to tcp port: " + str(e))
-        sys.exit()
+    pairs = list(args.pair)
+    if args.tcp_port is not None and args.com_port is not None:
+        pairs.insert(0, (args.tcp_port, args.com_port))
+    if not pairs:
+        parser.error("Give a TCP port and COM port, or at least one --pair.")
 
-    try:
-        serial_conn = serial.Serial(args.com_port, args.baud)
-    except Exception as e:
-        print("Failed to connect to serial port: " + str(e))
-        sys.exit()
+    bridges = []
+    for tcp_port, com_port in pairs:
+        try:
+            tcp_conn = socket.create_connection((args.host, tcp_port))
+        except Exception as e:
+            print("Failed to connect to tcp port: " + str(e))
+            sys.exit()
 
-    listen_thread = threading.Thread(target=listen_to_tcp, args=(tcp_conn, serial_conn))
-    listen_thread.daemon = True
-    listen_thread.start()
+        try:
+            # Reads never need to wait when the port is selected on, otherwise they block until data arrives
+            serial_conn = serial.Serial(com_port, args.baud, timeout=0 if CAN_SELECT_ON_SERIAL else None)
+        except Exception as e:
+            print("Failed to connect to serial port: " + str(e))
+            sys.exit()
+
+        bridges.append(Bridge(serial_conn, tcp_conn, "{}<->{}:{}".format(com_port, args.host, tcp_port),
+                              args.verbose))
+        print("Listening on " + str(com_port) + " and " + args.host + ":" + str(tcp_port))
 
-    print("Listening on " + str(args.com_port) + " and localhost:" + str(args.tcp_port))
     print("Press Ctrl+C to stop")
 
     try:
-        while True:
-            if serial_conn.inWaiting():
-                data = serial_conn.read()
-                print("Data on serial: " + str(data))
-                tcp_conn.sendall(data)
-
-            time.sleep(0.001)
+        if CAN_SELECT_ON_SERIAL:
+            run_with_selector(bridges, args.report_interval)
+        else:
+            run_with_threads(bridges, args.report_interval)
     except (KeyboardInterrupt, SystemExit) as e:
         pass
     finally:
-        tcp_conn.close()
-        serial_conn.close()
+        for bridge in bridges:
+            bridge.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+import os
+import socket
+import struct
+import unittest
+from hamcrest import assert_that, is_, greater_than_or_equal_to
+
+from com2tcp.com2tcp import Bridge
+
+try:
+    import fcntl
+    import pty
+    import termios
+    import tty
+except ImportError:
+    pty = None
+
+
+class PtySerial(object):
+    """
+    The parts of a pyserial port the bridge uses, on one end of a pseudo-terminal.
+    """
+
+    def __init__(self, fd):
+        self.fd = fd
+
+    @property
+    def in_waiting(self):
+        return struct.unpack("i", fcntl.ioctl(self.fd, termios.FIONREAD, struct.pack("i", 0)))[0]
+
+    def read(self, size):
+        return os.read(self.fd, size) if size else b""
+
+    def write(self, data):
+        os.write(self.fd, data)
+
+    def fileno(self):
+        return self.fd
+
+    def close(self):
+        os.close(self.fd)
+
+
+def read_exactly(read, size):
+    data = b""
+    while len(data) < size:
+        data += read(size - len(data))
+    return data
+
+
+@unittest.skipIf(pty is None, "Pseudo-terminals are not available on this platform")
+class BridgeTests(unittest.TestCase):
+    """
+    Tests for moving data between a serial port, played by a pseudo-terminal pair, and a TCP connection.
+    """
+
+    def setUp(self):
+        # The bridge has the slave end as its serial port and the test writes to the device on the master end
+        self.device, slave = pty.openpty()
+        tty.setraw(slave)
+        self.serial_conn = PtySerial(slave)
+        self.tcp_conn, self.client = socket.socketpair()
+        self.client.settimeout(5)
+        self.bridge = Bridge(self.serial_conn, self.tcp_conn, "test")
+
+    def tearDown(self):
+        self.bridge.close()
+        self.client.close()
+        os.close(self.device)
+
+    def test_that_GIVEN_data_from_the_serial_device_THEN_it_is_sent_over_tcp(self):
+        os.write(self.device, b"ID?\r\n")
+
+        self.bridge.forward_serial(block=True)
+
+        assert_that(read_exactly(self.client.recv, 5), is_(b"ID?\r\n"))
+        assert_that(self.bridge.serial_to_tcp.bytes, is_(5))
+
+    def test_that_GIVEN_data_from_tcp_THEN_it_is_written_to_the_serial_device(self):
+        self.client.sendall(b"\x02\x00\xff")
+
+        self.bridge.forward_tcp()
+
+        assert_that(read_exactly(lambda size: os.read(self.device, size), 3), is_(b"\x02\x00\xff"))
+        assert_that(self.bridge.tcp_to_serial.bytes, is_(3))
+
+    def test_that_GIVEN_a_transfer_THEN_its_latency_is_recorded(self):
+        self.client.sendall(b"x")
+
+        self.bridge.forward_tcp()
+
+        assert_that(self.bridge.tcp_to_serial.chunks, is_(1))
+        assert_that(self.bridge.tcp_to_serial.max_latency, greater_than_or_equal_to(0.0))
+
+    def test_that_GIVEN_the_tcp_connection_closes_THEN_the_bridge_is_no_longer_open(self):
+        self.client.shutdown(socket.SHUT_WR)
+
+        self.bridge.forward_tcp()
+
+        assert_that(self.bridge.open, is_(False))
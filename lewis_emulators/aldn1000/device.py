@@ -3,6 +3,8 @@ from .states import InfusingState, WithdrawingState, PumpingProgramStoppedState,
     PausePhaseState, UserWaitState
 from lewis.devices import StateMachineDevice
 
+from lewis_emulators.utils.ramp import LinearRamp, process_in_steps
+
 states = OrderedDict([
     ('I', InfusingState()),
     ('W', WithdrawingState()),
@@ -29,6 +31,7 @@ class SimulatedAldn1000(StateMachineDevice):
         self.volume_target = 0.0
         self.volume_infused = 0.0  # Cumulative infused volume
         self.volume_withdrawn = 0.0  # Cumulative withdrawn volume
+        self.dispense_ramp = LinearRamp()
         self.volume_dispensed = 0.0  # Dispensed volume for a single pump run
         self._direction = 'INF'
         self.rate = 0.0
@@ -56,6 +59,19 @@ class SimulatedAldn1000(StateMachineDevice):
             rate /= 60.0
         return rate
 
+    def process(self, dt=0):
+        # Stop from the moment the target volume has been dispensed, however long the cycle
+        time_to_target = self.dispense_ramp.time_to_target() if self._csm.state in ('I', 'W') else None
+        process_in_steps(super(SimulatedAldn1000, self).process, dt, time_to_target)
+
+    @property
+    def volume_dispensed(self):
+        return self.dispense_ramp.value
+
+    @volume_dispensed.setter
+    def volume_dispensed(self, volume):
+        self.dispense_ramp.value = volume
+
     @property
     def pump_on(self):
         return self._pump_on
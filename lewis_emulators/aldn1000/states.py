@@ -1,5 +1,11 @@
 from lewis.core.statemachine import State
-from lewis.core import approaches
+
+
+def dispense(device, dt):
+    ramp = device.dispense_ramp
+    ramp.rate = device.normalised_rate()
+    ramp.target = device.volume_target
+    ramp.advance(dt)
 
 
 class InfusingState(State):
@@ -9,8 +15,7 @@ class InfusingState(State):
 
     def in_state(self, dt):
         device = self._context
-        device.volume_dispensed = approaches.linear(device.volume_dispensed, device.volume_target,
-                                                    device.normalised_rate(), dt)
+        dispense(device, dt)
         device.volume_infused = self.originally_infused + device.volume_dispensed
 
     def on_exit(self, dt):
@@ -24,8 +29,7 @@ class WithdrawingState(State):
 
     def in_state(self, dt):
         device = self._context
-        device.volume_dispensed = approaches.linear(device.volume_dispensed, device.volume_target,
-                                                    device.normalised_rate(), dt)
+        dispense(device, dt)
         device.volume_withdrawn = self.originally_withdrawn + device.volume_dispensed
 
     def on_exit(self, dt):
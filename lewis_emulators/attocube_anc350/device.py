@@ -1,32 +1,222 @@
 from lewis.devices import StateMachineDevice
+from lewis_emulators.utils.motion import MotionEngine
+from lewis_emulators.utils.replies import TokenBucket
 from .states import DefaultState, MovingState
 from collections import OrderedDict
 
 
+AXIS_COUNT = 3
+
+# Status bitmask, named as in the C driver
+ANC_STATUS_RUNNING = 0x0001
+ANC_STATUS_HUMP = 0x0002
+ANC_STATUS_SENS_ERR = 0x0100
+ANC_STATUS_DISCONN = 0x0400
+ANC_STATUS_REF_VALID = 0x0800
+ANC_STATUS_ENABLE = 0x1000
+
+# The parameters of an axis the controller tells the client about when they change
+TOLD_PARAMETERS = ("counter", "status")
+
+
+class AttocubeAxis(object):
+    """
+    An axis of the controller, moved by the controller's motion engine.
+    """
+
+    def __init__(self, motion, index):
+        self.motion = motion
+        self.index = index
+        self.amplitude = 30000
+        self.on = True
+        self.start_move = False
+        self._position_setpoint = motion.target(index)
+
+    @property
+    def position(self):
+        return self.motion.position(self.index)
+
+    @position.setter
+    def position(self, position):
+        self.motion.set_position(self.index, position)
+
+    @property
+    def position_setpoint(self):
+        """
+        The position the axis moves to when it is next told to move.
+        """
+        return self._position_setpoint
+
+    @position_setpoint.setter
+    def position_setpoint(self, position_setpoint):
+        self._position_setpoint = position_setpoint
+
+    @property
+    def speed(self):
+        return self.motion.speed(self.index)
+
+    @speed.setter
+    def speed(self, speed):
+        self.motion.set_speed(self.index, speed)
+
+    @property
+    def moving(self):
+        return self.motion.moving(self.index)
+
+    @property
+    def counter(self):
+        return int(self.position)
+
+    @property
+    def status(self):
+        return (ANC_STATUS_REF_VALID | (ANC_STATUS_ENABLE if self.on else 0) |
+                (ANC_STATUS_RUNNING if self.moving else 0))
+
+    def move(self):
+        self.start_move = True
+
+    def start_requested_move(self):
+        if self.start_move and self.on:
+            self.start_move = False
+            self.motion.move(self.index, self._position_setpoint)
+
+
 class SimulatedAttocubeANC350(StateMachineDevice):
+
+    # Function of a list of (parameter, axis index, value) which tells the client about the changes without being
+    # polled and returns how many it told; set by the interface
+    tell_output = None
+
     def _initialize_data(self):
         """
         Initialize all of the device's attributes.
+
+        Changes to the told parameters of the axes are sent to the client as events. tell_coalescing_time is how long in
+        seconds changes are collected after the first before they are sent, so a parameter which changes several times
+        is only told once, with its latest value. max_tell_rate is the most events sent per second, in bursts of up to
+        max_tell_burst, or 0 for no limit; changes held back by the limit are coalesced with later ones, so the client
+        always hears the final value.
         """
         self.connected = True
-        self.position = 0
-        self.position_setpoint = 0
-        self.speed = 10
-        self.start_move = False
-        self.amplitude = 30000
-        self.axis_on = True
+        self.motion = MotionEngine(range(AXIS_COUNT), speed=10)
+        self.axes = [AttocubeAxis(self.motion, index) for index in range(AXIS_COUNT)]
 
-    def set_amplitude(self, amplitude):
-        self.amplitude = amplitude
+        self.tell_coalescing_time = 0.0
+        self.max_tell_rate = 0.0
+        self.max_tell_burst = 10
+        self._tell_time = 0.0
+        self._told = {}
+        self._pending_tells = OrderedDict()
+        self._pending_since = None
+        self._tell_bucket = None
 
-    def move(self):
-        self.start_move = True
+    # The first axis, as the emulator had before it simulated several
+    @property
+    def position(self):
+        return self.axes[0].position
+
+    @position.setter
+    def position(self, position):
+        self.axes[0].position = position
+
+    @property
+    def position_setpoint(self):
+        return self.axes[0].position_setpoint
+
+    @position_setpoint.setter
+    def position_setpoint(self, position_setpoint):
+        self.axes[0].position_setpoint = position_setpoint
+
+    @property
+    def speed(self):
+        return self.axes[0].speed
+
+    @speed.setter
+    def speed(self, speed):
+        self.axes[0].speed = speed
+
+    @property
+    def amplitude(self):
+        return self.axes[0].amplitude
+
+    @amplitude.setter
+    def amplitude(self, amplitude):
+        self.axes[0].amplitude = amplitude
+
+    @property
+    def axis_on(self):
+        return self.axes[0].on
+
+    @axis_on.setter
+    def axis_on(self, axis_on):
+        self.axes[0].on = axis_on
+
+    def set_amplitude(self, amplitude, index=0):
+        self.axes[index].amplitude = amplitude
+
+    def move(self, index=0):
+        self.axes[index].move()
+
+    def set_position_setpoint(self, position, index=0):
+        self.axes[index].position_setpoint = position
+
+    def set_axis_on(self, on_state, index=0):
+        self.axes[index].on = (on_state == 1)
+
+    def start_requested_moves(self):
+        for axis in self.axes:
+            axis.start_requested_move()
+
+    def _tells_allowed(self, count):
+        if self.max_tell_rate <= 0:
+            self._tell_bucket = None
+            return count
+        bucket = self._tell_bucket
+        if bucket is None or bucket.rate != self.max_tell_rate or bucket.capacity != self.max_tell_burst:
+            bucket = self._tell_bucket = TokenBucket(self.max_tell_rate, self.max_tell_burst,
+                                                     clock=lambda: self._tell_time)
+        allowed = 0
+        while allowed < count and bucket.take():
+            allowed += 1
+        return allowed
+
+    def process_tells(self, dt):
+        """
+        Tells the client about the changes to the told parameters of the axes which are due to be sent.
+
+        Args:
+            dt: Float, the length of the cycle in seconds
+
+        Returns: None
+        """
+        self._tell_time += dt
+        pending = self._pending_tells
+        for axis in self.axes:
+            for parameter in TOLD_PARAMETERS:
+                key = (parameter, axis.index)
+                value = getattr(axis, parameter)
+                if self._told.get(key) != value:
+                    pending[key] = value
+                else:
+                    # Changed back before it was told
+                    pending.pop(key, None)
 
-    def set_position_setpoint(self, position):
-        self.position_setpoint = position
+        if not pending:
+            self._pending_since = None
+            return
+        if self._pending_since is None:
+            self._pending_since = self._tell_time
+        if self.tell_output is None or self._tell_time - self._pending_since < self.tell_coalescing_time:
+            return
 
-    def set_axis_on(self, on_state):
-        self.axis_on = (on_state == 1)
+        tells = [(parameter, index, value) for (parameter, index), value in pending.items()]
+        tells = tells[:self._tells_allowed(len(tells))]
+        if not tells:
+            return
+        for parameter, index, value in tells[:self.tell_output(tells)]:
+            self._told[(parameter, index)] = pending.pop((parameter, index))
+        if not pending:
+            self._pending_since = None
 
     def _get_state_handlers(self):
         return {DefaultState.NAME: DefaultState(),
@@ -37,6 +227,6 @@ class SimulatedAttocubeANC350(StateMachineDevice):
 
     def _get_transition_handlers(self):
         return OrderedDict([
-            ((DefaultState.NAME, MovingState.NAME), lambda: self.start_move and self.axis_on),
-            ((MovingState.NAME, DefaultState.NAME), lambda: self.position_setpoint == self.position),
+            ((DefaultState.NAME, MovingState.NAME), lambda: bool(self.motion.moving_axes())),
+            ((MovingState.NAME, DefaultState.NAME), lambda: not self.motion.moving_axes()),
         ])
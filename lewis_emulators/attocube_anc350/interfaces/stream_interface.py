@@ -1,6 +1,7 @@
 from lewis.adapters.stream import StreamInterface, Cmd
 from lewis.core.logging import has_log
 from lewis_emulators.utils.byte_conversions import int_to_raw_bytes, raw_bytes_to_int
+from lewis_emulators.utils.framing import FramedStreamInterface, LengthFieldDeframer
 from functools import partial
 
 BYTES_IN_INT = 4
@@ -44,13 +45,11 @@ ID_ANC_TARGET = 0x0408  # The target to move to
 ID_ANC_RUN_TARGET = 0x040d  # Actually start the move to target
 ID_ANC_AXIS_ON = 0x3030  # Turn the axis on (on power cycle the axis is turned off
 
-# Status bitmask
-ANC_STATUS_RUNNING = 0x0001
-ANC_STATUS_HUMP = 0x0002
-ANC_STATUS_SENS_ERR = 0x0100
-ANC_STATUS_DISCONN = 0x0400
-ANC_STATUS_REF_VALID = 0x0800
-ANC_STATUS_ENABLE = 0x1000
+# The addresses of the parameters of the axes the controller sends events for
+TELL_ADDRESSES = {
+    "counter": ID_ANC_COUNTER,
+    "status": ID_ANC_STATUS,
+}
 
 
 def convert_to_ints(command, start, end):
@@ -67,7 +66,7 @@ def convert_to_ints(command, start, end):
     return [raw_bytes_to_int(command[x:x + BYTES_IN_INT]) for x in range(start, end, BYTES_IN_INT)]
 
 
-def generate_response(address, index, correlation_num, data=None):
+def generate_response(address, index, correlation_num, data=None, reason=UC_REASON_OK):
     """
     Creates a response of the format:
     * Length (the length of the response)
@@ -75,57 +74,92 @@ def generate_response(address, index, correlation_num, data=None):
     * Address (where the driver had read/written to)
     * Index (the axis the driver had read/written from)
     * Correlation Number (the ID of the message we're responding to)
-    * Reason (whether the request was successful, always SUCCESS currently)
+    * Reason (whether the request was successful)
 
     Args:
         address: The memory address where the driver had read/written to
         index: The axis the driver had read/written from
         correlation_num: The ID of the message we're responding to
         data (optional): The data we want to send back to the driver (only valid on a get command)
+        reason (optional): Whether the request was successful, UC_REASON_OK by default
 
     Returns: The raw bytes to send back to the driver.
     """
-    int_responses = [UC_ACK, address, index, correlation_num, UC_REASON_OK]
+    int_responses = [UC_ACK, address, index, correlation_num, reason]
     if data is not None:
         int_responses.append(data)
     response = "".join(convert_to_response(x) for x in int_responses)
     return convert_to_response(len(response)) + response
 
 
+def generate_tell(address, index, data):
+    """
+    Creates an event telegram, which has the format of a set command:
+    * Length (the length of the telegram)
+    * Opcode (always TELL)
+    * Address (the parameter which has changed)
+    * Index (the axis whose parameter has changed)
+    * Correlation Number (always 0, as the event is not a response)
+    * Data (the new value of the parameter)
+
+    Args:
+        address: The memory address of the parameter
+        index: The axis of the parameter
+        data: The new value of the parameter
+
+    Returns: The raw bytes to send to the driver.
+    """
+    telegram = "".join(convert_to_response(x) for x in [UC_TELL, address, index, 0, data])
+    return convert_to_response(len(telegram)) + telegram
+
+
 @has_log
-class AttocubeANC350StreamInterface(StreamInterface):
+class AttocubeANC350StreamInterface(FramedStreamInterface, StreamInterface):
 
     # Commands that we expect via serial during normal operation. Match anything!
     commands = {
         Cmd("any_command", "^([\s\S]*)$"),
     }
 
-    in_terminator = ""
     out_terminator = ""
 
-    # Due to poll rate of the driver this will get individual commands
-    readtimeout = 10
+    def _bind_device(self):
+        super(AttocubeANC350StreamInterface, self)._bind_device()
+        self._device.tell_output = self.send_tells
+
+    def send_tells(self, tells):
+        """
+        Sends event telegrams to the client without being polled, in one write.
+
+        Args:
+            tells: List of tuples of the told parameter, the index of its axis and its new value
+
+        Returns:
+            The number of events sent; none if no client is connected or the device is simulating disconnection
+
+        """
+        handler = self.handler
+        if handler is None or not handler.connected or not self.device.connected:
+            return 0
+        handler.unsolicited_reply("".join(generate_tell(TELL_ADDRESSES[parameter], index, value)
+                                          for parameter, index, value in tells))
+        return len(tells)
+
+    def create_deframer(self):
+        # Each telegram starts with its length, which doesn't include itself
+        return LengthFieldDeframer(field_size=BYTES_IN_INT, low_byte_first=True, discard_after=1.0)
 
     def handle_error(self, request, error):
         self.log.error("An error occurred at request " + repr(request) + ": " + repr(error))
         return str(error)
 
     def any_command(self, command):
-        response = ''
-
         if not self.device.connected:
             # Used rather than conditional_reply decorator to improve error message
             raise ValueError("Device simulating disconnection")
 
-        while command:
-            # Length doesn't include itself
-            length = raw_bytes_to_int(command[:BYTES_IN_INT]) + BYTES_IN_INT
-
-            response += self.handle_single_command(command[:length])
-
-            command = command[length:]
-
-        return response
+        # Telegrams are framed on their length as they arrive, so each request is a single command
+        return self.handle_single_command(command)
 
     def handle_single_command(self, command):
         length = raw_bytes_to_int(command[:BYTES_IN_INT])
@@ -147,33 +181,41 @@ class AttocubeANC350StreamInterface(StreamInterface):
         else:
             raise ValueError("Unrecognised opcode {}".format(opcode))
 
+    def _valid_axis(self, index):
+        return 0 <= index < len(self.device.axes)
+
     def set(self, address, index, correlation_num, data):
-        self.log.info("Setting address {} with data {}".format(address, data[0]))
+        self.log.info("Setting address {} of axis {} with data {}".format(address, index, data[0]))
+        if not self._valid_axis(index):
+            return generate_response(address, index, correlation_num, reason=UC_REASON_ADDR)
         command_mapping = {
-            ID_ANC_TARGET: partial(self.device.set_position_setpoint, position=data[0]),
-            ID_ANC_RUN_TARGET: self.device.move,
-            ID_ANC_AMPL: partial(self.device.set_amplitude, data[0]),
-            ID_ANC_AXIS_ON: partial(self.device.set_axis_on, data[0]),
+            ID_ANC_TARGET: partial(self.device.set_position_setpoint, position=data[0], index=index),
+            ID_ANC_RUN_TARGET: partial(self.device.move, index=index),
+            ID_ANC_AMPL: partial(self.device.set_amplitude, data[0], index=index),
+            ID_ANC_AXIS_ON: partial(self.device.set_axis_on, data[0], index=index),
         }
 
         try:
             command_mapping[address]()
-            print("Device amp is {}".format(self.device.amplitude))
+            print("Device amp is {}".format(self.device.axes[index].amplitude))
         except KeyError:
             pass  # Ignore unimplemented commands for now
         return generate_response(address, index, correlation_num)
 
     def get(self, address, index, correlation_num):
-        self.log.info("Getting address {}".format(address))
+        self.log.info("Getting address {} of axis {}".format(address, index))
+        if not self._valid_axis(index):
+            return generate_response(address, index, correlation_num, 0, reason=UC_REASON_ADDR)
+        axis = self.device.axes[index]
         command_mapping = {
-            ID_ANC_COUNTER: int(self.device.position),
+            ID_ANC_COUNTER: axis.counter,
             ID_ANC_REFCOUNTER: 0,
-            ID_ANC_STATUS: ANC_STATUS_REF_VALID + ANC_STATUS_ENABLE,
+            ID_ANC_STATUS: axis.status,
             ID_ANC_UNIT: 0x00,
-            ID_ANC_REGSPD_SETP: self.device.speed,
+            ID_ANC_REGSPD_SETP: axis.speed,
             ID_ANC_SENSOR_VOLT: 2000,
             ID_ANC_MAX_AMP: 60000,
-            ID_ANC_AMPL: self.device.amplitude,
+            ID_ANC_AMPL: axis.amplitude,
             ID_ANC_FAST_FREQ: 1000,
         }
         try:
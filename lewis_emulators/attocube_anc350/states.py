@@ -1,5 +1,4 @@
 from lewis.core.statemachine import State
-from lewis.core import approaches
 
 
 class MovingState(State):
@@ -9,13 +8,14 @@ class MovingState(State):
     NAME = 'Moving'
 
     def in_state(self, dt):
-        device = self._context
-        device.position = approaches.linear(device.position, device.position_setpoint, device.speed, dt)
+        self._context.start_requested_moves()
+        self._context.motion.advance(dt)
+        self._context.process_tells(dt)
 
 
 class DefaultState(State):
     NAME = 'Default'
 
-    def on_entry(self, dt):
-        self._context.start_move = False
-
+    def in_state(self, dt):
+        self._context.start_requested_moves()
+        self._context.process_tells(dt)
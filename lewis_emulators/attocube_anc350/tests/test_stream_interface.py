@@ -0,0 +1,43 @@
+import struct
+import unittest
+from hamcrest import assert_that, is_
+
+from lewis_emulators.attocube_anc350.device import SimulatedAttocubeANC350
+from lewis_emulators.attocube_anc350.interfaces import AttocubeANC350StreamInterface
+from lewis_emulators.attocube_anc350.interfaces import stream_interface
+from lewis_emulators.attocube_anc350.interfaces.stream_interface import UC_GET, UC_ACK, UC_REASON_OK
+
+ADDRESSES = sorted(value for name, value in vars(stream_interface).items() if name.startswith("ID_ANC_"))
+
+
+class AttocubeStreamInterfaceTests(unittest.TestCase):
+    """
+    Tests for the replies of the attocube ANC350 to requests.
+    """
+
+    def setUp(self):
+        self.device = SimulatedAttocubeANC350()
+        self.interface = AttocubeANC350StreamInterface()
+        self.interface.device = self.device
+
+    def _get(self, address, index=0, correlation_num=42):
+        reply = self.interface.any_command(struct.pack("<5i", 16, UC_GET, address, index, correlation_num))
+        reply = reply.encode("latin-1") if not isinstance(reply, bytes) else reply
+        return list(struct.unpack("<{}i".format(len(reply) // 4), reply))
+
+    def test_that_GIVEN_a_get_of_any_address_THEN_the_reply_is_an_ACK(self):
+        for address in ADDRESSES:
+            reply = self._get(address)
+
+            assert_that(reply[:6], is_([24, UC_ACK, address, 0, 42, UC_REASON_OK]))
+
+    def test_that_GIVEN_a_get_of_the_speed_THEN_the_reply_has_the_speed(self):
+        assert_that(self._get(stream_interface.ID_ANC_REGSPD_SETP)[6], is_(10))
+
+    def test_that_GIVEN_a_move_has_finished_THEN_the_counter_is_the_target(self):
+        self.device.set_position_setpoint(25)
+        self.device.move()
+        self.device.start_requested_moves()
+        self.device.motion.advance(10.0)
+
+        assert_that(self._get(stream_interface.ID_ANC_COUNTER)[6], is_(25))
@@ -0,0 +1,116 @@
+import struct
+import unittest
+from hamcrest import assert_that, is_, has_length, contains_exactly
+
+from lewis_emulators.attocube_anc350.device import SimulatedAttocubeANC350, ANC_STATUS_RUNNING
+from lewis_emulators.attocube_anc350.interfaces import AttocubeANC350StreamInterface
+from lewis_emulators.attocube_anc350.interfaces.stream_interface import UC_GET, UC_TELL, ID_ANC_COUNTER
+
+
+def unpack(telegrams):
+    """
+    Splits raw bytes into telegrams, each a list of its ints after the length.
+    """
+    telegrams = telegrams.encode("latin-1") if not isinstance(telegrams, bytes) else telegrams
+    ints = list(struct.unpack("<{}i".format(len(telegrams) // 4), telegrams))
+    split = []
+    while ints:
+        length = ints[0] // 4
+        split.append(ints[1:length + 1])
+        ints = ints[length + 1:]
+    return split
+
+
+class FakeHandler(object):
+    connected = True
+
+    def __init__(self):
+        self.replies = []
+
+    def unsolicited_reply(self, reply):
+        self.replies.extend(unpack(reply))
+
+
+class AttocubeTellTests(unittest.TestCase):
+    """
+    Tests for the events the controller sends when the counters and statuses of its axes change.
+    """
+
+    def setUp(self):
+        self.device = SimulatedAttocubeANC350()
+        self.told = []
+        self.device.tell_output = self._output
+        # The initial values of every axis
+        self.device.process_tells(0.1)
+        self.told = []
+
+    def _output(self, tells):
+        self.told.extend(tells)
+        return len(tells)
+
+    def _move(self, index, position):
+        self.device.set_position_setpoint(position, index)
+        self.device.move(index)
+        self.device.start_requested_moves()
+
+    def _process(self, dt):
+        self.device.motion.advance(dt)
+        self.device.process_tells(dt)
+
+    def test_that_GIVEN_an_axis_moving_THEN_its_counter_and_status_are_told_and_no_other_axis(self):
+        self._move(1, 5.0)
+
+        self._process(0.1)
+
+        assert_that(self.told, contains_exactly(("counter", 1, 1), ("status", 1, 0x1800 | ANC_STATUS_RUNNING)))
+
+    def test_that_GIVEN_no_change_THEN_nothing_is_told(self):
+        self._process(1.0)
+
+        assert_that(self.told, is_([]))
+
+    def test_that_GIVEN_a_coalescing_time_THEN_changes_are_told_once_with_their_latest_values(self):
+        self.device.tell_coalescing_time = 0.25
+        self._move(0, 100.0)
+
+        for _ in range(3):
+            self._process(0.1)
+        assert_that(self.told, is_([]))
+        self._process(0.1)
+
+        assert_that(self.told, contains_exactly(("counter", 0, 4), ("status", 0, 0x1800 | ANC_STATUS_RUNNING)))
+
+    def test_that_GIVEN_a_max_rate_THEN_changes_held_back_are_told_later_with_their_final_values(self):
+        self.device.max_tell_rate = 1.0
+        self.device.max_tell_burst = 1
+        self._move(0, 2.0)
+
+        self._process(0.1)
+        assert_that(self.told, is_([("counter", 0, 1)]))
+        # Arrives while the status is held back, so the status is as last told
+        self._process(0.1)
+        assert_that(self.told, has_length(1))
+        self._process(1.0)
+        self._process(1.0)
+
+        assert_that(self.told, is_([("counter", 0, 1), ("counter", 0, 2)]))
+
+    def test_that_GIVEN_a_connected_client_THEN_tells_are_sent_as_TELL_telegrams(self):
+        interface = AttocubeANC350StreamInterface()
+        interface.device = self.device
+        handler = interface.handler = FakeHandler()
+
+        self._move(2, -3.0)
+        self._process(1.0)
+
+        # The axis has arrived by the time the changes are told, so its status is as it was
+        assert_that(handler.replies, is_([[UC_TELL, ID_ANC_COUNTER, 2, 0, -3]]))
+
+    def test_that_GIVEN_a_get_for_an_axis_THEN_the_value_is_that_axis_s_value(self):
+        interface = AttocubeANC350StreamInterface()
+        interface.device = self.device
+        self.device.axes[1].position = 7.0
+
+        reply = interface.any_command(struct.pack("<5i", 16, UC_GET, ID_ANC_COUNTER, 1, 42))
+
+        assert_that(unpack(reply), is_([[3, ID_ANC_COUNTER, 1, 42, 0, 7]]))
@@ -2,6 +2,8 @@ from datetime import datetime
 
 from lewis.devices import StateMachineDevice
 from collections import OrderedDict
+
+from lewis_emulators.utils.ramp import LinearRamp, process_in_steps
 from .states import DefaultInitState, HoldingState, TrippedState, RampingState
 from .utils import RampTarget, RampDirection
 
@@ -27,6 +29,7 @@ class SimulatedCRYOSMS(StateMachineDevice):
         self.is_paused = False
 
         # output
+        self.output_ramp = LinearRamp(0.0, self.ramp_rate)
         self.output = 0.0
         self.is_output_mode_tesla = False
         self.direction = RampDirection.POSITIVE
@@ -67,6 +70,19 @@ class SimulatedCRYOSMS(StateMachineDevice):
             (('holding', 'ramping'), lambda: not self.at_target and not self.is_paused),
         ])
 
+    def process(self, dt=0):
+        # Hold from the moment the ramp reaches its target, however long the cycle
+        time_to_target = self.output_ramp.time_to_target() if self._csm.state == 'ramping' else None
+        process_in_steps(super(SimulatedCRYOSMS, self).process, dt, time_to_target)
+
+    @property
+    def output(self):
+        return self.output_ramp.value
+
+    @output.setter
+    def output(self, value):
+        self.output_ramp.value = value
+
     # Utilities
 
     def timestamp_str(self):
@@ -1,5 +1,4 @@
 from lewis.core.statemachine import State
-from lewis.core import approaches
 from lewis.core.logging import has_log
 
 
@@ -48,5 +47,8 @@ class RampingState(State):
         constant = device.constant
         if device.is_output_mode_tesla:
             rate = rate * constant
-        device.output = approaches.linear(device.output, target, rate, dt)
+        ramp = device.output_ramp
+        ramp.rate = rate
+        ramp.target = target
+        ramp.advance(dt)
         device.check_is_at_target()
@@ -1,27 +1,42 @@
 from collections import OrderedDict
 
 from lewis.devices import StateMachineDevice
+from lewis_emulators.utils.motion import MotionEngine
 from .states import InitializedState, UninitializedState, MovingState
 
+AXES = ("a", "b", "c")
+
+
+def _position(axis):
+    def set_position(self, position):
+        self.motion.set_position(axis, position)
+    return property(lambda self: self.motion.position(axis), set_position,
+                    doc="The position of axis {}".format(axis))
+
+
+def _setpoint(axis):
+    def set_setpoint(self, setpoint):
+        self.motion.move(axis, setpoint)
+    return property(lambda self: self.motion.target(axis), set_setpoint,
+                    doc="The setpoint of axis {}; setting it starts a move there".format(axis))
+
 
 class SimulatedCybaman(StateMachineDevice):
     """
     Simulated cyber man.
     """
 
+    a, b, c = (_position(axis) for axis in AXES)
+    a_setpoint, b_setpoint, c_setpoint = (_setpoint(axis) for axis in AXES)
+
     def _initialize_data(self):
         """
         Sets the initial state of the device.
         """
         self.connected = True
 
-        self.a_setpoint = 0
-        self.b_setpoint = 0
-        self.c_setpoint = 0
-
-        self.a = self.a_setpoint
-        self.b = self.b_setpoint
-        self.c = self.c_setpoint
+        # All axes start at 0, at their setpoints
+        self.motion = MotionEngine(AXES, speed=10)
 
         self.home_position_axis_a = 66
         self.home_position_axis_b = 77
@@ -53,10 +68,8 @@ class SimulatedCybaman(StateMachineDevice):
             ((UninitializedState.NAME, InitializedState.NAME), lambda: self.initialized),
             ((InitializedState.NAME, UninitializedState.NAME), lambda: not self.initialized),
             ((MovingState.NAME, UninitializedState.NAME), lambda: not self.initialized),
-            ((InitializedState.NAME, MovingState.NAME),
-             lambda: self.a != self.a_setpoint or self.b != self.b_setpoint or self.c != self.c_setpoint),
-            ((MovingState.NAME, InitializedState.NAME),
-             lambda: self.a == self.a_setpoint and self.b == self.b_setpoint and self.c == self.c_setpoint),
+            ((InitializedState.NAME, MovingState.NAME), lambda: self.motion.moving_axes()),
+            ((MovingState.NAME, InitializedState.NAME), lambda: not self.motion.moving_axes()),
         ])
 
     def home_axis_a(self):
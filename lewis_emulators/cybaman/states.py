@@ -1,4 +1,3 @@
-from lewis.core import approaches
 from lewis.core.statemachine import State
 
 
@@ -20,11 +19,7 @@ class MovingState(State):
     NAME = "MovingState"
 
     def in_state(self, dt):
-        device = self._context
-
-        device.a = approaches.linear(device.a, device.a_setpoint, 10, dt)
-        device.b = approaches.linear(device.b, device.b_setpoint, 10, dt)
-        device.c = approaches.linear(device.c, device.c_setpoint, 10, dt)
+        self._context.motion.advance(dt)
 
     def on_entry(self, dt):
         print("Entering moving state")
@@ -0,0 +1,44 @@
+import unittest
+from hamcrest import assert_that, is_
+
+from lewis_emulators.cybaman.device import SimulatedCybaman
+from lewis_emulators.cybaman.interfaces import CybamanStreamInterface
+
+
+class CybamanStreamInterfaceTests(unittest.TestCase):
+    """
+    Tests for the replies of the Cybaman to requests.
+    """
+
+    def setUp(self):
+        self.device = SimulatedCybaman()
+        self.interface = CybamanStreamInterface()
+        self.interface.device = self.device
+        self._request("A")
+        self._run(1.0)
+
+    def _request(self, request):
+        request = request.encode("latin-1")
+        command = next(command for command in self.interface.bound_commands if command.can_process(request))
+        return command.process_request(request)
+
+    def _run(self, seconds, dt=0.1):
+        for _ in range(int(round(seconds / dt))):
+            self.device.process(dt)
+
+    def test_that_GIVEN_the_device_is_initialized_THEN_the_axes_read_integer_zero(self):
+        for request in ("M101", "M201", "M301"):
+            assert_that(self._request(request), is_("0\r"))
+
+    def test_that_GIVEN_a_move_has_started_but_no_time_passed_THEN_the_axes_read_where_they_started(self):
+        self._request("OPEN PROG 10 CLEAR\nG1 A 5.0 B 3.0 C 2.0 TM4000")
+
+        assert_that(self._request("M101"), is_("0\r"))
+
+    def test_that_GIVEN_a_move_has_finished_THEN_the_axes_read_their_setpoints(self):
+        self._request("OPEN PROG 10 CLEAR\nG1 A 5.0 B 3.0 C 2.0 TM4000")
+
+        self._run(3.0)
+
+        assert_that([self._request(request) for request in ("M101", "M201", "M301")],
+                    is_(["17885.0\r", "10989.0\r", "7326.0\r"]))
@@ -1,6 +1,7 @@
 from collections import OrderedDict
 
 from lewis.devices import StateMachineDevice
+from lewis_emulators.utils.status_word import StatusWordSource, WatchedAttribute
 from .states import DefaultState
 
 
@@ -13,10 +14,14 @@ class FieldUnits(object):
     TESLA = object()
 
 
-class SimulatedDanfysik(StateMachineDevice):
+class SimulatedDanfysik(StatusWordSource, StateMachineDevice):
     """
     Simulated Danfysik.
     """
+    # Attributes reported in the status word
+    power = WatchedAttribute("power")
+    negative_polarity = WatchedAttribute("negative_polarity")
+    active_interlocks = WatchedAttribute("active_interlocks")
     
     def _initialize_data(self):
         """
@@ -52,6 +57,7 @@ class SimulatedDanfysik(StateMachineDevice):
         """
         if name not in self.active_interlocks:
             self.active_interlocks.append(name)
+            self.refresh_status("active_interlocks")
 
     def disable_interlock(self, name):
         """
@@ -61,6 +67,7 @@ class SimulatedDanfysik(StateMachineDevice):
         """
         if name in self.active_interlocks:
             self.active_interlocks.remove(name)
+            self.refresh_status("active_interlocks")
 
     def set_address(self, value):
         """
@@ -7,6 +7,7 @@ from lewis.core.logging import has_log
 from lewis_emulators.utils.command_builder import CmdBuilder
 from lewis_emulators.utils.replies import conditional_reply
 from .dfkps_base import CommonStreamInterface
+from .dfkps_8000 import MODEL_8000_STATUS_WORD
 
 __all__ = ["Danfysik8500StreamInterface"]
 
@@ -41,44 +42,7 @@ class Danfysik8500StreamInterface(CommonStreamInterface, StreamInterface):
         """
         Respond to the get_status command (S1)
         """
-        def bit(condition):
-            return "!" if condition else "."
-
-        def ilk(name):
-            return bit(name in self.device.active_interlocks)
-
-        response = "{power_off}{pol_normal}{pol_reversed}{reg_transformer}{dac16}{dac17}{is_percent}{spare}"\
-                   "{transistor_fault}{sum_interlock}{dc_overcurrent}{dc_overload}{reg_mod_fail}{prereg_fail}" \
-                   "{phase_fail}{mps_waterflow_fail}{earth_leak_fail}{thermal_fail}{mps_overtemperature}" \
-                   "{door_switch}{mag_waterflow_fail}{mag_overtemp}{mps_not_ready}{spare}".format(
-                        spare=bit(False),
-                        power_off=bit(not self.device.power),
-                        pol_normal=bit(not self.device.negative_polarity),
-                        pol_reversed=bit(self.device.negative_polarity),
-                        reg_transformer=bit(False),
-                        dac16=bit(False),
-                        dac17=bit(False),
-                        is_percent=bit(False),
-                        transistor_fault=ilk("transistor_fault"),
-                        sum_interlock=bit(len(self.device.active_interlocks) > 0),
-                        dc_overcurrent=ilk("dc_overcurrent"),
-                        dc_overload=ilk("dc_overload"),
-                        reg_mod_fail=ilk("reg_mod_fail"),
-                        prereg_fail=ilk("prereg_fail"),
-                        phase_fail=ilk("phase_fail"),
-                        mps_waterflow_fail=ilk("mps_waterflow_fail"),
-                        earth_leak_fail=ilk("earth_leak_fail"),
-                        thermal_fail=ilk("thermal_fail"),
-                        mps_overtemperature=ilk("mps_overtemperature"),
-                        door_switch=ilk("door_switch"),
-                        mag_waterflow_fail=ilk("mag_waterflow_fail"),
-                        mag_overtemp=ilk("mag_overtemp"),
-                        mps_not_ready=bit(not self.device.power),
-                    )
-
-        assert len(response) == 24, "length should have been 24 but was {}".format(len(response))
-
-        return response
+        return self.device.status_word(MODEL_8000_STATUS_WORD).render()
 
     def set_address(self, value):
         self.device.set_address(value)
@@ -6,12 +6,41 @@ from lewis.core.logging import has_log
 
 from lewis_emulators.utils.command_builder import CmdBuilder
 from lewis_emulators.utils.replies import conditional_reply
-from .dfkps_base import CommonStreamInterface
-
+from lewis_emulators.utils.status_word import StatusWordLayout, StatusField, render_characters
+from .dfkps_base import CommonStreamInterface, interlock_status_field
 
 __all__ = ["Danfysik8800StreamInterface"]
 
 
+# The status is a character per bit, "!" when set
+MODEL_8800_STATUS_WORD = StatusWordLayout([
+    interlock_status_field(1, "user1"),
+    interlock_status_field(2, "user2"),
+    interlock_status_field(3, "user3"),
+    interlock_status_field(4, "user4"),
+    interlock_status_field(5, "user5"),
+    interlock_status_field(6, "user6"),
+    interlock_status_field(7, "fw_diode_overtemp"),
+    interlock_status_field(8, "low_water_flow"),
+    interlock_status_field(9, "door_open"),
+    StatusField(10, "negative_polarity", invert=True),
+    StatusField(11, "negative_polarity"),
+    interlock_status_field(16, "diode_heatsink"),
+    interlock_status_field(17, "chassis_overtemp"),
+    interlock_status_field(18, "igbt_heatsink_overtemp"),
+    interlock_status_field(19, "hf_diode_overtemp"),
+    interlock_status_field(20, "switch_reg_ddct_fail"),
+    interlock_status_field(21, "switch_reg_supply_fail"),
+    interlock_status_field(22, "igbt_driver_fail"),
+    interlock_status_field(25, "ac_undervolt"),
+    interlock_status_field(27, "ground_ripple"),
+    interlock_status_field(28, "ground_leak"),
+    interlock_status_field(29, "overcurrent"),
+    StatusField(30, "power", invert=True),
+    StatusField(31, "power"),
+], render=render_characters(32))
+
+
 @has_log
 class Danfysik8800StreamInterface(CommonStreamInterface, StreamInterface):
     """
@@ -31,44 +60,4 @@ class Danfysik8800StreamInterface(CommonStreamInterface, StreamInterface):
         """
         Respond to the get_status command (S1)
         """
-
-        def bit(condition):
-            return "!" if condition else "."
-
-        def ilk(name):
-            return bit(name in self.device.active_interlocks)
-
-        response = "{spare}{user1}{user2}{user3}{user4}{user5}{user6}{fw_diode_overtemp}{low_water_flow}{door_open}" \
-                   "{pol_normal}{pol_reversed}{spare}{spare}{spare}{spare}{diode_heatsink}{chassis_overtemp}" \
-                   "{igbt_heatsink_overtemp}{hf_diode_overtemp}{switch_reg_ddct_fail}{switch_reg_supply_fail}" \
-                   "{igbt_driver_fail}{spare}{spare}{ac_undervolt}{spare}{ground_ripple}{ground_leak}"\
-                   "{overcurrent}{power_on}{ready}".format(
-                        spare=bit(False),
-                        user1=ilk("user1"),
-                        user2=ilk("user2"),
-                        user3=ilk("user3"),
-                        user4=ilk("user4"),
-                        user5=ilk("user5"),
-                        user6=ilk("user6"),
-                        pol_normal=bit(not self.device.negative_polarity),
-                        pol_reversed=bit(self.device.negative_polarity),
-                        fw_diode_overtemp=ilk("fw_diode_overtemp"),
-                        low_water_flow=ilk("low_water_flow"),
-                        door_open=ilk("door_open"),
-                        diode_heatsink=ilk("diode_heatsink"),
-                        chassis_overtemp=ilk("chassis_overtemp"),
-                        igbt_heatsink_overtemp=ilk("igbt_heatsink_overtemp"),
-                        hf_diode_overtemp=ilk("hf_diode_overtemp"),
-                        switch_reg_ddct_fail=ilk("switch_reg_ddct_fail"),
-                        switch_reg_supply_fail=ilk("switch_reg_supply_fail"),
-                        igbt_driver_fail=ilk("igbt_driver_fail"),
-                        ac_undervolt=ilk("ac_undervolt"),
-                        ground_ripple=ilk("ground_ripple"),
-                        ground_leak=ilk("ground_leak"),
-                        overcurrent=ilk("overcurrent"),
-                        power_on=bit(not self.device.power),
-                        ready=bit(self.device.power),
-                    )
-
-        assert len(response) == 32
-        return response
+        return self.device.status_word(MODEL_8800_STATUS_WORD).render()
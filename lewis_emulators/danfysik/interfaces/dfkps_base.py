@@ -7,10 +7,22 @@ import six
 from lewis.core.logging import has_log
 from lewis_emulators.utils.command_builder import CmdBuilder
 from lewis_emulators.utils.replies import conditional_reply
+from lewis_emulators.utils.status_word import StatusField
 
 if_available = conditional_reply("device_available")
 
 
+def interlock_status_field(position, name):
+    """
+    A bit of the status word which is set when an interlock is active.
+
+    Args:
+        position: the position of the bit
+        name: the name of the interlock
+    """
+    return StatusField(position, "active_interlocks", encoding=lambda interlocks: name in interlocks)
+
+
 @has_log
 @six.add_metaclass(abc.ABCMeta)
 class CommonStreamInterface(object):
@@ -3,3 +3,11 @@ from ..lewis_versions import LEWIS_LATEST
 
 framework_version = LEWIS_LATEST
 __all__ = ['SimulatedEurotherm']
+
+# A furnace with eight controllers on one serial line, at addresses 0011 to 0088
+setups = dict(
+    chain=dict(
+        device_type=SimulatedEurotherm,
+        parameters=dict(override_initial_data=dict(addresses=list(range(1, 9)))),
+    ),
+)
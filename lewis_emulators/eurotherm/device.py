@@ -1,12 +1,118 @@
 from collections import OrderedDict
 
+import six
 from lewis.devices import StateMachineDevice
+from lewis_emulators.utils.ramp import LinearRamp
 from .states import DefaultState
 
 
+def bisynch_address(unit):
+    """
+    The address of a controller as it appears in EI-Bisynch messages: the group and unit digits each sent twice.
+
+    Args:
+        unit: the number of the controller on the bus, from 0 to 99, or its address e.g. "0011". Addresses as older
+            versions of the emulator kept them, e.g. "A1" or "A01", are read as the number in them.
+
+    Returns: the address e.g. "0011" for controller 1 or "1122" for controller 12.
+    """
+    if isinstance(unit, six.string_types):
+        if len(unit) == 4 and unit.isdigit():
+            return unit
+        digits = "".join(character for character in unit if character.isdigit())
+        if not digits:
+            raise ValueError("{} is not the number or address of a controller".format(unit))
+        unit = digits
+    group, unit = divmod(int(unit), 10)
+    if group > 9:
+        raise ValueError("Controllers on an EI-Bisynch bus are numbered from 0 to 99, got {}".format(group * 10 + unit))
+    return str(group) * 2 + str(unit) * 2
+
+
+class EurothermController(object):
+    """
+    One Eurotherm controller on the serial line, at its own address.
+    """
+
+    def __init__(self, address):
+        """
+        Args:
+            address (str): the address of the controller e.g. "0011".
+        """
+        self.address = address
+        self.connected = True
+        self._temperature = LinearRamp(value=0.0, rate=1.0 / 60)
+        self._ramp_setpoint_temperature = 0.0
+        self._ramping_on = False
+
+    def _update_target(self):
+        if self._ramping_on:
+            self._temperature.target = self._ramp_setpoint_temperature
+        else:
+            self._temperature.stop()
+
+    def advance(self, dt):
+        """
+        Let time pass for the controller, so that its temperature ramps towards its set point if ramping is on.
+
+        Args:
+            dt (float): the time in seconds.
+        """
+        self._temperature.advance(dt)
+
+    @property
+    def current_temperature(self):
+        """
+        Returns: the current temperature in K.
+        """
+        return self._temperature.value
+
+    @current_temperature.setter
+    def current_temperature(self, temp):
+        self._temperature.value = temp
+        self._update_target()
+
+    @property
+    def ramping_on(self):
+        """
+        Returns: bool indicating if the controller is ramping to its set point.
+        """
+        return self._ramping_on
+
+    @ramping_on.setter
+    def ramping_on(self, toggle):
+        self._ramping_on = toggle
+        self._update_target()
+
+    @property
+    def ramp_rate(self):
+        """
+        Returns: the ramp rate in K/min.
+        """
+        return self._temperature.rate * 60
+
+    @ramp_rate.setter
+    def ramp_rate(self, ramp_rate):
+        self._temperature.rate = ramp_rate / 60.0
+
+    @property
+    def ramp_setpoint_temperature(self):
+        """
+        Returns: the set point temperature in K.
+        """
+        return self._ramp_setpoint_temperature
+
+    @ramp_setpoint_temperature.setter
+    def ramp_setpoint_temperature(self, temp):
+        self._ramp_setpoint_temperature = temp
+        self._update_target()
+
+
 class SimulatedEurotherm(StateMachineDevice):
     """
-    Simulated Eurotherm temperature sensor.
+    Simulated Eurotherm temperature sensor; a chain of Eurotherm controllers sharing one serial line.
+
+    The properties of a single controller (current_temperature etc.) are those of the first controller in the chain.
     """
 
     def _initialize_data(self):
@@ -15,12 +121,40 @@ class SimulatedEurotherm(StateMachineDevice):
         """
         self.connected = True
 
-        self._current_temperature = 0.0
-        self._setpoint_temperature = 0.0
-        self._ramp_setpoint_temperature = 0.0
-        self._ramping_on = False
-        self._ramp_rate = 1.0
-        self._address = "A1"
+        # Maps the address of each controller to the controller
+        self.controllers = OrderedDict()
+        self.addresses = [1]
+
+    @property
+    def addresses(self):
+        """
+        Get the addresses of the controllers in the chain.
+
+        Returns: list of the addresses e.g. ["0011", "0022"]
+        """
+        return list(self.controllers)
+
+    @addresses.setter
+    def addresses(self, addresses):
+        """
+        Sets the controllers in the chain. Controllers already in the chain keep their state.
+
+        Args:
+            addresses: the numbers or addresses of the controllers e.g. [1, 2] or ["0011", "0022"].
+
+        """
+        addresses = [bisynch_address(address) for address in addresses]
+        if not addresses:
+            raise ValueError("A chain needs at least one controller")
+        self.controllers = OrderedDict(
+            (address, self.controllers.get(address) or EurothermController(address)) for address in addresses)
+
+    @property
+    def controller(self):
+        """
+        Returns: the first controller in the chain.
+        """
+        return next(iter(self.controllers.values()))
 
     def _get_state_handlers(self):
         """
@@ -47,9 +181,9 @@ class SimulatedEurotherm(StateMachineDevice):
         """
         Get the address of the device.
 
-        Returns: the address of the device e.g. "A01"
+        Returns: the address of the first controller e.g. "0011"
         """
-        return self._address
+        return self.controller.address
 
     @address.setter
     def address(self, addr):
@@ -57,10 +191,13 @@ class SimulatedEurotherm(StateMachineDevice):
         Sets the address of the device.
 
         Args:
-            addr (str): the address of this device e.g. "A01".
+            addr (str): the address of the first controller e.g. "0011", or its number, e.g. 1 or "A01".
 
         """
-        self._address = addr
+        addresses = self.addresses
+        self.controller.address = addresses[0] = bisynch_address(addr)
+        controllers = list(self.controllers.values())
+        self.controllers = OrderedDict(zip(addresses, controllers))
 
     @property
     def current_temperature(self):
@@ -69,7 +206,7 @@ class SimulatedEurotherm(StateMachineDevice):
 
         Returns: the current temperature in K.
         """
-        return self._current_temperature
+        return self.controller.current_temperature
 
     @current_temperature.setter
     def current_temperature(self, temp):
@@ -80,7 +217,7 @@ class SimulatedEurotherm(StateMachineDevice):
             temp: the current temperature of the device in K.
 
         """
-        self._current_temperature = temp
+        self.controller.current_temperature = temp
 
     @property
     def ramping_on(self):
@@ -89,7 +226,7 @@ class SimulatedEurotherm(StateMachineDevice):
 
         Returns: bool indicating if the device is ramping.
         """
-        return self._ramping_on
+        return self.controller.ramping_on
 
     @ramping_on.setter
     def ramping_on(self, toggle):
@@ -100,7 +237,7 @@ class SimulatedEurotherm(StateMachineDevice):
             toggle (bool): turn ramping on or off.
 
         """
-        self._ramping_on = toggle
+        self.controller.ramping_on = toggle
 
     @property
     def ramp_rate(self):
@@ -109,7 +246,7 @@ class SimulatedEurotherm(StateMachineDevice):
 
         Returns: the current ramp rate in K/min
         """
-        return self._ramp_rate
+        return self.controller.ramp_rate
 
     @ramp_rate.setter
     def ramp_rate(self, ramp_rate):
@@ -120,7 +257,7 @@ class SimulatedEurotherm(StateMachineDevice):
             ramp_rate (float): set the current ramp rate in K/min.
 
         """
-        self._ramp_rate = ramp_rate
+        self.controller.ramp_rate = ramp_rate
 
     @property
     def ramp_setpoint_temperature(self):
@@ -129,7 +266,7 @@ class SimulatedEurotherm(StateMachineDevice):
 
         Returns: the current value of the setpoint temperature in K.
         """
-        return self._ramp_setpoint_temperature
+        return self.controller.ramp_setpoint_temperature
 
     @ramp_setpoint_temperature.setter
     def ramp_setpoint_temperature(self, temp):
@@ -140,5 +277,5 @@ class SimulatedEurotherm(StateMachineDevice):
             temp (float): the current value of the set point temperature in K.
 
         """
-        self._ramp_setpoint_temperature = temp
+        self.controller.ramp_setpoint_temperature = temp
 
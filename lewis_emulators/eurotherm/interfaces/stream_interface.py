@@ -1,35 +1,115 @@
+import six
 from lewis.adapters.stream import StreamInterface
-from lewis_emulators.utils.command_builder import CmdBuilder
+from lewis_emulators.utils.bound_command import SingleBoundCommand
+from lewis_emulators.utils.framing import FramedStreamInterface, IdleGapDeframer
 from lewis_emulators.utils.replies import conditional_reply
 
 if_connected = conditional_reply("connected")
 
+EOT = chr(4)
+STX = chr(2)
+ETX = chr(3)
+ENQ = chr(5)
 
-class EurothermStreamInterface(StreamInterface):
+ADDRESS_LENGTH = 4
+
+# Terminator the IOC used to add to its requests for older versions of the emulator, ignored if present
+LEGACY_TERMINATOR = "\r\n"
+
+
+class BisynchFrames(SingleBoundCommand):
+    """
+    Routes EI-Bisynch frames to the controller they are addressed to. It behaves like a single bound command
+    (lewis.adapters.stream.Func) which can process any well formed frame:
+
+    - a read: EOT, address, mnemonic, ENQ
+    - a write: EOT, address, STX, mnemonic, value, ETX, BCC
+
+    The address is parsed once, and the controller and the handler of the mnemonic are looked up in dictionaries. A
+    frame for an address with no connected controller gets no reply, as on a real bus.
+    """
+
+    def __init__(self, device, reads, writes):
+        """
+        :param device: the device with the chain of controllers
+        :param reads: dictionary of mnemonic to the handler of reads, a function of the controller
+        :param writes: dictionary of mnemonic to the handler of writes, a function of the controller and the value
+        """
+        super(BisynchFrames, self).__init__("\n".join(["Read " + mnemonic for mnemonic in sorted(reads)] +
+                                                      ["Write " + mnemonic for mnemonic in sorted(writes)]),
+                                            "EI-Bisynch frames")
+        self.device = device
+        self.reads = reads
+        self.writes = writes
+
+    def parse(self, request):
+        """
+        :param request: the request
+        :return: tuple of the address, the handler and its arguments after the controller; None if the request is not
+            a frame the router can process
+        """
+        request = six.ensure_str(request, "latin-1")
+        if request.endswith(LEGACY_TERMINATOR):
+            request = request[:-len(LEGACY_TERMINATOR)]
+        if len(request) < ADDRESS_LENGTH + 4 or request[0] != EOT:
+            return None
+        address, body = request[1:ADDRESS_LENGTH + 1], request[ADDRESS_LENGTH + 1:]
+
+        if body[0] == STX:
+            handler = self.writes.get(body[1:3])
+            if handler is None or len(body) < 6 or body[-2] != ETX:
+                return None
+            return address, handler, (body[3:-2],)
+
+        handler = self.reads.get(body[:2])
+        if handler is None or body[2:] != ENQ:
+            return None
+        return address, handler, ()
+
+    def find_match(self, request):
+        return self.parse(request)
+
+    def process_match(self, frame, request):
+        address, handler, arguments = frame
+        controller = self.device.controllers.get(address)
+        if controller is None or not controller.connected:
+            return None
+        return handler(controller, *arguments)
+
+
+class EurothermStreamInterface(FramedStreamInterface, StreamInterface):
     """
-    Stream interface for the serial port
+    Stream interface for the serial port, shared by the chain of controllers
     """
 
-    commands = {
-        CmdBuilder("get_current_temperature").eot().escape("0011PV").enq().build(),
-        CmdBuilder("get_ramp_setpoint").eot().escape("0011SP").enq().build(),
-        CmdBuilder("get_output").eot().escape("0011OP").enq().build(),
-        CmdBuilder("get_max_output").eot().escape("0011HO").enq().build(),
-        CmdBuilder("get_autotune").eot().escape("0011AT").enq().build(),
-        CmdBuilder("get_proportional").eot().escape("0011XP").enq().build(),
-        CmdBuilder("get_derivative").eot().escape("0011TD").enq().build(),
-        CmdBuilder("get_integral").eot().escape("0011TI").enq().build(),
-        CmdBuilder("get_highlim").eot().escape("0011HS").enq().build(),
-        CmdBuilder("get_lowlim").eot().escape("0011LS").enq().build(),
-
-        CmdBuilder("set_ramp_setpoint", arg_sep="").eot().escape("0011").stx().escape("SL").float().etx().any().build(),
-    }
-
-    # The real Eurotherm uses timeouts instead of terminators to assess when a command is finished. To make this work
-    # with the emulator we manually added terminators via asyn commands to the device. Lewis will be able to handle this
-    # natively in future versions. See: https://github.com/DMSC-Instrument-Data/lewis/pull/262
-    in_terminator = "\r\n"
-    out_terminator = chr(3)
+    commands = ()
+
+    # The real Eurotherm uses timeouts instead of terminators to assess when a command is finished, so requests are
+    # framed on the line going quiet for the idle gap in seconds
+    idle_gap = 0.02
+    out_terminator = ETX
+
+    def create_deframer(self):
+        return IdleGapDeframer(self.idle_gap)
+
+    def _bind_device(self):
+        super(EurothermStreamInterface, self)._bind_device()
+        reads = {
+            "PV": self.get_current_temperature,
+            "SP": self.get_ramp_setpoint,
+            "OP": self.get_output,
+            "HO": self.get_max_output,
+            "AT": self.get_autotune,
+            "XP": self.get_proportional,
+            "TD": self.get_derivative,
+            "TI": self.get_integral,
+            "HS": self.get_highlim,
+            "LS": self.get_lowlim,
+        }
+        writes = {
+            "SL": self.set_ramp_setpoint,
+        }
+        self.bound_commands = [BisynchFrames(self._device, reads, writes)]
 
     def handle_error(self, request, error):
         """
@@ -43,87 +123,87 @@ class EurothermStreamInterface(StreamInterface):
         self.log.error("An error occurred at request " + repr(request) + ": " + repr(error))
 
     @if_connected
-    def get_proportional(self):
+    def get_proportional(self, controller):
         """
         TODO: Get the proportional of the device's PID values
         """
         return "\x02XP0"
 
     @if_connected
-    def get_integral(self):
+    def get_integral(self, controller):
         """
         TODO: Get the integral of the device's PID values
         """
         return "\x02TI0"
 
     @if_connected
-    def get_derivative(self):
+    def get_derivative(self, controller):
         """
         TODO: Get the derivative of the device's PID values
         """
         return "\x02TD0"
 
     @if_connected
-    def get_output(self):
+    def get_output(self, controller):
         """
         TODO: Get the output of the device
         """
         return "\x02OP0"
 
     @if_connected
-    def get_highlim(self):
+    def get_highlim(self, controller):
         """
         TODO: Get the high limit of the device
         """
         return "\x02HS0"
 
     @if_connected
-    def get_lowlim(self):
+    def get_lowlim(self, controller):
         """
         TODO: Get the low limit of the device
         """
         return "\x02LS0"
 
     @if_connected
-    def get_max_output(self):
+    def get_max_output(self, controller):
         """
         TODO: Get the max output of the device
         """
         return "\x02HO0"
 
     @if_connected
-    def get_autotune(self):
+    def get_autotune(self, controller):
         """
         TODO: Get the max output of the device
         """
         return "\x02AT0"
 
     @if_connected
-    def get_current_temperature(self):
+    def get_current_temperature(self, controller):
         """
         Get the current temperature of the device.
 
         Returns: the current temperature formatted like the Eurotherm protocol.
         """
-        return "\x02PV{}".format(self._device.current_temperature)
+        return "\x02PV{}".format(controller.current_temperature)
 
     @if_connected
-    def get_ramp_setpoint(self):
+    def get_ramp_setpoint(self, controller):
         """
         Get the set point temperature.
 
         Returns: the current set point temperature formatted like the Eurotherm protocol.
         """
-        return "\x02SP{}".format(self._device.ramp_setpoint_temperature)
+        return "\x02SP{}".format(controller.ramp_setpoint_temperature)
 
     @if_connected
-    def set_ramp_setpoint(self, temperature, _):
+    def set_ramp_setpoint(self, controller, temperature):
         """
         Set the set point temperature.
 
         Args:
+            controller: the controller addressed.
             temperature: the temperature to set the setpoint to.
-            _: unused argument captured by the command.
 
         """
-        self._device.ramp_setpoint_temperature = temperature
+        controller.ramp_setpoint_temperature = float(temperature)
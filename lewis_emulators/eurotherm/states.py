@@ -1,5 +1,4 @@
 from lewis.core.statemachine import State
-from lewis.core import approaches
 
 
 class DefaultState(State):
@@ -8,3 +7,6 @@ class DefaultState(State):
     """
     NAME = 'Default'
 
+    def in_state(self, dt):
+        for controller in self._context.controllers.values():
+            controller.advance(dt)
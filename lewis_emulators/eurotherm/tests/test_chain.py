@@ -0,0 +1,81 @@
+import unittest
+from hamcrest import assert_that, is_, none, close_to
+
+from lewis_emulators.eurotherm.device import SimulatedEurotherm, bisynch_address
+from lewis_emulators.eurotherm.interfaces import EurothermStreamInterface
+
+
+def read(address, mnemonic):
+    return "\x04{}{}\x05".format(address, mnemonic)
+
+
+def write(address, mnemonic, value):
+    return "\x04{}\x02{}{}\x03B".format(address, mnemonic, value)
+
+
+class EurothermChainTests(unittest.TestCase):
+    """
+    Tests for a chain of Eurotherm controllers sharing one serial line.
+    """
+
+    def setUp(self):
+        self.device = SimulatedEurotherm(override_initial_data=dict(addresses=range(1, 17)))
+        self.interface = EurothermStreamInterface()
+        self.interface.device = self.device
+        self.frames = self.interface.bound_commands[0]
+
+    def _request(self, request):
+        assert_that(self.frames.can_process(request), is_(True))
+        return self.frames.process_request(request)
+
+    def test_that_GIVEN_controller_numbers_THEN_addresses_repeat_group_and_unit_digits(self):
+        assert_that(bisynch_address(1), is_("0011"))
+        assert_that(bisynch_address(12), is_("1122"))
+        assert_that(self.device.addresses[-1], is_("1166"))
+
+    def test_that_GIVEN_an_address_as_older_versions_kept_it_THEN_it_is_read_as_the_controller_number(self):
+        self.device.address = "A1"
+        assert_that(self.device.address, is_("0011"))
+
+        self.device.address = "A20"
+        assert_that(self.device.address, is_("2200"))
+        assert_that(self._request(read("2200", "SP")), is_("\x02SP0.0"))
+
+    def test_that_GIVEN_a_frame_THEN_the_matcher_describes_the_frames(self):
+        self._request(read("0011", "PV"))
+
+        assert_that(self.frames.matcher.pattern, is_("EI-Bisynch frames"))
+
+    def test_that_GIVEN_a_write_to_one_controller_THEN_only_that_controller_changes(self):
+        self._request(write("0033", "SL", "12.5"))
+
+        assert_that(self._request(read("0033", "SP")), is_("\x02SP12.5"))
+        assert_that(self._request(read("0011", "SP")), is_("\x02SP0.0"))
+        assert_that(self.device.ramp_setpoint_temperature, is_(0.0))
+
+    def test_that_GIVEN_an_address_with_no_connected_controller_THEN_there_is_no_reply(self):
+        self.device.controllers["0022"].connected = False
+
+        assert_that(self._request(read("0022", "PV")), none())
+        assert_that(self._request(read("9999", "PV")), none())
+
+    def test_that_GIVEN_a_malformed_frame_THEN_it_can_not_be_processed(self):
+        for request in ("0011PV\x05", "\x040011ZZ\x05", "\x040011PV", "\x040011\x02SL1.0B"):
+            assert_that(self.frames.can_process(request), is_(False))
+
+    def test_that_GIVEN_ramping_controllers_THEN_each_ramps_at_its_own_rate(self):
+        for address, rate in (("0011", 6.0), ("0022", 60.0)):
+            controller = self.device.controllers[address]
+            controller.ramp_rate = rate
+            controller.ramp_setpoint_temperature = 100.0
+            controller.ramping_on = True
+
+        for controller in self.device.controllers.values():
+            controller.advance(10.0)
+
+        assert_that(self.device.controllers["0011"].current_temperature, close_to(1.0, 1e-9))
+        assert_that(self.device.controllers["0022"].current_temperature, close_to(10.0, 1e-9))
+        assert_that(self.device.controllers["0033"].current_temperature, is_(0.0))
+
+    def test_that_GIVEN_a_frame_ending_with_the_terminator_older_IOCs_added_THEN_it_is_processed(self):
+        assert_that(self._request(read("0011", "PV") + "\r\n"), is_("\x02PV0.0"))
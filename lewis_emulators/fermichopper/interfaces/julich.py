@@ -0,0 +1,81 @@
+VALID_CHARACTERS = "#0123456789ABCDEFGH"
+
+# Frames made of these characters only have a checksum of 00
+_ZERO_CHARACTERS = frozenset("#0")
+
+# What each character adds to a checksum
+_CONTRIBUTIONS = {character: ord(character) for character in VALID_CHARACTERS}
+
+# The checksum of each low byte of a sum
+_HEX_BYTES = tuple("{:02X}".format(byte) for byte in range(256))
+
+WORD_FORMAT = "{:04X}"
+
+
+class JulichCodec(object):
+    """
+    Encodes and verifies the frames of the Julich chopper controller protocol: a # and a header character, four
+    characters of data and a checksum of two hex digits, the low byte of the sum of the characters.
+
+    The frames of a reply are cached by their header, so a frame is only encoded again when its value changes.
+    """
+
+    def __init__(self, checksum_start=0):
+        """
+        :param checksum_start: the index of the first character of a frame included in its checksum; 1 to leave out
+            the leading #
+        """
+        self.checksum_start = checksum_start
+        self._frames = {}
+
+    def checksum(self, alldata):
+        """
+        Calculates the Julich checksum of the given data
+        :param alldata: the input data (str or list of chars)
+        :return: the Julich checksum of the given input data
+        """
+        try:
+            contributions = [_CONTRIBUTIONS[character] for character in alldata]
+        except KeyError:
+            raise AssertionError("Invalid character can't calculate checksum")
+        if _ZERO_CHARACTERS.issuperset(alldata):
+            return "00"
+        return _HEX_BYTES[sum(contributions[self.checksum_start:]) & 0xFF]
+
+    def verify(self, header, data, actual_checksum):
+        """
+        Verifies that the checksum of received data is correct.
+        :param header: The leading # and the first byte (str, length 2)
+        :param data: The data bytes (str, length 4)
+        :param actual_checksum: The transmitted checksum (str, length 2)
+        :return: Nothing
+        :raises: AssertionError: If the checksum didn't match or the inputs were invalid
+        """
+        assert len(header) == 2, "Header should have length 2"
+        assert len(data) == 4, "Data should have length 4"
+        assert len(actual_checksum) == 2, "Actual checksum should have length 2"
+        assert self.checksum(header + data) == actual_checksum, "Checksum did not match"
+
+    def append(self, data):
+        """
+        Utility method for appending the Julich checksum to the input data
+        :param data: the input data
+        :return: the input data with it's checksum appended
+        """
+        assert len(data) == 6, "Unexpected data length."
+        return data + self.checksum(data)
+
+    def frame(self, header, value, data_format=WORD_FORMAT):
+        """
+        Encodes a frame of a reply, reusing the frame encoded last time for the header if the value is the same
+        :param header: The leading # and the first byte (str, length 2)
+        :param value: The value the data of the frame is formatted from
+        :param data_format: The format of the data (four characters); a word in hex by default
+        :return: the frame with its checksum
+        """
+        cached = self._frames.get(header)
+        if cached is not None and cached[0] == value:
+            return cached[1]
+        frame = self.append(header + data_format.format(value))
+        self._frames[header] = (value, frame)
+        return frame
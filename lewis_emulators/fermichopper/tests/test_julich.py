@@ -0,0 +1,35 @@
+import unittest
+from hamcrest import assert_that, is_, same_instance
+
+from lewis_emulators.fermichopper.interfaces.julich import JulichCodec
+
+
+class JulichCodecTests(unittest.TestCase):
+    """
+    Tests for encoding and verifying the frames of the Julich chopper controller protocol.
+    """
+
+    def test_that_GIVEN_a_checksum_start_THEN_characters_before_it_are_left_out_of_the_checksum(self):
+        # "10003" sums to 0xF4, and the # adds 0x23
+        assert_that(JulichCodec(checksum_start=1).append("#10003"), is_("#10003F4"))
+        assert_that(JulichCodec().append("#10003"), is_("#1000317"))
+
+    def test_that_GIVEN_a_frame_of_zeros_THEN_its_checksum_is_zero(self):
+        assert_that(JulichCodec().checksum("#00000"), is_("00"))
+
+    def test_that_GIVEN_an_invalid_character_or_checksum_THEN_verification_fails(self):
+        codec = JulichCodec(checksum_start=1)
+
+        codec.verify("#3", "0ABC", "29")
+        for header, data, checksum in (("#3", "0ABC", "28"), ("#3", "0abc", "29"), ("#3", "0AB", "29")):
+            with self.assertRaises(AssertionError):
+                codec.verify(header, data, checksum)
+
+    def test_that_GIVEN_a_frame_with_the_same_value_THEN_it_is_not_encoded_again(self):
+        codec = JulichCodec(checksum_start=1)
+
+        frame = codec.frame("#9", 0x132)
+        assert_that(frame, is_("#90132FF"))
+        assert_that(codec.frame("#9", 0x132), is_(same_instance(frame)))
+        assert_that(codec.frame("#9", 0x133), is_("#9013300"))
+        assert_that(codec.frame("#1", "0003", "{}"), is_("#10003F4"))
@@ -1,4 +1,5 @@
 from collections import OrderedDict
+from .memory import DataMemory, Int16MemoryView, Int32MemoryView, Float32MemoryView
 from .states import DefaultState
 from lewis.devices import StateMachineDevice
 
@@ -10,6 +11,9 @@ class SimulatedFinsPLC(StateMachineDevice):
 
     HELIUM_RECOVERY_NODE = 58
 
+    # Number of 16 bit words in the DM (data memory) area, D0 to D32767
+    DM_AREA_WORDS = 32768
+
     #  a dictionary representing the mapping between pv names, and the memory addresses in the helium recovery FINS PLC
     #  that store the data corresponding to each PV.
     PV_NAME_MEMORY_MAPPING = {
@@ -168,8 +172,12 @@ class SimulatedFinsPLC(StateMachineDevice):
 
         self.connected = True
 
+        # The whole DM area in a single block of bytes, which is what memory area reads are served from. The typed
+        # memories below are views of values stored in it.
+        self.data_memory = DataMemory(SimulatedFinsPLC.DM_AREA_WORDS)
+
         #  represents the part of the plc memory that stores 16 bit ints.
-        self.int16_memory = {
+        self.int16_memory = Int16MemoryView(self.data_memory, {
             # memory locations in the order they appear in the substitutions file (except the heartbeat)
             19500: 0,  # heartbeat
             19501: 0,  # mcp bank 1 TS2 helium gas resupply
@@ -276,10 +284,10 @@ class SimulatedFinsPLC(StateMachineDevice):
             19993: 0,  # motorised valve 178 status
             19994: 0,  # control valve 103 status
             19995: 0  # control valve 111 status
-        }
+        })
 
         #  represents the part of the plc memory that stores 32 bit ints, in the order they appear in the memory map
-        self.int32_memory = {
+        self.int32_memory = Int32MemoryView(self.data_memory, {
             19700: 0,  # R108 U40 gas counter
             19702: 0,  # R108 dewar farm gas counter
             19704: 0,  # gas counter R55 total
@@ -307,11 +315,11 @@ class SimulatedFinsPLC(StateMachineDevice):
             19766: 0,  # gas counter IMAT
             19768: 0,  # gas counter LET and NIMROD
             19772: 0  # gas counter R80 west
-        }
+        })
 
         # represents the part of the plc memory that stores floating point numbers, in the order they appear in the
         # memory map. Comments explaining what each memory location is are in the name to address mappings above.
-        self.float_memory = {address: 0 for address in range(19876, 19886, 2)}
+        self.float_memory = Float32MemoryView(self.data_memory, {address: 0 for address in range(19876, 19886, 2)})
 
     def _get_state_handlers(self):
         return {
@@ -352,11 +360,48 @@ class SimulatedFinsPLC(StateMachineDevice):
         """
         memory_location = SimulatedFinsPLC.PV_NAME_MEMORY_MAPPING[pv_name]
 
-        if memory_location in self.int16_memory.keys():
+        if memory_location in self.int16_memory:
             self.int16_memory[memory_location] = data
-        elif memory_location in self.int32_memory.keys():
+        elif memory_location in self.int32_memory:
             self.int32_memory[memory_location] = data
-        elif memory_location in self.float_memory.keys():
+        elif memory_location in self.float_memory:
             self.float_memory[memory_location] = data
         else:
             raise ValueError("the pv name maps to a memory address that is not recognized by the emulator memory.")
+
+    def read_words(self, memory_start_address, number_of_words):
+        """
+        Reads a block of consecutive words from the DM area without copying them.
+
+        Args:
+            memory_start_address (int): The address of the first word.
+            number_of_words (int): The number of words to read.
+
+        Returns:
+            memoryview: The words, each 2 bytes in big endian.
+
+        Raises:
+            ValueError: if the block is not entirely inside the DM area.
+        """
+        return self.data_memory.read_words(memory_start_address, number_of_words)
+
+    def get_memory_snapshot(self):
+        """
+        Takes a copy of the whole DM area, e.g. to restore it after a test.
+
+        Returns:
+            string: The bytes of the DM area in hexadecimal.
+        """
+        return self.data_memory.snapshot()
+
+    def restore_memory_snapshot(self, snapshot):
+        """
+        Restores the whole DM area from a copy taken with get_memory_snapshot.
+
+        Args:
+            snapshot (string): The bytes of the DM area in hexadecimal.
+
+        Returns:
+            None.
+        """
+        self.data_memory.restore(snapshot)
@@ -1,4 +1,4 @@
-from lewis_emulators.utils.byte_conversions import int_to_raw_bytes, float_to_raw_bytes, raw_bytes_to_int
+from lewis_emulators.utils.frame_builder import FrameBuilder
 from ..device import SimulatedFinsPLC
 
 
@@ -18,7 +18,7 @@ def check_is_byte(character):
 
 
 def dm_memory_area_read_response_fins_frame(device, client_network_address, client_node_address, client_unit_address,
-                                            service_id, memory_start_address, number_of_words_to_read):
+                                            service_id, memory_start_address, number_of_words_to_read, builder=None):
     """
     Returns a response to a DM memory area read command.
 
@@ -26,7 +26,7 @@ def dm_memory_area_read_response_fins_frame(device, client_network_address, clie
         10 bytes FINS frame header.
         2 bytes (integer): Command code, for memory area read in this case.
         2 bytes (integer): End code. Shows errors.
-        2 bytes for every word read.
+        2 bytes for every word read, big endian.
 
     Args:
         device (device.SimulatedFinsPLC): The Lewis device.
@@ -36,92 +36,33 @@ def dm_memory_area_read_response_fins_frame(device, client_network_address, clie
         service_id (int): The service ID of the original command.
         memory_start_address (int): The memory address from where reading starts.
         number_of_words_to_read (int): The number of words to be read, starting from the start address, inclusive.
+        builder (FinsResponseBuilder): The builder to reuse. A new one is created if None.
 
     Returns:
         string: the response.
     """
     # The length argument asks for number of bytes, and each word has two bytes
-    fins_reply = FinsResponseBuilder() \
+    fins_reply = (FinsResponseBuilder() if builder is None else builder.reset()) \
         .add_fins_frame_header(device.network_address, device.unit_address, client_network_address,
                                client_node_address, client_unit_address, service_id) \
         .add_fins_command_and_error_codes()
 
-    #  The plc has 2 byte words. The command asks for 1 word if the memory address stores a 16 bit integer, or 2 words
-    #  if it stores a 32 bit integer, or a real number.
-    if number_of_words_to_read == 1:
-        fins_reply = fins_reply.add_int(device.int16_memory[memory_start_address], 2)
-
-    #  The FINS driver does not recognise 32 bit ints. Instead, it represents 32 bit ints as an array of two 16 bit
-    #  ints. Although the 16 bit ints are in big endian, in the array the first int is the least significant int, and
-    #  the second one is the most significant one.
-    elif number_of_words_to_read == 2:
-        # convert 32 bit int to array of two ints
-        data = _convert_32bit_int_to_int16_array(device.int32_memory[memory_start_address])
-        fins_reply = fins_reply.add_int(data[0], 2).add_int(data[1], 2)
-    # The asyn device support for ai records makes the IOC ask for 4 words, even though the real numbers are only 2
-    # words long
-    elif number_of_words_to_read == 4:
-        data = _convert_32bit_float_to_int16_array(device.float_memory[memory_start_address])
-        fins_reply = fins_reply.add_int(data[0], 2).add_int(data[1], 2)
+    # The asyn device support for ai records makes the IOC ask for 4 words when reading a real number, even though
+    # real numbers are only 2 words long, and it expects a reply with just those 2 words.
+    if number_of_words_to_read == 4 and memory_start_address in device.float_memory:
+        number_of_words_to_read = 2
 
-    return fins_reply.build()
-
-
-def _convert_32bit_int_to_int16_array(number):
-    """
-    Converts a 32 bit integer into an array of two 16 bit integers. The first 16 bit integer is the least significant
-    one, and the second is the most significant. The order of the 16 bit integers in the array is little endian.
-
-    Args:
-        number (int): The number to be converted. But the individual 16 bit ints are encoded in big endian.
-
-    Returns:
-        int list: a list, with the first element being the least significant byte of the given number, and the second
-            element being the most significant byte.
-    """
-    if type(number) != int:
-        raise TypeError("number argument must always be an integer!")
-
-    raw_bytes_representation = int_to_raw_bytes(number, 4, False)
-
-    least_significant_byte = raw_bytes_to_int(raw_bytes_representation[2:4], low_bytes_first=False)
-    most_significant_byte = raw_bytes_to_int(raw_bytes_representation[:2], low_bytes_first=False)
-
-    return [least_significant_byte, most_significant_byte]
-
-
-def _convert_32bit_float_to_int16_array(number):
-    """
-    Converts a 32 bit real number into an array of two 16 bit integers. The first 16 bit integer is the least
-    significant one, and the second is the most significant. The order of the 16 bit integers in the array is little
-    endian.
+    #  The memory is stored exactly as it is sent, so any block of words can be copied straight from it.
+    fins_reply = fins_reply.add_bytes(device.read_words(memory_start_address, number_of_words_to_read))
 
-    Args:
-        number (float): The number to be converted. But the individual 16 bit ints are encoded in big endian.
-
-    Returns:
-        int list: a list, with the first element being the least significant byte of the given number, and the second
-            element being the most significant byte.
-    """
-    if type(number) != int and type(number) != float:
-        raise TypeError("number argument must always be a real number! {}".format(type(number)))
-
-    raw_bytes_representation = float_to_raw_bytes(number, False)
-
-    least_significant_byte = raw_bytes_to_int(raw_bytes_representation[2:4], low_bytes_first=False)
-    most_significant_byte = raw_bytes_to_int(raw_bytes_representation[:2], low_bytes_first=False)
-
-    return [least_significant_byte, most_significant_byte]
+    return fins_reply.build()
 
 
-class FinsResponseBuilder(object):
+class FinsResponseBuilder(FrameBuilder):
     """
     Response builder which formats the responses as bytes.
     """
 
-    def __init__(self):
-        self.response = ""
-
     def add_int(self, value, length):
         """
         Adds an integer to the builder.
@@ -133,8 +74,7 @@ class FinsResponseBuilder(object):
         Returns:
             FinsResponseBuilder: The builder.
         """
-        self.response += int_to_raw_bytes(value, length, False)
-        return self
+        return self.add_uint(value, length, False)
 
     def add_float(self, value):
         """
@@ -146,8 +86,7 @@ class FinsResponseBuilder(object):
         Returns:
             response_utilities.FinsResponseBuilder: The builder.
         """
-        self.response += float_to_raw_bytes(value, False)
-        return self
+        return self.add_float32(value, False)
 
     def add_fins_frame_header(self, emulator_network_address, emulator_unit_address, client_network_address,
                               client_node, client_unit_address, service_id):
@@ -198,13 +137,3 @@ class FinsResponseBuilder(object):
 
         # The memory area read command code is 0101, and the 0000 is the No error code.
         return self.add_int(0x0101, 2).add_int(0x0000, 2)
-
-    def build(self):
-        """
-        Gets the response from the builder.
-
-        Returns:
-            FinsResponseBuilder: The response builder.
-        """
-
-        return self.response
@@ -2,23 +2,38 @@ from lewis.adapters.stream import StreamInterface, Cmd
 from lewis.core.logging import has_log
 
 from lewis_emulators.utils.byte_conversions import raw_bytes_to_int
-from .response_utilities import check_is_byte, dm_memory_area_read_response_fins_frame
+from lewis_emulators.utils.framing import FramedStreamInterface, IdleGapDeframer
+from .response_utilities import check_is_byte, dm_memory_area_read_response_fins_frame, FinsResponseBuilder
 from ..device import SimulatedFinsPLC
 
 
+# The most words a memory area read command can ask for in one FINS frame
+MAX_WORDS_PER_READ = 999
+
+
 @has_log
-class FinsPLCStreamInterface(StreamInterface):
+class FinsPLCStreamInterface(FramedStreamInterface, StreamInterface):
 
     # Commands that we expect via serial during normal operation. Match anything!
     commands = {
         Cmd("any_command", "^([\s\S]*)$"),
     }
 
-    in_terminator = ""
-    out_terminator = in_terminator
+    out_terminator = ""
+
+    # FINS frames have no terminator, so a frame ends when the client stops sending
+    idle_gap = 0.1
 
     do_log = True
 
+    def __init__(self):
+        super(FinsPLCStreamInterface, self).__init__()
+        # Requests are handled one at a time, so every reply can be built in the same buffer
+        self._response_builder = FinsResponseBuilder()
+
+    def create_deframer(self):
+        return IdleGapDeframer(self.idle_gap)
+
     def handle_error(self, request, error):
         error_message = "An error occurred at request " + repr(request) + ": " + repr(error)
         self.log.error(error_message)
@@ -69,27 +84,19 @@ class FinsPLCStreamInterface(StreamInterface):
 
         number_of_words_to_read = raw_bytes_to_int(command[16:18], low_bytes_first=False)
 
-        # The helium recovery PLC memory map has addresses that store types that take up either one word (16 bits) or
-        # two. Most take up one word, so if the number of words to read is two we check that the client wants to read
-        # from a memory location from where a 32 bit value starts.
-        if number_of_words_to_read == 2 and memory_start_address not in self.device.int32_memory.keys():
-            raise ValueError("The memory start address {} corresponds to a single word in the memory map, "
-                             "not two.".format(memory_start_address))
-        # The PLC also stores 32 bit floating point numbers, but the asyn device support makes the IOC ask for 4 bytes
-        # instead of two.
-        elif number_of_words_to_read == 4 and memory_start_address not in self.device.float_memory.keys():
-            raise ValueError("The only commands that should ask for 4 words are for reading memory locations that "
-                             "store real numbers, which {} is not.".format(memory_start_address))
-        elif number_of_words_to_read > 4 or number_of_words_to_read == 3:
-            raise ValueError("The memory map only specifies data types for which commands should ask for one, two or "
-                             "four words at most .")
+        # A memory area read can ask for any block of contiguous words in the DM area, up to the maximum a single FINS
+        # frame can carry, e.g. to read many PVs in one go.
+        if not 1 <= number_of_words_to_read <= MAX_WORDS_PER_READ:
+            raise ValueError("The number of words to read must be between 1 and {}, not {}.".format(
+                MAX_WORDS_PER_READ, number_of_words_to_read))
 
         self._log_command_contents(client_network_address, client_node_address, client_unit_address, service_id,
                                    memory_start_address, number_of_words_to_read)
 
         reply = dm_memory_area_read_response_fins_frame(self.device, client_network_address,
                                                         client_node_address, client_unit_address, service_id,
-                                                        memory_start_address, number_of_words_to_read)
+                                                        memory_start_address, number_of_words_to_read,
+                                                        self._response_builder)
 
         self._log_fins_frame(reply, True)
 
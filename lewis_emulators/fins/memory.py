@@ -0,0 +1,186 @@
+import abc
+import binascii
+import struct
+
+import six
+
+# The PLC has 2 byte words, each encoded in big endian
+_WORD = struct.Struct(">H")
+_SIGNED_WORD = struct.Struct(">h")
+_TWO_WORDS = struct.Struct(">HH")
+_INT32 = struct.Struct(">i")
+_FLOAT32 = struct.Struct(">f")
+
+
+class DataMemory(object):
+    """
+    The DM (data memory) area of the PLC as a single block of bytes, stored exactly as it is sent in a FINS reply.
+    """
+
+    def __init__(self, number_of_words):
+        """
+        Args:
+            number_of_words (int): The size of the DM area in 16 bit words.
+        """
+        self.number_of_words = number_of_words
+        self.image = bytearray(2 * number_of_words)
+
+    def read_words(self, memory_start_address, number_of_words):
+        """
+        Reads a block of consecutive words without copying them. Any words in the DM area can be read, as on the PLC,
+        whether or not a value is mapped to them; words which have never been written read as 0.
+
+        Args:
+            memory_start_address (int): The address of the first word.
+            number_of_words (int): The number of words to read.
+
+        Returns:
+            memoryview: The words, each 2 bytes in big endian.
+
+        Raises:
+            ValueError: if the block is not entirely inside the DM area.
+        """
+        if memory_start_address < 0 or memory_start_address + number_of_words > self.number_of_words:
+            raise ValueError("Reading {} words from address {} goes outside the DM area.".format(
+                number_of_words, memory_start_address))
+        return memoryview(self.image)[2 * memory_start_address:2 * (memory_start_address + number_of_words)]
+
+    def snapshot(self):
+        """
+        Takes a copy of the whole DM area in a form that can be passed through the backdoor.
+
+        Returns:
+            string: The bytes of the DM area in hexadecimal.
+        """
+        return binascii.hexlify(self.image).decode("ascii")
+
+    def restore(self, snapshot):
+        """
+        Restores the whole DM area from a copy taken with snapshot.
+
+        Args:
+            snapshot (string): The bytes of the DM area in hexadecimal.
+
+        Returns:
+            None.
+        """
+        image = binascii.unhexlify(snapshot)
+        if len(image) != len(self.image):
+            raise ValueError("The snapshot is {} bytes long but the DM area is {} bytes.".format(
+                len(image), len(self.image)))
+        self.image[:] = image
+
+
+@six.add_metaclass(abc.ABCMeta)
+class _TypedMemoryView(object):
+    """
+    A dictionary-like view of values of one type stored at a set of addresses in the DM area. Values are read from and
+    written to the memory image directly, so a value reads back as the PLC holds it (and the IOC reads it) rather than
+    exactly as it was written, e.g. a 16 bit value outside the range of the word wraps.
+    """
+
+    def __init__(self, memory, initial_values):
+        """
+        Args:
+            memory (DataMemory): The memory the values are stored in.
+            initial_values (dict): The addresses of the values, mapped to the value to store initially.
+        """
+        self._memory = memory
+        self._addresses = frozenset(initial_values.keys())
+        for address, value in initial_values.items():
+            self._write(2 * address, value)
+
+    @abc.abstractmethod
+    def _write(self, offset, value):
+        """
+        Writes a value to the memory image.
+
+        Args:
+            offset (int): The offset of the value in bytes.
+            value: The value.
+        """
+
+    @abc.abstractmethod
+    def _read(self, offset):
+        """
+        Reads a value from the memory image.
+
+        Args:
+            offset (int): The offset of the value in bytes.
+
+        Returns:
+            The value.
+        """
+
+    def keys(self):
+        return self._addresses
+
+    def __contains__(self, address):
+        return address in self._addresses
+
+    def __iter__(self):
+        return iter(self._addresses)
+
+    def __len__(self):
+        return len(self._addresses)
+
+    def __getitem__(self, address):
+        if address not in self._addresses:
+            raise KeyError(address)
+        return self._read(2 * address)
+
+    def __setitem__(self, address, value):
+        if address not in self._addresses:
+            raise KeyError(address)
+        self._write(2 * address, value)
+
+    def items(self):
+        return [(address, self[address]) for address in self._addresses]
+
+
+class Int16MemoryView(_TypedMemoryView):
+    """
+    Values stored as a single 16 bit word. They read back as signed 16 bit integers, so a value from 32768 to 65535
+    written to a word reads back as a negative number with the same bits.
+    """
+
+    def _write(self, offset, value):
+        _WORD.pack_into(self._memory.image, offset, int(value) & 0xFFFF)
+
+    def _read(self, offset):
+        return _SIGNED_WORD.unpack_from(self._memory.image, offset)[0]
+
+
+class Int32MemoryView(_TypedMemoryView):
+    """
+    32 bit integers. The FINS driver does not recognise 32 bit ints. Instead, it represents them as an array of two 16
+    bit ints. Although the 16 bit ints are in big endian, in the array the first int is the least significant int,
+    and the second one is the most significant one.
+    """
+
+    def _write(self, offset, value):
+        if type(value) != int:
+            raise TypeError("number argument must always be an integer!")
+        value &= 0xFFFFFFFF
+        _TWO_WORDS.pack_into(self._memory.image, offset, value & 0xFFFF, value >> 16)
+
+    def _read(self, offset):
+        least_significant_word, most_significant_word = _TWO_WORDS.unpack_from(self._memory.image, offset)
+        return _INT32.unpack(_TWO_WORDS.pack(most_significant_word, least_significant_word))[0]
+
+
+class Float32MemoryView(_TypedMemoryView):
+    """
+    Real numbers (IEEE single-precision), stored as two words with the least significant word first like 32 bit
+    integers.
+    """
+
+    def _write(self, offset, value):
+        if type(value) != int and type(value) != float:
+            raise TypeError("number argument must always be a real number! {}".format(type(value)))
+        most_significant_word, least_significant_word = _TWO_WORDS.unpack(_FLOAT32.pack(value))
+        _TWO_WORDS.pack_into(self._memory.image, offset, least_significant_word, most_significant_word)
+
+    def _read(self, offset):
+        least_significant_word, most_significant_word = _TWO_WORDS.unpack_from(self._memory.image, offset)
+        return _FLOAT32.unpack(_TWO_WORDS.pack(most_significant_word, least_significant_word))[0]
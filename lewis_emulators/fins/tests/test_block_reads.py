@@ -0,0 +1,66 @@
+import struct
+import unittest
+from hamcrest import assert_that, is_, calling, raises
+
+from lewis_emulators.fins.device import SimulatedFinsPLC
+from lewis_emulators.fins.interfaces import FinsPLCStreamInterface
+from lewis_emulators.fins.interfaces.stream_interface import MAX_WORDS_PER_READ
+
+# Size of the FINS frame header, command code and end code at the start of a reply
+REPLY_HEADER_LENGTH = 14
+
+
+def memory_area_read(memory_start_address, number_of_words):
+    """
+    A memory area read command for words of the DM area, as a string with a character per byte.
+    """
+    command = struct.pack(">10BHBHBH", 0x80, 0x00, 0x02, 0x00, SimulatedFinsPLC.HELIUM_RECOVERY_NODE, 0x00,
+                          0x00, 0x01, 0x00, 0x07, 0x0101, 0x82, memory_start_address, 0x00, number_of_words)
+    return command.decode("latin-1")
+
+
+class FinsBlockReadTests(unittest.TestCase):
+    """
+    Tests for reading blocks of words of the DM area.
+    """
+
+    def setUp(self):
+        self.device = SimulatedFinsPLC()
+        self.interface = FinsPLCStreamInterface()
+        self.interface.device = self.device
+        self.interface.do_log = False
+
+    def _read_words(self, memory_start_address, number_of_words):
+        reply = self.interface.any_command(memory_area_read(memory_start_address, number_of_words))
+        data = bytes(reply[REPLY_HEADER_LENGTH:])
+        return list(struct.unpack(">{}H".format(len(data) // 2), data))
+
+    def test_that_GIVEN_a_read_of_several_words_THEN_all_of_them_are_returned_in_order(self):
+        self.device.int16_memory[19500] = 1
+        self.device.int16_memory[19501] = 2
+        self.device.int16_memory[19502] = 3
+
+        assert_that(self._read_words(19500, 3), is_([1, 2, 3]))
+
+    def test_that_GIVEN_a_read_of_the_most_words_allowed_THEN_they_are_all_returned(self):
+        self.device.int16_memory[19500] = 5
+
+        words = self._read_words(19500, MAX_WORDS_PER_READ)
+
+        assert_that(len(words), is_(MAX_WORDS_PER_READ))
+        assert_that(words[0], is_(5))
+
+    def test_that_GIVEN_a_read_of_no_words_or_too_many_THEN_it_is_an_error(self):
+        for number_of_words in (0, MAX_WORDS_PER_READ + 1):
+            assert_that(calling(self.interface.any_command).with_args(memory_area_read(19500, number_of_words)),
+                        raises(ValueError))
+
+    def test_that_GIVEN_a_read_of_4_words_of_a_real_number_THEN_only_its_2_words_are_returned(self):
+        self.device.float_memory[19876] = 1.5
+
+        words = self._read_words(19876, 4)
+
+        assert_that(words, is_([0x0000, 0x3FC0]))
+
+    def test_that_GIVEN_a_read_of_4_words_elsewhere_THEN_all_4_are_returned(self):
+        assert_that(self._read_words(19500, 4), is_([0, 0, 0, 0]))
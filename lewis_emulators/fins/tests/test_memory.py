@@ -0,0 +1,70 @@
+import unittest
+from hamcrest import assert_that, is_, calling, raises
+
+from lewis_emulators.fins.device import SimulatedFinsPLC
+from lewis_emulators.fins.memory import DataMemory, Int16MemoryView, Int32MemoryView, Float32MemoryView
+
+
+class FinsMemoryTests(unittest.TestCase):
+    """
+    Tests for the DM area of the PLC and the typed views of it.
+    """
+
+    def setUp(self):
+        self.memory = DataMemory(16)
+        self.int16 = Int16MemoryView(self.memory, {0: 0, 1: 0})
+        self.int32 = Int32MemoryView(self.memory, {2: 0})
+        self.float32 = Float32MemoryView(self.memory, {4: 0})
+
+    def test_that_GIVEN_values_in_range_THEN_they_read_back_as_written(self):
+        self.int16[0] = -5
+        self.int16[1] = 32767
+        self.int32[2] = -123456
+        self.float32[4] = 2.5
+
+        assert_that([self.int16[0], self.int16[1], self.int32[2], self.float32[4]], is_([-5, 32767, -123456, 2.5]))
+
+    def test_that_GIVEN_a_16_bit_value_which_only_fits_unsigned_THEN_it_reads_back_signed_with_the_same_bits(self):
+        self.int16[0] = 65535
+
+        assert_that(self.int16[0], is_(-1))
+        assert_that(bytes(self.memory.read_words(0, 1)), is_(b"\xff\xff"))
+
+    def test_that_GIVEN_a_32_bit_value_THEN_the_least_significant_word_is_stored_first(self):
+        self.int32[2] = 0x12345678
+
+        assert_that(bytes(self.memory.read_words(2, 2)), is_(b"\x56\x78\x12\x34"))
+
+    def test_that_GIVEN_an_address_with_no_value_mapped_THEN_it_is_not_in_the_view_but_its_word_reads_as_0(self):
+        assert_that(calling(self.int16.__getitem__).with_args(8), raises(KeyError))
+        assert_that(calling(self.int16.__setitem__).with_args(8, 1), raises(KeyError))
+        assert_that(bytes(self.memory.read_words(8, 1)), is_(b"\x00\x00"))
+
+    def test_that_GIVEN_a_read_outside_the_DM_area_THEN_it_is_an_error(self):
+        assert_that(calling(self.memory.read_words).with_args(15, 2), raises(ValueError))
+
+
+class FinsMemorySnapshotTests(unittest.TestCase):
+    """
+    Tests for saving and restoring the DM area of the emulator through the backdoor.
+    """
+
+    def test_that_GIVEN_a_snapshot_THEN_restoring_it_undoes_later_changes(self):
+        device = SimulatedFinsPLC()
+        device.int16_memory[19500] = 7
+        device.float_memory[19876] = 1.25
+        snapshot = device.get_memory_snapshot()
+
+        device.int16_memory[19500] = 8
+        device.float_memory[19876] = 0.0
+        device.restore_memory_snapshot(snapshot)
+
+        assert_that(device.int16_memory[19500], is_(7))
+        assert_that(device.float_memory[19876], is_(1.25))
+
+    def test_that_GIVEN_a_snapshot_of_the_wrong_size_THEN_it_is_not_restored(self):
+        device = SimulatedFinsPLC()
+        device.int16_memory[19500] = 7
+
+        assert_that(calling(device.restore_memory_snapshot).with_args("0000"), raises(ValueError))
+        assert_that(device.int16_memory[19500], is_(7))
@@ -3,6 +3,9 @@ from lewis.core.logging import has_log
 from .states import TemperatureControlState, He3PotEmptyState
 from lewis.devices import StateMachineDevice
 
+from lewis_emulators.utils.ramp import LinearRamp
+from lewis_emulators.utils.thermal_model import ThermalModel
+
 
 class TemperatureChannel(object):
     """
@@ -23,7 +26,7 @@ class SimulatedHeliox(StateMachineDevice):
         """
         Initialize all of the device's attributes.
         """
-        self.temperature = 0
+        self.temperature_ramp = LinearRamp()
         self.temperature_sp = 0
 
         self.temperature_stable = True
@@ -43,6 +46,21 @@ class SimulatedHeliox(StateMachineDevice):
         self.drift_towards = 1.5  # Drift to 1.5K ~= temperature of 1K pot.
         self.drift_rate = 1
 
+        # Thermal model of the He3 pot and of each temperature channel; it is only used once thermal_model_enabled is
+        # set through the backdoor, otherwise the He3 pot ramps and the channels stay where they are set
+        self.thermal_model = ThermalModel()
+        self.thermal_model_enabled = False
+        self.thermal_channel = self.thermal_model.add_channel()
+        self.channel_thermal_channels = {name: self.thermal_model.add_channel() for name in self.temperature_channels}
+
+    @property
+    def temperature(self):
+        return self.temperature_ramp.value
+
+    @temperature.setter
+    def temperature(self, temperature):
+        self.temperature_ramp.value = temperature
+
     def reset(self):
         self._initialize_data()
 
@@ -1,14 +1,53 @@
-from lewis.core import approaches
 from lewis.core.statemachine import State
 
 
+def simulate_thermal_model(device, dt, closed_loop, base_temperature):
+    """
+    Simulates the temperatures of the fridge with its thermal model, which is used instead of the ramp when
+    thermal_model_enabled is set.
+
+    :param device: the Heliox
+    :param dt: the time step in seconds
+    :param closed_loop: whether the He3 pot temperature is controlled to its setpoint
+    :param base_temperature: the temperature the He3 pot cools to without heating
+    """
+    channel = device.thermal_channel
+    channel.closed_loop = closed_loop
+    if not closed_loop:
+        channel.heater = 0
+    channel.setpoint = device.temperature_sp
+    channel.base_temperature = base_temperature
+    channel.temperature = device.temperature
+
+    for name, temperature_channel in device.temperature_channels.items():
+        channel = device.channel_thermal_channels[name]
+        channel.closed_loop = temperature_channel.heater_auto
+        if not temperature_channel.heater_auto:
+            channel.heater = temperature_channel.heater_percent
+        channel.setpoint = temperature_channel.temperature_sp
+        channel.temperature = temperature_channel.temperature
+
+    device.thermal_model.step(dt)
+
+    device.temperature = device.thermal_channel.temperature
+    for name, temperature_channel in device.temperature_channels.items():
+        channel = device.channel_thermal_channels[name]
+        temperature_channel.temperature = channel.temperature
+        temperature_channel.heater_percent = channel.heater
+
+
 class TemperatureControlState(State):
     def in_state(self, dt):
         device = self._context
 
-        rate = 10
+        if device.thermal_model_enabled:
+            simulate_thermal_model(device, dt, closed_loop=True, base_temperature=0.0)
+            return
 
-        device.temperature = approaches.linear(device.temperature, device.temperature_sp, rate, dt)
+        ramp = device.temperature_ramp
+        ramp.rate = 10
+        ramp.target = device.temperature_sp
+        ramp.advance(dt)
 
 
 class He3PotEmptyState(State):
@@ -18,4 +57,12 @@ class He3PotEmptyState(State):
     def in_state(self, dt):
         device = self._context
 
-        device.temperature = approaches.linear(device.temperature, device.drift_towards, device.drift_rate, dt)
+        if device.thermal_model_enabled:
+            # Without 3He in the pot nothing controls it, so it warms towards the drift temperature
+            simulate_thermal_model(device, dt, closed_loop=False, base_temperature=device.drift_towards)
+            return
+
+        ramp = device.temperature_ramp
+        ramp.rate = device.drift_rate
+        ramp.target = device.drift_towards
+        ramp.advance(dt)
@@ -0,0 +1,54 @@
+import unittest
+from hamcrest import assert_that, is_, close_to
+
+from lewis_emulators.heliox.device import SimulatedHeliox
+
+
+class StateTests(unittest.TestCase):
+    """
+    Tests for the temperatures the Heliox reads back.
+    """
+
+    def setUp(self):
+        self.device = SimulatedHeliox()
+        self.device.temperature_sp = 0.3
+        self.device.temperature_channels["HE3SORB"].temperature_sp = 20.0
+
+    def _run(self, seconds, dt=0.1):
+        for _ in range(int(round(seconds / dt))):
+            self.device.process(dt)
+
+    def test_that_GIVEN_the_thermal_model_is_not_enabled_THEN_the_he3_pot_ramps_and_the_channels_stay_put(self):
+        self.device.temperature = 1.0
+
+        self._run(1.0)
+
+        assert_that(self.device.temperature, is_(0.3))
+        assert_that(self.device.temperature_channels["HE3SORB"].temperature, is_(0))
+
+    def test_that_GIVEN_the_thermal_model_THEN_the_he3_pot_and_channels_are_brought_to_their_setpoints(self):
+        self.device.thermal_model_enabled = True
+
+        self._run(600.0)
+
+        assert_that(self.device.temperature, close_to(0.3, 1e-3))
+        assert_that(self.device.temperature_channels["HE3SORB"].temperature, close_to(20.0, 1e-3))
+
+    def test_that_GIVEN_the_thermal_model_and_a_channel_heater_in_manual_THEN_its_heater_stays_as_set(self):
+        self.device.thermal_model_enabled = True
+        channel = self.device.temperature_channels["HE4POT"]
+        channel.heater_auto = False
+        channel.heater_percent = 10.0
+
+        self._run(600.0)
+
+        assert_that(channel.heater_percent, is_(10.0))
+        assert_that(channel.temperature, close_to(100.0, 1e-2))
+
+    def test_that_GIVEN_the_thermal_model_and_the_he3_pot_empty_THEN_it_warms_to_the_drift_temperature(self):
+        self.device.thermal_model_enabled = True
+        self.device.helium_3_pot_empty = True
+
+        self._run(600.0)
+
+        assert_that(self.device.temperature, close_to(self.device.drift_towards, 1e-3))
@@ -2,6 +2,8 @@ from collections import OrderedDict
 from .states import DefaultState
 from lewis.devices import StateMachineDevice
 
+from lewis_emulators.utils.thermal_model import ThermalModel
+
 
 class VTILoopChannel(object):
     """
@@ -79,6 +81,13 @@ class SimulatedIceFridge(StateMachineDevice):
         self.he3_pump = 0
         self.roots_pump = 0
 
+        # Thermal model of the temperatures the VTI loops and the Lakeshore control; it is only used once
+        # thermal_model_enabled is set through the backdoor
+        self.thermal_model = ThermalModel()
+        self.thermal_model_enabled = False
+        self.vti_thermal_channels = {loop_num: self.thermal_model.add_channel() for loop_num in self.vti_loop_channels}
+        self.mc_thermal_channel = self.thermal_model.add_channel()
+
     def _get_state_handlers(self):
         return {
             'default': DefaultState(),
@@ -1,6 +1,7 @@
 from lewis.adapters.stream import StreamInterface, Cmd
 
 from lewis_emulators.utils.command_builder import CmdBuilder
+from lewis_emulators.utils.dispatch import DispatchingStreamInterface, FusedCommandDispatcher
 from lewis.core.logging import has_log
 from lewis_emulators.utils.replies import conditional_reply
 
@@ -8,7 +9,9 @@ if_connected = conditional_reply("connected")
 
 
 @has_log
-class IceFridgeStreamInterface(StreamInterface):
+class IceFridgeStreamInterface(DispatchingStreamInterface, StreamInterface):
+
+    command_dispatcher = FusedCommandDispatcher
 
     # Commands that we expect via serial during normal operation
     commands = {
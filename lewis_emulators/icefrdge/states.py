@@ -1,5 +1,55 @@
 from lewis.core.statemachine import State
 
+# Lakeshore 370 control modes and the heater currents of its ranges, in A
+CMODE_CLOSED_LOOP = 1
+CMODE_ZONE = 2
+CMODE_OPEN_LOOP = 3
+HEATER_RANGE_CURRENTS = (0.0, 31.6e-6, 100e-6, 316e-6, 1e-3, 3.16e-3, 10e-3, 31.6e-3, 100e-3)
+
+# Resistance of the mixing chamber heater in Ohm
+MC_HEATER_RESISTANCE = 100.0
+
 
 class DefaultState(State):
-    pass
+    """
+    Temperatures stay where they are set, unless thermal_model_enabled is set, when the temperatures controlled by
+    the VTI loops and the mixing chamber RuO sensor, which the Lakeshore controls, are simulated with the thermal
+    model.
+    """
+
+    def in_state(self, dt):
+        if self._context.thermal_model_enabled:
+            self._simulate_thermal_model(dt)
+
+    def _simulate_thermal_model(self, dt):
+        device = self._context
+
+        for loop_num, loop in device.vti_loop_channels.items():
+            channel = device.vti_thermal_channels[loop_num]
+            channel.setpoint = loop.vti_loop_temp_setpoint
+            channel.p, channel.i, channel.d = \
+                loop.vti_loop_proportional, loop.vti_loop_integral, loop.vti_loop_derivative
+            channel.temperature = device.vti_temps[loop_num - 1]
+
+        channel = device.mc_thermal_channel
+        try:
+            current = HEATER_RANGE_CURRENTS[device.lakeshore_mc_heater_range]
+        except IndexError:
+            current = 0.0
+        channel.max_power = current ** 2 * MC_HEATER_RESISTANCE
+        channel.closed_loop = device.lakeshore_cmode in (CMODE_CLOSED_LOOP, CMODE_ZONE)
+        if device.lakeshore_cmode == CMODE_OPEN_LOOP:
+            channel.heater = device.lakeshore_mc_heater_percentage
+        elif not channel.closed_loop:
+            channel.heater = 0
+        channel.setpoint = device.lakeshore_mc_temp_setpoint
+        channel.p, channel.i, channel.d = \
+            device.lakeshore_mc_proportional, device.lakeshore_mc_integral, device.lakeshore_mc_derivative
+        channel.temperature = device.lakeshore_mc_ruo
+
+        device.thermal_model.step(dt)
+
+        for loop_num, channel in device.vti_thermal_channels.items():
+            device.vti_temps[loop_num - 1] = channel.temperature
+        device.lakeshore_mc_ruo = device.mc_thermal_channel.temperature
+        device.lakeshore_mc_heater_percentage = device.mc_thermal_channel.heater
@@ -0,0 +1,59 @@
+import unittest
+from hamcrest import assert_that, is_, close_to, greater_than
+
+from lewis_emulators.icefrdge.device import SimulatedIceFridge
+from lewis_emulators.icefrdge.states import CMODE_CLOSED_LOOP, CMODE_OPEN_LOOP
+
+
+class DefaultStateTests(unittest.TestCase):
+    """
+    Tests for the temperatures the ICE fridge reads back.
+    """
+
+    def setUp(self):
+        self.device = SimulatedIceFridge()
+        loop = self.device.vti_loop_channels[1]
+        loop.vti_loop_temp_setpoint = 5.0
+        loop.vti_loop_proportional, loop.vti_loop_integral = 10.0, 2.0
+
+        self.device.lakeshore_cmode = CMODE_CLOSED_LOOP
+        self.device.lakeshore_mc_heater_range = 6
+        self.device.lakeshore_mc_temp_setpoint = 0.05
+        self.device.lakeshore_mc_proportional, self.device.lakeshore_mc_integral = 2000.0, 1000
+
+    def _run(self, seconds, dt=0.1):
+        for _ in range(int(round(seconds / dt))):
+            self.device.process(dt)
+
+    def test_that_GIVEN_the_thermal_model_is_not_enabled_THEN_the_temperatures_stay_where_they_are(self):
+        self._run(10.0)
+
+        assert_that(self.device.vti_temps, is_([0, 0, 0, 0]))
+        assert_that(self.device.lakeshore_mc_ruo, is_(0))
+        assert_that(self.device.lakeshore_mc_heater_percentage, is_(0))
+
+    def test_that_GIVEN_the_thermal_model_THEN_a_vti_loop_brings_its_temperature_to_the_setpoint(self):
+        self.device.thermal_model_enabled = True
+
+        self._run(600.0)
+
+        assert_that(self.device.vti_temps[0], close_to(5.0, 1e-3))
+
+    def test_that_GIVEN_the_thermal_model_THEN_the_lakeshore_brings_the_mixing_chamber_to_the_setpoint(self):
+        self.device.thermal_model_enabled = True
+
+        self._run(600.0)
+
+        assert_that(self.device.lakeshore_mc_ruo, close_to(0.05, 1e-3))
+        assert_that(self.device.lakeshore_mc_heater_percentage, greater_than(0))
+
+    def test_that_GIVEN_the_thermal_model_in_open_loop_THEN_the_mixing_chamber_heater_stays_as_set(self):
+        self.device.thermal_model_enabled = True
+        self.device.lakeshore_cmode = CMODE_OPEN_LOOP
+        self.device.lakeshore_mc_heater_percentage = 50.0
+
+        self._run(600.0)
+
+        # Half of the 10 mW of the 10 mA range heats the mixing chamber against its link to the base temperature
+        assert_that(self.device.lakeshore_mc_heater_percentage, is_(50.0))
+        assert_that(self.device.lakeshore_mc_ruo, close_to(0.1, 1e-3))
@@ -0,0 +1,83 @@
+from array import array
+
+
+class AcquisitionBuffer(object):
+    """
+    Ring buffer of the latest samples of the values of the channels, like the rig's data acquisition buffer. Samples
+    are stored in a column per channel so that a block of samples, or the latest samples of a channel, are copied in
+    slices rather than one at a time.
+    """
+
+    def __init__(self, size, channels):
+        """
+        :param size: the number of samples the buffer holds
+        :param channels: the numbers of the channels sampled
+        """
+        if size < 1:
+            raise ValueError("An acquisition buffer must hold at least one sample, got {}".format(size))
+        self.size = int(size)
+        self.channels = list(channels)
+        self.clear()
+
+    def clear(self):
+        self._times = array("d", [0.0]) * self.size
+        self._columns = {channel: array("d", [0.0]) * self.size for channel in self.channels}
+        # Index the next sample is written to
+        self._next = 0
+        self._count = 0
+
+    def __len__(self):
+        return self._count
+
+    def _write(self, column, start, samples):
+        samples = samples[-self.size:]
+        first = min(len(samples), self.size - start)
+        column[start:start + first] = array("d", samples[:first])
+        column[:len(samples) - first] = array("d", samples[first:])
+
+    def extend(self, times, values):
+        """
+        Add a block of samples, replacing the oldest samples once the buffer is full.
+
+        :param times: the times of the samples in seconds
+        :param values: dictionary of each channel to the list of its values at the times, or to a single value if it
+            held that value throughout the block
+        """
+        count = len(times)
+        if count == 0:
+            return
+
+        # Only the last size samples of a block survive it, so only those are written, where they end up
+        start = (self._next + max(count - self.size, 0)) % self.size
+        self._write(self._times, start, times)
+        for channel, column in self._columns.items():
+            samples = values[channel]
+            if not isinstance(samples, list):
+                samples = [float(samples)] * min(count, self.size)
+            self._write(column, start, samples)
+
+        self._next = (self._next + count) % self.size
+        self._count = min(self._count + count, self.size)
+
+    def _latest(self, column, count):
+        count = min(count, self._count)
+        start = (self._next - count) % self.size
+        if start + count <= self.size:
+            return column[start:start + count].tolist()
+        return column[start:].tolist() + column[:self._next].tolist()
+
+    def latest(self, channel, count):
+        """
+        :param channel: the channel
+        :param count: the number of samples
+        :return: list of the values of the latest count samples of the channel, oldest first; fewer if the buffer does
+            not hold that many
+        """
+        return self._latest(self._columns[channel], count)
+
+    def latest_times(self, count):
+        """
+        :param count: the number of samples
+        :return: list of the times of the latest count samples in seconds, oldest first
+        """
+        return self._latest(self._times, count)
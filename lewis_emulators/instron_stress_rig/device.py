@@ -3,12 +3,17 @@ from .states import DefaultState, GoingToSetpointState, GeneratingWaveformState
 from lewis.devices import StateMachineDevice
 from .channel import PositionChannel, StrainChannel, StressChannel
 from .waveform_generator import WaveformGenerator
+from .acquisition_buffer import AcquisitionBuffer
 
 import time
 
 
 class SimulatedInstron(StateMachineDevice):
 
+    # Samples per second of the values of the channels, and the number of the latest samples kept
+    acquisition_sample_rate = 1000.0
+    acquisition_buffer_size = 10000
+
     def _initialize_data(self):
         """
         Initialize all of the device's attributes.
@@ -32,7 +37,8 @@ class SimulatedInstron(StateMachineDevice):
         # Maps a channel number to a channel object
         self.channels = {1: PositionChannel(), 2: StressChannel(), 3: StrainChannel()}
 
-        self._waveform_generator = WaveformGenerator()
+        self._waveform_generator = WaveformGenerator(self.acquisition_sample_rate)
+        self.acquisition_buffer = AcquisitionBuffer(self.acquisition_buffer_size, self.channels.keys())
 
     def raise_exception_if_cannot_write(self):
         if self._control_mode != 1:
@@ -180,6 +186,27 @@ class SimulatedInstron(StateMachineDevice):
     def start_waveform_generation(self):
         self._waveform_generator.start()
 
+    def process_waveform(self, dt):
+        """
+        Let simulated time pass for the waveform generator, drive the control channel with the waveform while it is
+        generated and record the samples of the channels which fell due in the acquisition buffer.
+
+        :param dt: the time step in seconds
+        """
+        times, waveform = self._waveform_generator.process(dt, self.control_channel)
+        if waveform is not None:
+            self.channels[self.control_channel].value = self.get_waveform_value()
+
+        values = {index: channel.value for index, channel in self.channels.items()}
+        if waveform is not None:
+            values[self.control_channel] = waveform
+        self.acquisition_buffer.extend(times, values)
+
+        self.stop_waveform_generation_if_requested()
+
+    def get_acquired_values(self, channel, count):
+        return self.acquisition_buffer.latest(channel, count)
+
     def stop_waveform_generation_if_requested(self):
         if self._waveform_generator.time_to_stop():
             self._waveform_generator.stop()
@@ -223,8 +250,8 @@ class SimulatedInstron(StateMachineDevice):
     def set_waveform_hold(self):
         self._waveform_generator.hold()
 
-    def quarter_cycle_event(self):
-        self._waveform_generator.quart_counter.count()
+    def quarter_cycle_event(self, quarters=1):
+        self._waveform_generator.quart_counter.count(quarters)
 
     def arm_quarter_counter(self):
         self._waveform_generator.quart_counter.arm()
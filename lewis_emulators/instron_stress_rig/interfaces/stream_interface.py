@@ -52,6 +52,9 @@ class InstronStreamInterface(StreamInterface):
         Cmd("set_max_quarter_counts", "^C209,([0-9]+)$"),
         Cmd("set_quarter_counter_off", "^C212,0$"),
         Cmd("get_quarter_counter_status", "^Q212$"),
+
+        # Emulator only: the latest values in the acquisition buffer of a channel, oldest first
+        Cmd("get_acquired_values", "^Q135,([1-3]),([0-9]+)$"),
     }
 
     in_terminator = "\r\n"
@@ -187,5 +190,8 @@ class InstronStreamInterface(StreamInterface):
     def get_quarter_counter_status(self):
         return self._device.get_quarter_counter_status()
 
+    def get_acquired_values(self, channel, count):
+        return ",".join(str(value) for value in self._device.get_acquired_values(int(channel), int(count)))
+
     def set_waveform_maintain_log(self):
         self._device.set_waveform_maintain_log()
@@ -15,12 +15,15 @@ class QuarterCycleEventDetector(object):
         self.state = QCEDStates.ARMED
         self.counts = 0
 
-    def count(self):
+    def count(self, quarters=1):
         if self.state == QCEDStates.ARMED:
-            self.counts += 1
-            # This is intentionally == not >=. The counter won't trip if it already exceeds max_counts
-            if self.counts == self.max_counts:
+            # This is intentionally not >= max_counts. The counter won't trip if it already exceeds max_counts, but
+            # it does trip, at max_counts, if the quarters counted at once take it there or past it.
+            if self.counts < self.max_counts <= self.counts + quarters:
+                self.counts = self.max_counts
                 self.state = QCEDStates.TRIPPED
+            else:
+                self.counts += quarters
 
     def off(self):
         self.state = QCEDStates.OFF
@@ -12,8 +12,8 @@ class DefaultState(State):
         if device.watchdog_refresh_time + 3 < time.time() and device.get_control_mode() != 0:
             print("Watchdog time expired, going back to front panel control mode")
             device.set_control_mode(0)
-            
-        device.stop_waveform_generation_if_requested()
+
+        device.process_waveform(dt)
 
 
 class GoingToSetpointState(DefaultState):
@@ -31,20 +31,6 @@ class GoingToSetpointState(DefaultState):
 
 
 class GeneratingWaveformState(DefaultState):
-
-    TIME_SINCE_LAST_QUART_COUNT = 0
-
-    @staticmethod
-    def increment_cycle(device, dt):
-        GeneratingWaveformState.TIME_SINCE_LAST_QUART_COUNT += dt
-        if GeneratingWaveformState.TIME_SINCE_LAST_QUART_COUNT > 1.0:
-            GeneratingWaveformState.TIME_SINCE_LAST_QUART_COUNT = 0.0
-            device.quarter_cycle_event()
-
-    def in_state(self, dt):
-        super(GeneratingWaveformState, self).in_state(dt)
-        device = self._context
-
-        GeneratingWaveformState.increment_cycle(device,dt)
-        device.channels[device.control_channel].value = device.get_waveform_value()
+    # The waveform generator counts quarter cycles and drives the control channel as it is processed in DefaultState
+    pass
 
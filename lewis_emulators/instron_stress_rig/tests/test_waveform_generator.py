@@ -0,0 +1,95 @@
+import unittest
+from hamcrest import assert_that, is_, close_to, contains_exactly
+
+from lewis_emulators.instron_stress_rig.acquisition_buffer import AcquisitionBuffer
+from lewis_emulators.instron_stress_rig.quarter_cycle_event_detector_states import QuarterCycleEventDetectorStates
+from lewis_emulators.instron_stress_rig.waveform_generator import WaveformGenerator
+from lewis_emulators.instron_stress_rig.waveform_generator_states import WaveformGeneratorStates
+from lewis_emulators.instron_stress_rig.waveform_types import WaveformTypes
+
+
+class WaveformGeneratorTests(unittest.TestCase):
+    """
+    Tests for the generation of waveforms from simulated time.
+    """
+
+    def setUp(self):
+        self.generator = WaveformGenerator(sample_rate=100.0)
+        self.generator.amplitude[1] = 2.0
+        self.generator.frequency[1] = 10.0
+        self.generator.quart_counter.arm()
+        self.generator.start()
+
+    def test_that_GIVEN_a_running_waveform_THEN_quarter_cycles_are_counted_at_its_frequency(self):
+        for _ in range(100):
+            self.generator.process(0.1, 1)
+
+        assert_that(self.generator.quart_counter.counts, is_(400))
+
+    def test_that_GIVEN_max_counts_WHEN_a_step_passes_it_THEN_counter_trips_at_max_counts(self):
+        self.generator.quart_counter.max_counts = 10
+
+        self.generator.process(1.0, 1)
+
+        assert_that(self.generator.quart_counter.counts, is_(10))
+        assert_that(self.generator.quart_counter.state, is_(QuarterCycleEventDetectorStates.TRIPPED))
+
+    def test_that_GIVEN_steps_of_any_length_THEN_samples_are_the_waveform_at_their_times(self):
+        samples = []
+        for dt in (0.013, 0.2, 0.0004, 0.0866):
+            times, values = self.generator.process(dt, 1)
+            samples.extend(zip(times, values))
+
+        assert_that(len(samples), is_(30))
+        for time, value in samples:
+            assert_that(value, close_to(self.generator._value_at(1, 10.0 * time), 1e-9))
+
+    def test_that_GIVEN_a_haversine_THEN_value_follows_phase(self):
+        self.generator.type[1] = WaveformTypes.HAVERSINE
+
+        self.generator.process(0.05, 1)
+
+        assert_that(self.generator.get_value(1), close_to(2.0, 1e-9))
+
+    def test_that_GIVEN_a_request_to_finish_THEN_generator_stops_after_the_delay_in_simulated_time(self):
+        self.generator.finish()
+        self.generator.process(WaveformGenerator.STOP_DELAY, 1)
+        assert_that(self.generator.time_to_stop(), is_(False))
+
+        self.generator.process(0.1, 1)
+        assert_that(self.generator.time_to_stop(), is_(True))
+
+    def test_that_GIVEN_a_held_waveform_THEN_phase_and_counts_do_not_advance(self):
+        self.generator.process(0.01, 1)
+        self.generator.hold()
+        self.generator.process(1.0, 1)
+
+        assert_that(self.generator.state, is_(WaveformGeneratorStates.HOLDING))
+        assert_that(self.generator.phase[1], close_to(0.1, 1e-9))
+        assert_that(self.generator.quart_counter.counts, is_(0))
+
+
+class AcquisitionBufferTests(unittest.TestCase):
+    """
+    Tests for the ring buffer of samples of the channels.
+    """
+
+    def test_that_GIVEN_more_samples_than_it_holds_THEN_buffer_keeps_the_latest(self):
+        buffer = AcquisitionBuffer(4, [1, 2])
+
+        buffer.extend([0.0, 1.0, 2.0], {1: [0.0, 1.0, 2.0], 2: 5.0})
+        buffer.extend([3.0, 4.0], {1: [3.0, 4.0], 2: 6.0})
+
+        assert_that(len(buffer), is_(4))
+        assert_that(buffer.latest(1, 10), contains_exactly(1.0, 2.0, 3.0, 4.0))
+        assert_that(buffer.latest(2, 3), contains_exactly(5.0, 6.0, 6.0))
+
+    def test_that_GIVEN_a_block_larger_than_the_buffer_THEN_its_last_samples_are_kept_in_order(self):
+        buffer = AcquisitionBuffer(3, [1])
+        buffer.extend([0.0], {1: [0.0]})
+
+        buffer.extend([1.0, 2.0, 3.0, 4.0, 5.0], {1: [1.0, 2.0, 3.0, 4.0, 5.0]})
+        buffer.extend([6.0], {1: [6.0]})
+
+        assert_that(buffer.latest(1, 3), contains_exactly(4.0, 5.0, 6.0))
+        assert_that(buffer.latest_times(2), contains_exactly(5.0, 6.0))
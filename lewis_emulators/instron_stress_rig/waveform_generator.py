@@ -1,21 +1,85 @@
 from .waveform_generator_states import WaveformGeneratorStates as GenStates
 from .waveform_types import WaveformTypes
-from datetime import datetime, timedelta
 from .quarter_cycle_event_detector import QuarterCycleEventDetector as QCED
+from lewis_emulators.utils.reading_generator import ReadingGenerator
 import math
 
+TWO_PI = 2.0 * math.pi
+
+
+def sine(phase):
+    return math.sin(TWO_PI * phase)
+
+
+def square(phase):
+    return math.copysign(1.0, sine(phase))
+
+
+def sawtooth(phase):
+    return phase % 1.0
+
+
+def triangle(phase):
+    return 1.0 - 2.0 * abs((2.0 * phase - 0.5) % 2.0 - 1.0)
+
+
+def haversine(phase):
+    return 0.5 * (1.0 - math.cos(TWO_PI * phase))
+
+
+def havertriangle(phase):
+    return 1.0 - abs((2.0 * phase) % 2.0 - 1.0)
+
+
+def haversquare(phase):
+    return 0.5 * (1.0 + math.copysign(1.0, haversine(phase) - 0.5))
+
+
+# The shape of each type of waveform as a function of its phase in cycles, for an amplitude of 1. Types not listed
+# (the external waveforms) are generated as sine waves.
+SHAPES = {
+    WaveformTypes.SINE: sine,
+    WaveformTypes.TRIANGLE: triangle,
+    WaveformTypes.SQUARE: square,
+    WaveformTypes.HAVERSINE: haversine,
+    WaveformTypes.HAVERTRIANGLE: havertriangle,
+    WaveformTypes.HAVERSQUARE: haversquare,
+    WaveformTypes.SAWTOOTH: sawtooth,
+}
+
 
 class WaveformGenerator(object):
-    STOP_DELAY = timedelta(seconds=3)
+    """
+    Generates a waveform on each channel from its phase, which advances at the channel's frequency as simulated time
+    passes while the generator runs. The quarter counter counts the quarter cycles of the waveform being generated as
+    they pass, and the waveform is sampled at sample_rate, so a fatigue run at tens of Hz is followed exactly however
+    long the simulation cycle.
+    """
+
+    # Simulated time in seconds between a request to finish and the generator stopping
+    STOP_DELAY = 3.0
 
-    def __init__(self):
+    def __init__(self, sample_rate=1000.0):
         self.state = GenStates.STOPPED
         self.amplitude = {i+1: 0.0 for i in range(3)}
         self.frequency = {i+1: 1.0 for i in range(3)}
         self.type = {i+1: WaveformTypes.SINE for i in range(3)}
+        # In cycles, from 0 up to 1
+        self.phase = {i+1: 0.0 for i in range(3)}
         self.stop_requested_at_time = None
         self.quart_counter = QCED()
 
+        # The generator is the profile of its sampler, which works out when samples fall due
+        self.sampler = ReadingGenerator(sample_rate, self)
+        self._sampling = None
+
+    @property
+    def time(self):
+        """
+        The simulated time in seconds the generator has been processed for.
+        """
+        return self.sampler.time
+
     def abort(self):
         if self.active():
             self.state = GenStates.ABORTED
@@ -24,12 +88,12 @@ class WaveformGenerator(object):
 
     def finish(self):
         if self.active():
-            self.stop_requested_at_time = datetime.now()
+            self.stop_requested_at_time = self.time
             self.state = GenStates.FINISHING
 
     def time_to_stop(self):
         return self.stop_requested_at_time is not None and \
-               (datetime.now() - self.stop_requested_at_time) > WaveformGenerator.STOP_DELAY
+               (self.time - self.stop_requested_at_time) > WaveformGenerator.STOP_DELAY
 
     def stop(self):
         self.stop_requested_at_time = None
@@ -39,6 +103,7 @@ class WaveformGenerator(object):
     def start(self):
         self.state = GenStates.RUNNING
         self.stop_requested_at_time = None
+        self.phase = {index: 0.0 for index in self.phase}
 
     def hold(self):
         if self.active():
@@ -51,49 +116,59 @@ class WaveformGenerator(object):
     def active(self):
         return self.state in [GenStates.RUNNING, GenStates.HOLDING]
 
-    def get_value(self, channel):
-        def sin(a, x, f):
-            return a*math.sin(math.pi*x*f)
-
-        def square(a, x, f):
-            return math.copysign(a, sin(a, x, f))
-
-        def sawtooth(a, x, f):
-            return a*(x % (1.0/f))
-
-        def triangle(a, x, f):
-            return a*(1 - 2*abs((f*x-0.5) % 2 - 1))
-
-        def haversine(a, x, f):
-            return a/2.0*(1.0 - math.cos(math.pi*f*x))
-
-        def havertriangle(a, x, f):
-            return a*(1 - abs(f*x % 2 - 1))
-
-        def haversquare(a, x, f):
-            return a/2.0*(1.0 + math.copysign(1.0, haversine(a, x, f)-0.5))
+    def _rate_of_phase(self, channel):
+        # Holding freezes the waveform where it is
+        return max(self.frequency[channel], 0.0) if self.state == GenStates.RUNNING else 0.0
+
+    def _value_at(self, channel, phase):
+        return self.amplitude[channel] * SHAPES.get(self.type[channel], sine)(phase)
+
+    def values(self, times):
+        """
+        The values of the waveform being sampled at the times of the samples, from the phase at the start of the step
+        being processed.
+
+        Args:
+            times (list[float]): The times of the samples in seconds.
+
+        Returns:
+            list[float]: The values.
+        """
+        channel, start, phase = self._sampling
+        rate_of_phase = self._rate_of_phase(channel)
+        if rate_of_phase == 0:
+            return [self._value_at(channel, phase)] * len(times)
+        amplitude, shape = self.amplitude[channel], SHAPES.get(self.type[channel], sine)
+        return [amplitude * shape(phase + rate_of_phase * (time - start)) for time in times]
+
+    def process(self, dt, channel):
+        """
+        Lets simulated time pass for the generator. While it runs, the phase of each waveform advances and the quarter
+        counter counts the quarter cycles of the channel's waveform that pass.
+
+        Args:
+            dt (float): The time step in seconds.
+            channel (int): The channel the waveform is generated on.
+
+        Returns:
+            tuple(list[float], list[float]): The times of the samples of the channel's waveform which fell due during
+                the step, and their values; the values are None if the generator is not active.
+        """
+        self._sampling = (channel, self.time, self.phase[channel])
+        times, values = self.sampler.process(dt)
+
+        for index in self.phase:
+            travelled = self.phase[index] + self._rate_of_phase(index) * dt
+            if index == channel:
+                quarters = int(math.floor(4.0 * travelled)) - int(math.floor(4.0 * self.phase[index]))
+                if quarters > 0:
+                    self.quart_counter.count(quarters)
+            self.phase[index] = travelled % 1.0
+
+        return times, (values if self.active() else None)
 
+    def get_value(self, channel):
         if self.active():
-            amp = self.amplitude[channel]
-            freq = max(self.frequency[channel], 1.e-20)
-            wave_type = self.type[channel]
-            val = self.quart_counter.counts
-
-            if not self.active():
-                return 0.0
-            elif wave_type == WaveformTypes.TRIANGLE:
-                return triangle(amp, val, freq)
-            elif wave_type == WaveformTypes.SAWTOOTH:
-                return sawtooth(amp, val, freq)
-            elif wave_type == WaveformTypes.SQUARE:
-                return square(amp, val, freq)
-            elif wave_type == WaveformTypes.HAVERSINE:
-                return haversine(amp, val, freq)
-            elif wave_type == WaveformTypes.HAVERSQUARE:
-                return haversquare(amp, val, freq)
-            elif wave_type == WaveformTypes.HAVERTRIANGLE:
-                return havertriangle(amp, val, freq)
-            else:
-                return sin(amp, val, freq)
+            return self._value_at(channel, self.phase[channel])
 
         return 0.0
@@ -3,6 +3,7 @@ from .states import DefaultState
 from lewis.devices import StateMachineDevice
 from .utils import Channel, StatusRegister, ScanTrigger
 from .buffer import Buffer
+from lewis_emulators.utils.reading_generator import ReadingGenerator, RandomProfile, create_profile
 
 
 class SimulatedKeithley2001(StateMachineDevice):
@@ -46,6 +47,9 @@ class SimulatedKeithley2001(StateMachineDevice):
         self._error = [0, "No error"]
         self.number_of_times_ioc_has_been_reset = 0
 
+        # Simulated readings are off until they are turned on through the backdoor
+        self.reading_generator = ReadingGenerator(0, RandomProfile())
+        self._next_simulated_channel = 0
 
     def _get_state_handlers(self):
         return {
@@ -151,6 +155,21 @@ class SimulatedKeithley2001(StateMachineDevice):
                 "READ_UNIT": channel.reading_units
             })
 
+    def simulate_readings_for(self, dt):
+        """
+        Sets channel readings to the simulated readings which fell due in a time step. Each reading goes to the next
+        channel in turn, so only the latest reading of each channel is kept.
+
+        Args:
+            dt (float): The time step in seconds.
+        """
+        times, values = self.reading_generator.process(dt)
+        number_of_channels = len(self._channels)
+        first = self._next_simulated_channel
+        self._next_simulated_channel = (first + len(values)) % number_of_channels
+        for index in range(max(0, len(values) - number_of_channels), len(values)):
+            self._channels[(first + index) % number_of_channels + 1].reading = values[index]
+
     @property
     def error(self):
         """
@@ -225,6 +244,18 @@ class SimulatedKeithley2001(StateMachineDevice):
         self._channels[channel].reading = value
         self._channels[channel].reading_units = reading_unit
 
+    def set_reading_generator_via_the_backdoor(self, rate, profile, *parameters):
+        """
+        Sets how simulated channel readings are generated using Lewis backdoor.
+
+        Args:
+            rate (float): Readings per second across all channels, 0 to stop generating readings.
+            profile (string): Name of the profile the readings come from; random, ramp or replay.
+            parameters: Arguments of the profile, see lewis_emulators.utils.reading_generator.
+        """
+        self.reading_generator.profile = create_profile(profile, *parameters)
+        self.reading_generator.rate = float(rate)
+
     def set_error_via_the_backdoor(self, error_code, error_message):
         """
         Sets an error via the using Lewis backdoor.
@@ -1,9 +1,12 @@
-from lewis.adapters.stream import StreamInterface
 from lewis_emulators.utils.command_builder import CmdBuilder
+from lewis.adapters.stream import StreamInterface
+from lewis_emulators.utils.dispatch import DispatchingStreamInterface, FusedCommandDispatcher
 from lewis_emulators.utils.replies import conditional_reply
 
 
-class Keithley2001StreamInterface(StreamInterface):
+class Keithley2001StreamInterface(DispatchingStreamInterface, StreamInterface):
+
+    command_dispatcher = FusedCommandDispatcher
 
     in_terminator = "\r\n"
     out_terminator = "\n"
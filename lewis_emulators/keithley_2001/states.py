@@ -2,4 +2,7 @@ from lewis.core.statemachine import State
 
 
 class DefaultState(State):
-    pass
+
+    def in_state(self, dt):
+        device = self._context
+        device.simulate_readings_for(dt)
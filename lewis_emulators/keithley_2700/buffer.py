@@ -0,0 +1,147 @@
+from array import array
+
+# The text the device returns for a reading: reading, timestamp in seconds and channel
+ENTRY_FORMAT = "{:+.2f},{:.3f},{:+d}"
+
+
+class ReadingBuffer(object):
+    """
+    Fixed capacity ring buffer of readings. Buffer locations are the physical slots of the buffer, so TRAC:NEXT? is the
+    slot the next reading will be stored in and wraps back to 0 once the buffer is full.
+
+    Readings are kept in separate columns of numbers, the reading, timestamp and channel, and are only formatted when
+    they are read back. Readings put in through the backdoor as text which the device would not return, e.g. a reading
+    which is not a number, keep their text alongside the columns and are returned as given.
+    """
+
+    def __init__(self, size):
+        self.autoclear_on = False
+        self.number_of_times_buffer_cleared = 0
+        self._allocate(size)
+
+    def _allocate(self, size):
+        if size < 1:
+            raise ValueError("{} is not a valid buffer size.".format(size))
+        self._size = size
+        self.readings = array("d", [0.0]) * size
+        self.timestamps = array("d", [0.0]) * size
+        self.channels = array("l", [0]) * size
+        self._text_entries = {}
+        self._next_location = 0
+        self._count = 0
+
+    @property
+    def size(self):
+        return self._size
+
+    @size.setter
+    def size(self, size):
+        """
+        Changing the size clears the buffer.
+        """
+        self._allocate(size)
+
+    @property
+    def next_location(self):
+        return self._next_location
+
+    def __len__(self):
+        return self._count
+
+    def is_full(self):
+        return self._count == self._size
+
+    def clear(self):
+        self._next_location = 0
+        self._count = 0
+        self._text_entries.clear()
+        self.number_of_times_buffer_cleared += 1
+
+    def _next(self):
+        """
+        Claims the location for the next reading. If the buffer is full it is cleared first when autoclear is on,
+        otherwise the oldest reading is overwritten.
+
+        :return: the location
+        """
+        if self._count == self._size and self.autoclear_on:
+            self.clear()
+        location = self._next_location
+        self._next_location = (location + 1) % self._size
+        self._count = min(self._count + 1, self._size)
+        self._text_entries.pop(location, None)
+        return location
+
+    def append(self, reading, timestamp, channel):
+        """
+        Stores a reading in the next location.
+
+        :param reading: the reading
+        :param timestamp: the timestamp in seconds
+        :param channel: the channel, e.g. 101
+        """
+        location = self._next()
+        self.readings[location] = reading
+        self.timestamps[location] = timestamp
+        self.channels[location] = channel
+
+    def append_text(self, reading, timestamp, channel):
+        """
+        Stores a reading given as text in the next location. Text the device would not return for the reading, e.g.
+        a reading which is not a number, is returned as given.
+
+        :param reading: the reading as text, e.g. "+1386.05"
+        :param timestamp: the timestamp in seconds as text
+        :param channel: the channel as text, e.g. "+101"
+        """
+        text = "{},{},{}".format(reading, timestamp, channel)
+        try:
+            numbers = float(reading), float(timestamp), int(channel)
+        except ValueError:
+            numbers = float("nan"), 0.0, 0
+        location = self._next()
+        self.readings[location], self.timestamps[location], self.channels[location] = numbers
+        if text != ENTRY_FORMAT.format(*numbers):
+            self._text_entries[location] = text
+
+    def extend(self, readings, timestamps, channels):
+        """
+        Stores a batch of readings, as if each was appended in turn.
+
+        :param readings: the readings
+        :param timestamps: the timestamps in seconds
+        :param channels: the channels
+        """
+        for reading, timestamp, channel in zip(readings, timestamps, channels):
+            self.append(reading, timestamp, channel)
+
+    def entries(self, start=0, count=None):
+        """
+        The text of readings in consecutive buffer locations.
+
+        :param start: the first buffer location
+        :param count: the number of readings; all readings from start if None
+        :return: list of readings, each formatted as reading,timestamp,channel
+        """
+        if count is None:
+            count = self._count - start
+        if start < 0 or count < 0 or start + count > self._count:
+            raise ValueError("Buffer locations {} to {} do not hold readings, the buffer holds {}.".format(
+                start, start + count - 1, self._count))
+        end = start + count
+        entries = list(map(ENTRY_FORMAT.format,
+                           self.readings[start:end], self.timestamps[start:end], self.channels[start:end]))
+        for location, text in self._text_entries.items():
+            if start <= location < end:
+                entries[location - start] = text
+        return entries
+
+    def format_readings(self, start, count):
+        """
+        Formats readings in consecutive buffer locations as the reply to TRAC:DATA:SEL?.
+
+        :param start: the first buffer location
+        :param count: the number of readings
+        :return: the readings separated by ", "
+        """
+        return ", ".join(self.entries(start, count))
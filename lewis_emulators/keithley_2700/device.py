@@ -1,20 +1,15 @@
 from collections import OrderedDict
 from lewis.core.logging import has_log
 from .states import DefaultState
+from .buffer import ReadingBuffer
 from lewis.devices import StateMachineDevice
-from random import randint
-import time
-import threading
+from lewis_emulators.utils.reading_generator import ReadingGenerator, RandomProfile, create_profile
 
 MAX_READ = 1500
 MIN_READ = 1000
 
-
-class BufferReading(object):
-    def __init__(self, reading, timestamp, channel):
-        self.reading = reading
-        self.timestamp = timestamp
-        self.channel = channel
+# The channels readings are taken from in turn, 101 to 110 then 201 to 210
+SCAN_CHANNELS = tuple(range(101, 111)) + tuple(range(201, 211))
 
 
 @has_log
@@ -23,53 +18,79 @@ class SimulatedKeithley2700(StateMachineDevice):
     Simulated Keithley2700 Multimeter
     """
 
-    def _simulate_readings_thread(self):
-        """
-        Generates random simulated data to put insert into the buffer.
-        """
-
-        def i_to_channel(i):
-            """
-            formats index as channel number, 101 to 110, 201 to 210
-            """
-            if i < 10:
-                return 101 + i
-            else:
-                return 191 + i
-
-        i = 0
-        while self.simulate_readings:
-            resistance = randint(1000, 2000)
-            timestamp = time.time() - self.start_time
-            self.insert_mock_data(["+{},{},+{}".format(resistance, timestamp, i_to_channel(i))])
-            i = (i + 1) % 20
-            time.sleep(0.1)
-
     def _initialize_data(self):
         """
         Initialize the device's attributes necessary for testing.
         """
         self.idn = "KEITHLEY"               # Device name 
-        self.buffer = []                    # The buffer in which samples are stored
-        self.buffer_autoclear_on = False    # when false, new readings appended to old readings in buffer
-        self.buffer_size = 1000             # size of buffer which holds read data default 1000
+        self.buffer = ReadingBuffer(1000)   # The buffer in which samples are stored, size 1000 by default
         # The below attributes are not used but are needed for the stream interface
         self.bytes_available = 0
         self.bytes_used = 0
-        self.start_time = time.time()
         self.simulate_readings = True
-        thread = threading.Thread(group=None, target=self._simulate_readings_thread)
-        thread.daemon = True
-        thread.start()
+        self.reading_generator = ReadingGenerator(10, RandomProfile(MIN_READ, MAX_READ))
+        self._next_scan_channel = 0
+
+    @property
+    def buffer_autoclear_on(self):
+        """
+        When false, new readings overwrite the oldest readings once the buffer is full; when true, the buffer is
+        cleared first.
+        """
+        return self.buffer.autoclear_on
+
+    @buffer_autoclear_on.setter
+    def buffer_autoclear_on(self, autoclear_on):
+        self.buffer.autoclear_on = autoclear_on
+
+    @property
+    def buffer_size(self):
+        """
+        Size of the buffer which holds read data. Changing it clears the buffer.
+        """
+        return self.buffer.size
+
+    @buffer_size.setter
+    def buffer_size(self, size):
+        self.buffer.size = size
+
+    @property
+    def reading_rate(self):
+        """
+        The number of simulated readings put in the buffer per second.
+        """
+        return self.reading_generator.rate
+
+    @reading_rate.setter
+    def reading_rate(self, rate):
+        self.reading_generator.rate = rate
+
+    def set_reading_profile(self, name, *parameters):
+        """
+        Chooses where the values of simulated readings come from.
+        :param name: the name of the profile, one of random, ramp or replay
+        :param parameters: the arguments of the profile, see lewis_emulators.utils.reading_generator
+        """
+        self.reading_generator.profile = create_profile(name, *parameters)
+
+    def simulate_readings_for(self, dt):
+        """
+        Puts the simulated readings which fell due in a time step in the buffer.
+        :param dt: the time step in seconds
+        """
+        times, values = self.reading_generator.process(dt)
+        if not self.simulate_readings or not times:
+            return
+        first = self._next_scan_channel
+        self._next_scan_channel = (first + len(times)) % len(SCAN_CHANNELS)
+        self.buffer.extend(values, times,
+                           [SCAN_CHANNELS[(first + index) % len(SCAN_CHANNELS)] for index in range(len(times))])
 
     def get_next_buffer_location(self):
-        if not self.is_buffer_full():
-            return len(self.buffer)
-        else:
-            return 0  # Buffer full so next loc is 0 after a clear
+        return self.buffer.next_location
 
     def is_buffer_full(self):
-        return len(self.buffer) >= self.buffer_size  # -1 because buffer is 0 indexed
+        return self.buffer.is_full()
 
     def insert_mock_data(self, data):
         """
@@ -79,23 +100,20 @@ class SimulatedKeithley2700(StateMachineDevice):
         self.log.info("Inserting mock data into buffer: {}".format(data))
         for item in data:
             reading, timestamp, channel = item.split(",")
-            if self.is_buffer_full() and self.buffer_autoclear_on:
-                self.clear_buffer()
-            self.buffer.append(BufferReading(reading, timestamp, channel))
+            self.buffer.append_text(reading, timestamp, channel)
 
     def check_buffer_data(self):
         """
         Gets values contained in self.buffer
         :return: List of comma separated string representations of readings in the buffer
         """
-        return [",".join((reading.reading, reading.timestamp, reading.channel))
-                .encode("utf-8") for reading in self.buffer]
+        return [entry.encode("utf-8") for entry in self.buffer.entries()]
 
     def clear_buffer(self):
         """
         Clears all buffer entries
         """
-        self.buffer = []
+        self.buffer.clear()
         self.log.info("=== Cleared Buffer ===")
 
     def _get_state_handlers(self):
@@ -1,6 +1,7 @@
 import traceback
 
 from lewis.adapters.stream import StreamInterface
+from lewis_emulators.utils.dispatch import DispatchingStreamInterface
 from lewis_emulators.utils.command_builder import CmdBuilder
 from lewis.core.logging import has_log
 
@@ -14,7 +15,7 @@ SCAN_STATE = {0: "INT", 1: "NONE"}
 
 
 @has_log
-class Keithley2700StreamInterface(StreamInterface):
+class Keithley2700StreamInterface(DispatchingStreamInterface, StreamInterface):
     in_terminator = "\r"
     out_terminator = "\r"
     commands = {
@@ -225,15 +226,9 @@ class Keithley2700StreamInterface(StreamInterface):
         :return: String value of readings from buffer
         """
 
-        chunks = []
-        start, count = int(start), int(count)
-        for buffer_location in range(start, start + count):
-            chunks.append("{},{},{}".format(self._device.buffer[buffer_location].reading,
-                                            self._device.buffer[buffer_location].timestamp,
-                                            self._device.buffer[buffer_location].channel))
-
-        self.log.info("Returned readings: {}".format("No readings" if (len(chunks) == 0) else ",".join(chunks)))
-        return ", ".join(chunks)
+        readings = self._device.buffer.format_readings(int(start), int(count))
+        self.log.info("Returned readings: {}".format(readings if readings else "No readings"))
+        return readings
 
     def set_buffer_size(self, size):
         self._device.buffer_size = int(size)
@@ -7,3 +7,6 @@ class DefaultState(State):
     """
     NAME = 'Default'
 
+    def in_state(self, dt):
+        device = self._context
+        device.simulate_readings_for(dt)
@@ -0,0 +1,92 @@
+import unittest
+from hamcrest import assert_that, is_, equal_to, calling, raises
+
+from lewis_emulators.keithley_2700.buffer import ReadingBuffer
+
+
+class ReadingBufferTests(unittest.TestCase):
+    """
+    Tests for the ring buffer of readings.
+    """
+
+    def _fill(self, buffer, number_of_readings):
+        for index in range(number_of_readings):
+            buffer.append(1000.0 + index, index + 0.5, 101 + index)
+
+    def test_that_GIVEN_readings_stored_THEN_next_location_follows_them(self):
+        buffer = ReadingBuffer(5)
+        self._fill(buffer, 3)
+
+        assert_that(buffer.next_location, is_(3))
+        assert_that(len(buffer), is_(3))
+        assert_that(buffer.is_full(), is_(False))
+
+    def test_that_GIVEN_readings_stored_THEN_they_are_formatted_as_the_device_returns_them(self):
+        buffer = ReadingBuffer(5)
+        self._fill(buffer, 3)
+
+        assert_that(buffer.format_readings(1, 2), is_("+1001.00,1.500,+102, +1002.00,2.500,+103"))
+
+    def test_that_GIVEN_readings_stored_THEN_they_are_kept_in_columns_of_numbers(self):
+        buffer = ReadingBuffer(5)
+        self._fill(buffer, 2)
+
+        assert_that(list(buffer.readings[:2]), is_([1000.0, 1001.0]))
+        assert_that(list(buffer.timestamps[:2]), is_([0.5, 1.5]))
+        assert_that(list(buffer.channels[:2]), is_([101, 102]))
+
+    def test_that_GIVEN_a_reading_as_text_THEN_it_is_stored_in_the_columns_and_returned_as_given(self):
+        buffer = ReadingBuffer(5)
+
+        buffer.append_text("+1386.05", "0.5", "+101")
+
+        assert_that(buffer.readings[0], is_(1386.05))
+        assert_that(buffer.channels[0], is_(101))
+        assert_that(buffer.format_readings(0, 1), is_("+1386.05,0.5,+101"))
+
+    def test_that_GIVEN_a_reading_which_is_not_a_number_THEN_it_is_returned_as_given(self):
+        buffer = ReadingBuffer(5)
+
+        buffer.append_text("OVERFLOW", "0.5", "+101")
+        buffer.append(1001.0, 1.5, 102)
+
+        assert_that(buffer.format_readings(0, 2), is_("OVERFLOW,0.5,+101, +1001.00,1.500,+102"))
+
+    def test_that_GIVEN_a_reading_as_text_overwritten_THEN_the_new_reading_is_returned(self):
+        buffer = ReadingBuffer(1)
+
+        buffer.append_text("OVERFLOW", "0.5", "+101")
+        buffer.append(1001.0, 1.5, 102)
+
+        assert_that(buffer.entries(), is_(["+1001.00,1.500,+102"]))
+
+    def test_that_GIVEN_a_full_buffer_without_autoclear_WHEN_reading_stored_THEN_oldest_reading_overwritten(self):
+        buffer = ReadingBuffer(3)
+        self._fill(buffer, 4)
+
+        assert_that(buffer.is_full(), is_(True))
+        assert_that(buffer.next_location, is_(1))
+        assert_that(buffer.entries(), equal_to(["+1003.00,3.500,+104", "+1001.00,1.500,+102", "+1002.00,2.500,+103"]))
+
+    def test_that_GIVEN_a_full_buffer_with_autoclear_WHEN_reading_stored_THEN_buffer_cleared_first(self):
+        buffer = ReadingBuffer(3)
+        buffer.autoclear_on = True
+        self._fill(buffer, 4)
+
+        assert_that(len(buffer), is_(1))
+        assert_that(buffer.next_location, is_(1))
+        assert_that(buffer.number_of_times_buffer_cleared, is_(1))
+
+    def test_that_WHEN_locations_without_readings_requested_THEN_error_raised(self):
+        buffer = ReadingBuffer(5)
+        self._fill(buffer, 2)
+
+        assert_that(calling(buffer.format_readings).with_args(1, 2), raises(ValueError))
+
+    def test_that_WHEN_size_changed_THEN_buffer_cleared(self):
+        buffer = ReadingBuffer(5)
+        self._fill(buffer, 2)
+        buffer.size = 10
+
+        assert_that(buffer.size, is_(10))
+        assert_that(len(buffer), is_(0))
@@ -50,19 +50,28 @@ class SimulatedKynctm3K(StateMachineDevice):
 
     INPUT_MODES = ("R0", "R1", "Q0")
 
+    # Function of a list of frames of measurements which sends them to the client unasked and returns how many it sent;
+    # set by the interface
+    auto_send_output = None
+
     def _initialize_data(self):
         """
         Initialize all of the device's attributes.
 
         OUT_values contains the measurement values to be returned. A False value is considered to not
         be in the program, and will not be returned.
+
+        auto_send_rate is the number of frames of measurements sent per second in auto-send mode; 0 to send none, so
+        the device only replies to polls.
         """
         self.OUT_values = None
         self.truncated_output = False
         self.auto_send = False
         self.input_mode = "R0"
 
-        pass
+        self.auto_send_rate = 0.0
+        self.auto_send_dropped_frames = 0
+        self._auto_send_frames_due = 0.0
 
     def reset_device(self):
         """
@@ -156,9 +165,8 @@ class SimulatedKynctm3K(StateMachineDevice):
         else:
             return off_return
 
-    @fake_auto_send
     @truncate_if_set
-    def format_output_data(self):
+    def format_measurements(self):
         """
         Recalls and formats the measurement values
 
@@ -176,3 +184,40 @@ class SimulatedKynctm3K(StateMachineDevice):
                 channel_strings.append(self.parse_status(output_value))
 
         return ','.join(channel_strings)
+
+    @fake_auto_send
+    def format_output_data(self):
+        """
+        Formats the measurement values in reply to a poll
+
+        Returns:
+            A string containing the measurement values for the current program, or a TG reply if the device is in
+            auto-send mode
+
+        """
+        return self.format_measurements()
+
+    def process_auto_send(self, dt):
+        """
+        Sends the frames of measurements which fell due during a simulation cycle when the device is in auto-send mode,
+        so the client gets them at auto_send_rate however long the cycle. Frames the client is too slow to take are
+        dropped and counted in auto_send_dropped_frames.
+
+        Args:
+            dt: Float, the length of the cycle in seconds
+
+        Returns: None
+
+        """
+        if not self.auto_send or self.auto_send_rate <= 0 or self.OUT_values is None or self.auto_send_output is None:
+            self._auto_send_frames_due = 0.0
+            return
+
+        self._auto_send_frames_due += dt * self.auto_send_rate
+        count = int(self._auto_send_frames_due)
+        self._auto_send_frames_due -= count
+        if count == 0:
+            return
+
+        frames = [self.format_measurements() for _ in range(count)]
+        self.auto_send_dropped_frames += count - self.auto_send_output(frames)
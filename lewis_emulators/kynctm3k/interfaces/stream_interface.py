@@ -15,6 +15,43 @@ class Kynctm3KStreamInterface(StreamInterface):
     in_terminator = "\r"
     out_terminator = "\r"
 
+    # The most output in bytes left waiting for a client which reads slowly before auto-send frames are dropped
+    auto_send_max_backlog = 64 * 1024
+
+    def _bind_device(self):
+        super(Kynctm3KStreamInterface, self)._bind_device()
+        self._device.auto_send_output = self.send_frames
+
+    def send_frames(self, frames):
+        """
+        Sends frames of measurements to the client without being polled, as the controller does in auto-send mode.
+        The frames are sent in one write. Output the client has not read yet waits in the connection's buffer; frames
+        which would take it over auto_send_max_backlog are not sent, just as a controller streaming to a slow reader
+        loses them, rather than the buffer growing without limit.
+
+        Args:
+            frames: List of strings, the frames to send
+
+        Returns:
+            The number of frames sent
+
+        """
+        handler = getattr(self, "handler", None)
+        if handler is None or not handler.connected:
+            return 0
+
+        room = self.auto_send_max_backlog - sum(len(data) for data in handler.producer_fifo)
+        count = 0
+        for frame in frames:
+            room -= len(frame) + len(self.out_terminator)
+            if room < 0:
+                break
+            count += 1
+
+        if count:
+            handler.unsolicited_reply(self.out_terminator.join(frames[:count]))
+        return count
+
     def return_data(self):
         return self._device.format_output_data()
 
@@ -0,0 +1,70 @@
+import unittest
+from collections import deque
+from hamcrest import assert_that, is_, equal_to
+
+from lewis_emulators.kynctm3k.device import SimulatedKynctm3K
+from lewis_emulators.kynctm3k.interfaces.stream_interface import Kynctm3KStreamInterface
+
+FRAME = "MM,1111111111111111,+001.500" + ",XXXXXXXX" * 15
+
+
+class FakeHandler(object):
+    """
+    Stands in for the connection to a client which never reads, so everything sent to it waits in its buffer.
+    """
+    def __init__(self):
+        self.connected = True
+        self.producer_fifo = deque()
+
+    def unsolicited_reply(self, reply):
+        self.producer_fifo.append(reply + "\r")
+
+    def frames(self):
+        return "".join(self.producer_fifo).split("\r")[:-1]
+
+
+class AutoSendTests(unittest.TestCase):
+    """
+    Tests for the frames of measurements streamed in auto-send mode.
+    """
+
+    def setUp(self):
+        self.device = SimulatedKynctm3K()
+        self.device.reset_device()
+        self.device.OUT_values[0] = 1.5
+        self.device.set_input_mode("Q0")
+        self.device.set_autosend_status(1)
+        self.device.auto_send_rate = 1000
+
+        self.interface = Kynctm3KStreamInterface()
+        self.interface.device = self.device
+        self.interface.handler = FakeHandler()
+
+    def test_that_GIVEN_auto_send_WHEN_time_passes_THEN_frames_are_sent_at_the_rate_unpolled(self):
+        for _ in range(10):
+            self.device.process_auto_send(0.0333)
+
+        assert_that(self.interface.handler.frames(), equal_to([FRAME] * 333))
+        assert_that(self.device.auto_send_dropped_frames, is_(0))
+
+    def test_that_GIVEN_auto_send_off_WHEN_time_passes_THEN_no_frames_are_sent(self):
+        self.device.set_autosend_status(0)
+
+        self.device.process_auto_send(1.0)
+
+        assert_that(len(self.interface.handler.producer_fifo), is_(0))
+
+    def test_that_GIVEN_a_client_reading_slowly_THEN_frames_beyond_the_backlog_are_dropped(self):
+        self.interface.auto_send_max_backlog = 100 * (len(FRAME) + 1)
+
+        self.device.process_auto_send(0.25)
+
+        assert_that(len(self.interface.handler.frames()), is_(100))
+        assert_that(self.device.auto_send_dropped_frames, is_(150))
+
+    def test_that_GIVEN_no_client_THEN_frames_are_dropped(self):
+        self.interface.handler.connected = False
+
+        self.device.process_auto_send(0.01)
+
+        assert_that(self.device.auto_send_dropped_frames, is_(10))
@@ -3,6 +3,7 @@ from collections import OrderedDict
 from .states import WarnStateCode, ErrorStateCode
 from .states import StoppedState, MovingState
 from lewis.devices import StateMachineDevice
+from lewis_emulators.utils.motion import MotionEngine
 
 HARD_LIMIT_MINIMUM = 0.0
 HARD_LIMIT_MAXIMUM = 5000.0
@@ -12,6 +13,8 @@ DEVICE_DEFAULT_VELO = 52
 DEVICE_DEFAULT_MAX_ACCEL = 10
 DEVICE_DEFAULT_SPEED_RES = 190735
 
+AXIS = "axis"
+
 states = OrderedDict([("Stopped", StoppedState()),
                       ("Moving", MovingState())])
 
@@ -22,11 +25,10 @@ class SimulatedLinmot(StateMachineDevice):
         """
         Initialize all of the device's attributes.
         """
-        self.position = 0
-        self.target_position = 0
+        self.motion = MotionEngine([AXIS], speed=DEVICE_DEFAULT_VELO, tolerance=0.01,
+                                   limits=(HARD_LIMIT_MINIMUM, HARD_LIMIT_MAXIMUM))
         self.inside_hard_limits = True
 
-        self.velocity = DEVICE_DEFAULT_VELO
         self.maximal_acceleration = DEVICE_DEFAULT_MAX_ACCEL
         self.speed_resolution = DEVICE_DEFAULT_SPEED_RES
 
@@ -35,7 +37,6 @@ class SimulatedLinmot(StateMachineDevice):
 
         self.new_action = False
         self.position_reached = False
-        self.tolerance = 0.01
 
     def _get_transition_handlers(self):
         return OrderedDict([
@@ -43,6 +44,34 @@ class SimulatedLinmot(StateMachineDevice):
             (("Moving", "Stopped"), lambda: self.position_reached is True),
         ])
 
+    @property
+    def position(self):
+        return self.motion.position(AXIS)
+
+    @position.setter
+    def position(self, position):
+        self.motion.set_position(AXIS, position)
+
+    @property
+    def target_position(self):
+        return self.motion.target(AXIS)
+
+    @target_position.setter
+    def target_position(self, target_position):
+        self.motion.move(AXIS, target_position)
+
+    @property
+    def velocity(self):
+        return self.motion.speed(AXIS)
+
+    @velocity.setter
+    def velocity(self, velocity):
+        self.motion.set_speed(AXIS, velocity)
+
+    @property
+    def tolerance(self):
+        return self.motion.tolerance(AXIS)
+
     @property
     def state(self):
         return self._csm.state
@@ -89,7 +118,7 @@ class SimulatedLinmot(StateMachineDevice):
         The axis has a range of moment, however if taken beyond these then it will put the controller into an
         error state.
         """
-        return HARD_LIMIT_MINIMUM <= self.position <= HARD_LIMIT_MAXIMUM
+        return self.motion.within_limits(AXIS)
 
     def _get_state_handlers(self):
         return states
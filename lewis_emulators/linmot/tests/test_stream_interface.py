@@ -0,0 +1,35 @@
+import unittest
+from hamcrest import assert_that, is_
+
+from lewis_emulators.linmot.device import SimulatedLinmot
+from lewis_emulators.linmot.interfaces import LinmotStreamInterface
+
+
+class LinmotStreamInterfaceTests(unittest.TestCase):
+    """
+    Tests for the replies of the LinMot to requests.
+    """
+
+    def setUp(self):
+        self.device = SimulatedLinmot()
+        self.interface = LinmotStreamInterface()
+        self.interface.device = self.device
+
+    def _request(self, request):
+        request = request.encode("latin-1")
+        command = next(command for command in self.interface.bound_commands if command.can_process(request))
+        return command.process_request(request)
+
+    def _run(self, seconds, dt=0.1):
+        for _ in range(int(round(seconds / dt))):
+            self.device.process(dt)
+
+    def test_that_GIVEN_the_device_has_started_THEN_the_position_is_an_integer(self):
+        assert_that(self._request("!GPA"), is_("#0"))
+
+    def test_that_GIVEN_a_move_to_a_position_has_finished_THEN_the_position_is_the_integer_target(self):
+        assert_that(self._request("!SP1000A"), is_("#"))
+
+        self._run(30.0)
+
+        assert_that(self._request("!GPA"), is_("#1000"))
@@ -5,6 +5,8 @@ from lewis.core.logging import has_log
 from .states import DefaultState
 from lewis.devices import StateMachineDevice
 
+from lewis_emulators.utils.thermal_model import ThermalModel, ThermalAttribute
+
 
 class ChannelTypes(object):
     TEMP = "TEMP"
@@ -17,9 +19,16 @@ class ChannelTypes(object):
 class Channel(object):
     def __init__(self, channel_type, nickname):
         super(Channel, self).__init__()
+        # Fragments of bulk replies rendered from the channel, see MercuryitcInterface._fragment
+        self.fragments = {}
         self.channel_type = channel_type
         self.nickname = nickname
 
+    def __setattr__(self, name, value):
+        super(Channel, self).__setattr__(name, value)
+        # Counts the changes to the channel, so cached fragments of replies can tell they are out of date
+        self.__dict__["revision"] = self.__dict__.get("revision", 0) + 1
+
 
 class TempPressureCommonChannel(Channel):
     """
@@ -49,7 +58,18 @@ class TempPressureCommonChannel(Channel):
 
 
 class TemperatureChannel(TempPressureCommonChannel):
-    def __init__(self, nickname):
+    # Held by the device's thermal model; the heater is under PID control, with the channel's gains, when it is
+    # automatic. The gains start at 0 as on the other channels, so they must be set for the heater to come on.
+    temperature = ThermalAttribute("temperature")
+    temperature_sp = ThermalAttribute("setpoint")
+    heater_auto = ThermalAttribute("closed_loop")
+    heater_percent = ThermalAttribute("heater")
+    p = ThermalAttribute("p")
+    i = ThermalAttribute("i")
+    d = ThermalAttribute("d")
+
+    def __init__(self, nickname, thermal_channel):
+        self.thermal_channel = thermal_channel
         super(TemperatureChannel, self).__init__(ChannelTypes.TEMP, nickname)
 
         self.temperature = 0
@@ -100,14 +120,18 @@ class SimulatedMercuryitc(StateMachineDevice):
 
         self.resistance_suffix = "O"
 
+        # Temperatures only follow the model when it is enabled, otherwise they stay where they are set
+        self.thermal_model = ThermalModel()
+        self.thermal_model_enabled = False
+
         self.channels = {
             # Temperature channel 1
-            "MB0.T0": TemperatureChannel("MB0.T0"),
+            "MB0.T0": TemperatureChannel("MB0.T0", self.thermal_model.add_channel()),
             "MB1.H0": HeaterChannel("DB0.H0"),
             "DB1.A0": AuxChannel("DB1.A0"),
 
             # Temperature channel 2
-            "DB2.T1": TemperatureChannel("DB2.T1"),
+            "DB2.T1": TemperatureChannel("DB2.T1", self.thermal_model.add_channel()),
             "DB3.H1": HeaterChannel("DB3.H1"),
             "DB4.A1": AuxChannel("DB4.A1"),
 
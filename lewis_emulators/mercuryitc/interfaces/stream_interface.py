@@ -1,8 +1,8 @@
-from lewis.adapters.stream import StreamInterface
 from lewis.core.logging import has_log
 
 from lewis_emulators.mercuryitc.device import ChannelTypes
-from lewis_emulators.utils.command_builder import CmdBuilder
+from lewis.adapters.stream import StreamInterface
+from lewis_emulators.utils.path_router import RoutingStreamInterface
 from lewis_emulators.utils.replies import conditional_reply
 
 if_connected = conditional_reply("connected")
@@ -10,128 +10,85 @@ if_connected = conditional_reply("connected")
 ISOBUS_PREFIX = "@1"
 
 
+def _on_off(value):
+    return "ON" if value else "OFF"
+
+
 @has_log
-class MercuryitcInterface(StreamInterface):
-    commands = {
+class MercuryitcInterface(RoutingStreamInterface, StreamInterface):
+
+    route_prefix = ISOBUS_PREFIX
+    routes = (
         # System-level commands
-        CmdBuilder("get_catalog").optional(ISOBUS_PREFIX)
-            .escape("READ:SYS:CAT").eos().build(),
-        CmdBuilder("read_calib_tables").optional(ISOBUS_PREFIX)
-            .escape("READ:FILE:calibration_tables:LIST").eos().build(),
-        CmdBuilder("get_nickname").optional(ISOBUS_PREFIX)
-            .escape("READ:DEV:").any_except(":").escape(":").any_except(":").escape(":NICK").eos().build(),
-        CmdBuilder("set_nickname").optional(ISOBUS_PREFIX)
-            .escape("SET:DEV:").any_except(":").escape(":").any_except(":").escape(":NICK:").any_except(":").eos().build(),
+        ("READ:SYS:CAT", "get_catalog"),
+        ("READ:FILE:calibration_tables:LIST", "read_calib_tables"),
+        ("READ:DEV:{channel}:*:NICK", "get_nickname"),
+        ("SET:DEV:{channel}:*:NICK:{}", "set_nickname"),
 
         # Calibration files
-        CmdBuilder("get_calib_file").optional(ISOBUS_PREFIX)
-            .escape("READ:DEV:").any_except(":").escape(":").any_except(":").escape(":CAL:FILE").eos().build(),
-        CmdBuilder("set_calib_file").optional(ISOBUS_PREFIX)
-            .escape("SET:DEV:").any_except(":").escape(":").any_except(":").escape(":CAL:FILE:").any_except(":").eos().build(),
+        ("READ:DEV:{channel}:*:CAL:FILE", "get_calib_file"),
+        ("SET:DEV:{channel}:*:CAL:FILE:{}", "set_calib_file"),
 
         # Commands to read all info at once
-        CmdBuilder("get_all_temp_sensor_details").optional(ISOBUS_PREFIX)
-            .escape("READ:DEV:").any_except(":").escape(":TEMP").eos().build(),
-        CmdBuilder("get_all_pressure_sensor_details").optional(ISOBUS_PREFIX)
-            .escape("READ:DEV:").any_except(":").escape(":PRES").eos().build(),
-        CmdBuilder("get_all_heater_details").optional(ISOBUS_PREFIX)
-            .escape("READ:DEV:").any_except(":").escape(":HTR").eos().build(),
-        CmdBuilder("get_all_aux_details").optional(ISOBUS_PREFIX)
-            .escape("READ:DEV:").any_except(":").escape(":AUX").eos().build(),
-        CmdBuilder("get_all_level_sensor_details").optional(ISOBUS_PREFIX)
-            .escape("READ:DEV:").any_except(":").escape(":LVL").eos().build(),
+        ("READ:DEV:{channel}:TEMP", "get_all_temp_sensor_details"),
+        ("READ:DEV:{channel}:PRES", "get_all_pressure_sensor_details"),
+        ("READ:DEV:{channel}:HTR", "get_all_heater_details"),
+        ("READ:DEV:{channel}:AUX", "get_all_aux_details"),
+        ("READ:DEV:{channel}:LVL", "get_all_level_sensor_details"),
 
         # Get heater & aux card associations
-        CmdBuilder("get_associated_heater").optional(ISOBUS_PREFIX)
-            .escape("READ:DEV:").any_except(":").escape(":").any_except(":").escape(":LOOP:HTR").eos().build(),
-        CmdBuilder("set_associated_heater").optional(ISOBUS_PREFIX)
-            .escape("SET:DEV:").any_except(":").escape(":").any_except(":").escape(":LOOP:HTR:").any_except(":").eos().build(),
-        CmdBuilder("get_associated_aux").optional(ISOBUS_PREFIX)
-            .escape("READ:DEV:").any_except(":").escape(":").any_except(":").escape(":LOOP:AUX").eos().build(),
-        CmdBuilder("set_associated_aux").optional(ISOBUS_PREFIX)
-            .escape("SET:DEV:").any_except(":").escape(":").any_except(":").escape(":LOOP:AUX:").any_except(":").eos().build(),
+        ("READ:DEV:{channel}:*:LOOP:HTR", "get_associated_heater"),
+        ("SET:DEV:{channel}:*:LOOP:HTR:{}", "set_associated_heater"),
+        ("READ:DEV:{channel}:*:LOOP:AUX", "get_associated_aux"),
+        ("SET:DEV:{channel}:*:LOOP:AUX:{}", "set_associated_aux"),
 
         # PID settings
-        CmdBuilder("get_autopid").optional(ISOBUS_PREFIX)
-            .escape("READ:DEV:").any_except(":").escape(":").any_except(":").escape(":LOOP:PIDT").eos().build(),
-        CmdBuilder("set_autopid").optional(ISOBUS_PREFIX)
-            .escape("SET:DEV:").any_except(":").escape(":").any_except(":").escape(":LOOP:PIDT:").enum("ON", "OFF").eos().build(),
-        CmdBuilder("get_temp_p").optional(ISOBUS_PREFIX)
-            .escape("READ:DEV:").any_except(":").escape(":").any_except(":").escape(":LOOP:P").eos().build(),
-        CmdBuilder("set_temp_p").optional(ISOBUS_PREFIX)
-            .escape("SET:DEV:").any_except(":").escape(":").any_except(":").escape(":LOOP:P:").float().eos().build(),
-        CmdBuilder("get_temp_i").optional(ISOBUS_PREFIX)
-            .escape("READ:DEV:").any_except(":").escape(":").any_except(":").escape(":LOOP:I").eos().build(),
-        CmdBuilder("set_temp_i").optional(ISOBUS_PREFIX)
-            .escape("SET:DEV:").any_except(":").escape(":").any_except(":").escape(":LOOP:I:").float().eos().build(),
-        CmdBuilder("get_temp_d").optional(ISOBUS_PREFIX)
-            .escape("READ:DEV:").any_except(":").escape(":").any_except(":").escape(":LOOP:D").eos().build(),
-        CmdBuilder("set_temp_d").optional(ISOBUS_PREFIX)
-            .escape("SET:DEV:").any_except(":").escape(":").any_except(":").escape(":LOOP:D:").float().eos().build(),
+        ("READ:DEV:{channel}:*:LOOP:PIDT", "get_autopid"),
+        ("SET:DEV:{channel}:*:LOOP:PIDT:{ON|OFF}", "set_autopid"),
+        ("READ:DEV:{channel}:*:LOOP:P", "get_temp_p"),
+        ("SET:DEV:{channel}:*:LOOP:P:{float}", "set_temp_p"),
+        ("READ:DEV:{channel}:*:LOOP:I", "get_temp_i"),
+        ("SET:DEV:{channel}:*:LOOP:I:{float}", "set_temp_i"),
+        ("READ:DEV:{channel}:*:LOOP:D", "get_temp_d"),
+        ("SET:DEV:{channel}:*:LOOP:D:{float}", "set_temp_d"),
 
         # Raw measurements
-        CmdBuilder("get_temp_measured").optional(ISOBUS_PREFIX)
-            .escape("READ:DEV:").any_except(":").escape(":TEMP:SIG:TEMP").eos().build(),
-        CmdBuilder("get_pres_measured").optional(ISOBUS_PREFIX)
-            .escape("READ:DEV:").any_except(":").escape(":PRES:SIG:PRES").eos().build(),
-        CmdBuilder("get_resistance").optional(ISOBUS_PREFIX)
-            .escape("READ:DEV:").any_except(":").escape(":TEMP:SIG:RES").eos().build(),
-        CmdBuilder("get_voltage").optional(ISOBUS_PREFIX)
-            .escape("READ:DEV:").any_except(":").escape(":PRES:SIG:VOLT").eos().build(),
+        ("READ:DEV:{channel}:TEMP:SIG:TEMP", "get_temp_measured"),
+        ("READ:DEV:{channel}:PRES:SIG:PRES", "get_pres_measured"),
+        ("READ:DEV:{channel}:TEMP:SIG:RES", "get_resistance"),
+        ("READ:DEV:{channel}:PRES:SIG:VOLT", "get_voltage"),
 
         # Control loop
-        CmdBuilder("get_temp_setpoint").optional(ISOBUS_PREFIX)
-            .escape("READ:DEV:").any_except(":").escape(":TEMP:LOOP:TSET").eos().build(),
-        CmdBuilder("get_pres_setpoint").optional(ISOBUS_PREFIX)
-            .escape("READ:DEV:").any_except(":").escape(":PRES:LOOP:PRST").eos().build(),
-        CmdBuilder("set_temp_setpoint").optional(ISOBUS_PREFIX)
-            .escape("SET:DEV:").any_except(":").escape(":TEMP:LOOP:TSET:").float().escape("K").eos().build(),
-        CmdBuilder("set_pres_setpoint").optional(ISOBUS_PREFIX)
-            .escape("SET:DEV:").any_except(":").escape(":PRES:LOOP:PRST:").float().escape("mB").eos().build(),
+        ("READ:DEV:{channel}:TEMP:LOOP:TSET", "get_temp_setpoint"),
+        ("READ:DEV:{channel}:PRES:LOOP:PRST", "get_pres_setpoint"),
+        ("SET:DEV:{channel}:TEMP:LOOP:TSET:{float}K", "set_temp_setpoint"),
+        ("SET:DEV:{channel}:PRES:LOOP:PRST:{float}mB", "set_pres_setpoint"),
 
         # Heater
-        CmdBuilder("get_heater_auto").optional(ISOBUS_PREFIX)
-            .escape("READ:DEV:").any_except(":").escape(":").any_except(":").escape(":LOOP:ENAB").eos().build(),
-        CmdBuilder("set_heater_auto").optional(ISOBUS_PREFIX)
-            .escape("SET:DEV:").any_except(":").escape(":").any_except(":").escape(":LOOP:ENAB:").enum("ON", "OFF").eos().build(),
-        CmdBuilder("get_heater_percent").optional(ISOBUS_PREFIX)
-            .escape("READ:DEV:").any_except(":").escape(":").any_except(":").escape(":LOOP:HSET").eos().build(),
-        CmdBuilder("set_heater_percent").optional(ISOBUS_PREFIX)
-            .escape("SET:DEV:").any_except(":").escape(":").any_except(":").escape(":LOOP:HSET:").float().eos().build(),
-        CmdBuilder("get_heater_voltage").optional(ISOBUS_PREFIX)
-            .escape("READ:DEV:").any_except(":").escape(":HTR:SIG:VOLT").eos().build(),
-        CmdBuilder("get_heater_current").optional(ISOBUS_PREFIX)
-            .escape("READ:DEV:").any_except(":").escape(":HTR:SIG:CURR").eos().build(),
-        CmdBuilder("get_heater_power").optional(ISOBUS_PREFIX)
-            .escape("READ:DEV:").any_except(":").escape(":HTR:SIG:POWR").eos().build(),
-        CmdBuilder("get_heater_voltage_limit").optional(ISOBUS_PREFIX)
-            .escape("READ:DEV:").any_except(":").escape(":HTR:VLIM").eos().build(),
-        CmdBuilder("set_heater_voltage_limit").optional(ISOBUS_PREFIX)
-            .escape("SET:DEV:").any_except(":").escape(":HTR:VLIM:").float().eos().build(),
+        ("READ:DEV:{channel}:*:LOOP:ENAB", "get_heater_auto"),
+        ("SET:DEV:{channel}:*:LOOP:ENAB:{ON|OFF}", "set_heater_auto"),
+        ("READ:DEV:{channel}:*:LOOP:HSET", "get_heater_percent"),
+        ("SET:DEV:{channel}:*:LOOP:HSET:{float}", "set_heater_percent"),
+        ("READ:DEV:{channel}:HTR:SIG:VOLT", "get_heater_voltage"),
+        ("READ:DEV:{channel}:HTR:SIG:CURR", "get_heater_current"),
+        ("READ:DEV:{channel}:HTR:SIG:POWR", "get_heater_power"),
+        ("READ:DEV:{channel}:HTR:VLIM", "get_heater_voltage_limit"),
+        ("SET:DEV:{channel}:HTR:VLIM:{float}", "set_heater_voltage_limit"),
 
         # Gas flow
-        CmdBuilder("get_gas_flow_auto").optional(ISOBUS_PREFIX)
-            .escape("READ:DEV:").any_except(":").escape(":").any_except(":").escape(":LOOP:FAUT").eos().build(),
-        CmdBuilder("set_gas_flow_auto").optional(ISOBUS_PREFIX)
-            .escape("SET:DEV:").any_except(":").escape(":").any_except(":").escape(":LOOP:FAUT:").enum("ON", "OFF").eos().build(),
-        CmdBuilder("get_gas_flow").optional(ISOBUS_PREFIX)
-            .escape("READ:DEV:").any_except(":").escape(":AUX:SIG:PERC").eos().build(),
-        CmdBuilder("set_gas_flow").optional(ISOBUS_PREFIX)
-            .escape("SET:DEV:").any_except(":").escape(":").any_except(":").escape(":LOOP:FSET:").float().eos().build(),
+        ("READ:DEV:{channel}:*:LOOP:FAUT", "get_gas_flow_auto"),
+        ("SET:DEV:{channel}:*:LOOP:FAUT:{ON|OFF}", "set_gas_flow_auto"),
+        ("READ:DEV:{channel}:AUX:SIG:PERC", "get_gas_flow"),
+        ("SET:DEV:{channel}:*:LOOP:FSET:{float}", "set_gas_flow"),
 
         # Gas levels
-        CmdBuilder("get_nitrogen_level").optional(ISOBUS_PREFIX)
-            .escape("READ:DEV:").any_except(":").escape(":LVL:SIG:NIT:LEV").eos().build(),
-        CmdBuilder("get_helium_level").optional(ISOBUS_PREFIX)
-            .escape("READ:DEV:").any_except(":").escape(":LVL:SIG:HEL:LEV").eos().build(),
+        ("READ:DEV:{channel}:LVL:SIG:NIT:LEV", "get_nitrogen_level"),
+        ("READ:DEV:{channel}:LVL:SIG:HEL:LEV", "get_helium_level"),
 
         # Level card probe rates
-        CmdBuilder("get_helium_probe_speed").optional(ISOBUS_PREFIX)
-            .escape("READ:DEV:").any_except(":").escape(":LVL:HEL:PULS:SLOW").eos().build(),
-        CmdBuilder("set_helium_probe_speed").optional(ISOBUS_PREFIX)
-            .escape("SET:DEV:").any_except(":").escape(":LVL:HEL:PULS:SLOW:").float().eos().build(),
-
-    }
+        ("READ:DEV:{channel}:LVL:HEL:PULS:SLOW", "get_helium_probe_speed"),
+        ("SET:DEV:{channel}:LVL:HEL:PULS:SLOW:{float}", "set_helium_probe_speed"),
+    )
 
     in_terminator = "\n"
     out_terminator = "\n"
@@ -174,350 +131,317 @@ class MercuryitcInterface(StreamInterface):
 
         return self.device.channels[deviceid]
 
+    def resolve_channel(self, channel_id, channel_type):
+        """
+        Gets the channel a request is for, before the request is handed to its handler.
+
+        Args:
+            channel_id: the device identifier in the request e.g. "MB0", "DB1"
+            channel_type: the type of channel in the request, one of ChannelTypes
+        """
+        if not self.device.connected:
+            # The handlers do not reply while disconnected, so nor should a request for a channel which is not there
+            return None
+        return self._chan_from_id(channel_id, expected_type=channel_type)
+
+    @staticmethod
+    def _fragment(name, render, chan, *sources):
+        """
+        Gets a fragment of a bulk reply, rendering it again only if the channel or any other channels it is rendered
+        from have changed since it was last rendered. Values the thermal model changes (temperatures and heater
+        outputs) change without the channel knowing, so must not be rendered in a fragment.
+
+        Args:
+            name: the name of the fragment
+            render: function rendering the fragment
+            chan: the channel the fragment is cached for
+            sources: any other channels the fragment is rendered from
+        """
+        revisions = tuple(source.revision for source in (chan,) + sources)
+        cached = chan.fragments.get(name)
+        if cached is None or cached[0] != revisions:
+            cached = chan.fragments[name] = (revisions, render())
+        return cached[1]
+
     @if_connected
-    def get_nickname(self, deviceid, devicetype):
-        chan = self._chan_from_id(deviceid, expected_type=devicetype)
-        return "STAT:DEV:{}:{}:NICK:{}".format(deviceid, devicetype, chan.nickname)
+    def get_nickname(self, deviceid, chan):
+        return "STAT:DEV:{}:{}:NICK:{}".format(deviceid, chan.channel_type, chan.nickname)
 
     @if_connected
-    def set_nickname(self, deviceid, devicetype, nickname):
-        chan = self._chan_from_id(deviceid, expected_type=devicetype)
+    def set_nickname(self, deviceid, chan, nickname):
         chan.nickname = nickname
-        return "STAT:SET:DEV:{}:{}:NICK:{}:VALID".format(deviceid, devicetype, chan.nickname)
+        return "STAT:SET:DEV:{}:{}:NICK:{}:VALID".format(deviceid, chan.channel_type, chan.nickname)
 
     @if_connected
     def read_calib_tables(self):
         return "STAT:FILE:calibration_tables:LIST:fake_table_1;fake_table_2"
 
-    @if_connected
-    def get_all_temp_sensor_details(self, deviceid):
+    def _loop_details(self, chan, setpoint):
+        """
+        Gets the nickname, control loop and calibration details of a temperature or pressure channel for its bulk reply.
+        """
+        aux_chan = self._chan_from_id(chan.associated_aux_channel, expected_type=ChannelTypes.AUX)
+
+        return self._fragment("loop", lambda: (
+                   ":NICK:{}".format(chan.nickname) +
+                   ":LOOP" +
+                     ":AUX:{}".format(chan.associated_aux_channel) +
+                     ":D:{}".format(chan.d) +
+                     ":HTR:{}".format(chan.associated_heater_channel) +
+                     ":I:{}".format(chan.i)), chan) + \
+               ":HSET:{}".format(chan.heater_percent) + \
+               self._fragment("loop_settings", lambda: (
+                     ":PIDT:{}".format(_on_off(chan.autopid)) +
+                     ":ENAB:{}".format(_on_off(chan.heater_auto)) +
+                     ":FAUT:{}".format(_on_off(chan.gas_flow_auto)) +
+                     ":FSET:{}".format(aux_chan.gas_flow) +
+                     ":PIDF:{}".format(chan.autopid_file if chan.autopid else "None") +
+                     ":P:{}".format(chan.p) +
+                     ":TSET:{:.4f}K".format(getattr(chan, setpoint)) +
+                   ":CAL" +
+                     ":FILE:{}".format(chan.calibration_file)), chan, aux_chan)
+
+    @if_connected
+    def get_all_temp_sensor_details(self, deviceid, temp_chan):
         """
         Gets the details for an entire temperature sensor all at once. This is only used by the LabVIEW VI, not by
         the IOC (the ioc queries each parameter individually)
         """
-
-        temp_chan = self._chan_from_id(deviceid, expected_type=ChannelTypes.TEMP)
-        aux_chan = self._chan_from_id(temp_chan.associated_aux_channel, expected_type=ChannelTypes.AUX)
-
         return "STAT:DEV:{}:TEMP:".format(deviceid) + \
-               ":NICK:{}".format(temp_chan.nickname) + \
-               ":LOOP" + \
-                 ":AUX:{}".format(temp_chan.associated_aux_channel) + \
-                 ":D:{}".format(temp_chan.d) + \
-                 ":HTR:{}".format(temp_chan.associated_heater_channel) + \
-                 ":I:{}".format(temp_chan.i) + \
-                 ":HSET:{}".format(temp_chan.heater_percent) + \
-                 ":PIDT:{}".format("ON" if temp_chan.autopid else "OFF") + \
-                 ":ENAB:{}".format("ON" if temp_chan.heater_auto else "OFF") + \
-                 ":FAUT:{}".format("ON" if temp_chan.gas_flow_auto else "OFF") + \
-                 ":FSET:{}".format(aux_chan.gas_flow) + \
-                 ":PIDF:{}".format(temp_chan.autopid_file if temp_chan.autopid else "None") + \
-                 ":P:{}".format(temp_chan.p) + \
-                 ":TSET:{:.4f}K".format(temp_chan.temperature_sp) + \
-               ":CAL" + \
-                 ":FILE:{}".format(temp_chan.calibration_file) + \
+               self._loop_details(temp_chan, "temperature_sp") + \
                ":SIG" + \
                  ":TEMP:{:.4f}K".format(temp_chan.temperature) + \
                  ":RES:{:.4f}O".format(temp_chan.resistance)
 
     @if_connected
-    def get_all_pressure_sensor_details(self, deviceid):
+    def get_all_pressure_sensor_details(self, deviceid, pres_chan):
         """
         Gets the details for an entire temperature sensor all at once. This is only used by the LabVIEW VI, not by
         the IOC (the ioc queries each parameter individually)
         """
-
-        pres_chan = self._chan_from_id(deviceid, expected_type=ChannelTypes.PRES)
-        aux_chan = self._chan_from_id(pres_chan.associated_aux_channel, expected_type=ChannelTypes.AUX)
-
         return "STAT:DEV:{}:PRES:".format(deviceid) + \
-               ":NICK:{}".format(pres_chan.nickname) + \
-               ":LOOP" + \
-                 ":AUX:{}".format(pres_chan.associated_aux_channel) + \
-                 ":D:{}".format(pres_chan.d) + \
-                 ":HTR:{}".format(pres_chan.associated_heater_channel) + \
-                 ":I:{}".format(pres_chan.i) + \
-                 ":HSET:{}".format(pres_chan.heater_percent) + \
-                 ":PIDT:{}".format("ON" if pres_chan.autopid else "OFF") + \
-                 ":ENAB:{}".format("ON" if pres_chan.heater_auto else "OFF") + \
-                 ":FAUT:{}".format("ON" if pres_chan.gas_flow_auto else "OFF") + \
-                 ":FSET:{}".format(aux_chan.gas_flow) + \
-                 ":PIDF:{}".format(pres_chan.autopid_file if pres_chan.autopid else "None") + \
-                 ":P:{}".format(pres_chan.p) + \
-                 ":TSET:{:.4f}K".format(pres_chan.pressure_sp) + \
-               ":CAL" + \
-                 ":FILE:{}".format(pres_chan.calibration_file) + \
+               self._loop_details(pres_chan, "pressure_sp") + \
                ":SIG" + \
                  ":PRES:{:.4f}mBar".format(pres_chan.pressure) + \
                  ":VOLT:{:.4f}V".format(pres_chan.voltage)
 
     @if_connected
-    def get_calib_file(self, deviceid, chan_type):
-        chan = self._chan_from_id(deviceid, expected_type=chan_type)
-        return "STAT:DEV:{}:{}:CAL:FILE:{}".format(deviceid, chan_type, chan.calibration_file)
+    def get_calib_file(self, deviceid, chan):
+        return "STAT:DEV:{}:{}:CAL:FILE:{}".format(deviceid, chan.channel_type, chan.calibration_file)
 
     @if_connected
-    def set_calib_file(self, deviceid, chan_type, calib_file):
-        chan = self._chan_from_id(deviceid, expected_type=chan_type)
+    def set_calib_file(self, deviceid, chan, calib_file):
         if not hasattr(chan, "calibration_file"):
             raise ValueError("Unexpected channel type in set_calib_file")
         chan.calibration_file = calib_file
-        return "STAT:SET:DEV:{}:{}:CAL:FILE:{}:VALID".format(deviceid, chan_type, chan.calibration_file)
+        return "STAT:SET:DEV:{}:{}:CAL:FILE:{}:VALID".format(deviceid, chan.channel_type, chan.calibration_file)
 
     @if_connected
-    def get_associated_heater(self, deviceid, chan_type):
-        chan = self._chan_from_id(deviceid, expected_type=chan_type)
-        return "STAT:DEV:{}:{}:LOOP:HTR:{}".format(deviceid, chan_type, chan.associated_heater_channel)
+    def get_associated_heater(self, deviceid, chan):
+        return "STAT:DEV:{}:{}:LOOP:HTR:{}".format(deviceid, chan.channel_type, chan.associated_heater_channel)
 
     @if_connected
-    def set_associated_heater(self, deviceid, chan_type, new_heater):
-        chan = self._chan_from_id(deviceid, expected_type=chan_type)
+    def set_associated_heater(self, deviceid, chan, new_heater):
         if new_heater == "None":
             chan.associated_heater_channel = None
         else:
             self._chan_from_id(new_heater, expected_type=ChannelTypes.HTR)
             chan.associated_heater_channel = new_heater
-        return "STAT:SET:DEV:{}:{}:LOOP:HTR:{}:VALID".format(deviceid, chan_type, chan.associated_heater_channel)
+        return "STAT:SET:DEV:{}:{}:LOOP:HTR:{}:VALID".format(deviceid, chan.channel_type,
+                                                             chan.associated_heater_channel)
 
     @if_connected
-    def get_associated_aux(self, deviceid, chan_type):
-        chan = self._chan_from_id(deviceid, expected_type=chan_type)
-        return "STAT:DEV:{}:{}:LOOP:AUX:{}".format(deviceid, chan_type, chan.associated_aux_channel)
+    def get_associated_aux(self, deviceid, chan):
+        return "STAT:DEV:{}:{}:LOOP:AUX:{}".format(deviceid, chan.channel_type, chan.associated_aux_channel)
 
     @if_connected
-    def set_associated_aux(self, deviceid, chan_type, new_aux):
-        chan = self._chan_from_id(deviceid, expected_type=chan_type)
+    def set_associated_aux(self, deviceid, chan, new_aux):
         if new_aux == "None":
             chan.associated_aux_channel = None
         else:
             self._chan_from_id(new_aux, expected_type=ChannelTypes.AUX)
             chan.associated_aux_channel = new_aux
-        return "STAT:SET:DEV:{}:{}:LOOP:AUX:{}:VALID".format(deviceid, chan_type, chan.associated_aux_channel)
+        return "STAT:SET:DEV:{}:{}:LOOP:AUX:{}:VALID".format(deviceid, chan.channel_type, chan.associated_aux_channel)
 
     @if_connected
-    def get_autopid(self, deviceid, chan_type):
-        chan = self._chan_from_id(deviceid, expected_type=chan_type)
-        return "STAT:DEV:{}:{}:LOOP:PIDT:{}".format(deviceid, chan_type, "ON" if chan.autopid else "OFF")
+    def get_autopid(self, deviceid, chan):
+        return "STAT:DEV:{}:{}:LOOP:PIDT:{}".format(deviceid, chan.channel_type, _on_off(chan.autopid))
 
     @if_connected
-    def set_autopid(self, deviceid, chan_type, sp):
-        chan = self._chan_from_id(deviceid, expected_type=chan_type)
+    def set_autopid(self, deviceid, chan, sp):
         chan.autopid = (sp == "ON")
-        return "STAT:SET:DEV:{}:{}:LOOP:PIDT:{}:VALID".format(deviceid, chan_type, sp)
+        return "STAT:SET:DEV:{}:{}:LOOP:PIDT:{}:VALID".format(deviceid, chan.channel_type, sp)
 
     @if_connected
-    def get_temp_p(self, deviceid, chan_type):
-        chan = self._chan_from_id(deviceid, expected_type=chan_type)
-        return "STAT:DEV:{}:{}:LOOP:P:{:.4f}".format(deviceid, chan_type, chan.p)
+    def get_temp_p(self, deviceid, chan):
+        return "STAT:DEV:{}:{}:LOOP:P:{:.4f}".format(deviceid, chan.channel_type, chan.p)
 
     @if_connected
-    def set_temp_p(self, deviceid, chan_type, p):
-        chan = self._chan_from_id(deviceid, expected_type=chan_type)
+    def set_temp_p(self, deviceid, chan, p):
         chan.p = p
-        return "STAT:SET:DEV:{}:{}:LOOP:P:{:.4f}:VALID".format(deviceid, chan_type, p)
+        return "STAT:SET:DEV:{}:{}:LOOP:P:{:.4f}:VALID".format(deviceid, chan.channel_type, p)
 
     @if_connected
-    def get_temp_i(self, deviceid, chan_type):
-        chan = self._chan_from_id(deviceid, expected_type=chan_type)
-        return "STAT:DEV:{}:{}:LOOP:I:{:.4f}".format(deviceid, chan_type, chan.i)
+    def get_temp_i(self, deviceid, chan):
+        return "STAT:DEV:{}:{}:LOOP:I:{:.4f}".format(deviceid, chan.channel_type, chan.i)
 
     @if_connected
-    def set_temp_i(self, deviceid, chan_type, i):
-        chan = self._chan_from_id(deviceid, expected_type=chan_type)
+    def set_temp_i(self, deviceid, chan, i):
         chan.i = i
-        return "STAT:SET:DEV:{}:{}:LOOP:I:{:.4f}:VALID".format(deviceid, chan_type, i)
+        return "STAT:SET:DEV:{}:{}:LOOP:I:{:.4f}:VALID".format(deviceid, chan.channel_type, i)
 
     @if_connected
-    def get_temp_d(self, deviceid, chan_type):
-        chan = self._chan_from_id(deviceid, expected_type=chan_type)
-        return "STAT:DEV:{}:{}:LOOP:D:{:.4f}".format(deviceid, chan_type, chan.d)
+    def get_temp_d(self, deviceid, chan):
+        return "STAT:DEV:{}:{}:LOOP:D:{:.4f}".format(deviceid, chan.channel_type, chan.d)
 
     @if_connected
-    def set_temp_d(self, deviceid, chan_type, d):
-        chan = self._chan_from_id(deviceid, expected_type=chan_type)
+    def set_temp_d(self, deviceid, chan, d):
         chan.d = d
-        return "STAT:SET:DEV:{}:{}:LOOP:D:{:.4f}:VALID".format(deviceid, chan_type, d)
+        return "STAT:SET:DEV:{}:{}:LOOP:D:{:.4f}:VALID".format(deviceid, chan.channel_type, d)
 
     @if_connected
-    def get_temp_measured(self, deviceid):
-        chan = self._chan_from_id(deviceid, expected_type=ChannelTypes.TEMP)
+    def get_temp_measured(self, deviceid, chan):
         return "STAT:DEV:{}:TEMP:SIG:TEMP:{:.4f}K".format(deviceid, chan.temperature)
 
     @if_connected
-    def get_pres_measured(self, deviceid):
-        chan = self._chan_from_id(deviceid, expected_type=ChannelTypes.PRES)
+    def get_pres_measured(self, deviceid, chan):
         return "STAT:DEV:{}:PRES:SIG:PRES:{:.4f}mB".format(deviceid, chan.pressure)
 
     @if_connected
-    def get_temp_setpoint(self, deviceid):
-        chan = self._chan_from_id(deviceid, expected_type=ChannelTypes.TEMP)
+    def get_temp_setpoint(self, deviceid, chan):
         return "STAT:DEV:{}:TEMP:LOOP:TSET:{:.4f}K".format(deviceid, chan.temperature_sp)
 
     @if_connected
-    def get_pres_setpoint(self, deviceid):
-        chan = self._chan_from_id(deviceid, expected_type=ChannelTypes.PRES)
+    def get_pres_setpoint(self, deviceid, chan):
         return "STAT:DEV:{}:PRES:LOOP:PRST:{:.4f}mB".format(deviceid, chan.pressure_sp)
 
     @if_connected
-    def set_temp_setpoint(self, deviceid, sp):
-        chan = self._chan_from_id(deviceid, expected_type=ChannelTypes.TEMP)
+    def set_temp_setpoint(self, deviceid, chan, sp):
         chan.temperature_sp = sp
         return "STAT:SET:DEV:{}:TEMP:LOOP:TSET:{:.4f}K:VALID".format(deviceid, sp)
 
     @if_connected
-    def set_pres_setpoint(self, deviceid, sp):
-        chan = self._chan_from_id(deviceid, expected_type=ChannelTypes.PRES)
+    def set_pres_setpoint(self, deviceid, chan, sp):
         chan.pressure_sp = sp
         return "STAT:SET:DEV:{}:PRES:LOOP:PRST:{:.4f}mB:VALID".format(deviceid, sp)
 
     @if_connected
-    def get_resistance(self, deviceid):
-        chan = self._chan_from_id(deviceid, expected_type=ChannelTypes.TEMP)
+    def get_resistance(self, deviceid, chan):
         return "STAT:DEV:{}:TEMP:SIG:RES:{:.4f}{}".format(deviceid, chan.resistance, self.device.resistance_suffix)
 
     @if_connected
-    def get_voltage(self, deviceid):
-        chan = self._chan_from_id(deviceid, expected_type=ChannelTypes.PRES)
+    def get_voltage(self, deviceid, chan):
         return "STAT:DEV:{}:PRES:SIG:VOLT:{:.4f}V".format(deviceid, chan.voltage)
 
     @if_connected
-    def get_heater_auto(self, deviceid, chan_type):
-        chan = self._chan_from_id(deviceid, expected_type=chan_type)
-        return "STAT:DEV:{}:{}:LOOP:ENAB:{}".format(deviceid, chan_type, "ON" if chan.heater_auto else "OFF")
+    def get_heater_auto(self, deviceid, chan):
+        return "STAT:DEV:{}:{}:LOOP:ENAB:{}".format(deviceid, chan.channel_type, _on_off(chan.heater_auto))
 
     @if_connected
-    def set_heater_auto(self, deviceid, chan_type, sp):
-        chan = self._chan_from_id(deviceid, expected_type=chan_type)
+    def set_heater_auto(self, deviceid, chan, sp):
         chan.heater_auto = (sp == "ON")
-        return "STAT:SET:DEV:{}:{}:LOOP:ENAB:{}:VALID".format(deviceid, chan_type, "ON" if chan.heater_auto else "OFF")
+        return "STAT:SET:DEV:{}:{}:LOOP:ENAB:{}:VALID".format(deviceid, chan.channel_type, _on_off(chan.heater_auto))
 
     @if_connected
-    def get_gas_flow_auto(self, deviceid, chan_type):
-        chan = self._chan_from_id(deviceid, expected_type=chan_type)
-        return "STAT:DEV:{}:{}:LOOP:FAUT:{}".format(deviceid, chan_type, "ON" if chan.gas_flow_auto else "OFF")
+    def get_gas_flow_auto(self, deviceid, chan):
+        return "STAT:DEV:{}:{}:LOOP:FAUT:{}".format(deviceid, chan.channel_type, _on_off(chan.gas_flow_auto))
 
     @if_connected
-    def set_gas_flow_auto(self, deviceid, chan_type, sp):
-        chan = self._chan_from_id(deviceid, expected_type=chan_type)
+    def set_gas_flow_auto(self, deviceid, chan, sp):
         chan.gas_flow_auto = (sp == "ON")
-        return "STAT:SET:DEV:{}:{}:LOOP:FAUT:{}:VALID".format(deviceid, chan_type, "ON" if chan.gas_flow_auto else "OFF")
+        return "STAT:SET:DEV:{}:{}:LOOP:FAUT:{}:VALID".format(deviceid, chan.channel_type, _on_off(chan.gas_flow_auto))
 
     @if_connected
-    def get_heater_percent(self, deviceid, chan_type):
-        chan = self._chan_from_id(deviceid, expected_type=chan_type)
-        return "STAT:DEV:{}:{}:LOOP:HSET:{:.4f}".format(deviceid, chan_type, chan.heater_percent)
+    def get_heater_percent(self, deviceid, chan):
+        return "STAT:DEV:{}:{}:LOOP:HSET:{:.4f}".format(deviceid, chan.channel_type, chan.heater_percent)
 
     @if_connected
-    def set_heater_percent(self, deviceid, chan_type, sp):
-        chan = self._chan_from_id(deviceid, expected_type=chan_type)
+    def set_heater_percent(self, deviceid, chan, sp):
         chan.heater_percent = sp
-        return "STAT:SET:DEV:{}:{}:LOOP:HSET:{:.4f}:VALID".format(deviceid, chan_type, sp)
+        return "STAT:SET:DEV:{}:{}:LOOP:HSET:{:.4f}:VALID".format(deviceid, chan.channel_type, sp)
 
     @if_connected
-    def get_gas_flow(self, deviceid):
-        aux_chan = self._chan_from_id(deviceid, expected_type=ChannelTypes.AUX)
+    def get_gas_flow(self, deviceid, aux_chan):
         return "STAT:DEV:{}:AUX:SIG:PERC:{:.4f}%".format(deviceid, aux_chan.gas_flow)
 
     @if_connected
-    def set_gas_flow(self, deviceid, chan_type, sp):
-        temp_chan = self._chan_from_id(deviceid, expected_type=chan_type)
+    def set_gas_flow(self, deviceid, temp_chan, sp):
         aux_chan = self._chan_from_id(temp_chan.associated_aux_channel, expected_type=ChannelTypes.AUX)
         aux_chan.gas_flow = sp
-        return "STAT:SET:DEV:{}:{}:LOOP:FSET:{:.4f}:VALID".format(deviceid, chan_type, sp)
+        return "STAT:SET:DEV:{}:{}:LOOP:FSET:{:.4f}:VALID".format(deviceid, temp_chan.channel_type, sp)
 
     @if_connected
-    def get_all_heater_details(self, deviceid):
+    def get_all_heater_details(self, deviceid, chan):
         """
         Gets the details for an entire heater sensor all at once. This is only used by the LabVIEW VI, not by
         the IOC (the ioc queries each parameter individually)
         """
-
-        chan = self._chan_from_id(deviceid, expected_type=ChannelTypes.HTR)
-
-        return "STAT:DEV:{}:HTR".format(deviceid) + \
-               ":NICK:{}".format(chan.nickname) + \
-               ":VLIM:{}".format(chan.voltage_limit) + \
-               ":SIG" + \
-                 ":VOLT:{:.4f}V".format(chan.voltage) + \
-                 ":CURR:{:.4f}A".format(chan.current) + \
-                 ":POWR:{:.4f}W".format(chan.power)
+        return "STAT:DEV:{}:HTR".format(deviceid) + self._fragment("details", lambda: (
+               ":NICK:{}".format(chan.nickname) +
+               ":VLIM:{}".format(chan.voltage_limit) +
+               ":SIG" +
+                 ":VOLT:{:.4f}V".format(chan.voltage) +
+                 ":CURR:{:.4f}A".format(chan.current) +
+                 ":POWR:{:.4f}W".format(chan.power)), chan)
 
     @if_connected
-    def get_heater_voltage_limit(self, deviceid):
-        chan = self._chan_from_id(deviceid, expected_type=ChannelTypes.HTR)
+    def get_heater_voltage_limit(self, deviceid, chan):
         return "STAT:DEV:{}:HTR:VLIM:{:.4f}".format(deviceid, chan.voltage_limit)
 
     @if_connected
-    def set_heater_voltage_limit(self, deviceid, sp):
-        chan = self._chan_from_id(deviceid, expected_type=ChannelTypes.HTR)
+    def set_heater_voltage_limit(self, deviceid, chan, sp):
         chan.voltage_limit = sp
         return "STAT:SET:DEV:{}:HTR:VLIM:{:.4f}:VALID".format(deviceid, chan.voltage_limit)
 
     @if_connected
-    def get_heater_voltage(self, deviceid):
-        chan = self._chan_from_id(deviceid, expected_type=ChannelTypes.HTR)
+    def get_heater_voltage(self, deviceid, chan):
         return "STAT:DEV:{}:HTR:SIG:VOLT:{:.4f}V".format(deviceid, chan.voltage)
 
     @if_connected
-    def get_heater_current(self, deviceid):
-        chan = self._chan_from_id(deviceid, expected_type=ChannelTypes.HTR)
+    def get_heater_current(self, deviceid, chan):
         return "STAT:DEV:{}:HTR:SIG:CURR:{:.4f}A".format(deviceid, chan.current)
 
     @if_connected
-    def get_heater_power(self, deviceid):
-        chan = self._chan_from_id(deviceid, expected_type=ChannelTypes.HTR)
+    def get_heater_power(self, deviceid, chan):
         return "STAT:DEV:{}:HTR:SIG:POWR:{:.4f}W".format(deviceid, chan.power)
 
     @if_connected
-    def get_all_aux_details(self, deviceid):
+    def get_all_aux_details(self, deviceid, chan):
         """
         Gets the details for an entire aux sensor all at once. This is only used by the LabVIEW VI, not by
         the IOC (the ioc queries each parameter individually)
         """
-        chan = self._chan_from_id(deviceid, expected_type=ChannelTypes.AUX)
-
-        return "STAT:DEV:{}:AUX".format(deviceid) + \
-               ":NICK:{}".format(chan.nickname) + \
-               ":SIG" \
-                 ":PERC:{:.4f}".format(chan.gas_flow)
+        return "STAT:DEV:{}:AUX".format(deviceid) + self._fragment("details", lambda: (
+               ":NICK:{}".format(chan.nickname) +
+               ":SIG"
+                 ":PERC:{:.4f}".format(chan.gas_flow)), chan)
 
     @if_connected
-    def get_all_level_sensor_details(self, deviceid):
+    def get_all_level_sensor_details(self, deviceid, lvl_chan):
         """
         Gets the details for an entire temperature sensor all at once. This is only used by the LabVIEW VI, not by
         the IOC (the ioc queries each parameter individually)
         """
-
-        lvl_chan = self._chan_from_id(deviceid, expected_type=ChannelTypes.LVL)
-
-        return "STAT:DEV:{}:TEMP:".format(deviceid) + \
-               ":NICK:{}".format(lvl_chan.nickname) + \
-               ":SIG" + \
-                 ":NIT:LEV:{:.3f}%".format(lvl_chan.nitrogen_level) + \
-                 ":HEL:LEV:{:.3f}%".format(lvl_chan.helium_level)
+        return "STAT:DEV:{}:TEMP:".format(deviceid) + self._fragment("details", lambda: (
+               ":NICK:{}".format(lvl_chan.nickname) +
+               ":SIG" +
+                 ":NIT:LEV:{:.3f}%".format(lvl_chan.nitrogen_level) +
+                 ":HEL:LEV:{:.3f}%".format(lvl_chan.helium_level)), lvl_chan)
 
     @if_connected
-    def get_nitrogen_level(self, deviceid):
-        chan = self._chan_from_id(deviceid, expected_type=ChannelTypes.LVL)
-
+    def get_nitrogen_level(self, deviceid, chan):
         return "STAT:DEV:{}:LVL:SIG:NIT:LEV:{:.3f}%".format(deviceid, chan.nitrogen_level)
 
     @if_connected
-    def get_helium_level(self, deviceid):
-        chan = self._chan_from_id(deviceid, expected_type=ChannelTypes.LVL)
-
+    def get_helium_level(self, deviceid, chan):
         return "STAT:DEV:{}:LVL:SIG:HEL:LEV:{:.3f}%".format(deviceid, chan.helium_level)
 
     @if_connected
-    def get_helium_probe_speed(self, deviceid):
-        chan = self._chan_from_id(deviceid, expected_type=ChannelTypes.LVL)
-
-        return "STAT:DEV:{}:LVL:HEL:PULS:SLOW:{}".format(deviceid, "ON" if chan.slow_helium_read_rate else "OFF")
+    def get_helium_probe_speed(self, deviceid, chan):
+        return "STAT:DEV:{}:LVL:HEL:PULS:SLOW:{}".format(deviceid, _on_off(chan.slow_helium_read_rate))
 
     @if_connected
-    def set_helium_probe_speed(self, deviceid, sp):
-        chan = self._chan_from_id(deviceid, expected_type=ChannelTypes.LVL)
-
+    def set_helium_probe_speed(self, deviceid, chan, sp):
         chan.slow_helium_read_rate = sp == 1
 
-        return "STAT:SET:DEV:{}:LVL:HEL:PULS:SLOW:{}:VALID".format(deviceid, "ON" if chan.slow_helium_read_rate else "OFF")
+        return "STAT:SET:DEV:{}:LVL:HEL:PULS:SLOW:{}:VALID".format(deviceid, _on_off(chan.slow_helium_read_rate))
@@ -4,4 +4,7 @@ from lewis.core.statemachine import State
 
 
 class DefaultState(State):
-    pass
+    def in_state(self, dt):
+        device = self._context
+        if device.thermal_model_enabled:
+            device.thermal_model.step(dt)
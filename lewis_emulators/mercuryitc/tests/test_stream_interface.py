@@ -0,0 +1,68 @@
+import unittest
+from hamcrest import assert_that, is_, contains_string, starts_with
+
+from lewis_emulators.mercuryitc.device import SimulatedMercuryitc
+from lewis_emulators.mercuryitc.interfaces.stream_interface import MercuryitcInterface
+
+
+class MercuryitcInterfaceTests(unittest.TestCase):
+    """
+    Tests for the routing of requests and the bulk replies of the Mercury iTC.
+    """
+
+    def setUp(self):
+        self.device = SimulatedMercuryitc()
+        self.interface = MercuryitcInterface()
+        self.interface.device = self.device
+
+    def _request(self, request):
+        router = self.interface.bound_commands[0]
+        try:
+            return router.process_request(request)
+        except Exception as error:
+            return self.interface.handle_error(request, error)
+
+    def test_that_GIVEN_a_request_with_the_isobus_prefix_THEN_it_is_routed_to_the_channel(self):
+        self._request("@1SET:DEV:DB2.T1:TEMP:LOOP:P:2.5")
+
+        assert_that(self._request("READ:DEV:DB2.T1:TEMP:LOOP:P"), is_("STAT:DEV:DB2.T1:TEMP:LOOP:P:2.5000"))
+
+    def test_that_GIVEN_a_channel_of_another_type_THEN_reply_is_invalid(self):
+        assert_that(self._request("READ:DEV:MB1.H0:TEMP:LOOP:P"), is_("READ:DEV:MB1.H0:TEMP:LOOP:P:INVALID"))
+
+    def test_that_GIVEN_a_bulk_reply_WHEN_a_setting_changes_THEN_next_bulk_reply_has_the_new_setting(self):
+        self._request("READ:DEV:MB0.T0:TEMP")
+
+        self._request("SET:DEV:MB0.T0:TEMP:LOOP:PIDT:ON")
+        self._request("SET:DEV:MB0.T0:TEMP:LOOP:FSET:12.5")
+
+        reply = self._request("READ:DEV:MB0.T0:TEMP")
+        assert_that(reply, starts_with("STAT:DEV:MB0.T0:TEMP::NICK:MB0.T0:LOOP:AUX:DB1.A0"))
+        assert_that(reply, contains_string(":PIDT:ON:"))
+        assert_that(reply, contains_string(":FSET:12.5:PIDF:sim_autopid_file:"))
+
+    def test_that_GIVEN_a_bulk_reply_WHEN_the_thermal_model_runs_THEN_next_bulk_reply_has_the_new_temperature(self):
+        self.device.thermal_model_enabled = True
+        self._request("SET:DEV:MB0.T0:TEMP:LOOP:P:10")
+        self._request("SET:DEV:MB0.T0:TEMP:LOOP:I:2")
+        self._request("SET:DEV:MB0.T0:TEMP:LOOP:TSET:10K")
+        self._request("READ:DEV:MB0.T0:TEMP")
+
+        self.device.thermal_model.step(600.0)
+
+        assert_that(self._request("READ:DEV:MB0.T0:TEMP"), contains_string(":SIG:TEMP:10.0000K:"))
+
+    def test_that_GIVEN_pid_gains_set_THEN_the_thermal_model_controls_with_them(self):
+        self._request("SET:DEV:MB0.T0:TEMP:LOOP:P:4.5")
+        self._request("SET:DEV:MB0.T0:TEMP:LOOP:I:0.5")
+        self._request("SET:DEV:MB0.T0:TEMP:LOOP:D:1.5")
+
+        thermal_channel = self.device.channels["MB0.T0"].thermal_channel
+        assert_that((thermal_channel.p, thermal_channel.i, thermal_channel.d), is_((4.5, 0.5, 1.5)))
+
+    def test_that_GIVEN_a_new_device_THEN_the_bulk_reply_has_the_initial_settings_as_integers(self):
+        reply = self._request("READ:DEV:MB0.T0:TEMP")
+
+        assert_that(reply, contains_string(":D:0:"))
+        assert_that(reply, contains_string(":I:0:HSET:0:"))
+        assert_that(reply, contains_string(":P:0:"))
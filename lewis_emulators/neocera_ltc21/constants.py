@@ -8,6 +8,12 @@ HEATER_INDEX = 0
 # Index in the arrays of the analog output
 ANALOG_INDEX = 1
 
+# Power of the heater in W at full scale for each heater range
+HEATER_RANGE_POWER = [0.0, 0.05, 0.5, 5.0, 50.0]
+
+# Power in W at full scale of the heating driven by the analog output in the thermal model
+ANALOG_OUTPUT_POWER = 0.5
+
 # Minimum allowed output control type for the output index (see self.control)
 CONTROL_TYPE_MIN = [0, 3]
 
@@ -2,6 +2,7 @@ from collections import OrderedDict
 
 from lewis.devices import StateMachineDevice
 
+from lewis_emulators.utils.thermal_model import ThermalModel
 from .constants import HEATER_INDEX, ANALOG_INDEX
 from .device_errors import NeoceraDeviceErrors
 from .states import MonitorState, ControlState
@@ -26,6 +27,12 @@ class SimulatedNeocera(StateMachineDevice):
         # temperature of the samples measure by sensor n (this index is different to the setpoints)
         self.temperatures = [0] * self.sensor_count
 
+        # thermal model of the samples, a channel per sensor, which the outputs control; it is only used once
+        # thermal_model_enabled is set through the backdoor, otherwise the sensors ramp to their setpoints
+        self.thermal_model = ThermalModel()
+        self.thermal_model_enabled = False
+        self.sensor_channels = [self.thermal_model.add_channel() for _ in range(self.sensor_count)]
+
         # display units (this is for sensor n and reading setpoint n)
         self.units = ["K"] * self.sensor_count
 
@@ -1,7 +1,7 @@
 from lewis.core.statemachine import State
 from lewis.core import approaches
 
-from .constants import HEATER_INDEX
+from .constants import HEATER_INDEX, HEATER_RANGE_POWER, ANALOG_OUTPUT_POWER
 
 
 class OffState(State):
@@ -28,10 +28,20 @@ class ControlState(State):
     """
     Temperature is being controlled and monitored. The device will try to use the heater to make
     the temperature the same as the set point.
+
+    By default each sensor ramps linearly to the setpoint of the output it is connected to and the heater reads in
+    proportion to how far its sensor is from the setpoint. With thermal_model_enabled set the sensors are simulated
+    with the thermal model instead.
     """
     NAME = 'control'
 
     def in_state(self, dt):
+        if self._context.thermal_model_enabled:
+            self._simulate_thermal_model(dt)
+        else:
+            self._ramp_to_setpoints(dt)
+
+    def _ramp_to_setpoints(self, dt):
         device = self._context
         for output_index in range(device.sensor_count):
             sensor_source = device.sensor_source[output_index] - 1  # sensor source is 1 indexed
@@ -54,3 +64,39 @@ class ControlState(State):
         except IndexError:
             # heater is not connected to a sensor so it is off
             device.heater = 0
+
+    def _simulate_thermal_model(self, dt):
+        device = self._context
+        heater_limit = device.pid[HEATER_INDEX]["limit"] / 100.0
+
+        # each output controls the sensor it is connected to in the thermal model, unless it can not be read
+        controlled = {}
+        for output_index in range(device.sensor_count):
+            sensor_index = device.sensor_source[output_index] - 1  # sensor source is 1 indexed
+            if 0 <= sensor_index < device.sensor_count and device.temperatures[sensor_index] is not None:
+                controlled[sensor_index] = output_index
+
+        for sensor_index, channel in enumerate(device.sensor_channels):
+            output_index = controlled.get(sensor_index)
+            if output_index == HEATER_INDEX:
+                channel.max_power = HEATER_RANGE_POWER[device.heater_range] * heater_limit
+            elif output_index is not None:
+                channel.max_power = ANALOG_OUTPUT_POWER
+            if output_index is None or channel.max_power <= 0:
+                # nothing heats the sensor, so it cools to the base temperature
+                channel.closed_loop = False
+                channel.heater = 0
+            else:
+                channel.closed_loop = True
+                channel.setpoint = device.setpoints[output_index]
+            if device.temperatures[sensor_index] is not None:
+                channel.temperature = device.temperatures[sensor_index]
+
+        device.thermal_model.step(dt)
+
+        device.heater = 0
+        for sensor_index, channel in enumerate(device.sensor_channels):
+            if device.temperatures[sensor_index] is not None:
+                device.temperatures[sensor_index] = channel.temperature
+            if controlled.get(sensor_index) == HEATER_INDEX:
+                device.heater = channel.heater * heater_limit
@@ -0,0 +1,59 @@
+import unittest
+from hamcrest import assert_that, is_, close_to, less_than
+
+from lewis_emulators.neocera_ltc21.constants import HEATER_INDEX
+from lewis_emulators.neocera_ltc21.device import SimulatedNeocera
+
+
+class ControlStateTests(unittest.TestCase):
+    """
+    Tests for the temperatures and heater the Neocera reads back while it is controlling.
+    """
+
+    def setUp(self):
+        self.device = SimulatedNeocera()
+        self.device.setpoints = [10.0, 2.0]
+
+    def _run(self, seconds, dt=0.1):
+        for _ in range(int(round(seconds / dt))):
+            self.device.process(dt)
+
+    def test_that_GIVEN_a_setpoint_THEN_the_sensor_ramps_to_it_at_a_tenth_of_a_kelvin_a_second(self):
+        self._run(10.0)
+
+        assert_that(self.device.temperatures[0], close_to(1.0, 0.11))
+
+    def test_that_GIVEN_a_sensor_below_the_setpoint_THEN_the_heater_reads_ten_times_the_difference(self):
+        self.device.temperatures = [9.5, 2.0]
+
+        self._run(1.0)
+
+        assert_that(self.device.heater, close_to((10.0 - self.device.temperatures[0]) * 10.0, 1e-9))
+        assert_that(self.device.heater, close_to(4.0, 0.11))
+
+    def test_that_GIVEN_a_heater_limit_THEN_the_heater_reads_no_more_than_the_limit(self):
+        self.device.pid[HEATER_INDEX]["limit"] = 40.0
+
+        self._run(0.1)
+
+        assert_that(self.device.heater, is_(40.0))
+
+    def test_that_GIVEN_the_thermal_model_THEN_the_analog_output_brings_its_sensor_to_the_setpoint(self):
+        self.device.thermal_model_enabled = True
+
+        highest = 0.0
+        for _ in range(120):
+            self._run(1.0)
+            highest = max(highest, self.device.temperatures[1])
+
+        assert_that(self.device.temperatures[1], close_to(2.0, 0.05))
+        assert_that(highest, less_than(2.5))
+
+    def test_that_GIVEN_the_thermal_model_and_the_heater_range_off_THEN_the_heater_reads_zero(self):
+        self.device.thermal_model_enabled = True
+        self.device.heater_range = 0
+
+        self._run(10.0)
+
+        assert_that(self.device.heater, is_(0))
+        assert_that(self.device.temperatures[0], is_(0.0))
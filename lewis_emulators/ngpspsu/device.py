@@ -1,6 +1,8 @@
 from collections import OrderedDict
 from .states import DefaultState
 from lewis.devices import StateMachineDevice
+from lewis_emulators.utils.status_word import StatusWord
+from .interfaces.device_status import DEVICE_STATUS_WORD
 
 
 class SimulatedNgpspsu(StateMachineDevice):
@@ -35,6 +37,7 @@ class SimulatedNgpspsu(StateMachineDevice):
             "DCCT fault": False,
             "OVP": False
         }
+        self._status_word = StatusWord(DEVICE_STATUS_WORD, self._status)
 
     def _get_state_handlers(self):
         return {
@@ -60,6 +63,16 @@ class SimulatedNgpspsu(StateMachineDevice):
 
         return self._status
 
+    @property
+    def status_word(self):
+        """ Returns the status of the device as a status word, which is kept up to date as the status changes. """
+
+        return self._status_word
+
+    def _set_status(self, key, value):
+        self._status[key] = value
+        self._status_word.refresh(key)
+
     @property
     def voltage(self):
         """ Returns voltage to 6 decimal places. """
@@ -125,7 +138,7 @@ class SimulatedNgpspsu(StateMachineDevice):
         if self._status["ON/OFF"]:
             return "#NAK:09"
         else:
-            self._status["ON/OFF"] = True
+            self._set_status("ON/OFF", True)
             return "#AK"
 
     def stop_device(self):
@@ -139,7 +152,7 @@ class SimulatedNgpspsu(StateMachineDevice):
         if not self._status["ON/OFF"]:
             return "#NAK:13"
         else:
-            self._status["ON/OFF"] = False
+            self._set_status("ON/OFF", False)
             self._voltage = 0.00000
             self._current = 0.00000
             return "#AK"
@@ -154,11 +167,11 @@ class SimulatedNgpspsu(StateMachineDevice):
 
         for key in self._status:
             if key == "Control mode":
-                self._status[key] = "Remote"
+                self._set_status(key, "Remote")
             elif key == "Update mode":
-                self._status[key] = "Normal"
+                self._set_status(key, "Normal")
             else:
-                self._status[key] = False
+                self._set_status(key, False)
 
         self._voltage = 0
         self._voltage_setpoint = 0
@@ -196,7 +209,7 @@ class SimulatedNgpspsu(StateMachineDevice):
         """
 
         if fault_name in self._status:
-            self._status[fault_name] = True
+            self._set_status(fault_name, True)
         else:
             raise ValueError("Could not find {}".format(fault_name))
 
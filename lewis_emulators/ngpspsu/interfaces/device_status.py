@@ -1,50 +1,52 @@
 # Class and function to help convert status into 8 hexadecimal characters
 
+from lewis_emulators.utils.status_word import StatusWord, StatusWordLayout, StatusField, render_hexadecimal
+
 NUMBER_OF_BITS = 32
 NUMBER_OF_HEXADECIMAL_CHARACTERS = 8
 
+_CONTROL_MODE = {
+    "Remote": 0b00,
+    "Local": 0b10
+}
+
+_UPDATE_MODE = {
+    "Normal": 0b00,
+    "Waveform": 0b10,
+    "Triggered FIFO": 0b01,
+    "Analog Input": 0b11
+}
+
+# The device's status, keyed on the names in the device's status dictionary
+DEVICE_STATUS_WORD = StatusWordLayout([
+    StatusField(0, "ON/OFF"),
+    StatusField(1, "Fault condition"),
+    StatusField(2, "Control mode", width=2, encoding=_CONTROL_MODE),
+    StatusField(5, "Regulation mode"),
+    StatusField(6, "Update mode", width=2, encoding=_UPDATE_MODE),
+    StatusField(12, "Ramping"),
+    StatusField(13, "Waveform"),
+    StatusField(20, "OVT"),
+    StatusField(21, "Mains fault"),
+    StatusField(22, "Earth leakage"),
+    StatusField(23, "Earth fuse"),
+    StatusField(24, "Regulation fault"),
+    StatusField(26, "Ext. interlock #1"),
+    StatusField(27, "Ext. interlock #2"),
+    StatusField(28, "Ext. interlock #3"),
+    StatusField(29, "Ext. interlock #4"),
+    StatusField(30, "DCCT fault"),
+    StatusField(31, "OVP"),
+], render=render_hexadecimal(NUMBER_OF_HEXADECIMAL_CHARACTERS))
+
 
 class DeviceStatus(object):
     """
     Converts the device's status to a list of 8 hexadecimal characters.
     """
 
-    _REFERENCE = {
-        "0": "ON/OFF",
-        "1": "Fault condition",
-        "2": "Control mode",
-        "5": "Regulation mode",
-        "6": "Update mode",
-        "12": "Ramping",
-        "13": "Waveform",
-        "20": "OVT",
-        "21": "Mains fault",
-        "22": "Earth leakage",
-        "23": "Earth fuse",
-        "24": "Regulation fault",
-        "26": "Ext. interlock #1",
-        "27": "Ext. interlock #2",
-        "28": "Ext. interlock #3",
-        "29": "Ext. interlock #4",
-        "30": "DCCT fault",
-        "31": "OVP"
-    }
-
-    _CONTROL_MODE = {
-        "Remote": [False, False],
-        "Local": [False, True]
-    }
-
-    _UPDATE_MODE = {
-        "Normal": [False, False],
-        "Waveform": [False, True],
-        "Triggered FIFO": [True, False],
-        "Analog Input": [True, True]
-    }
-
     def __init__(self, status):
-        self._status = status
-        self._bits = [False for _ in range(0, NUMBER_OF_BITS)]
+        self._status_word = StatusWord(DEVICE_STATUS_WORD, status)
 
     def in_hexadecimal(self):
         """
@@ -54,23 +56,7 @@ class DeviceStatus(object):
             string: 8 hexadecimal values 0-F.
         """
 
-        self._convert_status_to_bits()
-        hexadecimals = self._get_hexadecimals(NUMBER_OF_HEXADECIMAL_CHARACTERS)
-        return "".join(hexadecimals)
-
-    def _convert_status_to_bits(self):
-        for key, value in self._REFERENCE.items():
-            if value == "Control mode":
-                self._bits[2:4] = self._CONTROL_MODE[self._status["Control mode"]]
-            elif value == "Update mode":
-                self._bits[6:8] = self._UPDATE_MODE[self._status["Update mode"]]
-            else:
-                self._bits[int(key)] = self._status[value]
-
-    def _get_hexadecimals(self, number_of_digits):
-        bits = list(reversed(self._bits))
-
-        return convert_to_hexadecimal(bits, number_of_digits)
+        return self._status_word.render()
 
 
 def convert_to_hexadecimal(bits, padding):
@@ -1,7 +1,6 @@
 from lewis.adapters.stream import StreamInterface
 from lewis_emulators.utils.command_builder import CmdBuilder
 from lewis_emulators.utils.replies import conditional_reply
-from lewis_emulators.ngpspsu.interfaces.device_status import DeviceStatus
 
 if_connected = conditional_reply("connected")
 
@@ -81,9 +80,7 @@ class NgpspsuStreamInterface(StreamInterface):
         Returns:
             string: The status of the device as a string of 8 hexadecimal digits.
         """
-        device_status = DeviceStatus(self._device.status)
-        hexadecimal_status = device_status.in_hexadecimal()
-        return "#MST:{}".format(hexadecimal_status)
+        return "#MST:{}".format(self._device.status_word.render())
 
     @if_connected
     def reset(self):
@@ -2,13 +2,32 @@ from collections import OrderedDict
 
 from lewis.core.logging import has_log
 from lewis.devices import StateMachineDevice
+from lewis_emulators.utils.status_word import StatusWordSource, WatchedAttribute
 from .states import DefaultState
 
 
-class PowerSupply(object):
+class PowerSupply(StatusWordSource):
     """
     Class representing a single power supply within a chain.
     """
+    # Attributes reported in the status word
+    power_on = WatchedAttribute("power_on")
+    interlock_active = WatchedAttribute("interlock_active")
+    TRANS = WatchedAttribute("TRANS")
+    DCOC = WatchedAttribute("DCOC")
+    DCOL = WatchedAttribute("DCOL")
+    REGMOD = WatchedAttribute("REGMOD")
+    PREREG = WatchedAttribute("PREREG")
+    PHAS = WatchedAttribute("PHAS")
+    MPSWATER = WatchedAttribute("MPSWATER")
+    EARTHLEAK = WatchedAttribute("EARTHLEAK")
+    THERMAL = WatchedAttribute("THERMAL")
+    MPSTEMP = WatchedAttribute("MPSTEMP")
+    DOOR = WatchedAttribute("DOOR")
+    MAGWATER = WatchedAttribute("MAGWATER")
+    MAGTEMP = WatchedAttribute("MAGTEMP")
+    MPSREADY = WatchedAttribute("MPSREADY")
+
     def __init__(self):
 
         self.curr = 0
@@ -97,6 +116,17 @@ class SimulatedRknps(StateMachineDevice):
         """
         return self._psus[self._address]
 
+    def status_word(self, layout):
+        """
+        Gets the status word of the currently addressed power supply.
+
+        Args:
+            layout: the layout of the status word (lewis_emulators.utils.status_word.StatusWordLayout)
+
+        Returns (StatusWord) the status word
+        """
+        return self._currently_addressed_psu().status_word(layout)
+
     def get_current(self):
         """
         Gets the actual value of the output current for the currently addressed power supply.
@@ -1,13 +1,36 @@
 from lewis.adapters.stream import StreamInterface, Cmd
 from lewis.core.logging import has_log
 from lewis_emulators.utils.command_builder import CmdBuilder
+from lewis_emulators.utils.status_word import StatusWordLayout, StatusField, render_characters
 
 from lewis_emulators.utils.replies import conditional_reply
 
 if_connected = conditional_reply("connected")
 
-ILK_STRING = {True: "!", False: "."}
-PWR_STRING = {True: ".", False: "!"}
+# The status is a character per bit, "!" when set. Bit 2 is always set, and the spare bits track the door interlock.
+STATUS_WORD = StatusWordLayout([
+    StatusField(0, "power_on", invert=True),
+    StatusField(4, "DOOR"),
+    StatusField(5, "DOOR"),
+    StatusField(6, "DOOR"),
+    StatusField(7, "DOOR"),
+    StatusField(8, "TRANS"),
+    StatusField(9, "interlock_active"),
+    StatusField(10, "DCOC"),
+    StatusField(11, "DCOL"),
+    StatusField(12, "REGMOD"),
+    StatusField(13, "PREREG"),
+    StatusField(14, "PHAS"),
+    StatusField(15, "MPSWATER"),
+    StatusField(16, "EARTHLEAK"),
+    StatusField(17, "THERMAL"),
+    StatusField(18, "MPSTEMP"),
+    StatusField(19, "DOOR"),
+    StatusField(20, "MAGWATER"),
+    StatusField(21, "MAGTEMP"),
+    StatusField(22, "MPSREADY"),
+    StatusField(23, "DOOR"),
+], render=render_characters(24), constant=1 << 2)
 
 
 @has_log
@@ -151,33 +174,7 @@ class RknpsStreamInterface(StreamInterface):
 
         Returns: A character string for the status.
         """
-        device = self._device
-
-        status = ("{POWER}.!.{SPARE}{SPARE}{SPARE}{SPARE}{TRANS}{ILK}{DCOC}{DCOLOAD}{REGMOD}{PREREG}{PHAS}"
-                  "{MPSWATER}{EARTHLEAK}{THERMAL}{MPSTEMP}{DOOR}{MAGWATER}{MAGTEMP}"
-                  "{MPSREADY}{SPARE}").format(
-                        POWER=PWR_STRING[device.is_power_on()],
-                        TRANS=ILK_STRING[device.get_TRANS()],
-                        ILK=ILK_STRING[device.is_interlock_active()],
-                        DCOC=ILK_STRING[device.get_DCOC()],
-                        DCOLOAD=ILK_STRING[device.get_DCOL()],
-                        REGMOD=ILK_STRING[device.get_REGMOD()],
-                        PREREG=ILK_STRING[device.get_PREREG()],
-                        PHAS=ILK_STRING[device.get_PHAS()],
-                        MPSWATER=ILK_STRING[device.get_MPSWATER()],
-                        EARTHLEAK=ILK_STRING[device.get_EARTHLEAK()],
-                        THERMAL=ILK_STRING[device.get_THERMAL()],
-                        MPSTEMP=ILK_STRING[device.get_MPSTEMP()],
-                        DOOR=ILK_STRING[device.get_DOOR()],
-                        MAGWATER=ILK_STRING[device.get_MAGWATER()],
-                        MAGTEMP=ILK_STRING[device.get_MAGTEMP()],
-                        MPSREADY=ILK_STRING[device.get_MPSREADY()],
-                        # The spare interlocks aren't always on/off.
-                        # Simulate this by making all of the spares "track" one of the other interlocks.
-                        SPARE=ILK_STRING[device.get_DOOR()],
-                    )
-
-        return status
+        return self._device.status_word(STATUS_WORD).render()
 
     @if_connected
     def set_power(self, power):
@@ -2,9 +2,13 @@ from lewis.core.logging import has_log
 from lewis.devices import StateMachineDevice
 from lewis.core.statemachine import State
 from .states import MovingState, Errors, SampleDroppedState
+from lewis_emulators.utils.motion import MotionEngine
 from collections import OrderedDict
 
 
+CAROUSEL = "carousel"
+
+
 @has_log
 class SimulatedSampleChanger(StateMachineDevice):
     MIN_CAROUSEL = 1
@@ -15,8 +19,25 @@ class SimulatedSampleChanger(StateMachineDevice):
     CAR_SPEED = 1.0/6.0  # Carousel takes 6 seconds per position (measured on actual device)
 
     def _initialize_data(self):
+        self.motion = MotionEngine([CAROUSEL], speed=self.CAR_SPEED)
         self.uninitialise()
 
+    @property
+    def car_pos(self):
+        return self.motion.position(CAROUSEL)
+
+    @car_pos.setter
+    def car_pos(self, position):
+        self.motion.set_position(CAROUSEL, position)
+
+    @property
+    def car_target(self):
+        return self.motion.target(CAROUSEL)
+
+    @car_target.setter
+    def car_target(self, target):
+        self.motion.move(CAROUSEL, target)
+
     def uninitialise(self):
         self.reset_from_dropped_sample()
         self.car_pos = -1
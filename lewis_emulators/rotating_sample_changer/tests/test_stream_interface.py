@@ -0,0 +1,42 @@
+import unittest
+from hamcrest import assert_that, is_
+
+from lewis_emulators.rotating_sample_changer.device import SimulatedSampleChanger
+from lewis_emulators.rotating_sample_changer.interfaces.HRPD_stream_interface import HRPDSampleChangerStreamInterface
+
+
+class HRPDStreamInterfaceTests(unittest.TestCase):
+    """
+    Tests for the replies of the HRPD sample changer to requests.
+    """
+
+    def setUp(self):
+        self.device = SimulatedSampleChanger()
+        self.interface = HRPDSampleChangerStreamInterface()
+        self.interface.device = self.device
+
+    def _request(self, request):
+        request = request.encode("latin-1")
+        command = next(command for command in self.interface.bound_commands if command.can_process(request))
+        return command.process_request(request)
+
+    def _run(self, seconds, dt=0.1):
+        for _ in range(int(round(seconds / dt))):
+            self.device.process(dt)
+
+    def test_that_GIVEN_the_carousel_is_initialised_THEN_it_is_at_position_1(self):
+        assert_that(self._request("in"), is_("ok"))
+
+        self._run(15.0)
+
+        assert_that(self._request("po"), is_("Position =  1"))
+
+    def test_that_GIVEN_a_move_has_finished_THEN_the_carousel_is_at_the_position(self):
+        self._request("in")
+        self._run(15.0)
+        assert_that(self._request("ma05"), is_("ok"))
+
+        self._run(40.0)
+
+        assert_that(self._request("po"), is_("Position =  5"))
+        assert_that(self._request("st"), is_("0100000100100000 0 0  0  5"))
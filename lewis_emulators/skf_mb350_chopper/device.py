@@ -2,10 +2,34 @@ from collections import OrderedDict
 
 from lewis.devices import StateMachineDevice
 
-from .states import DefaultState, StoppingState, GoingState
-
-
-class SimulatedSkfMb350Chopper(StateMachineDevice):
+from lewis_emulators.utils.ramp import LinearRamp
+from lewis_emulators.utils.status_word import StatusWordSource, WatchedAttribute
+from .states import DefaultState, StoppingState, GoingState, ACCELERATION
+
+# The interlocks, in the order of their bits in the interlock status bit-field
+INTERLOCKS = (
+    "DSP_WD_FAIL",
+    "OSCILLATOR_FAIL",
+    "POSITION_SHUTDOWN",
+    "EMERGENCY_STOP",
+    "UPS_FAIL",
+    "EXTERNAL_FAULT",
+    "CC_WD_FAIL",
+    "OVERSPEED_TRIP",
+    "VACUUM_FAIL",
+    "MOTOR_OVER_TEMP",
+    "REFERENCE_SIGNAL_LOSS",
+    "SPEED_SENSOR_LOSS",
+    "COOLING_LOSS",
+    "DSP_SUMMARY_SHUTDOWN",
+    "CC_SHUTDOWN_REQ",
+    "TEST_MODE",
+)
+
+
+class SimulatedSkfMb350Chopper(StatusWordSource, StateMachineDevice):
+
+    interlocks = WatchedAttribute("interlocks")
 
     def _initialize_data(self):
         """
@@ -14,34 +38,18 @@ class SimulatedSkfMb350Chopper(StateMachineDevice):
 
         self._started = False
         self.phase = 0
-        self.frequency = 0
+        self.frequency_ramp = LinearRamp(0, ACCELERATION)
         self.frequency_setpoint = 0
         self.phase_percent_ok = 100.
         self.phase_repeatability = 100.
 
-        self.interlocks = OrderedDict([
-            ("DSP_WD_FAIL", False),
-            ("OSCILLATOR_FAIL", False),
-            ("POSITION_SHUTDOWN", False),
-            ("EMERGENCY_STOP", False),
-            ("UPS_FAIL", False),
-            ("EXTERNAL_FAULT", False),
-            ("CC_WD_FAIL", False),
-            ("OVERSPEED_TRIP", False),
-            ("VACUUM_FAIL", False),
-            ("MOTOR_OVER_TEMP", False),
-            ("REFERENCE_SIGNAL_LOSS", False),
-            ("SPEED_SENSOR_LOSS", False),
-            ("COOLING_LOSS", False),
-            ("DSP_SUMMARY_SHUTDOWN", False),
-            ("CC_SHUTDOWN_REQ", False),
-            ("TEST_MODE", False),
-        ])
+        self.interlocks = OrderedDict((interlock, False) for interlock in INTERLOCKS)
 
         self.rotator_angle = 90
 
     def set_interlock_state(self, item, value):
         self.interlocks[item] = value
+        self.refresh_status("interlocks")
 
     def get_interlocks(self):
         return self.interlocks
@@ -63,6 +71,14 @@ class SimulatedSkfMb350Chopper(StateMachineDevice):
             (('stopping', 'default'), lambda: self.frequency == 0 and not self._started),
         ])
 
+    @property
+    def frequency(self):
+        return self.frequency_ramp.value
+
+    @frequency.setter
+    def frequency(self, frequency):
+        self.frequency_ramp.value = frequency
+
     def set_frequency(self, frequency):
         self.frequency_setpoint = frequency
 
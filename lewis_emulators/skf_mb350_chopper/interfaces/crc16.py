@@ -1,4 +1,8 @@
-from lewis_emulators.utils.byte_conversions import int_to_raw_bytes, BYTE
+import struct
+
+from lewis_emulators.utils.checksum import crc16 as crc16_value
+
+_LOW_BYTE_FIRST_UINT16 = struct.Struct("<H")
 
 
 def crc16_matches(data, expected):
@@ -7,26 +11,13 @@ def crc16_matches(data, expected):
     :param expected: The expected checksum, an iterable of two characters
     :return: true if the checksum of 'input' is equal to 'expected', false otherwise.
     """
-    return crc16(data) == expected
+    return len(expected) == 2 and crc16_value(data) == _LOW_BYTE_FIRST_UINT16.unpack(expected)[0]
 
 
 def crc16(data):
     """
-    CRC algorithm, translated to python from the C code in appendix A of the manual.
+    CRC algorithm from appendix A of the manual (see lewis_emulators.utils.checksum).
     :param data: the data to checksum
-    :return: the checksum
+    :return: the checksum as two raw bytes, least significant byte first
     """
-    crc = 0xFFFF
-
-    for b in [ord(c) for c in data]:
-        crc ^= b
-        for _ in range(8):
-            if crc & 1:
-                crc >>= 1
-                crc ^= 0xA001
-            else:
-                crc >>= 1
-
-            crc %= BYTE**2
-
-    return int_to_raw_bytes(crc, 2, low_byte_first=True)
+    return _LOW_BYTE_FIRST_UINT16.pack(crc16_value(data))
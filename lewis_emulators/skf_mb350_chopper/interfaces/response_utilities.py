@@ -1,5 +1,25 @@
-from lewis_emulators.utils.byte_conversions import int_to_raw_bytes, float_to_raw_bytes
-from .crc16 import crc16
+from lewis_emulators.utils.frame_builder import FrameBuilder
+from lewis_emulators.utils.status_word import StatusWordLayout, StatusField
+from lewis_emulators.skf_mb350_chopper.device import INTERLOCKS
+
+
+def _interlock_field(position, interlock):
+    return StatusField(position, "interlocks", encoding=lambda interlocks: interlocks[interlock])
+
+
+INTERLOCK_STATUS_WORD = StatusWordLayout(
+    [_interlock_field(position, interlock) for position, interlock in enumerate(INTERLOCKS)])
+
+DEVICE_STATUS_WORD = StatusWordLayout([
+    StatusField(0, "is_controller_ok"),
+    StatusField(1, "is_up_to_speed"),
+    StatusField(2, "is_able_to_run"),
+    StatusField(3, "is_shutting_down"),
+    StatusField(4, "is_levitation_complete"),
+    StatusField(5, "is_phase_locked"),
+    StatusField(6, "get_motor_direction", encoding=lambda direction: direction > 0),
+    StatusField(7, "is_avc_on"),
+])
 
 
 def build_interlock_status(device):
@@ -8,43 +28,22 @@ def build_interlock_status(device):
     :param device: the lewis device
     :return: int representation of the bit field
     """
-    interlocks = device.get_interlocks()
-
-    bit = 1
-    result = 0
-    for ilk in interlocks.values():
-        result += bit if ilk else 0
-        bit *= 2
-
-    return result
+    return device.status_word(INTERLOCK_STATUS_WORD).value
 
 
 def build_device_status(device):
     """
-    Builds an integer representation of the device status bit-field.
+    Builds an integer representation of the device status bit-field. The fields are worked out from the speed of the
+    chopper, so they are refreshed every time.
     :param device: the lewis device
     :return: int representation of the bit field
     """
-    status_bits = [
-        device.is_controller_ok(),
-        device.is_up_to_speed(),
-        device.is_able_to_run(),
-        device.is_shutting_down(),
-        device.is_levitation_complete(),
-        device.is_phase_locked(),
-        device.get_motor_direction() > 0,
-        device.is_avc_on()
-    ]
-
-    bit = 1
-    result = 0
-    for stat in status_bits:
-        result += bit if stat else 0
-        bit *= 2
-    return result
-
-
-def general_status_response_packet(address, device, command):
+    status_word = device.status_word(DEVICE_STATUS_WORD)
+    status_word.refresh()
+    return status_word.value
+
+
+def general_status_response_packet(address, device, command, builder=None):
     """
     Returns the general response packet, the default response to any command that doesn't have a more specific response.
 
@@ -54,14 +53,15 @@ def general_status_response_packet(address, device, command):
     :param address: The address of this device
     :param device: The lewis device
     :param command: The command number that this is a reply to
+    :param builder: The ResponseBuilder to reuse; a new one is created if None
     :return: The response
     """
-    return ResponseBuilder() \
+    return _reset(builder) \
         .add_common_header(address, command, device) \
         .build()
 
 
-def phase_information_response_packet(address, device):
+def phase_information_response_packet(address, device, builder=None):
     """
     Returns the response to the "get_phase_information" command.
 
@@ -73,9 +73,10 @@ def phase_information_response_packet(address, device):
 
     :param address: The address of this device
     :param device: The lewis device
+    :param builder: The ResponseBuilder to reuse; a new one is created if None
     :return: The response
     """
-    return ResponseBuilder() \
+    return _reset(builder) \
         .add_common_header(address, 0xC0, device) \
         .add_float(device.get_phase()) \
         .add_float(device.get_phase_repeatability()) \
@@ -83,7 +84,7 @@ def phase_information_response_packet(address, device):
         .build()
 
 
-def rotator_angle_response_packet(address, device):
+def rotator_angle_response_packet(address, device, builder=None):
     """
     Returns the response to the "get_rotator_angle" command.
 
@@ -93,15 +94,16 @@ def rotator_angle_response_packet(address, device):
 
     :param address: The address of this device
     :param device: The lewis device
+    :param builder: The ResponseBuilder to reuse; a new one is created if None
     :return: The response
     """
-    return ResponseBuilder() \
+    return _reset(builder) \
         .add_common_header(address, 0x81, device) \
         .add_int(int(device.get_rotator_angle()*10), 4) \
         .build()
 
 
-def phase_time_response_packet(address, device):
+def phase_time_response_packet(address, device, builder=None):
     """
     Returns the response to the "get_phase_information" command.
 
@@ -111,22 +113,24 @@ def phase_time_response_packet(address, device):
 
     :param address: The address of this device
     :param device: The lewis device
+    :param builder: The ResponseBuilder to reuse; a new one is created if None
     :return: The response
     """
-    return ResponseBuilder() \
+    return _reset(builder) \
         .add_common_header(address, 0x85, device) \
         .add_float(device.get_phase()/1000.) \
         .build()
 
 
-class ResponseBuilder(object):
+def _reset(builder):
+    return ResponseBuilder() if builder is None else builder.reset()
+
+
+class ResponseBuilder(FrameBuilder):
     """
     Response builder which formats the responses as bytes.
     """
 
-    def __init__(self):
-        self.response = ""
-
     def add_int(self, value, length, low_byte_first=True):
         """
         Adds an integer to the builder
@@ -136,18 +140,15 @@ class ResponseBuilder(object):
                                If false, put the most significant byte first.
         :return: The builder
         """
-        self.response += int_to_raw_bytes(value, length, low_byte_first)
-        return self
+        return self.add_uint(value, length, low_byte_first)
 
     def add_float(self, value):
         """
         Adds an float to the builder (4 bytes, IEEE single-precision)
         :param value: The float to add
-        :param length: How many bytes should the integer be represented as
         :return: The builder
         """
-        self.response += float_to_raw_bytes(value)
-        return self
+        return self.add_float32(value)
 
     def add_common_header(self, address, command_number, device):
         """
@@ -175,8 +176,8 @@ class ResponseBuilder(object):
 
     def build(self):
         """
-        Gets the response from the builder
+        Gets the response from the builder, with its CRC16 appended
         :return: the response
         """
-        self.response += crc16(self.response)
-        return self.response
\ No newline at end of file
+        self.add_crc16()
+        return super(ResponseBuilder, self).build()
@@ -3,7 +3,7 @@ from lewis.core.logging import has_log
 
 from lewis_emulators.utils.byte_conversions import raw_bytes_to_int
 from .response_utilities import phase_information_response_packet, rotator_angle_response_packet, \
-    phase_time_response_packet, general_status_response_packet
+    phase_time_response_packet, general_status_response_packet, ResponseBuilder
 from .crc16 import crc16_matches, crc16
 
 
@@ -18,6 +18,11 @@ class SkfMb350ChopperStreamInterface(StreamInterface):
     in_terminator = "\r\n"
     out_terminator = in_terminator
 
+    def __init__(self):
+        super(SkfMb350ChopperStreamInterface, self).__init__()
+        # Requests are handled one at a time, so every reply can be built in the same buffer
+        self._response_builder = ResponseBuilder()
+
     def handle_error(self, request, error):
         error_message = "An error occurred at request " + repr(request) + ": " + repr(error)
         print(error_message)
@@ -60,11 +65,11 @@ class SkfMb350ChopperStreamInterface(StreamInterface):
 
     def start(self, address, data):
         self._device.start()
-        return general_status_response_packet(address, self.device, 0x20)
+        return general_status_response_packet(address, self.device, 0x20, self._response_builder)
 
     def stop(self, address, data):
         self._device.stop()
-        return general_status_response_packet(address, self.device, 0x30)
+        return general_status_response_packet(address, self.device, 0x30, self._response_builder)
 
     def set_nominal_phase(self, address, data):
         self.log.info("Setting phase")
@@ -72,7 +77,7 @@ class SkfMb350ChopperStreamInterface(StreamInterface):
         nominal_phase = raw_bytes_to_int(data) / 1000.
         self.log.info("Setting nominal phase to {}".format(nominal_phase))
         self._device.set_nominal_phase(nominal_phase)
-        return general_status_response_packet(address, self.device, 0x90)
+        return general_status_response_packet(address, self.device, 0x90, self._response_builder)
 
     def set_gate_width(self, address, data):
         self.log.info("Setting gate width")
@@ -80,7 +85,7 @@ class SkfMb350ChopperStreamInterface(StreamInterface):
         width = raw_bytes_to_int(data)
         self.log.info("Setting gate width to {}".format(width))
         self._device.set_phase_repeatability(width / 10.)
-        return general_status_response_packet(address, self.device, 0x8E)
+        return general_status_response_packet(address, self.device, 0x8E, self._response_builder)
 
     def set_rotational_speed(self, address, data):
         self.log.info("Setting frequency")
@@ -88,7 +93,7 @@ class SkfMb350ChopperStreamInterface(StreamInterface):
         freq = raw_bytes_to_int(data)
         self.log.info("Setting frequency to {}".format(freq))
         self._device.set_frequency(freq)
-        return general_status_response_packet(address, self.device, 0x60)
+        return general_status_response_packet(address, self.device, 0x60, self._response_builder)
 
     def set_rotator_angle(self, address, data):
         self.log.info("Setting rotator angle")
@@ -96,16 +101,16 @@ class SkfMb350ChopperStreamInterface(StreamInterface):
         angle_times_ten = raw_bytes_to_int(data)
         self.log.info("Setting rotator angle to {}".format(angle_times_ten / 10.))
         self._device.set_rotator_angle(angle_times_ten / 10.)
-        return general_status_response_packet(address, self.device, 0x82)
+        return general_status_response_packet(address, self.device, 0x82, self._response_builder)
 
     def get_phase_info(self, address, data):
         self.log.info("Getting phase info")
-        return phase_information_response_packet(address, self._device)
+        return phase_information_response_packet(address, self._device, self._response_builder)
 
     def get_rotator_angle(self, address, data):
         self.log.info("Getting rotator angle")
-        return rotator_angle_response_packet(address, self._device)
+        return rotator_angle_response_packet(address, self._device, self._response_builder)
 
     def get_phase_delay(self, address, data):
         self.log.info("Getting phase time")
-        return phase_time_response_packet(address, self._device)
+        return phase_time_response_packet(address, self._device, self._response_builder)
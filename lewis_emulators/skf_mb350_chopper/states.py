@@ -1,6 +1,8 @@
-from lewis.core import approaches
 from lewis.core.statemachine import State
 
+# Acceleration of the chopper in Hz/s
+ACCELERATION = 50
+
 
 class DefaultState(State):
     pass
@@ -9,10 +11,12 @@ class DefaultState(State):
 class StoppingState(State):
     def in_state(self, dt):
         device = self._context
-        device.frequency = approaches.linear(device.frequency, 0, 50, dt)
+        device.frequency_ramp.target = 0
+        device.frequency_ramp.advance(dt)
 
 
 class GoingState(State):
     def in_state(self, dt):
         device = self._context
-        device.frequency = approaches.linear(device.frequency, device.frequency_setpoint, 50, dt)
+        device.frequency_ramp.target = device.frequency_setpoint
+        device.frequency_ramp.advance(dt)
@@ -8,7 +8,7 @@ from lewis.core.logging import has_log
 
 from .states import DefaultState
 from lewis.devices import StateMachineDevice
-from lewis.core import approaches
+from lewis_emulators.utils.motion import MotionEngine
 
 
 @has_log
@@ -17,44 +17,57 @@ class Axis(object):
     An axis within the SM300 device
     """
 
-    def __init__(self, axis_label):
+    def __init__(self, axis_label, motion):
         """
         Constructor.
         Args:
             axis_label: the label for the axis
+            motion: the motion engine the axis moves in
         """
         self.rbv_error = None
-        self.rbv = 10.0
+        self.axis_label = axis_label
+        self._motion = motion
         self.sp = self.rbv
-        self._move_to_sp = 0
-        self.moving = False
         self.speed = 10
-        self.axis_label = axis_label
 
-    def home(self):
+    @property
+    def rbv(self):
         """
-        Perform a homing operation.
+        Returns: the position of the axis
         """
-        self.sp = 0.0
-        self.move_to_sp()
+        return self._motion.position(self.axis_label)
+
+    @rbv.setter
+    def rbv(self, position):
+        moving = self.moving
+        self._motion.set_position(self.axis_label, position)
+        if not moving:
+            self._motion.stop(self.axis_label)
 
-    def simulate(self, dt):
+    @property
+    def speed(self):
         """
-        Simulate movement of the axis.
-        Args:
-            dt: time since last simulation
+        Returns: the speed of the axis
         """
-        if self.moving:
-            self.rbv = approaches.linear(self.rbv, self._move_to_sp, self.speed, dt)
-            self.moving = not self._at_position()
-            self.log.debug("moving {}".format(self.moving))
-        return
+        return self._motion.speed(self.axis_label)
 
-    def _at_position(self):
+    @speed.setter
+    def speed(self, speed):
+        self._motion.set_speed(self.axis_label, speed)
+
+    @property
+    def moving(self):
+        """
+        Returns: True if the axis is moving to its set point; False otherwise
         """
-        Returns: True if at position (within tolerance); False otherwise.
+        return self._motion.moving(self.axis_label)
+
+    def home(self):
         """
-        return abs(self.rbv - self._move_to_sp) < 0.01
+        Perform a homing operation.
+        """
+        self.sp = 0.0
+        self.move_to_sp()
 
     def get_label_and_position(self):
         """
@@ -70,7 +83,7 @@ class Axis(object):
         Stop the motor moving.
 
         """
-        self.moving = False
+        self._motion.stop(self.axis_label)
 
     def move_to_sp(self):
         """
@@ -78,10 +91,9 @@ class Axis(object):
 
         Returns: True if can start moving (or is already at position), False otherwise
         """
-        self._move_to_sp = self.sp
-        if self._at_position():
+        if abs(self.rbv - self.sp) < self._motion.tolerance(self.axis_label):
             return True
-        self.moving = True
+        self._motion.move(self.axis_label, self.sp)
         return True
 
 
@@ -95,9 +107,10 @@ class SimulatedSm300(StateMachineDevice):
         """
         # Is the device initialised, if not it won't talk to me
         self.initialised = False
+        self.motion = MotionEngine(["X", "Y"], tolerance=0.01, position=10.0)
         self.axes = {
-            "X": Axis("X"),
-            "Y": Axis("Y")
+            "X": Axis("X", self.motion),
+            "Y": Axis("Y", self.motion)
         }
         self.x_axis = self.axes["X"]
         self.y_axis = self.axes["Y"]
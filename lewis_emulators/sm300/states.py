@@ -7,10 +7,10 @@ class DefaultState(State):
     """
     def in_state(self, dt):
         """
-        When in this state simulate each axis.
+        When in this state simulate the motion of the axes.
         Args:
             dt: time since last simulate
 
         """
         device = self._context
-        [axis.simulate(dt) for axis in device.axes.values()]
+        device.motion.advance(dt)
@@ -0,0 +1,39 @@
+import unittest
+from hamcrest import assert_that, is_, starts_with
+
+from lewis_emulators.sm300.device import SimulatedSm300
+from lewis_emulators.sm300.interfaces import Sm300StreamInterface
+
+ACK_STX = "\x06\x02"
+
+
+class Sm300StreamInterfaceTests(unittest.TestCase):
+    """
+    Tests for the replies of the SM300 to requests.
+    """
+
+    def setUp(self):
+        self.device = SimulatedSm300()
+        self.interface = Sm300StreamInterface()
+        self.interface.device = self.device
+
+    def _request(self, request):
+        request = (ACK_STX + request).encode("latin-1")
+        command = next(command for command in self.interface.bound_commands if command.can_process(request))
+        return command.process_request(request)
+
+    def _run(self, seconds, dt=0.1):
+        for _ in range(int(round(seconds / dt))):
+            self.device.process(dt)
+
+    def test_that_GIVEN_the_device_has_started_THEN_the_axes_are_at_10(self):
+        assert_that(self._request("LQ"), starts_with(ACK_STX + "X10,Y10\x03"))
+
+    def test_that_GIVEN_a_move_has_finished_THEN_the_axes_are_at_their_set_points(self):
+        self._request("B/ X100 Y200")
+        self._request("BSL")
+
+        self._run(30.0)
+
+        assert_that(self._request("LQ"), starts_with(ACK_STX + "X100,Y200\x03"))
+        assert_that(self._request("LM"), is_(ACK_STX + "P\x04"))
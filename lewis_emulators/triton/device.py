@@ -2,6 +2,8 @@ from collections import OrderedDict
 from .states import DefaultState
 from lewis.devices import StateMachineDevice
 
+from lewis_emulators.utils.thermal_model import ThermalModel
+
 
 HEATER_NAME = "H1"
 
@@ -67,6 +69,12 @@ class SimulatedTriton(StateMachineDevice):
         self.sample_channel = "T5"
         assert self.sample_channel in self.temperature_stages
 
+        # Thermal model of the sample stage, which the control loop heats; it is only used once thermal_model_enabled
+        # is set through the backdoor, and the heater only has power once its resistance is set too
+        self.thermal_model = ThermalModel()
+        self.thermal_model_enabled = False
+        self.sample_thermal_channel = self.thermal_model.add_channel()
+
     def find_temperature_channel(self, name):
 
         for k, v in self.temperature_stages.items():
@@ -2,4 +2,30 @@ from lewis.core.statemachine import State
 
 
 class DefaultState(State):
-    pass
+    """
+    Temperatures stay where they are set, unless thermal_model_enabled is set, when the sample stage is simulated
+    with the thermal model and heated by the control loop.
+    """
+
+    def in_state(self, dt):
+        if self._context.thermal_model_enabled:
+            self._simulate_thermal_model(dt)
+
+    def _simulate_thermal_model(self, dt):
+        device = self._context
+        stage = device.temperature_stages[device.sample_channel]
+        channel = device.sample_thermal_channel
+
+        # The heater range is a current in mA, so the heater's full power is I^2 R
+        channel.max_power = (device.heater_range / 1000.0) ** 2 * device.heater_resistance
+        channel.closed_loop = device.closed_loop
+        if not device.closed_loop:
+            channel.heater = 0
+        channel.setpoint = device.temperature_setpoint
+        channel.p, channel.i, channel.d = device.p, device.i, device.d
+        channel.temperature = stage.temperature
+
+        device.thermal_model.step(dt)
+
+        stage.temperature = channel.temperature
+        device.heater_power = channel.heater / 100.0 * channel.max_power * 1e6  # uW
@@ -0,0 +1,45 @@
+import unittest
+from hamcrest import assert_that, is_, close_to, greater_than
+
+from lewis_emulators.triton.device import SimulatedTriton
+
+
+class DefaultStateTests(unittest.TestCase):
+    """
+    Tests for the temperature of the sample stage the Triton reads back.
+    """
+
+    def setUp(self):
+        self.device = SimulatedTriton()
+        self.device.temperature_setpoint = 0.1
+        self.device.closed_loop = True
+        self.device.p, self.device.i = 1000.0, 200.0
+        self.device.heater_range = 10
+        self.device.heater_resistance = 100
+
+    def _run(self, seconds, dt=0.1):
+        for _ in range(int(round(seconds / dt))):
+            self.device.process(dt)
+
+    def test_that_GIVEN_the_thermal_model_is_not_enabled_THEN_the_temperature_stays_where_it_is(self):
+        self._run(10.0)
+
+        assert_that(self.device.get_temp("T5"), is_(1))
+        assert_that(self.device.heater_power, is_(1))
+
+    def test_that_GIVEN_the_thermal_model_THEN_the_control_loop_brings_the_sample_stage_to_the_setpoint(self):
+        self.device.thermal_model_enabled = True
+
+        self._run(600.0)
+
+        assert_that(self.device.get_temp("T5"), close_to(0.1, 1e-3))
+        assert_that(self.device.heater_power, greater_than(0))
+
+    def test_that_GIVEN_the_thermal_model_and_the_loop_open_THEN_the_sample_stage_cools_with_the_heater_off(self):
+        self.device.thermal_model_enabled = True
+        self.device.closed_loop = False
+
+        self._run(600.0)
+
+        assert_that(self.device.get_temp("T5"), close_to(0.0, 1e-3))
+        assert_that(self.device.heater_power, is_(0))
@@ -0,0 +1,89 @@
+"""
+Base class for objects which stand in for the bound commands of a stream interface, e.g. a command dispatcher or a
+router, by behaving like a single bound command (lewis.adapters.stream.Func).
+"""
+import abc
+import six
+
+
+class _DescriptionMatcher(object):
+    """
+    Pattern matcher reported before any request has matched; lewis logs its pattern when processing a request.
+    """
+    def __init__(self, description):
+        self.pattern = description
+        self.arg_count = 0
+        self.argument_mappings = None
+
+    def match(self, request):
+        return None
+
+
+@six.add_metaclass(abc.ABCMeta)
+class SingleBoundCommand(object):
+    """
+    Base class for objects which behave like a single bound command (lewis.adapters.stream.Func) that can process any
+    request it finds a match for. Lewis asks whether a command can process a request before having it process the
+    same request, so the match of the last request is kept rather than found twice.
+
+    Sub-classes must implement find_match and process_match, and may implement matcher_of.
+    """
+
+    def __init__(self, doc, description):
+        """
+        :param doc: the documentation of the requests it can process
+        :param description: the pattern reported before any request has matched
+        """
+        self.func = None
+        self.doc = doc
+        self._description = _DescriptionMatcher(description)
+        self._last_request = None
+        self._last_match = None
+
+    @abc.abstractmethod
+    def find_match(self, request):
+        """
+        Find what should process the request.
+
+        :param request: the request
+        :return: the match, passed to process_match; None if the request can not be processed
+        """
+
+    @abc.abstractmethod
+    def process_match(self, match, request):
+        """
+        Process a request.
+
+        :param match: the match of the request, as found by find_match
+        :param request: the request
+        :return: the reply
+        """
+
+    def matcher_of(self, match):
+        """
+        :param match: the match of a request
+        :return: the pattern matcher lewis logs when processing the request
+        """
+        return self._description
+
+    @property
+    def matcher(self):
+        """
+        The matcher of the request that last matched; lewis logs its pattern when processing the request.
+        """
+        return self._description if self._last_match is None else self.matcher_of(self._last_match)
+
+    def _match_for(self, request):
+        if self._last_match is None or request != self._last_request:
+            self._last_request = request
+            self._last_match = self.find_match(request)
+        return self._last_match
+
+    def can_process(self, request):
+        return self._match_for(request) is not None
+
+    def process_request(self, request):
+        match = self._match_for(request)
+        if match is None:
+            raise RuntimeError("Request can not be processed.")
+        return self.process_match(match, request)
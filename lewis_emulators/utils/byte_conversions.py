@@ -1,7 +1,230 @@
 import struct
 
+import six
+
 BYTE = 2**8
 
+_UINT_FORMAT_CHARACTERS = {1: "B", 2: "H", 4: "I", 8: "Q"}
+
+_UINT_STRUCTS = {(length, low_byte_first): struct.Struct(("<" if low_byte_first else ">") + character)
+                 for length, character in _UINT_FORMAT_CHARACTERS.items() for low_byte_first in (True, False)}
+
+_FLOAT32_STRUCTS = {low_byte_first: struct.Struct("<f" if low_byte_first else ">f") for low_byte_first in (True, False)}
+
+# Structs for packing several values at once, keyed on (format character, count, low byte first)
+_BATCH_STRUCTS = {}
+
+
+def _batch_struct(character, count, low_byte_first):
+    key = (character, count, low_byte_first)
+    try:
+        return _BATCH_STRUCTS[key]
+    except KeyError:
+        packer = struct.Struct("{}{}{}".format("<" if low_byte_first else ">", count, character))
+        _BATCH_STRUCTS[key] = packer
+        return packer
+
+
+def _uint_format_character(length):
+    try:
+        return _UINT_FORMAT_CHARACTERS[length]
+    except KeyError:
+        raise ValueError("Batches of unsigned integers must be 1, 2, 4 or 8 bytes long, not {}".format(length))
+
+
+def _mask(length):
+    return (1 << (8 * length)) - 1
+
+
+def _as_bytes(raw_bytes):
+    """
+    Converts raw bytes given as a string, or an iterable of one character strings, to something struct can unpack.
+    """
+    if isinstance(raw_bytes, (bytes, bytearray, memoryview)):
+        return raw_bytes
+    if isinstance(raw_bytes, six.text_type):
+        return raw_bytes.encode("latin-1")
+    return _as_bytes("".join(raw_bytes))
+
+
+def _as_str(raw_bytes):
+    """
+    Converts bytes to a string where each character represents a byte.
+    """
+    return raw_bytes if isinstance(raw_bytes, str) else raw_bytes.decode("latin-1")
+
+
+def pack_uint(value, length, low_byte_first=True):
+    """
+    Packs an integer into an unsigned set of bytes with the specified length. Integers which do not fit are wrapped,
+    e.g. -1 is packed as all bits set.
+
+    Args:
+        value (int): The integer to pack.
+        length (int): The number of bytes in the result.
+        low_byte_first (bool): Whether to put the least significant byte first. True by default.
+
+    Returns:
+        bytes: The packed integer.
+    """
+    value &= _mask(length)
+    try:
+        return _UINT_STRUCTS[(length, low_byte_first)].pack(value)
+    except KeyError:
+        raw_bytes = bytearray((value >> (8 * index)) & 0xFF for index in range(length))
+        if not low_byte_first:
+            raw_bytes.reverse()
+        return bytes(raw_bytes)
+
+
+def unpack_uint(raw_bytes, low_byte_first=True):
+    """
+    Unpacks an unsigned set of bytes of any length into an integer.
+
+    Args:
+        raw_bytes (bytes|bytearray|memoryview): The bytes to unpack.
+        low_byte_first (bool): Whether the least significant byte is first. True by default.
+
+    Returns:
+        int: The integer represented by the bytes.
+    """
+    try:
+        return _UINT_STRUCTS[(len(raw_bytes), low_byte_first)].unpack_from(raw_bytes)[0]
+    except KeyError:
+        ordered = bytearray(raw_bytes)
+        if low_byte_first:
+            ordered.reverse()
+        result = 0
+        for byte in ordered:
+            result = (result << 8) | byte
+        return result
+
+
+def pack_uint_into(buffer, offset, value, length, low_byte_first=True):
+    """
+    Packs an integer into an unsigned set of bytes with the specified length, writing them into a buffer. Integers
+    which do not fit are wrapped.
+
+    Args:
+        buffer (bytearray|memoryview): The writable buffer.
+        offset (int): Where in the buffer to write the first byte.
+        value (int): The integer to pack.
+        length (int): The number of bytes to write.
+        low_byte_first (bool): Whether to put the least significant byte first. True by default.
+
+    Returns:
+        None.
+    """
+    try:
+        _UINT_STRUCTS[(length, low_byte_first)].pack_into(buffer, offset, value & _mask(length))
+    except KeyError:
+        buffer[offset:offset + length] = pack_uint(value, length, low_byte_first)
+
+
+def pack_uints(values, length, low_byte_first=True):
+    """
+    Packs a sequence of integers into consecutive unsigned sets of bytes of the same length.
+
+    Args:
+        values (list[int]): The integers to pack.
+        length (int): The number of bytes for each integer; 1, 2, 4 or 8.
+        low_byte_first (bool): Whether to put the least significant byte of each integer first. True by default.
+
+    Returns:
+        bytes: The packed integers.
+    """
+    mask = _mask(length)
+    return _batch_struct(_uint_format_character(length), len(values), low_byte_first).pack(
+        *[value & mask for value in values])
+
+
+def unpack_uints(raw_bytes, length, low_byte_first=True):
+    """
+    Unpacks consecutive unsigned sets of bytes of the same length into integers.
+
+    Args:
+        raw_bytes (bytes|bytearray|memoryview): The bytes to unpack; a multiple of length long.
+        length (int): The number of bytes for each integer; 1, 2, 4 or 8.
+        low_byte_first (bool): Whether the least significant byte of each integer is first. True by default.
+
+    Returns:
+        tuple[int]: The integers represented by the bytes.
+    """
+    return _batch_struct(_uint_format_character(length), len(raw_bytes) // length, low_byte_first).unpack_from(
+        raw_bytes)
+
+
+def pack_float32(value, low_byte_first=True):
+    """
+    Packs a floating point number into 4 bytes (IEEE single-precision).
+
+    Args:
+        value (float): The number to pack.
+        low_byte_first (bool): Whether to put the least significant byte first. True by default.
+
+    Returns:
+        bytes: The packed number.
+    """
+    return _FLOAT32_STRUCTS[low_byte_first].pack(value)
+
+
+def pack_float32_into(buffer, offset, value, low_byte_first=True):
+    """
+    Packs a floating point number into 4 bytes (IEEE single-precision), writing them into a buffer.
+
+    Args:
+        buffer (bytearray|memoryview): The writable buffer.
+        offset (int): Where in the buffer to write the first byte.
+        value (float): The number to pack.
+        low_byte_first (bool): Whether to put the least significant byte first. True by default.
+
+    Returns:
+        None.
+    """
+    _FLOAT32_STRUCTS[low_byte_first].pack_into(buffer, offset, value)
+
+
+def unpack_float32(raw_bytes, low_byte_first=True):
+    """
+    Unpacks 4 bytes (IEEE single-precision) into a floating point number.
+
+    Args:
+        raw_bytes (bytes|bytearray|memoryview): The bytes to unpack.
+        low_byte_first (bool): Whether the least significant byte is first. True by default.
+
+    Returns:
+        float: The number represented by the bytes.
+    """
+    return _FLOAT32_STRUCTS[low_byte_first].unpack_from(raw_bytes)[0]
+
+
+def pack_float32s(values, low_byte_first=True):
+    """
+    Packs a sequence of floating point numbers into consecutive sets of 4 bytes (IEEE single-precision).
+
+    Args:
+        values (list[float]): The numbers to pack.
+        low_byte_first (bool): Whether to put the least significant byte of each number first. True by default.
+
+    Returns:
+        bytes: The packed numbers.
+    """
+    return _batch_struct("f", len(values), low_byte_first).pack(*values)
+
+
+def unpack_float32s(raw_bytes, low_byte_first=True):
+    """
+    Unpacks consecutive sets of 4 bytes (IEEE single-precision) into floating point numbers.
+
+    Args:
+        raw_bytes (bytes|bytearray|memoryview): The bytes to unpack; a multiple of 4 long.
+        low_byte_first (bool): Whether the least significant byte of each number is first. True by default.
+
+    Returns:
+        tuple[float]: The numbers represented by the bytes.
+    """
+    return _batch_struct("f", len(raw_bytes) // 4, low_byte_first).unpack_from(raw_bytes)
+
 
 def int_to_raw_bytes(integer, length, low_byte_first):
     """
@@ -17,12 +240,7 @@ def int_to_raw_bytes(integer, length, low_byte_first):
     Returns:
         string:  string representation of the bytes.
     """
-    result = r""
-
-    for index in range(length):
-        result += chr((integer // (BYTE**index)) % BYTE)
-
-    return result if low_byte_first else result[::-1]
+    return _as_str(pack_uint(integer, length, low_byte_first))
 
 
 def raw_bytes_to_int(raw_bytes, low_bytes_first=True):
@@ -36,15 +254,7 @@ def raw_bytes_to_int(raw_bytes, low_bytes_first=True):
     Returns:
         int: The integer represented by the raw bytes passed in.
     """
-    if not low_bytes_first:
-        raw_bytes = raw_bytes[::-1]
-
-    multiplier = 1
-    result = 0
-    for b in raw_bytes:
-        result += ord(b) * multiplier
-        multiplier *= BYTE
-    return result
+    return unpack_uint(_as_bytes(raw_bytes), low_bytes_first)
 
 
 def float_to_raw_bytes(real_number, low_byte_first=True):
@@ -58,9 +268,7 @@ def float_to_raw_bytes(real_number, low_byte_first=True):
     Returns:
         string: A string representation of the bytes.
     """
-    raw_bytes = "".join(chr(c) for c in bytearray(struct.pack(">f", real_number)))
-
-    return raw_bytes[::-1] if low_byte_first else raw_bytes
+    return _as_str(pack_float32(real_number, low_byte_first))
 
 
 def raw_bytes_to_float(raw_bytes):
@@ -68,9 +276,9 @@ def raw_bytes_to_float(raw_bytes):
     Convert a set of bytes to a floating point number
 
     Args:
-        raw_bytes (string): A stirng representation of the raw bytes.
+        raw_bytes (string): A stirng representation of the raw bytes, most significant byte first.
 
     Returns:
         float: The floating point number represented by the given bytes.
     """
-    return struct.unpack('f', raw_bytes[::-1])[0]
+    return unpack_float32(_as_bytes(raw_bytes), low_byte_first=False)
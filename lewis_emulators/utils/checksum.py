@@ -0,0 +1,62 @@
+"""
+Checksums used by binary protocols.
+"""
+
+import six
+
+# Initial value of a Modbus style CRC16
+CRC16_INITIAL_VALUE = 0xFFFF
+
+# Reversed form of the CRC16 polynomial x^16 + x^15 + x^2 + 1
+CRC16_POLYNOMIAL = 0xA001
+
+
+def _crc16_table(polynomial):
+    table = []
+    for byte in range(256):
+        crc = byte
+        for _ in range(8):
+            crc = (crc >> 1) ^ polynomial if crc & 1 else crc >> 1
+        table.append(crc)
+    return tuple(table)
+
+
+_CRC16_TABLE = _crc16_table(CRC16_POLYNOMIAL)
+
+
+def as_bytearray(data):
+    """
+    View data as a bytearray so that iterating over it gives integers in both python 2 and 3.
+
+    Args:
+        data (bytes|bytearray|memoryview|str): The data; text is treated as one byte per character.
+
+    Returns:
+        bytearray: The data.
+    """
+    if isinstance(data, bytearray):
+        return data
+    if isinstance(data, six.text_type):
+        return bytearray(data.encode("latin-1"))
+    return bytearray(data)
+
+
+def crc16(data, value=CRC16_INITIAL_VALUE):
+    """
+    Calculates a Modbus style CRC16 of some data using a lookup table.
+
+    Like zlib.crc32 the checksum can be calculated incrementally by passing the result of the previous call as value,
+    e.g. crc16(b"5678", crc16(b"1234")) == crc16(b"12345678").
+
+    Args:
+        data (bytes|bytearray|memoryview|str): The data to checksum.
+        value (int): The checksum of any preceding data; the initial value by default.
+
+    Returns:
+        int: The 16 bit checksum.
+    """
+    table = _CRC16_TABLE
+    crc = value
+    for byte in as_bytearray(data):
+        crc = (crc >> 8) ^ table[(crc ^ byte) & 0xFF]
+    return crc
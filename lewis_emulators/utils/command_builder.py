@@ -6,6 +6,7 @@ import re
 from lewis.adapters.stream import Cmd, regex
 
 from lewis_emulators.utils.constants import STX, ACK, EOT, ETX, ENQ
+from lewis_emulators.utils.regex_prefix import has_top_level_alternation, QUANTIFIERS, SPECIAL_CHARACTERS
 
 
 class CmdBuilder(object):
@@ -27,6 +28,9 @@ class CmdBuilder(object):
     There are various arguments like int and digit. Finally some special characters are included so if your protocol
     uses enquirey character ascii 5 you can match is using
     >>> CmdBuilder("set_pres").escape("pres?").enq().build()
+    The literal text at the start of the command (here "pres?") is recorded as literal_prefix on the builder and on
+    the pattern of the built command so that lewis_emulators.utils.dispatch can look the command up without trying
+    its regex. That module can also fuse the regexes of a whole interface into one (FusedCommandDispatcher).
     """
 
     def __init__(self, target_method, arg_sep="", ignore="", ignore_case=False):
@@ -50,8 +54,20 @@ class CmdBuilder(object):
 
         self._ignore_case = ignore_case
 
-    def _add_to_regex(self, regex, is_arg):
+        # Literal text every match must start with; it can only be relied upon if there are no ignored characters
+        self.literal_prefix = ""
+        self._prefix_complete = self._ignore != ""
+
+    def _add_to_regex(self, regex, is_arg, literal=None):
+        if literal is None:
+            self._prefix_complete = True
+        elif not self._prefix_complete:
+            self.literal_prefix += literal
         self._reg_ex += regex + self._ignore
+        if self.literal_prefix and has_top_level_alternation(self._reg_ex):
+            # A match need not start with the text before the alternation, wherever the alternation was added
+            self.literal_prefix = ""
+            self._prefix_complete = True
         if not is_arg:
             self._current_sep = ""
 
@@ -71,7 +87,7 @@ class CmdBuilder(object):
         :param text: text to add
         :return: builder
         """
-        self._add_to_regex(re.escape(text), False)
+        self._add_to_regex(re.escape(text), False, literal=text)
         return self
 
     def regex(self, regex):
@@ -81,6 +97,10 @@ class CmdBuilder(object):
         :param regex: regex to add
         :return: builder
         """
+        if not regex:
+            return self
+        if not self._prefix_complete and regex[0] in QUANTIFIERS:
+            self.literal_prefix = self.literal_prefix[:-1]
         self._add_to_regex(regex, False)
         return self
 
@@ -209,11 +229,10 @@ class CmdBuilder(object):
         :param kwargs: key word arguments to pass to Cmd constructor
         :return: Cmd object
         """
+        pattern = regex(self._reg_ex)
         if self._ignore_case:
-            pattern = regex(self._reg_ex)
             pattern.compiled_pattern = re.compile(self._reg_ex, re.IGNORECASE)
-        else:
-            pattern = self._reg_ex
+        pattern.literal_prefix = self.literal_prefix
         return Cmd(self._target_method, pattern, argument_mappings=self.argument_mappings, *args, **kwargs)
 
     def add_ascii_character(self, char_number):
@@ -223,7 +242,8 @@ class CmdBuilder(object):
         :param char_number: character number
         :return: self
         """
-        self._add_to_regex(chr(char_number), False)
+        char = chr(char_number)
+        self._add_to_regex(char, False, literal=None if char in SPECIAL_CHARACTERS else char)
         return self
 
     def stx(self):
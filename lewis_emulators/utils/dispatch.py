@@ -0,0 +1,250 @@
+"""
+Command dispatchers for stream interfaces.
+
+Lewis tries each bound command of an interface against a request in turn, so the time taken to handle a request
+grows with the size of the command table. A dispatcher stands in for all of the bound commands of an interface and
+finds the command which should handle a request with less work.
+
+To use one derive the interface from DispatchingStreamInterface as well as StreamInterface, e.g.
+
+>>> class MyStreamInterface(DispatchingStreamInterface, StreamInterface):
+>>>     commands = {CmdBuilder("get_pres").escape("pres?").build()}
+"""
+
+import abc
+import re
+
+import six
+from lewis.adapters.stream import regex
+
+from lewis_emulators.utils.bound_command import SingleBoundCommand
+from lewis_emulators.utils.regex_prefix import literal_prefix
+
+
+def _ignores_case(matcher):
+    compiled_pattern = getattr(matcher, "compiled_pattern", None)
+    return compiled_pattern is not None and bool(compiled_pattern.flags & re.IGNORECASE)
+
+
+def _prefix_of(matcher):
+    """
+    The literal prefix of a pattern matcher; recorded by CmdBuilder or worked out from a plain regex.
+    """
+    prefix = getattr(matcher, "literal_prefix", None)
+    if prefix is None:
+        prefix = literal_prefix(matcher.pattern) if type(matcher) is regex else ""
+    return prefix
+
+
+class CommandDispatcher(SingleBoundCommand):
+    """
+    Base class for dispatchers. It behaves like a single bound command (lewis.adapters.stream.Func) that can process
+    any request one of the commands it was created from can process.
+
+    Sub-classes must implement find_command.
+    """
+
+    def __init__(self, bound_commands):
+        """
+        Create a dispatcher.
+
+        :param bound_commands: the bound commands of the interface, in the order lewis would try them
+        """
+        self.commands = list(bound_commands)
+        super(CommandDispatcher, self).__init__(
+            "\n".join(sorted(command.matcher.pattern for command in self.commands)),
+            "{} over {} commands".format(type(self).__name__, len(self.commands)))
+
+    @abc.abstractmethod
+    def find_command(self, request):
+        """
+        Find the bound command which should process the request.
+
+        :param request: the request
+        :return: the bound command; None if no command matches
+        """
+
+    def find_match(self, request):
+        return self.find_command(request)
+
+    def matcher_of(self, command):
+        return command.matcher
+
+    def process_match(self, command, request):
+        return command.process_request(request)
+
+
+class IndexedCommandDispatcher(CommandDispatcher):
+    """
+    Dispatcher which looks up the commands that could match a request by the literal text they start with and only
+    tries the regexes of those. Commands which do not start with literal text (e.g. they start with an argument) are
+    always tried.
+    """
+
+    def __init__(self, bound_commands):
+        super(IndexedCommandDispatcher, self).__init__(bound_commands)
+        self._by_prefix = {}
+        self._by_folded_prefix = {}
+        self._unindexed = []
+
+        for position, command in enumerate(self.commands):
+            prefix = _prefix_of(command.matcher)
+            if prefix == "":
+                self._unindexed.append(position)
+            elif _ignores_case(command.matcher):
+                self._by_folded_prefix.setdefault(six.b(prefix).lower(), []).append(position)
+            else:
+                self._by_prefix.setdefault(six.b(prefix), []).append(position)
+
+        self._prefix_lengths = sorted(set(len(prefix) for prefix in self._by_prefix))
+        self._folded_prefix_lengths = sorted(set(len(prefix) for prefix in self._by_folded_prefix))
+
+    def candidates(self, request):
+        """
+        The commands which could match a request, in the order lewis would have tried them.
+
+        :param request: the request
+        :return: list of bound commands
+        """
+        positions = list(self._unindexed)
+        for length in self._prefix_lengths:
+            if length > len(request):
+                break
+            positions.extend(self._by_prefix.get(request[:length], ()))
+
+        if self._folded_prefix_lengths:
+            folded_request = request[:self._folded_prefix_lengths[-1]].lower()
+            for length in self._folded_prefix_lengths:
+                if length > len(folded_request):
+                    break
+                positions.extend(self._by_folded_prefix.get(folded_request[:length], ()))
+
+        positions.sort()
+        return [self.commands[position] for position in positions]
+
+    def find_command(self, request):
+        for command in self.candidates(request):
+            if command.can_process(request):
+                return command
+        return None
+
+
+# Python 2 does not allow more than 100 groups in one regex
+MAX_FUSED_GROUPS = 99
+
+# Constructs whose meaning depends on group numbering or which must be at the start of a regex
+_UNFUSABLE = re.compile(r"\(\?P[<=]|\\[1-9]|\(\?[aiLmsux]+\)")
+
+
+def _like(text, source):
+    """
+    Convert text to the same string type (bytes or unicode) as a regex source so that they can be joined.
+    """
+    return text if isinstance(source, six.text_type) else six.b(text)
+
+
+class _FusedSegment(object):
+    """
+    A run of consecutive commands whose regexes have been joined into a single alternation, one named group per
+    command.
+    """
+
+    def __init__(self, commands, sources, flags):
+        self.commands = commands
+        self._arguments = {}
+        alternatives = []
+        group = 1
+        for index, (command, source) in enumerate(zip(commands, sources)):
+            alternatives.append(_like("(?P<cmd{}>".format(index), source) + source + _like(")", source))
+            arg_count = command.matcher.compiled_pattern.groups
+            self._arguments[group] = (command, group, group + arg_count)
+            group += 1 + arg_count
+        self.compiled_pattern = re.compile(_like("|", sources[0]).join(alternatives), flags)
+
+    def match(self, request):
+        """
+        Match the request against every command in the segment with a single regex search.
+
+        :param request: the request
+        :return: tuple of the winning bound command and its (unmapped) arguments; None if no command matched
+        """
+        match = self.compiled_pattern.match(request)
+        if match is None:
+            return None
+        command, first, end = self._arguments[match.lastindex]
+        return command, match.groups()[first:end]
+
+
+class FusedCommandDispatcher(CommandDispatcher):
+    """
+    Dispatcher which compiles the regexes of all the commands into one alternation with a named group per command, so
+    that a request is matched by a single regex search. The group that matched identifies the command and the slice
+    of groups inside it are that command's arguments, which are then mapped with the command's argument mappings
+    (e.g. those recorded by CmdBuilder.float()).
+
+    Commands are only fused with neighbours which have the same regex flags (e.g. CmdBuilder ignore_case), so the
+    first command lewis would have matched is still the one that is chosen. Commands which can not be fused (because
+    they use back references, named groups or global inline flags) are tried on their own.
+    """
+
+    def __init__(self, bound_commands):
+        super(FusedCommandDispatcher, self).__init__(bound_commands)
+        self.segments = []
+        self._last_arguments = None
+
+        run, sources, run_key, run_groups = [], [], None, 0
+        for command in self.commands:
+            compiled_pattern = getattr(command.matcher, "compiled_pattern", None)
+            source = None if compiled_pattern is None else compiled_pattern.pattern
+            if source is None or _UNFUSABLE.search(six.ensure_str(source, "latin-1")) is not None:
+                key, groups = None, 0
+            else:
+                key, groups = (compiled_pattern.flags, type(source)), compiled_pattern.groups + 1
+
+            if run and (key != run_key or run_groups + groups > MAX_FUSED_GROUPS):
+                self.segments.append(_FusedSegment(run, sources, run_key[0]))
+                run, sources, run_groups = [], [], 0
+
+            if key is None:
+                self.segments.append(command)
+            else:
+                run.append(command)
+                sources.append(source)
+                run_key = key
+                run_groups += groups
+
+        if run:
+            self.segments.append(_FusedSegment(run, sources, run_key[0]))
+
+    def find_command(self, request):
+        self._last_arguments = None
+        for segment in self.segments:
+            if isinstance(segment, _FusedSegment):
+                result = segment.match(request)
+                if result is not None:
+                    command, self._last_arguments = result
+                    return command
+            elif segment.can_process(request):
+                return segment
+        return None
+
+    def process_match(self, command, request):
+        if self._last_arguments is None:
+            return command.process_request(request)
+        return command.map_return_value(command.func(*command.map_arguments(self._last_arguments)))
+
+
+class DispatchingStreamInterface(object):
+    """
+    Mixin for stream interfaces which hands requests to a command dispatcher instead of letting lewis try every command
+    in turn. Set command_dispatcher to choose the dispatcher.
+
+    It is not an interface itself, so that lewis does not find it as a second stream interface in the modules which
+    import it.
+    """
+
+    command_dispatcher = IndexedCommandDispatcher
+
+    def _bind_device(self):
+        super(DispatchingStreamInterface, self)._bind_device()
+        self.bound_commands = [self.command_dispatcher(self.bound_commands)]
@@ -0,0 +1,337 @@
+"""
+Runs many emulators in one process.
+
+Lewis runs each emulator in its own process, with a thread per adapter polling its sockets and a loop sleeping between
+the device's simulation cycles. The host instead runs every emulator from a single loop: one poll of all sockets
+serves the adapters of every device, and a shared scheduler runs each device's simulation cycle when it is due. The
+time each device takes to process a cycle is recorded, so one slow device can not hold up the others unnoticed.
+
+Emulators are listed in a YAML file, e.g.
+
+    cycle_delay: 0.1
+    report_interval: 60
+    emulators:
+      - device: rknps
+        protocol: stream
+        port: 57001
+      - device: danfysik
+        protocol: model8000
+        port: 57002
+        setup: default
+        control_server: 127.0.0.1:10002
+
+and run with
+
+    python -m lewis_emulators.utils.emulator_host emulators.yaml
+
+or listed on the command line as DEVICE:PROTOCOL:PORT with -e.
+"""
+
+import argparse
+import asyncore
+import time
+from datetime import datetime
+
+import yaml
+from lewis.adapters.modbus import ModbusAdapter
+from lewis.adapters.stream import StreamAdapter
+from lewis.core.logging import has_log, logging, default_log_format
+from lewis.core.simulation import Simulation
+
+from lewis_emulators.utils.manifest import LazyDeviceRegistry
+
+_clock = getattr(time, "monotonic", time.time)
+
+
+class CycleTimes(object):
+    """
+    Statistics of the time a device takes to process its simulation cycles.
+    """
+
+    def __init__(self):
+        self.cycles = 0
+        self.total = 0.0
+        self.last = 0.0
+        self.max = 0.0
+
+    def record(self, cycle_time):
+        self.cycles += 1
+        self.total += cycle_time
+        self.last = cycle_time
+        self.max = max(self.max, cycle_time)
+
+    @property
+    def mean(self):
+        return self.total / self.cycles if self.cycles else 0.0
+
+    def __str__(self):
+        return "{} cycles, mean {:.3f} ms, max {:.3f} ms".format(self.cycles, self.mean * 1000, self.max * 1000)
+
+
+@has_log
+class HostedSimulation(Simulation):
+    """
+    A simulation whose adapters and simulation cycles are driven by an EmulatorHost rather than its own threads and
+    loop. It can be paused, resumed, stopped and sped up like any other simulation, including through its control
+    server.
+    """
+
+    def __init__(self, name, device, adapters, device_builder=None, control_server=None):
+        """
+        :param name: name of the emulator in the host
+        :param device: the simulated device
+        :param adapters: adapters which expose the device
+        :param device_builder: builder to allow switching setups
+        :param control_server: 'host:port' of the control server, or None
+        """
+        super(HostedSimulation, self).__init__(device, adapters, device_builder, control_server)
+        self.name = name
+        self.cycle_times = CycleTimes()
+        self._hosted_adapters = list(adapters)
+        self._last_cycle = None
+
+    def start(self):
+        """
+        Starts the adapters and control server, but not a simulation loop.
+        """
+        self.log.info("Starting hosted simulation %s", self.name)
+        self._running = True
+        self._started = True
+        self._stop_commanded = False
+
+        if self._control_server is not None:
+            self._control_server.start_server()
+
+        for adapter in self._hosted_adapters:
+            adapter.device_lock = self._adapters.device_lock
+            adapter.start_server()
+
+        self._start_time = datetime.now()
+        self._last_cycle = _clock()
+
+    def shut_down(self):
+        """
+        Stops the adapters after the simulation has been stopped.
+        """
+        for adapter in self._hosted_adapters:
+            adapter.stop_server()
+        self._running = False
+        self._started = False
+        self.log.info("Hosted simulation %s has ended.", self.name)
+
+    @property
+    def is_stopping(self):
+        return self._stop_commanded
+
+    @property
+    def mean_cycle_time(self):
+        """
+        Mean time in seconds the device takes to process a simulation cycle.
+        """
+        return self.cycle_times.mean
+
+    @property
+    def max_cycle_time(self):
+        """
+        Longest time in seconds the device has taken to process a simulation cycle.
+        """
+        return self.cycle_times.max
+
+    def next_cycle_due(self):
+        """
+        :return: clock time at which the next simulation cycle is due
+        """
+        return self._last_cycle + self._cycle_delay
+
+    def process_cycle(self, now):
+        """
+        Processes one simulation cycle, passing the device the time since the last cycle.
+
+        :param now: the current clock time
+        :return: time in seconds the device took to process the cycle
+        """
+        delta = now - self._last_cycle
+        self._last_cycle = now
+        if not self._running:
+            return 0.0
+
+        delta_simulation = delta * self._speed
+        start = _clock()
+        with self._adapters.device_lock:
+            self._device.process(delta_simulation)
+        cycle_time = _clock() - start
+
+        self._cycles += 1
+        self._runtime += delta_simulation
+        self.cycle_times.record(cycle_time)
+        return cycle_time
+
+    def process_requests(self, msec):
+        """
+        Handles requests which have been received since the last call, after the host has polled the sockets.
+
+        :param msec: time in milliseconds since the last call, for read timeouts
+        """
+        if self._control_server is not None:
+            self._control_server.process(blocking=False)
+
+        for adapter in self._hosted_adapters:
+            if isinstance(adapter, StreamAdapter):
+                adapter._server.process(msec)
+            elif not isinstance(adapter, ModbusAdapter):
+                # Adapters which do not use asyncore have their own way of handling requests
+                adapter.handle(0)
+
+
+@has_log
+class EmulatorHost(object):
+    """
+    Runs emulators in one process, on one loop.
+    """
+
+    def __init__(self, cycle_delay=0.1, poll_interval=0.01, report_interval=None, devices_package="lewis_emulators"):
+        """
+        :param cycle_delay: time in seconds between simulation cycles of each device, as lewis' cycle delay
+        :param poll_interval: longest time in seconds to wait for requests before checking whether a cycle is due
+        :param report_interval: seconds between logging the cycle times of all devices, or None not to
+        :param devices_package: the package the emulators are in
+        """
+        self.cycle_delay = cycle_delay
+        self.poll_interval = poll_interval
+        self.report_interval = report_interval
+        self.simulations = []
+        self._registry = LazyDeviceRegistry(devices_package)
+        self._stop_commanded = False
+
+    def add(self, device, protocol, port, setup=None, bind_address="0.0.0.0", control_server=None, name=None):
+        """
+        Creates an emulator to be run by the host.
+
+        :param device: name of the emulator package, e.g. rknps
+        :param protocol: protocol of the interface to expose the device with
+        :param port: port to listen on
+        :param setup: setup to create the device with, or None for the default
+        :param bind_address: address to listen on
+        :param control_server: 'host:port' of a control server for the emulator, or None
+        :param name: name of the emulator in logs and reports, by default device:port
+        :return: the emulator's simulation
+        """
+        builder = self._registry.device_builder(device, strict_versions=False)
+        simulated_device = builder.create_device(setup)
+        interface = builder.create_interface(protocol)
+        interface.device = simulated_device
+        adapter = interface.adapter(options={"bind_address": bind_address, "port": port})
+        adapter.interface = interface
+
+        simulation = HostedSimulation(name or "{}:{}".format(device, port), simulated_device, [adapter], builder,
+                                      control_server)
+        simulation.cycle_delay = self.cycle_delay
+        self.simulations.append(simulation)
+        return simulation
+
+    def stop(self):
+        """
+        Stops the host after its current loop. Can be called from another thread.
+        """
+        self._stop_commanded = True
+
+    def report(self):
+        """
+        Logs the cycle times of every device, slowest first.
+        """
+        for simulation in sorted(self.simulations, key=lambda sim: sim.cycle_times.max, reverse=True):
+            self.log.info("%s: %s", simulation.name, simulation.cycle_times)
+
+    def run(self):
+        """
+        Runs all the emulators until stop is called or every simulation has been stopped.
+        """
+        for simulation in self.simulations:
+            simulation.start()
+        self.log.info("Hosting %s emulators", len(self.simulations))
+
+        running = list(self.simulations)
+        last_poll = _clock()
+        next_report = None if self.report_interval is None else last_poll + self.report_interval
+        try:
+            while running and not self._stop_commanded:
+                now = _clock()
+                next_cycle = min(simulation.next_cycle_due() for simulation in running)
+                asyncore.loop(min(self.poll_interval, max(0.0, next_cycle - now)), count=1)
+
+                now = _clock()
+                msec = int((now - last_poll) * 1000)
+                last_poll = now
+                for simulation in running:
+                    simulation.process_requests(msec)
+
+                for simulation in running:
+                    if now >= simulation.next_cycle_due():
+                        cycle_time = simulation.process_cycle(now)
+                        if cycle_time > simulation.cycle_delay:
+                            self.log.warning("%s took %.3f ms to process a cycle, longer than the cycle delay",
+                                             simulation.name, cycle_time * 1000)
+
+                for simulation in [simulation for simulation in running if simulation.is_stopping]:
+                    simulation.shut_down()
+                    running.remove(simulation)
+
+                if next_report is not None and now >= next_report:
+                    self.report()
+                    next_report = now + self.report_interval
+        finally:
+            for simulation in running:
+                simulation.shut_down()
+
+
+def parse_emulator(entry):
+    """
+    Parses an emulator given on the command line as DEVICE:PROTOCOL:PORT.
+    """
+    try:
+        device, protocol, port = entry.split(":")
+        return {"device": device, "protocol": protocol, "port": int(port)}
+    except ValueError:
+        raise argparse.ArgumentTypeError("Expected DEVICE:PROTOCOL:PORT but got {}".format(entry))
+
+
+def main(argument_list=None):
+    parser = argparse.ArgumentParser(description="Runs many lewis emulators in one process.")
+    parser.add_argument("config", nargs="?", help="YAML file listing the emulators to run.")
+    parser.add_argument("-e", "--emulator", type=parse_emulator, action="append", default=[],
+                        help="An emulator to run, as DEVICE:PROTOCOL:PORT. Can be given more than once.")
+    parser.add_argument("-c", "--cycle-delay", type=float, help="Seconds between simulation cycles of each device.")
+    parser.add_argument("-r", "--report-interval", type=float,
+                        help="Seconds between logging the cycle times of every device.")
+    parser.add_argument("-o", "--output-level", default="info",
+                        choices=["none", "critical", "error", "warning", "info", "debug"])
+    arguments = parser.parse_args(argument_list)
+
+    config = {}
+    if arguments.config is not None:
+        with open(arguments.config) as config_file:
+            config = yaml.safe_load(config_file) or {}
+    emulators = list(config.get("emulators", [])) + arguments.emulator
+    if not emulators:
+        parser.error("No emulators to run, give a config file or at least one -e.")
+
+    if arguments.output_level != "none":
+        logging.basicConfig(level=getattr(logging, arguments.output_level.upper()), format=default_log_format)
+
+    host = EmulatorHost(
+        cycle_delay=arguments.cycle_delay if arguments.cycle_delay is not None else config.get("cycle_delay", 0.1),
+        report_interval=(arguments.report_interval if arguments.report_interval is not None
+                         else config.get("report_interval")))
+    for emulator in emulators:
+        host.add(**emulator)
+
+    try:
+        host.run()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        host.report()
+
+
+if __name__ == "__main__":
+    main()
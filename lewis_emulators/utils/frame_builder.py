@@ -0,0 +1,156 @@
+"""
+A reusable builder for frames of binary protocols.
+"""
+
+from lewis_emulators.utils.byte_conversions import pack_uint_into, pack_float32_into
+from lewis_emulators.utils.checksum import crc16
+
+
+class FrameBuilder(object):
+    """
+    Builds a binary frame in a preallocated buffer, e.g.
+
+    >>> FrameBuilder().add_uint8(0x01).add_uint16(0x0203, low_byte_first=False).add_crc16().build()
+
+    The buffer grows if a frame is larger than its capacity. Call reset to reuse the same builder (and buffer) for the
+    next frame.
+    """
+
+    def __init__(self, capacity=64):
+        """
+        Args:
+            capacity (int): The initial size of the buffer in bytes.
+        """
+        self._buffer = bytearray(capacity)
+        self._length = 0
+
+    def __len__(self):
+        return self._length
+
+    def reset(self):
+        """
+        Empties the builder so that it can build a new frame.
+
+        Returns:
+            FrameBuilder: The builder.
+        """
+        self._length = 0
+        return self
+
+    def _reserve(self, size):
+        """
+        Makes room for some bytes at the end of the frame.
+
+        Args:
+            size (int): The number of bytes.
+
+        Returns:
+            int: The offset in the buffer of the first reserved byte.
+        """
+        offset = self._length
+        self._length += size
+        if self._length > len(self._buffer):
+            self._buffer.extend(bytearray(max(self._length, 2 * len(self._buffer)) - len(self._buffer)))
+        return offset
+
+    def add_uint(self, value, length, low_byte_first=True):
+        """
+        Adds an unsigned integer to the frame.
+
+        Args:
+            value (int): The integer to add.
+            length (int): How many bytes the integer should be represented as.
+            low_byte_first (bool): Whether to put the least significant byte first. True by default.
+
+        Returns:
+            FrameBuilder: The builder.
+        """
+        pack_uint_into(self._buffer, self._reserve(length), value, length, low_byte_first)
+        return self
+
+    def add_uint8(self, value):
+        """
+        Adds a one byte unsigned integer to the frame.
+
+        Args:
+            value (int): The integer to add.
+
+        Returns:
+            FrameBuilder: The builder.
+        """
+        return self.add_uint(value, 1)
+
+    def add_uint16(self, value, low_byte_first=True):
+        """
+        Adds a two byte unsigned integer to the frame.
+
+        Args:
+            value (int): The integer to add.
+            low_byte_first (bool): Whether to put the least significant byte first. True by default.
+
+        Returns:
+            FrameBuilder: The builder.
+        """
+        return self.add_uint(value, 2, low_byte_first)
+
+    def add_uint32(self, value, low_byte_first=True):
+        """
+        Adds a four byte unsigned integer to the frame.
+
+        Args:
+            value (int): The integer to add.
+            low_byte_first (bool): Whether to put the least significant byte first. True by default.
+
+        Returns:
+            FrameBuilder: The builder.
+        """
+        return self.add_uint(value, 4, low_byte_first)
+
+    def add_float32(self, value, low_byte_first=True):
+        """
+        Adds a float to the frame (4 bytes, IEEE single-precision).
+
+        Args:
+            value (float): The number to add.
+            low_byte_first (bool): Whether to put the least significant byte first. True by default.
+
+        Returns:
+            FrameBuilder: The builder.
+        """
+        pack_float32_into(self._buffer, self._reserve(4), value, low_byte_first)
+        return self
+
+    def add_bytes(self, data):
+        """
+        Adds raw bytes to the frame.
+
+        Args:
+            data (bytes|bytearray|memoryview): The bytes to add.
+
+        Returns:
+            FrameBuilder: The builder.
+        """
+        offset = self._reserve(len(data))
+        self._buffer[offset:self._length] = data
+        return self
+
+    def add_crc16(self, low_byte_first=True):
+        """
+        Adds the CRC16 (see lewis_emulators.utils.checksum) of everything in the frame so far.
+
+        Args:
+            low_byte_first (bool): Whether to put the least significant byte first. True by default.
+
+        Returns:
+            FrameBuilder: The builder.
+        """
+        return self.add_uint(crc16(self._buffer[:self._length]), 2, low_byte_first)
+
+    def build(self):
+        """
+        Gets the frame from the builder.
+
+        Returns:
+            bytes: The frame.
+        """
+        return bytes(self._buffer[:self._length])
@@ -0,0 +1,205 @@
+"""
+Framing of requests for stream interfaces whose devices do not end their messages with a terminator.
+
+Lewis splits the data a client sends into requests on the in_terminator of the interface. Some devices have no
+terminator: a message ends when the line goes quiet (e.g. the Eurotherm's EI-Bisynch protocol over serial), or its
+header says how long it is (e.g. the attocube ANC350). A deframer splits the data into frames as it arrives instead,
+and each frame is handled as a request as if it had ended with a terminator.
+
+Deframers are incremental: data is fed to them as it arrives and they only look at each byte once, however the data is
+split between reads.
+
+To use one derive the interface from FramedStreamInterface as well as StreamInterface and implement create_deframer,
+e.g.
+
+>>> class MyStreamInterface(FramedStreamInterface, StreamInterface):
+>>>     commands = {Cmd("any_command", r"^([\\s\\S]*)$")}
+>>>
+>>>     def create_deframer(self):
+>>>         return LengthFieldDeframer(field_size=4, low_byte_first=True)
+"""
+
+import abc
+import time
+
+import six
+
+# Times the gaps between data, which lewis's cycle length can not: it is the same however long the cycle took
+_clock = getattr(time, "monotonic", time.time)
+
+
+class IdleGapDeframer(object):
+    """
+    Frames messages which end when no more data arrives for a time, the idle gap, timed from the last data received.
+    """
+
+    def __init__(self, gap, clock=None):
+        """
+        :param gap: the idle gap in seconds
+        :param clock: function returning the time in seconds; a monotonic clock by default
+        """
+        self.gap = gap
+        self._clock = clock or _clock
+        self._chunks = []
+        self._last_received = None
+
+    def feed(self, data):
+        """
+        :param data: bytes received
+        :return: list of the frames completed; always empty, as a frame only ends once the line goes quiet
+        """
+        if data:
+            self._chunks.append(bytes(data))
+            self._last_received = self._clock()
+        return []
+
+    def idle(self):
+        """
+        Called while no data is arriving.
+
+        :return: list of the frames completed
+        """
+        if not self._chunks or self._clock() - self._last_received < self.gap:
+            return []
+        frame = b"".join(self._chunks)
+        self._chunks = []
+        return [frame]
+
+
+class LengthFieldDeframer(object):
+    """
+    Frames messages whose header has a field giving their length.
+    """
+
+    def __init__(self, field_offset=0, field_size=4, low_byte_first=False, length_includes_header=False,
+                 adjustment=0, discard_after=None, clock=None):
+        """
+        :param field_offset: the position of the length field in the header
+        :param field_size: the size of the length field in bytes
+        :param low_byte_first: whether the length field is little endian
+        :param length_includes_header: whether the length counts the header up to the end of the length field; if not,
+            it is the length of the rest of the message
+        :param adjustment: number of bytes added to the length, e.g. for a checksum after the counted bytes
+        :param discard_after: time in seconds after which a partly received message is discarded, so that a client
+            which has lost its place in the stream can start again; None to wait for the rest of it forever
+        :param clock: function returning the time in seconds; a monotonic clock by default
+        """
+        self.field_offset = field_offset
+        self.field_size = field_size
+        self.low_byte_first = low_byte_first
+        self.header_size = field_offset + field_size
+        self.adjustment = adjustment + (0 if length_includes_header else self.header_size)
+        self.discard_after = discard_after
+        self._clock = clock or _clock
+        self._buffer = bytearray()
+        # Length of the message at the start of the buffer, once its header has arrived
+        self._frame_length = None
+        self._last_received = None
+
+    def _length_of_frame(self, start):
+        field = self._buffer[start + self.field_offset:start + self.header_size]
+        if self.low_byte_first:
+            field.reverse()
+        length = 0
+        for byte in field:
+            length = (length << 8) | byte
+        length += self.adjustment
+        if length < self.header_size:
+            raise ValueError("Length field gives a message of {} bytes, shorter than its header".format(length))
+        return length
+
+    def feed(self, data):
+        """
+        :param data: bytes received
+        :return: list of the frames completed
+        """
+        self._buffer.extend(data)
+        self._last_received = self._clock()
+        frames = []
+        start = 0
+        while True:
+            available = len(self._buffer) - start
+            if self._frame_length is None:
+                if available < self.header_size:
+                    break
+                self._frame_length = self._length_of_frame(start)
+            if available < self._frame_length:
+                break
+            frames.append(bytes(self._buffer[start:start + self._frame_length]))
+            start += self._frame_length
+            self._frame_length = None
+        # Drop the frames taken in one go, rather than each as it is taken
+        if start:
+            del self._buffer[:start]
+        return frames
+
+    def idle(self):
+        """
+        Called while no data is arriving.
+
+        :return: list of the frames completed; always empty, but a partly received message may be discarded
+        """
+        if self._buffer and self.discard_after is not None \
+                and self._clock() - self._last_received >= self.discard_after:
+            del self._buffer[:]
+            self._frame_length = None
+        return []
+
+
+class _FramedConnection(object):
+    """
+    Routes the data a client sends through a deframer, and each frame to the stream handler of the connection as a
+    request.
+    """
+
+    def __init__(self, handler, deframer):
+        self.handler = handler
+        self.deframer = deframer
+        handler.collect_incoming_data = self.collect_incoming_data
+        handler.process = self.process
+
+    def _handle(self, frames):
+        for frame in frames:
+            # Hand the frame to lewis as the whole of the request, and process it as if its terminator had arrived
+            self.handler._buffer = [frame]
+            self.handler.found_terminator()
+
+    def collect_incoming_data(self, data):
+        self._handle(self.deframer.feed(data))
+
+    def process(self, msec):
+        # Lewis passes the length of its cycle rather than the time since data last arrived, so it is not used
+        self._handle(self.deframer.idle())
+
+
+@six.add_metaclass(abc.ABCMeta)
+class FramedStreamInterface(object):
+    """
+    Mixin for stream interfaces which frames the requests of each connection with a deframer rather than a terminator.
+
+    Implement create_deframer to return a new deframer for each connection.
+    """
+
+    # Lewis hands all the data received to the connection as it arrives if there is no terminator
+    in_terminator = ""
+
+    _handler = None
+
+    @abc.abstractmethod
+    def create_deframer(self):
+        """
+        :return: a new deframer for a connection
+        """
+
+    @property
+    def handler(self):
+        """
+        The stream handler of the connection lewis accepted last. Lewis sets it when it accepts a connection, and the
+        connection's data is then framed by a new deframer.
+        """
+        return self._handler
+
+    @handler.setter
+    def handler(self, handler):
+        _FramedConnection(handler, self.create_deframer())
+        self._handler = handler
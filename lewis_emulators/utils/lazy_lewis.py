@@ -0,0 +1,24 @@
+"""
+Runs lewis with the emulator manifest, so that only the emulator being started is imported. It takes the same
+arguments as lewis, e.g.
+
+    python -m lewis_emulators.utils.lazy_lewis -k lewis_emulators rknps -p stream
+"""
+
+import lewis.scripts.run
+
+from lewis_emulators.utils.manifest import LazySimulationFactory
+
+
+def run_simulation(argument_list=None):
+    """
+    Runs lewis, creating the simulation with a LazySimulationFactory in place of its SimulationFactory.
+
+    :param argument_list: the arguments of lewis; sys.argv by default
+    """
+    lewis.scripts.run.SimulationFactory = LazySimulationFactory
+    lewis.scripts.run.run_simulation(argument_list)
+
+
+if __name__ == "__main__":
+    run_simulation()
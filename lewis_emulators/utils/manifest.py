@@ -0,0 +1,167 @@
+"""
+A manifest of the emulators, so that starting one only imports that emulator.
+
+Lewis finds devices by importing every sub-package of the devices package, and with it every emulator's device and
+interfaces. The manifest records what lewis would have found for each emulator (its module, device types, protocols,
+setups and framework version) so that the list of emulators and their protocols can be read without importing them,
+and only the package of the emulator being started is imported.
+
+The manifest is generated from the emulators, and should be regenerated whenever an emulator is added or its
+protocols, setups or framework version change:
+
+    python -m lewis_emulators.utils.manifest
+
+To start an emulator with the manifest, use lazy_lewis in place of lewis; it takes the same arguments, e.g.
+
+    python -m lewis_emulators.utils.lazy_lewis -k lewis_emulators rknps -p stream
+"""
+
+import argparse
+import importlib
+import json
+import os
+import pkgutil
+from collections import OrderedDict
+
+from lewis.core.devices import DeviceBuilder, DeviceRegistry
+from lewis.core.logging import has_log
+from lewis.core.simulation import SimulationFactory
+
+DEVICES_PACKAGE = "lewis_emulators"
+MANIFEST_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "manifest.json")
+
+
+def describe_device(module_name, builder):
+    """
+    :param module_name: name of the emulator's package
+    :param builder: lewis' device builder for the emulator
+    :return: the manifest entry of the emulator
+    """
+    return OrderedDict([
+        ("module", module_name),
+        ("device_types", ["{}.{}".format(device_type.__module__, device_type.__name__)
+                          for device_type in builder.device_types]),
+        ("protocols", sorted(builder.protocols)),
+        ("setups", sorted(builder.setups)),
+        ("framework_version", builder.framework_version),
+    ])
+
+
+def generate_manifest(devices_package=DEVICES_PACKAGE):
+    """
+    Imports every emulator in the package, as lewis would, and describes it.
+
+    :param devices_package: name of the package the emulators are in
+    :return: the manifest, emulators by name
+    """
+    package = importlib.import_module(devices_package)
+    manifest = OrderedDict()
+    for _, name, is_package in sorted(pkgutil.iter_modules(package.__path__), key=lambda module: module[1]):
+        if not is_package:
+            continue
+        module_name = "{}.{}".format(devices_package, name)
+        builder = DeviceBuilder(importlib.import_module(module_name))
+        if builder.device_types:
+            manifest[name] = describe_device(module_name, builder)
+    return manifest
+
+
+def write_manifest(manifest, path=MANIFEST_FILE):
+    with open(path, "w") as manifest_file:
+        json.dump(manifest, manifest_file, indent=2, separators=(",", ": "))
+        manifest_file.write("\n")
+
+
+def load_manifest(path=MANIFEST_FILE):
+    """
+    :param path: the manifest file
+    :return: the manifest, emulators by name; empty if there is no manifest
+    """
+    try:
+        with open(path) as manifest_file:
+            return json.load(manifest_file, object_pairs_hook=OrderedDict)
+    except IOError:
+        return OrderedDict()
+
+
+@has_log
+class LazyDeviceRegistry(DeviceRegistry):
+    """
+    Device registry which takes the emulators from the manifest, and only imports an emulator when its builder is
+    requested. Emulators which are missing from the manifest are still found, by importing their package.
+    """
+
+    def __init__(self, device_module=DEVICES_PACKAGE, manifest=None):
+        """
+        :param device_module: name of the package the emulators are in
+        :param manifest: the manifest; read from the manifest file by default if the package is lewis_emulators
+        """
+        if manifest is None:
+            manifest = load_manifest() if device_module == DEVICES_PACKAGE else OrderedDict()
+        self._device_module_name = device_module
+        self._manifest = manifest
+        self._devices = {}
+
+    @property
+    def devices(self):
+        return self._manifest.keys()
+
+    def protocols(self, name):
+        """
+        :param name: name of the emulator
+        :return: its protocols, from the manifest if it is in it
+        """
+        try:
+            return list(self._manifest[name]["protocols"])
+        except KeyError:
+            return self.device_builder(name).protocols
+
+    def device_builder(self, name, strict_versions=None):
+        if name not in self._devices:
+            entry = self._manifest.get(name)
+            module_name = entry["module"] if entry else "{}.{}".format(self._device_module_name, name)
+            try:
+                module = importlib.import_module(module_name)
+            except ImportError:
+                if entry:
+                    raise
+            else:
+                builder = DeviceBuilder(module)
+                if not entry:
+                    self.log.warning("Device '%s' is not in the manifest, regenerate it with "
+                                     "python -m lewis_emulators.utils.manifest", name)
+                elif entry["framework_version"] != builder.framework_version \
+                        or sorted(builder.protocols) != entry["protocols"]:
+                    self.log.warning("The manifest entry of device '%s' is out of date, regenerate it with "
+                                     "python -m lewis_emulators.utils.manifest", name)
+                self._devices[name] = builder
+
+        return super(LazyDeviceRegistry, self).device_builder(name, strict_versions)
+
+
+class LazySimulationFactory(SimulationFactory):
+    """
+    Simulation factory which only imports the emulator it creates a simulation of.
+    """
+
+    def __init__(self, devices_package, strict_versions=None):
+        self._reg = LazyDeviceRegistry(devices_package)
+        self._rv = strict_versions
+
+    def get_protocols(self, device):
+        return self._reg.protocols(device)
+
+
+def main(argument_list=None):
+    parser = argparse.ArgumentParser(description="Generates the manifest of the emulators.")
+    parser.add_argument("-o", "--output", default=MANIFEST_FILE, help="The manifest file to write.")
+    parser.add_argument("-k", "--device-package", default=DEVICES_PACKAGE, help="The package the emulators are in.")
+    arguments = parser.parse_args(argument_list)
+
+    manifest = generate_manifest(arguments.device_package)
+    write_manifest(manifest, arguments.output)
+    print("Wrote {} emulators to {}".format(len(manifest), arguments.output))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,378 @@
+"""
+Motion of the axes of motor controllers, evaluated from the time elapsed rather than stepped each cycle.
+
+A MotionEngine holds any number of axes in arrays, one entry per axis for each parameter of its move. A move is planned
+once, when the axis is given a target: it accelerates at a fixed rate up to its speed, cruises and decelerates to stop
+exactly at the target. The position of an axis at any time comes from the plan in closed form, so time passing costs
+nothing however many axes there are, and the time each axis arrives is known in advance, e.g. for process_in_steps.
+
+Two profiles are available:
+
+- TRAPEZOIDAL: constant acceleration, so the speed ramps linearly.
+- S_CURVE: the speed ramps along a half cosine, so the acceleration itself ramps smoothly up and down. The ramps take
+  as long as the trapezoidal ones, i.e. the acceleration of an axis is the average acceleration of the ramp, and moves
+  take the same time.
+
+An axis with infinite acceleration, the default, moves at constant speed like approaches.linear. Like it too, an axis
+which has arrived is at its target exactly as it was given, e.g. an int stays an int, as is an axis yet to set off at
+the position it started from, and its speed.
+
+>>> engine = MotionEngine(["X", "Y"], speed=10.0, acceleration=5.0)
+>>> engine.move("X", 100.0)
+>>> engine.time_to_arrival("X")
+12.0
+>>> engine.advance(1.0)
+>>> engine.position("X")
+2.5
+"""
+
+import math
+from array import array
+
+from lewis_emulators.utils.ramp import TIME_RESOLUTION
+
+INFINITY = float("inf")
+
+TRAPEZOIDAL = "trapezoidal"
+S_CURVE = "s-curve"
+PROFILES = (TRAPEZOIDAL, S_CURVE)
+
+
+def _trapezoidal_ramp(peak_speed, ramp_time, time):
+    return peak_speed * time * time / (2.0 * ramp_time)
+
+
+def _s_curve_ramp(peak_speed, ramp_time, time):
+    return 0.5 * peak_speed * (time - ramp_time / math.pi * math.sin(math.pi * time / ramp_time))
+
+
+class MotionEngine(object):
+    """
+    The axes of a motor controller, each moving towards its target. Time only passes for the axes when the engine is
+    advanced, so a state which does not advance it holds every axis where it is.
+
+    Axes are named by the labels they are created with. Changing the target, speed or acceleration of a moving axis
+    plans a new move from where the axis is, starting from rest.
+    """
+
+    def __init__(self, axes, speed=1.0, acceleration=INFINITY, profile=TRAPEZOIDAL, tolerance=0.0,
+                 limits=(-INFINITY, INFINITY), position=0):
+        """
+        Args:
+            axes (list): The labels of the axes.
+            speed (float): The top speed of every axis, in units per second.
+            acceleration (float): The acceleration of every axis, in units per second squared.
+            profile (string): The profile of moves; one of PROFILES.
+            tolerance (float): How far from its target an axis may be and still count as at its target.
+            limits (tuple(float, float)): The lowest and highest positions of every axis.
+            position (float): The initial position of every axis.
+        """
+        if profile not in PROFILES:
+            raise ValueError("{} is not a motion profile, expected one of {}".format(profile, ", ".join(PROFILES)))
+        self.profile = profile
+        self._ramp_distance = _s_curve_ramp if profile == S_CURVE else _trapezoidal_ramp
+
+        self.axes = list(axes)
+        self._indexes = {axis: index for index, axis in enumerate(self.axes)}
+        if len(self._indexes) != len(self.axes):
+            raise ValueError("The labels of axes must be unique, got {}".format(self.axes))
+        self.time = 0.0
+
+        def column(value):
+            return array("d", [value]) * len(self.axes)
+
+        self._speed = column(abs(speed))
+        # As given, to be returned as they were given
+        self._given_speed = [abs(speed)] * len(self.axes)
+        self._given_start_position = [position] * len(self.axes)
+        self._given_target = [position] * len(self.axes)
+        self._acceleration = column(abs(acceleration))
+        self._tolerance = column(tolerance)
+        self._lower_limit = column(limits[0])
+        self._upper_limit = column(limits[1])
+
+        # The plan of the current move of each axis
+        self._start_time = column(0.0)
+        self._start_position = column(position)
+        self._target = column(position)
+        self._direction = column(1.0)
+        self._distance = column(0.0)
+        self._peak_speed = column(0.0)
+        self._ramp_time = column(0.0)
+        self._cruise_time = column(0.0)
+        self._end_time = column(0.0)
+
+    def _index(self, axis):
+        try:
+            return self._indexes[axis]
+        except KeyError:
+            raise ValueError("No axis {}, expected one of {}".format(axis, self.axes))
+
+    def _plan(self, index, position, target):
+        distance = abs(target - position)
+        speed, acceleration = self._speed[index], self._acceleration[index]
+
+        if distance == 0:
+            peak_speed, ramp_time, cruise_time = speed, 0.0, 0.0
+        elif speed == 0:
+            peak_speed, ramp_time, cruise_time = 0.0, 0.0, INFINITY
+        elif acceleration == INFINITY:
+            peak_speed, ramp_time, cruise_time = speed, 0.0, distance / speed
+        elif acceleration == 0:
+            peak_speed, ramp_time, cruise_time = 0.0, INFINITY, 0.0
+        elif distance * acceleration >= speed * speed:
+            # Reaches top speed and cruises at it
+            peak_speed, ramp_time = speed, speed / acceleration
+            cruise_time = (distance - speed * ramp_time) / speed
+        else:
+            # Starts slowing down before it reaches top speed
+            peak_speed = math.sqrt(distance * acceleration)
+            ramp_time, cruise_time = peak_speed / acceleration, 0.0
+
+        self._start_time[index] = self.time
+        self._start_position[index] = position
+        self._given_start_position[index] = position
+        self._target[index] = target
+        self._given_target[index] = target
+        self._direction[index] = 1.0 if target >= position else -1.0
+        self._distance[index] = distance
+        self._peak_speed[index] = peak_speed
+        self._ramp_time[index] = ramp_time
+        self._cruise_time[index] = cruise_time
+        self._end_time[index] = self.time + 2.0 * ramp_time + cruise_time
+
+    def _travelled(self, index, time):
+        """
+        The distance an axis has travelled on its move by a time, which must be before the end of the move.
+        """
+        elapsed = time - self._start_time[index]
+        if elapsed <= 0:
+            return 0.0
+        peak_speed, ramp_time, cruise_time = self._peak_speed[index], self._ramp_time[index], self._cruise_time[index]
+        if ramp_time == INFINITY:
+            return 0.0
+        if elapsed < ramp_time:
+            return self._ramp_distance(peak_speed, ramp_time, elapsed)
+        if elapsed <= ramp_time + cruise_time:
+            return peak_speed * (0.5 * ramp_time + elapsed - ramp_time)
+        remaining = 2.0 * ramp_time + cruise_time - elapsed
+        return self._distance[index] - self._ramp_distance(peak_speed, ramp_time, remaining)
+
+    def _position(self, index, time):
+        if time >= self._end_time[index] - TIME_RESOLUTION:
+            return self._given_target[index]
+        travelled = self._travelled(index, time)
+        if travelled == 0:
+            return self._given_start_position[index]
+        return self._start_position[index] + self._direction[index] * travelled
+
+    def advance(self, dt):
+        """
+        Lets time pass for the axes.
+
+        Args:
+            dt (float): The time in seconds.
+        """
+        self.time += dt
+
+    def position(self, axis):
+        """
+        Args:
+            axis: The label of the axis.
+
+        Returns:
+            float: The position of the axis now.
+        """
+        return self._position(self._index(axis), self.time)
+
+    def positions(self, time=None):
+        """
+        Args:
+            time (float): The time of the positions; now if None.
+
+        Returns:
+            list[float]: The position of every axis at the time, in the order of the axes.
+        """
+        time = self.time if time is None else time
+        end_times, targets = self._end_time, self._given_target
+        return [targets[index] if time >= end_times[index] - TIME_RESOLUTION else self._position(index, time)
+                for index in range(len(self.axes))]
+
+    def set_position(self, axis, position):
+        """
+        Moves an axis to a position at once, e.g. to simulate a lost position or from the backdoor. The axis carries on
+        towards its target from there.
+
+        Args:
+            axis: The label of the axis.
+            position (float): The new position.
+        """
+        index = self._index(axis)
+        self._plan(index, position, self._given_target[index])
+
+    def target(self, axis):
+        """
+        Args:
+            axis: The label of the axis.
+
+        Returns:
+            float: The position the axis is heading for.
+        """
+        return self._given_target[self._index(axis)]
+
+    def move(self, axis, target):
+        """
+        Starts a move of an axis to a target.
+
+        Args:
+            axis: The label of the axis.
+            target (float): The position to move to.
+        """
+        index = self._index(axis)
+        if target != self._target[index]:
+            self._plan(index, self._position(index, self.time), target)
+
+    def stop(self, axis=None):
+        """
+        Stops an axis where it is, by making its current position its target.
+
+        Args:
+            axis: The label of the axis; every axis if None.
+        """
+        for index in (range(len(self.axes)) if axis is None else [self._index(axis)]):
+            position = self._position(index, self.time)
+            self._plan(index, position, position)
+
+    def _replan(self, index, column, value):
+        position = self._position(index, self.time)
+        column[index] = value
+        self._plan(index, position, self._given_target[index])
+
+    def speed(self, axis):
+        """
+        Args:
+            axis: The label of the axis.
+
+        Returns:
+            float: The top speed of the axis in units per second.
+        """
+        return self._given_speed[self._index(axis)]
+
+    def set_speed(self, axis, speed):
+        """
+        Args:
+            axis: The label of the axis.
+            speed (float): The top speed of the axis in units per second.
+        """
+        index = self._index(axis)
+        self._given_speed[index] = abs(speed)
+        self._replan(index, self._speed, abs(speed))
+
+    def acceleration(self, axis):
+        """
+        Args:
+            axis: The label of the axis.
+
+        Returns:
+            float: The acceleration of the axis in units per second squared.
+        """
+        return self._acceleration[self._index(axis)]
+
+    def set_acceleration(self, axis, acceleration):
+        """
+        Args:
+            axis: The label of the axis.
+            acceleration (float): The acceleration of the axis in units per second squared; infinite for moves at
+                constant speed.
+        """
+        self._replan(self._index(axis), self._acceleration, abs(acceleration))
+
+    def tolerance(self, axis):
+        """
+        Args:
+            axis: The label of the axis.
+
+        Returns:
+            float: How far from its target the axis may be and still count as at its target.
+        """
+        return self._tolerance[self._index(axis)]
+
+    def set_limits(self, axis, lower, upper):
+        """
+        Args:
+            axis: The label of the axis.
+            lower (float): The lowest position of the axis.
+            upper (float): The highest position of the axis.
+        """
+        index = self._index(axis)
+        self._lower_limit[index] = lower
+        self._upper_limit[index] = upper
+
+    def moving(self, axis):
+        """
+        Args:
+            axis: The label of the axis.
+
+        Returns:
+            bool: Whether the axis has yet to arrive at its target.
+        """
+        return self.time < self._end_time[self._index(axis)] - TIME_RESOLUTION
+
+    def moving_axes(self):
+        """
+        Returns:
+            list: The labels of the axes which have yet to arrive at their targets.
+        """
+        time, end_times = self.time + TIME_RESOLUTION, self._end_time
+        return [axis for index, axis in enumerate(self.axes) if time < end_times[index]]
+
+    def at_target(self, axis):
+        """
+        Args:
+            axis: The label of the axis.
+
+        Returns:
+            bool: Whether the axis is within its tolerance of its target.
+        """
+        index = self._index(axis)
+        return abs(self._position(index, self.time) - self._target[index]) <= self._tolerance[index]
+
+    def within_limits(self, axis):
+        """
+        Args:
+            axis: The label of the axis.
+
+        Returns:
+            bool: Whether the axis is between its limits.
+        """
+        index = self._index(axis)
+        return self._lower_limit[index] <= self._position(index, self.time) <= self._upper_limit[index]
+
+    def arrival_time(self, axis):
+        """
+        Args:
+            axis: The label of the axis.
+
+        Returns:
+            float: The time the axis arrives, or arrived, at its target; infinite if it never will.
+        """
+        return self._end_time[self._index(axis)]
+
+    def time_to_arrival(self, axis):
+        """
+        Args:
+            axis: The label of the axis.
+
+        Returns:
+            float: The time in seconds until the axis arrives at its target; 0 if it has.
+        """
+        return max(0.0, self.arrival_time(axis) - self.time) if self.moving(axis) else 0.0
+
+    def time_to_next_arrival(self):
+        """
+        Returns:
+            float: The time in seconds until the next axis arrives at its target; None if no axis is moving.
+        """
+        time = self.time + TIME_RESOLUTION
+        arrivals = [end_time for end_time in self._end_time if end_time > time]
+        return min(arrivals) - self.time if arrivals else None
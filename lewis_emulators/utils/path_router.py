@@ -0,0 +1,309 @@
+"""
+Routing of requests in command trees like those of Oxford Instruments controllers (e.g. the Mercury iTC), whose
+commands are paths of segments separated by colons, e.g. READ:DEV:MB0.T0:TEMP:LOOP:P or SET:DEV:MB0.T0:TEMP:LOOP:P:5.
+
+Matching such commands with a regex each means a request is tried against every command, and every handler then
+looks up the channel named in the request itself. A PathRouter instead builds a tree of the segments of all the
+commands once. It splits a request into its segments, walks down the tree one segment at a time and calls the handler
+at the leaf with the arguments already converted and the channel already resolved.
+
+Routes are declared as templates, with a segment in braces for each argument:
+
+- {} is a string, {float} a float, {int} an integer and {ON|OFF} one of the listed values. Literal text may follow
+  the braces, e.g. {float}K, and must then be in the request.
+- {channel} is the id of a channel, and the segment after it the channel's type, either literal (e.g. TEMP) or * for
+  any type. The router calls its resolve_channel function with the id and type in the request, and passes the
+  handler the id followed by the channel it returns. The function should raise ValueError for an unknown channel or
+  a channel of a different type.
+- * is any segment, which is not passed to the handler.
+
+A literal segment is preferred to an argument, and an argument to *, where routes differ. Arguments are only converted
+once the route is found, so an argument which can not be converted is an error rather than a reason to try another
+route.
+
+e.g.
+
+>>> class MyStreamInterface(RoutingStreamInterface, StreamInterface):
+>>>     routes = (
+>>>         ("READ:DEV:{channel}:*:NICK", "get_nickname"),
+>>>         ("SET:DEV:{channel}:TEMP:LOOP:TSET:{float}K", "set_temp_setpoint"),
+>>>     )
+>>>
+>>>     def resolve_channel(self, channel_id, channel_type):
+>>>         ...
+>>>
+>>>     def set_temp_setpoint(self, channel_id, channel, setpoint):
+>>>         ...
+"""
+
+import abc
+import re
+
+import six
+
+from lewis_emulators.utils.bound_command import SingleBoundCommand
+
+
+SEPARATOR = ":"
+
+_FLOAT = re.compile(r"[+-]?\d+\.?\d*$")
+_INT = re.compile(r"[+-]?\d+$")
+_PLACEHOLDER = re.compile(r"\{([^}]*)\}(.*)$")
+
+
+def _convert_string(text):
+    return text
+
+
+def _convert_float(text):
+    if _FLOAT.match(text) is None:
+        raise ValueError("Expected a float, got {}".format(text))
+    return float(text)
+
+
+def _convert_int(text):
+    if _INT.match(text) is None:
+        raise ValueError("Expected an integer, got {}".format(text))
+    return int(text)
+
+
+def _enum_converter(allowed_values):
+    def convert(text):
+        if text not in allowed_values:
+            raise ValueError("Expected one of {}, got {}".format(", ".join(allowed_values), text))
+        return text
+    return convert
+
+
+class _Placeholder(object):
+    """
+    A segment of a template which stands for any segment of a request.
+    """
+
+    CHANNEL = "channel"
+    ANY = "*"
+
+    def __init__(self, spec, suffix=""):
+        self.spec = spec
+        self.suffix = suffix
+        if spec == "":
+            self.convert = _convert_string
+        elif spec == "float":
+            self.convert = _convert_float
+        elif spec == "int":
+            self.convert = _convert_int
+        elif spec in (self.CHANNEL, self.ANY):
+            self.convert = None
+        else:
+            self.convert = _enum_converter(spec.split("|"))
+
+    @staticmethod
+    def parse(segment):
+        """
+        :param segment: a segment of a template
+        :return: the placeholder the segment is; None if it is literal text
+        """
+        if segment == _Placeholder.ANY:
+            return _Placeholder(_Placeholder.ANY)
+        match = _PLACEHOLDER.match(segment)
+        return None if match is None else _Placeholder(*match.groups())
+
+    def __eq__(self, other):
+        return isinstance(other, _Placeholder) and (self.spec, self.suffix) == (other.spec, other.suffix)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def value(self, segment):
+        """
+        :param segment: the segment of the request the placeholder matched
+        :return: the segment converted to the type of the placeholder
+        """
+        if self.suffix:
+            if not segment.endswith(self.suffix):
+                raise ValueError("Expected {} to end with {}".format(segment, self.suffix))
+            segment = segment[:-len(self.suffix)]
+        return self.convert(segment)
+
+
+class _Node(object):
+    """
+    A node of the tree of routes: the segments that may come next, and the route that ends here if any.
+    """
+
+    def __init__(self):
+        self.children = {}
+        self.placeholder = None
+        self.wildcard = None
+        self.route = None
+
+
+class Route(object):
+    """
+    A path of the command tree and the handler of requests for it.
+    """
+
+    def __init__(self, template, handler):
+        """
+        :param template: the template of the path, see the module documentation
+        :param handler: the function handling requests for the path
+        """
+        self.pattern = template
+        self.handler = handler
+        self.placeholders = []
+
+        segments = template.split(SEPARATOR)
+        for position, segment in enumerate(segments):
+            placeholder = _Placeholder.parse(segment)
+            if placeholder is None:
+                continue
+            if placeholder.spec == _Placeholder.CHANNEL and position + 1 == len(segments):
+                raise ValueError("The channel in {} must be followed by its type".format(template))
+            self.placeholders.append((position, placeholder))
+
+        self.segments = segments
+
+
+class PathRouter(SingleBoundCommand):
+    """
+    Routes requests through a tree of the segments of the routes. It behaves like a single bound command
+    (lewis.adapters.stream.Func) that can process any request one of the routes matches.
+    """
+
+    def __init__(self, routes, resolve_channel=None, prefix=""):
+        """
+        Create a router.
+
+        :param routes: iterable of Route
+        :param resolve_channel: function of a channel id and type returning the channel, for routes with a {channel}
+        :param prefix: optional text which a request may start with, e.g. an address, and which is ignored
+        """
+        self.routes = list(routes)
+        super(PathRouter, self).__init__("\n".join(sorted(route.pattern for route in self.routes)),
+                                         "{} over {} routes".format(type(self).__name__, len(self.routes)))
+        self.resolve_channel = resolve_channel
+        self.prefix = prefix
+        self._root = _Node()
+
+        for route in self.routes:
+            self._add(route)
+
+    def _add(self, route):
+        placeholders = dict(route.placeholders)
+        node = self._root
+        for position, segment in enumerate(route.segments):
+            placeholder = placeholders.get(position)
+            if placeholder is None:
+                node = node.children.setdefault(segment, _Node())
+            elif placeholder.spec == _Placeholder.ANY:
+                node.wildcard = node.wildcard or _Node()
+                node = node.wildcard
+            else:
+                if node.placeholder is None:
+                    node.placeholder = (placeholder, _Node())
+                elif node.placeholder[0] != placeholder:
+                    raise ValueError("Route {} has an argument where another route has a different argument"
+                                     .format(route.pattern))
+                node = node.placeholder[1]
+
+        if node.route is not None:
+            raise ValueError("Routes {} and {} have the same path".format(node.route.pattern, route.pattern))
+        if self.resolve_channel is None and any(p.spec == _Placeholder.CHANNEL for _, p in route.placeholders):
+            raise ValueError("Route {} has a channel but the router can not resolve channels".format(route.pattern))
+        node.route = route
+
+    def _walk(self, node, segments, position):
+        """
+        Find the route matching the segments of a request from a node down, preferring literal segments over
+        arguments over any segment.
+        """
+        if position == len(segments):
+            return node.route
+
+        segment = segments[position]
+        child = node.children.get(segment)
+        if child is not None:
+            route = self._walk(child, segments, position + 1)
+            if route is not None:
+                return route
+
+        for child in (node.placeholder and node.placeholder[1], node.wildcard):
+            if child is not None:
+                route = self._walk(child, segments, position + 1)
+                if route is not None:
+                    return route
+        return None
+
+    def match(self, request):
+        """
+        Find the route for a request.
+
+        :param request: the request
+        :return: tuple of the route and the segments of the request; None if no route matches
+        """
+        request = six.ensure_str(request, "latin-1")
+        if self.prefix and request.startswith(self.prefix):
+            request = request[len(self.prefix):]
+        segments = request.split(SEPARATOR)
+        route = self._walk(self._root, segments, 0)
+        return None if route is None else (route, segments)
+
+    def find_match(self, request):
+        return self.match(request)
+
+    def matcher_of(self, match):
+        """
+        The route that matched a request; lewis logs its pattern when processing the request.
+        """
+        return match[0]
+
+    def arguments(self, route, segments):
+        """
+        Convert the segments of a request matched by a route to the arguments of its handler.
+
+        :param route: the route
+        :param segments: the segments of the request
+        :return: list of arguments
+        """
+        arguments = []
+        for position, placeholder in route.placeholders:
+            segment = segments[position]
+            if placeholder.spec == _Placeholder.CHANNEL:
+                arguments.append(segment)
+                arguments.append(self.resolve_channel(segment, segments[position + 1]))
+            elif placeholder.spec != _Placeholder.ANY:
+                arguments.append(placeholder.value(segment))
+        return arguments
+
+    def process_match(self, match, request):
+        route, segments = match
+        return route.handler(*self.arguments(route, segments))
+
+
+@six.add_metaclass(abc.ABCMeta)
+class RoutingStreamInterface(object):
+    """
+    Mixin for stream interfaces which routes requests through a PathRouter before trying their commands.
+
+    Set routes to a sequence of (template, name of the handler method) pairs, route_prefix to text requests may start
+    with and implement resolve_channel to find the channel of any route with a {channel}.
+    """
+
+    commands = ()
+    routes = ()
+    route_prefix = ""
+
+    @abc.abstractmethod
+    def resolve_channel(self, channel_id, channel_type):
+        """
+        Find the channel a request is for. Raises ValueError for an unknown channel or a channel of a different type.
+
+        :param channel_id: the id of the channel in the request
+        :param channel_type: the type of the channel in the request, the segment after its id
+        :return: the channel
+        """
+
+    def _bind_device(self):
+        super(RoutingStreamInterface, self)._bind_device()
+        routes = [Route(template, getattr(self, handler)) for template, handler in self.routes]
+        self.bound_commands = [PathRouter(routes, self.resolve_channel, self.route_prefix)] + list(self.bound_commands)
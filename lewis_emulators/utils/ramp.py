@@ -0,0 +1,130 @@
+"""
+Values which ramp linearly towards a target, evaluated from the time elapsed rather than stepped each cycle.
+
+approaches.linear moves a value a step of rate * dt towards its target every cycle, so the value is only as accurate as
+the sum of the steps and the state machine only finds out the target was reached at the end of a cycle. A LinearRamp
+stores where and when the ramp started, its rate and its target, and works out the value at any time from those. It
+also knows when it will reach the target, so a device can split a cycle there and change state at the right time
+however long the cycle, e.g. when the simulation is sped up:
+
+>>> ramp = LinearRamp(value=0.0, rate=0.5)
+>>> ramp.target = 10.0
+>>> ramp.advance(4.0)
+>>> ramp.value, ramp.time_to_target()
+(2.0, 16.0)
+"""
+
+# Simulated time in seconds within which a ramp counts as having arrived, so that rounding in the time of arrival
+# never leaves it a hair short of its target
+TIME_RESOLUTION = 1e-9
+
+
+class LinearRamp(object):
+    """
+    A value which moves towards a target at a fixed rate. Time only passes for the ramp when it is advanced, so a
+    state which does not advance it holds the value where it is.
+    """
+
+    def __init__(self, value=0.0, rate=1.0):
+        """
+        Args:
+            value (float): The initial value; the ramp starts at its target.
+            rate (float): The change in the value per second.
+        """
+        self.time = 0.0
+        self._rate = abs(rate)
+        self._restart(value, value)
+
+    def _restart(self, value, target):
+        self._start_value = value
+        self._start_time = self.time
+        self._target = target
+        self._end_time = self.time + (abs(target - value) / self._rate if self._rate else float("inf"))
+        if value == target:
+            self._end_time = self.time
+
+    @property
+    def value(self):
+        """
+        float: The value now. Setting it moves the value there at once, and it ramps on towards the target from there.
+        """
+        if self.time >= self._end_time - TIME_RESOLUTION:
+            return self._target
+        travelled = self._rate * (self.time - self._start_time)
+        return self._start_value + (travelled if self._target > self._start_value else -travelled)
+
+    @value.setter
+    def value(self, value):
+        self._restart(value, self._target)
+
+    @property
+    def target(self):
+        """
+        float: The value the ramp is heading for.
+        """
+        return self._target
+
+    @target.setter
+    def target(self, target):
+        if target != self._target:
+            self._restart(self.value, target)
+
+    @property
+    def rate(self):
+        """
+        float: The change in the value per second.
+        """
+        return self._rate
+
+    @rate.setter
+    def rate(self, rate):
+        rate = abs(rate)
+        if rate != self._rate:
+            value = self.value
+            self._rate = rate
+            self._restart(value, self._target)
+
+    @property
+    def at_target(self):
+        """
+        bool: Whether the ramp has reached its target.
+        """
+        return self.time >= self._end_time - TIME_RESOLUTION
+
+    def stop(self):
+        """
+        Stops the ramp where it is, by making the current value its target.
+        """
+        self._restart(self.value, self.value)
+
+    def advance(self, dt):
+        """
+        Lets time pass for the ramp.
+
+        Args:
+            dt (float): The time in seconds.
+        """
+        self.time += dt
+
+    def time_to_target(self):
+        """
+        Returns:
+            float: The time in seconds until the ramp reaches its target; 0 if it has, infinite if it never will.
+        """
+        return 0.0 if self.at_target else self._end_time - self.time
+
+
+def process_in_steps(process, dt, time_to_event):
+    """
+    Processes a cycle in two steps if an event, e.g. a ramp reaching its target, falls within it. The state machine
+    then makes the transition the event causes at the time of the event, rather than at the end of the cycle.
+
+    Args:
+        process: The function processing a step, e.g. the process method of the device's base class.
+        dt (float): The length of the cycle in seconds.
+        time_to_event (float): The time in seconds until the event, or None if there is none.
+    """
+    if time_to_event is not None and 0 < time_to_event < dt:
+        process(time_to_event)
+        dt -= time_to_event
+    process(dt)
@@ -0,0 +1,195 @@
+"""
+Simulated readings generated at a configurable rate from the simulation cycle of a device.
+
+A ReadingGenerator is advanced by the time step of each simulation cycle (e.g. from the in_state of the device's
+state) and returns every reading that fell due during the step in one batch, so the rate of readings does not depend
+on how often the cycle runs. The values of the readings come from a profile, e.g.
+
+>>> generator = ReadingGenerator(rate=1000, profile=RampProfile(start=0, rate=5, end=100))
+>>> times, values = generator.process(0.1)  # 100 readings
+"""
+
+import random
+
+
+class RandomProfile(object):
+    """
+    Readings uniformly distributed between a minimum and a maximum.
+    """
+
+    def __init__(self, minimum=0.0, maximum=1.0):
+        """
+        Args:
+            minimum (float): The smallest reading.
+            maximum (float): The largest reading.
+        """
+        self.minimum = float(minimum)
+        self.maximum = float(maximum)
+
+    def values(self, times):
+        """
+        Args:
+            times (list[float]): The times of the readings in seconds.
+
+        Returns:
+            list[float]: The readings.
+        """
+        return [random.uniform(self.minimum, self.maximum) for _ in times]
+
+
+class RampProfile(object):
+    """
+    Readings which change linearly with time. If an end is given, the ramp starts again from the start once it
+    reaches the end.
+    """
+
+    def __init__(self, start=0.0, rate=1.0, end=None):
+        """
+        Args:
+            start (float): The reading at time 0.
+            rate (float): The change in the reading per second.
+            end (float): The reading at which the ramp starts again, or None to ramp forever.
+        """
+        self.start = float(start)
+        self.rate = float(rate)
+        self.end = None if end is None else float(end)
+
+    def values(self, times):
+        """
+        Args:
+            times (list[float]): The times of the readings in seconds.
+
+        Returns:
+            list[float]: The readings.
+        """
+        start, rate = self.start, self.rate
+        if self.end is None or self.end == start:
+            return [start + rate * time for time in times]
+        span = self.end - start
+        return [start + (rate * time) % span for time in times]
+
+
+class ReplayProfile(object):
+    """
+    Readings replayed from a fixed sequence, which repeats once it runs out.
+    """
+
+    def __init__(self, values):
+        """
+        Args:
+            values (list[float]): The readings to replay.
+        """
+        self._values = [float(value) for value in values]
+        if not self._values:
+            raise ValueError("A replay profile needs at least one reading.")
+        self._next = 0
+
+    @classmethod
+    def from_file(cls, path):
+        """
+        Creates a profile replaying the readings in a file. The file has a reading per line; only the first comma
+        separated field of a line is used, and blank lines and lines starting with # are ignored.
+
+        Args:
+            path (string): The path of the file.
+
+        Returns:
+            ReplayProfile: The profile.
+        """
+        with open(path) as replay_file:
+            lines = [line.strip() for line in replay_file]
+        return cls(line.split(",")[0] for line in lines if line and not line.startswith("#"))
+
+    def values(self, times):
+        """
+        Args:
+            times (list[float]): The times of the readings in seconds.
+
+        Returns:
+            list[float]: The next len(times) readings of the sequence.
+        """
+        count, length = len(times), len(self._values)
+        start = self._next
+        self._next = (start + count) % length
+        repeated = self._values[start:] + self._values * ((start + count) // length)
+        return repeated[:count]
+
+
+PROFILES = {
+    "random": RandomProfile,
+    "ramp": RampProfile,
+    "replay": ReplayProfile.from_file,
+}
+
+
+def create_profile(name, *parameters):
+    """
+    Creates a profile by name, e.g. so that it can be chosen through the backdoor.
+
+    Args:
+        name (string): The name of the profile; one of PROFILES.
+        parameters: The arguments of the profile, e.g. the minimum and maximum of a random profile or the path of the
+            file for a replay profile.
+
+    Returns:
+        The profile.
+    """
+    try:
+        profile = PROFILES[name]
+    except KeyError:
+        raise ValueError("{} is not a reading profile, expected one of {}.".format(name, ", ".join(sorted(PROFILES))))
+    return profile(*parameters)
+
+
+class ReadingGenerator(object):
+    """
+    Produces readings at a fixed rate as simulated time passes.
+    """
+
+    def __init__(self, rate, profile):
+        """
+        Args:
+            rate (float): The number of readings per second; 0 to stop producing readings.
+            profile: The profile the values of readings come from.
+        """
+        self.rate = rate
+        self.profile = profile
+        self.time = 0.0
+        self._readings_due = 0.0
+
+    @property
+    def rate(self):
+        return self._rate
+
+    @rate.setter
+    def rate(self, rate):
+        if rate < 0:
+            raise ValueError("The rate of readings can not be negative, got {}".format(rate))
+        self._rate = float(rate)
+        self._readings_due = 0.0
+
+    def process(self, dt):
+        """
+        Advances simulated time and produces the readings which fell due.
+
+        Args:
+            dt (float): The time step in seconds.
+
+        Returns:
+            tuple(list[float], list[float]): The times of the readings in seconds, and their values.
+        """
+        self.time += dt
+        if self._rate == 0:
+            return [], []
+
+        self._readings_due += dt * self._rate
+        count = int(self._readings_due)
+        self._readings_due -= count
+        if count == 0:
+            return [], []
+
+        # The last reading was due _readings_due periods ago, and the others one period apart before it
+        period = 1.0 / self._rate
+        last = self.time - self._readings_due * period
+        times = [last - (count - 1 - index) * period for index in range(count)]
+        return times, self.profile.values(times)
@@ -0,0 +1,72 @@
+"""
+Helpers for working out the literal text a regular expression must start with.
+"""
+
+# Characters which have a special meaning in a regular expression
+SPECIAL_CHARACTERS = "\\.^$*+?{}[]|()"
+
+# Quantifiers which make the preceding character optional
+QUANTIFIERS = "?*{"
+
+
+def has_top_level_alternation(pattern):
+    """
+    Whether a regular expression contains a | which is not inside a group or character class, e.g. "a|b" does but
+    "(?:a|b)" does not.
+
+    :param pattern: the regular expression
+    :return: True if the pattern has an alternation at the top level; False otherwise
+    """
+    depth = 0
+    in_class = False
+    index = 0
+    while index < len(pattern):
+        char = pattern[index]
+        if char == "\\":
+            index += 1
+        elif in_class:
+            in_class = char != "]"
+        elif char == "[":
+            in_class = True
+            # A ] straight after the opening bracket (or its negation) is a literal
+            if pattern[index + 1:index + 2] == "^":
+                index += 1
+            if pattern[index + 1:index + 2] == "]":
+                index += 1
+        elif char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif char == "|" and depth == 0:
+            return True
+        index += 1
+    return False
+
+
+def literal_prefix(pattern):
+    """
+    Works out the literal text that anything matching a regular expression must start with, e.g. "TRAC:POIN " for
+    r"^TRAC:POIN (\\d+)$". This is conservative and stops at the first character which is not plain text.
+
+    :param pattern: the regular expression
+    :return: the literal prefix; empty string if there is none
+    """
+    if has_top_level_alternation(pattern):
+        return ""
+
+    prefix = []
+    index = 1 if pattern.startswith("^") else 0
+    while index < len(pattern):
+        char = pattern[index]
+        if char == "\\" and index + 1 < len(pattern) and not pattern[index + 1].isalnum():
+            prefix.append(pattern[index + 1])
+            index += 2
+        elif char not in SPECIAL_CHARACTERS:
+            prefix.append(char)
+            index += 1
+        else:
+            if char in QUANTIFIERS and prefix:
+                prefix.pop()
+            break
+
+    return "".join(prefix)
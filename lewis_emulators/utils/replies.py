@@ -1,4 +1,5 @@
 import time
+import weakref
 
 import six
 from lewis.core.logging import has_log
@@ -55,24 +56,122 @@ def conditional_reply(property_name, reply=None):
     return decorator
 
 
-class _LastInput:
-    last_input_time = 0
+_clock = getattr(time, "monotonic", time.time)
+
+
+class TokenBucket(object):
+    """
+    Limits the rate of events: each event takes a token from the bucket, which refills at a fixed rate up to its
+    capacity. Bursts of up to capacity events are allowed, and a sustained rate of up to rate events per second.
+    """
+
+    def __init__(self, rate, capacity=1, clock=None):
+        """
+        Args:
+            rate (float): The number of tokens added to the bucket per second.
+            capacity (int): The largest number of tokens the bucket holds; the bucket starts full.
+            clock: Function returning the time in seconds; a monotonic clock by default.
+        """
+        if rate <= 0 or capacity < 1:
+            raise ValueError("A token bucket needs a positive rate and a capacity of at least 1, got rate {} and "
+                             "capacity {}".format(rate, capacity))
+        self.rate = float(rate)
+        self.capacity = float(capacity)
+        self._clock = clock or _clock
+        self.tokens = self.capacity
+        self._last_time = self._clock()
+
+    def _refill(self):
+        now = self._clock()
+        self.tokens = min(self.capacity, self.tokens + (now - self._last_time) * self.rate)
+        self._last_time = now
+
+    def take(self):
+        """
+        Take a token for an event if there is one.
+
+        Returns:
+            bool: True if the event is within the limit; False if the bucket is empty.
+        """
+        self._refill()
+        # Allow for rounding in the sums of times, so a token is there once exactly 1 / rate seconds have passed
+        if self.tokens >= 1 - 1e-9:
+            self.tokens = max(0.0, self.tokens - 1)
+            return True
+        return False
+
+    def time_to_token(self):
+        """
+        Returns:
+            float: The time in seconds until the bucket holds a whole token.
+        """
+        self._refill()
+        return max(0.0, (1 - self.tokens) / self.rate)
+
+
+class RateLimits(object):
+    """
+    The token buckets of the rate limited commands of each device. Buckets are looked up by the device and a key, so
+    limits of one device do not affect another running in the same process, and are dropped with the device. Buckets
+    of a connection are dropped with the connection too.
+    """
+
+    def __init__(self):
+        self._buckets = weakref.WeakKeyDictionary()
+        self._connection_buckets = weakref.WeakKeyDictionary()
+
+    def bucket(self, device, key, rate, capacity, connection=None):
+        """
+        Get the bucket of a device for a key, creating it with the given rate and capacity if it does not exist yet.
+        If a connection is given, the bucket is the connection's own.
+        """
+        if connection is None:
+            buckets = self._buckets.setdefault(device, {})
+        else:
+            connections = self._connection_buckets.setdefault(device, weakref.WeakKeyDictionary())
+            buckets = connections.setdefault(connection, {})
+        try:
+            return buckets[key]
+        except KeyError:
+            return buckets.setdefault(key, TokenBucket(rate, capacity))
+
+    def reset(self, device):
+        """
+        Forget the buckets of a device, so that all its commands are allowed straight away.
+        """
+        self._buckets.pop(device, None)
+        self._connection_buckets.pop(device, None)
+
+
+rate_limits = RateLimits()
 
 
 @has_log
-def timed_reply(action, reply=None, minimum_time_delay=0):
+def timed_reply(action, reply=None, minimum_time_delay=0, rate=None, burst=1, per_connection=False, bucket=None):
     """
-    Decorator that inhibits a command and performs a action if call time is less than than some minimum time delay
-    between the the current and last input
+    Decorator that inhibits a command and performs an action on the device if commands arrive faster than the device
+    can take them. The limit is a token bucket per device: commands are allowed in bursts of up to burst commands, and
+    at up to rate commands per second on average.
+
+    Commands decorated by the same decorator share a bucket, e.g. to limit the rate of every command sent to a device;
+    decorators with the same bucket name share a bucket too. Whichever of them is called first on a device sets the
+    rate and burst of its bucket.
 
     Args:
         action (str): The name of the method to execute for on the device
         reply (str): Desired output reply string when input time delay is less than the minimum
-        minimum_time_delay (int): The minimum time (ms) between commands sent to the device
+        minimum_time_delay (int): The minimum time (ms) between commands sent to the device, if rate is not given
+        rate (float): The largest average number of commands per second
+        burst (int): The largest number of commands allowed at once
+        per_connection (bool): Whether each connection (client) of the interface has a bucket of its own, rather than
+            the device having one for all its interfaces. Lewis only tells an interface which connection it accepted
+            last, so commands from clients connected at the same time count against that connection's bucket. A
+            connection's buckets are dropped once lewis lets go of it
+        bucket (str): Name of the bucket shared with other decorators with the same name
 
     Returns:
-       The function returns as normal if minimum delay exceeded. The command is not executed and the action method is
-       called on the device instead
+       The function returns as normal if the command is within the limit. The command is not executed and the action
+       method is called on the device instead if it is not
 
     Raises:
         - AttributeError if the first argument of the decorated function (self) does not contain .device or ._device
@@ -83,26 +182,35 @@ def timed_reply(action, reply=None, minimum_time_delay=0):
         def acknowledge_pressure(channel):
             return ACK
     """
+    if rate is None:
+        rate = 1000.0 / minimum_time_delay if minimum_time_delay > 0 else None
+    key = object() if bucket is None else bucket
+
     def decorator(func):
         @six.wraps(func)
         def wrapper(self, *args, **kwargs):
-            try:
-                new_input_time = int(round(time.time() * 1000))
-                time_since_last_request = new_input_time - _LastInput.last_input_time
-                valid_input = time_since_last_request > minimum_time_delay
-                if valid_input:
-                    _LastInput.last_input_time = new_input_time
-                    return func(self, *args, **kwargs)
-                else:
-                    self.log.info("Violated time tolerance ({}ms) was {}ms. Calling action ({}) on device".format(minimum_time_delay, time_since_last_request, action))
-                    device = _get_device_from(self)
-                    action_function = getattr(device, action)
-                    action_function()
-                    return reply
+            if rate is None:
+                return func(self, *args, **kwargs)
 
+            device = _get_device_from(self)
+            connection = None
+            if per_connection:
+                # The interface stands for the connection until a client connects
+                connection = getattr(self, "handler", None)
+                connection = self if connection is None else connection
+            limit = rate_limits.bucket(device, key, rate, burst, connection)
+            if limit.take():
+                return func(self, *args, **kwargs)
+
+            self.log.info("Exceeded rate limit ({} commands per second, bursts of {}). Calling action ({}) on device"
+                          .format(rate, burst, action))
+            try:
+                action_function = getattr(device, action)
             except AttributeError:
                 raise AttributeError(
-                    "Expected device to contain an attribute called '{}' but it wasn't found.".format(self.action))
+                    "Expected device to contain an attribute called '{}' but it wasn't found.".format(action))
+            action_function()
+            return reply
 
         return wrapper
     return decorator
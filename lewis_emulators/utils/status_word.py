@@ -0,0 +1,251 @@
+"""
+Status words: integers made up of bit fields which report the state of a device, e.g. its interlocks.
+
+A layout declares each field of a word once: which bits of the word it occupies, which attribute of the device it
+comes from and how the attribute's value is encoded into bits. A StatusWord keeps the integer for one device up to
+date as its fields change, and only renders it (e.g. as a string of "!" and "." characters or as hexadecimal) again
+after it has changed, e.g.
+
+>>> LAYOUT = StatusWordLayout([StatusField(0, "power", invert=True), StatusField(1, "interlocked")],
+>>>                           render=render_characters(2))
+>>>
+>>> class Device(StatusWordSource):
+>>>     power = WatchedAttribute("power")
+>>>     interlocked = WatchedAttribute("interlocked")
+>>>
+>>> device.status_word(LAYOUT).render()
+
+Setting a watched attribute refreshes the fields which come from it. Attributes which are changed in place (e.g. a list
+of active interlocks) or computed by a method must be refreshed explicitly with refresh_status or StatusWord.refresh.
+"""
+
+
+class StatusField(object):
+    """
+    A field of a status word.
+    """
+
+    def __init__(self, position, source, width=1, encoding=None, invert=False):
+        """
+        Args:
+            position (int): The bit of the word holding the least significant bit of the field.
+            source (string): The attribute of the device the field comes from; the key if the device is a dictionary.
+                If the attribute is a method, it is called.
+            width (int): The number of bits in the field.
+            encoding: How the value of the source is converted to the bits of the field; a dictionary of values to
+                bits, or a function of the value returning the bits. By default the field is a single bit set when the
+                value is true.
+            invert (bool): Whether a single bit field with no encoding is set when the value is false instead.
+        """
+        self.position = position
+        self.source = source
+        self.mask = ((1 << width) - 1) << position
+        self._encoding = encoding
+        self._invert = invert
+
+    def bits(self, value):
+        """
+        Args:
+            value: The value of the source.
+
+        Returns:
+            int: The bits of the field, in their position in the word.
+        """
+        if self._encoding is None:
+            field = bool(value) != self._invert
+        elif isinstance(self._encoding, dict):
+            field = self._encoding[value]
+        else:
+            field = self._encoding(value)
+        return (int(field) << self.position) & self.mask
+
+
+def render_characters(length, set_character="!", clear_character="."):
+    """
+    Renders a word as one character per bit, least significant bit first.
+
+    Args:
+        length (int): The number of bits to render.
+        set_character (string): The character for a set bit.
+        clear_character (string): The character for a clear bit.
+
+    Returns:
+        function: The renderer.
+    """
+    def render(value):
+        return "".join(set_character if value >> bit & 1 else clear_character for bit in range(length))
+    return render
+
+
+def render_hexadecimal(digits):
+    """
+    Renders a word as zero padded, upper case hexadecimal digits.
+
+    Args:
+        digits (int): The number of digits.
+
+    Returns:
+        function: The renderer.
+    """
+    return "{{:0{}X}}".format(digits).format
+
+
+def render_binary(digits):
+    """
+    Renders a word as zero padded binary digits, most significant bit first.
+
+    Args:
+        digits (int): The number of digits.
+
+    Returns:
+        function: The renderer.
+    """
+    return "{{:0{}b}}".format(digits).format
+
+
+class StatusWordLayout(object):
+    """
+    The fields of a status word and how it is rendered.
+    """
+
+    def __init__(self, fields, render=int, constant=0):
+        """
+        Args:
+            fields (list[StatusField]): The fields of the word. A source may have several fields, e.g. to repeat the
+                same bit in several positions.
+            render: Function converting the integer to the form the device sends; by default the integer itself.
+            constant (int): Bits which are always set.
+        """
+        self.fields = tuple(fields)
+        self.render = render
+        self.constant = constant
+        self._fields_by_source = {}
+        for field in self.fields:
+            self._fields_by_source.setdefault(field.source, []).append(field)
+
+    def fields_from(self, source):
+        """
+        Args:
+            source (string): The attribute of the device.
+
+        Returns:
+            list[StatusField]: The fields which come from the attribute.
+        """
+        return self._fields_by_source.get(source, ())
+
+
+def _read(device, source):
+    value = device[source] if isinstance(device, dict) else getattr(device, source)
+    return value() if callable(value) else value
+
+
+class StatusWord(object):
+    """
+    The status word of a device. The integer is updated as fields are refreshed, and it is only rendered again after
+    it has changed.
+    """
+
+    def __init__(self, layout, device):
+        """
+        Args:
+            layout (StatusWordLayout): The layout of the word.
+            device: The object (or dictionary) the fields come from.
+        """
+        self.layout = layout
+        self._device = device
+        self._value = layout.constant
+        self._rendered = None
+        self.refresh()
+
+    @property
+    def value(self):
+        """
+        int: The status word.
+        """
+        return self._value
+
+    def refresh(self, source=None):
+        """
+        Reads fields from the device again.
+
+        Args:
+            source (string): The attribute whose fields to read; all fields if None.
+
+        Returns:
+            bool: Whether the word changed.
+        """
+        fields = self.layout.fields if source is None else self.layout.fields_from(source)
+        value = self._value
+        for field in fields:
+            value = (value & ~field.mask) | field.bits(_read(self._device, field.source))
+        if value == self._value:
+            return False
+        self._value = value
+        self._rendered = None
+        return True
+
+    def render(self):
+        """
+        Returns:
+            The status word as the device sends it.
+        """
+        if self._rendered is None:
+            self._rendered = self.layout.render(self._value)
+        return self._rendered
+
+
+class StatusWordSource(object):
+    """
+    Mixin for devices whose attributes are fields of status words. It keeps one status word per layout up to date.
+    """
+
+    def status_word(self, layout):
+        """
+        Args:
+            layout (StatusWordLayout): The layout of the word.
+
+        Returns:
+            StatusWord: The device's status word with that layout.
+        """
+        words = self.__dict__.setdefault("_status_words", {})
+        try:
+            return words[layout]
+        except KeyError:
+            word = words[layout] = StatusWord(layout, self)
+            return word
+
+    def refresh_status(self, source=None):
+        """
+        Refreshes the fields of all status words which come from an attribute, e.g. after it was changed in place.
+
+        Args:
+            source (string): The attribute; all fields if None.
+        """
+        for word in self.__dict__.get("_status_words", {}).values():
+            word.refresh(source)
+
+
+class WatchedAttribute(object):
+    """
+    Descriptor for an attribute of a StatusWordSource which refreshes its fields in the device's status words when it
+    is set.
+    """
+
+    def __init__(self, name):
+        """
+        Args:
+            name (string): The name of the attribute.
+        """
+        self.name = name
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        try:
+            return instance.__dict__[self.name]
+        except KeyError:
+            raise AttributeError(self.name)
+
+    def __set__(self, instance, value):
+        instance.__dict__[self.name] = value
+        instance.refresh_status(self.name)
@@ -0,0 +1,37 @@
+import unittest
+from hamcrest import assert_that, is_, calling, raises
+
+from lewis_emulators.utils.bound_command import SingleBoundCommand
+
+
+class EchoCommand(SingleBoundCommand):
+    def find_match(self, request):
+        return request if request.startswith("ECHO") else None
+
+    def process_match(self, match, request):
+        return match[4:]
+
+
+class SingleBoundCommandTests(unittest.TestCase):
+    """
+    Tests for the base class of objects which behave like a single bound command.
+    """
+
+    def test_that_GIVEN_a_command_without_process_match_THEN_it_can_not_be_created(self):
+        class MatchOnly(SingleBoundCommand):
+            def find_match(self, request):
+                return request
+
+        assert_that(calling(MatchOnly).with_args("doc", "description"), raises(TypeError))
+
+    def test_that_GIVEN_a_request_it_matches_THEN_it_processes_the_request(self):
+        command = EchoCommand("doc", "description")
+
+        assert_that(command.can_process("ECHO hello"), is_(True))
+        assert_that(command.process_request("ECHO hello"), is_(" hello"))
+
+    def test_that_GIVEN_a_request_it_does_not_match_THEN_it_can_not_process_the_request(self):
+        command = EchoCommand("doc", "description")
+
+        assert_that(command.can_process("READ"), is_(False))
+        assert_that(calling(command.process_request).with_args("READ"), raises(RuntimeError))
@@ -0,0 +1,67 @@
+import unittest
+
+import six
+from hamcrest import assert_that, is_, equal_to, close_to
+
+from lewis_emulators.utils.byte_conversions import pack_uint, unpack_uint, pack_uints, unpack_uints, pack_float32, \
+    unpack_float32, pack_float32s, unpack_float32s, int_to_raw_bytes, raw_bytes_to_int, float_to_raw_bytes
+
+
+class PackUintTests(unittest.TestCase):
+    """
+    Tests for packing and unpacking unsigned integers.
+    """
+
+    def test_GIVEN_integer_THEN_it_is_packed_in_the_requested_byte_order(self):
+        assert_that(pack_uint(0x0102, 2, low_byte_first=True), is_(equal_to(six.b("\x02\x01"))))
+        assert_that(pack_uint(0x0102, 2, low_byte_first=False), is_(equal_to(six.b("\x01\x02"))))
+
+    def test_GIVEN_length_without_a_struct_format_THEN_integer_is_still_packed(self):
+        assert_that(pack_uint(0x010203, 3, low_byte_first=False), is_(equal_to(six.b("\x01\x02\x03"))))
+        assert_that(unpack_uint(six.b("\x01\x02\x03"), low_byte_first=False), is_(equal_to(0x010203)))
+
+    def test_GIVEN_integer_too_big_or_negative_THEN_it_wraps(self):
+        assert_that(pack_uint(0x1FF, 1), is_(equal_to(six.b("\xff"))))
+        assert_that(pack_uint(-1, 2), is_(equal_to(six.b("\xff\xff"))))
+
+    def test_GIVEN_bytearray_or_memoryview_THEN_integer_is_unpacked(self):
+        assert_that(unpack_uint(bytearray(six.b("\x02\x01"))), is_(equal_to(0x0102)))
+        assert_that(unpack_uint(memoryview(six.b("\x00\x02\x01"))[1:]), is_(equal_to(0x0102)))
+
+    def test_GIVEN_several_integers_THEN_they_are_packed_and_unpacked_together(self):
+        raw = pack_uints([1, 2, 0xFFFF], 2, low_byte_first=False)
+
+        assert_that(raw, is_(equal_to(six.b("\x00\x01\x00\x02\xff\xff"))))
+        assert_that(unpack_uints(raw, 2, low_byte_first=False), is_(equal_to((1, 2, 0xFFFF))))
+
+
+class PackFloat32Tests(unittest.TestCase):
+    """
+    Tests for packing and unpacking single precision floats.
+    """
+
+    def test_GIVEN_float_THEN_it_round_trips(self):
+        for low_byte_first in (True, False):
+            raw = pack_float32(1.5, low_byte_first)
+            assert_that(unpack_float32(raw, low_byte_first), is_(equal_to(1.5)))
+
+    def test_GIVEN_several_floats_THEN_they_round_trip(self):
+        values = unpack_float32s(pack_float32s([1.5, -2.25, 0.1], False), False)
+
+        assert_that(values[:2], is_(equal_to((1.5, -2.25))))
+        assert_that(values[2], is_(close_to(0.1, 1e-6)))
+
+
+class CompatibilityTests(unittest.TestCase):
+    """
+    Tests that the string based functions behave as before.
+    """
+
+    def test_GIVEN_integer_THEN_raw_string_has_one_character_per_byte(self):
+        assert_that(int_to_raw_bytes(0x0102, 4, False), is_(equal_to("\x00\x00\x01\x02")))
+
+    def test_GIVEN_list_of_characters_THEN_integer_is_unpacked(self):
+        assert_that(raw_bytes_to_int(["\x02", "\x01"]), is_(equal_to(0x0102)))
+
+    def test_GIVEN_float_THEN_raw_string_is_low_byte_first_by_default(self):
+        assert_that(float_to_raw_bytes(1.0), is_(equal_to("\x00\x00\x80\x3f")))
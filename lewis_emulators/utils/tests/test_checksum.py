@@ -0,0 +1,40 @@
+import unittest
+
+import six
+from hamcrest import assert_that, is_, equal_to
+
+from lewis_emulators.utils.checksum import crc16
+
+
+def bitwise_crc16(data):
+    crc = 0xFFFF
+    for byte in bytearray(data):
+        crc ^= byte
+        for _ in range(8):
+            crc = (crc >> 1) ^ 0xA001 if crc & 1 else crc >> 1
+    return crc
+
+
+class Crc16Tests(unittest.TestCase):
+    """
+    Tests for the table driven CRC16.
+    """
+
+    def test_GIVEN_standard_check_string_THEN_modbus_check_value_is_returned(self):
+        assert_that(crc16(six.b("123456789")), is_(equal_to(0x4B37)))
+
+    def test_GIVEN_all_byte_values_THEN_result_is_the_same_as_the_bitwise_algorithm(self):
+        data = bytearray(range(256)) * 3
+
+        assert_that(crc16(data), is_(equal_to(bitwise_crc16(data))))
+
+    def test_GIVEN_data_split_into_parts_THEN_incremental_checksum_is_the_same_as_the_whole(self):
+        data = six.b("\x01\x80\x20some data")
+
+        assert_that(crc16(data[5:], crc16(data[:5])), is_(equal_to(crc16(data))))
+
+    def test_GIVEN_text_bytes_and_memoryview_of_the_same_data_THEN_checksums_are_equal(self):
+        data = six.b("\x01\x80\xc0")
+
+        assert_that(crc16("\x01\x80\xc0"), is_(equal_to(crc16(data))))
+        assert_that(crc16(memoryview(data)), is_(equal_to(crc16(data))))
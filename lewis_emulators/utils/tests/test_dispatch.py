@@ -0,0 +1,160 @@
+import unittest
+
+import six
+from hamcrest import assert_that, is_, equal_to, none
+from lewis.adapters.stream import Cmd
+
+from lewis_emulators.utils.command_builder import CmdBuilder
+from lewis_emulators.utils.dispatch import CommandDispatcher, IndexedCommandDispatcher, FusedCommandDispatcher
+from lewis_emulators.utils.regex_prefix import literal_prefix
+
+
+class FakeInterface(object):
+    def get_pres(self):
+        return "pres"
+
+    def set_pres(self, pressure):
+        return "set {}".format(pressure)
+
+    def get_temp(self, channel):
+        return "temp {}".format(channel)
+
+    def echo(self, text):
+        return "echo {}".format(six.ensure_str(text))
+
+
+def bind(commands):
+    interface = FakeInterface()
+    return [bound for command in commands for bound in command.bind(interface)]
+
+
+class LiteralPrefixTests(unittest.TestCase):
+    """
+    Tests for the literal prefixes recorded by CmdBuilder and worked out from plain regexes.
+    """
+
+    def test_GIVEN_escaped_text_followed_by_an_argument_THEN_prefix_is_the_escaped_text(self):
+        builder = CmdBuilder("set_pres").escape("pres ").stx().float()
+
+        assert_that(builder.literal_prefix, is_(equal_to("pres \x02")))
+
+    def test_GIVEN_command_starting_with_an_argument_THEN_prefix_is_empty(self):
+        builder = CmdBuilder("set_pres").float().escape("pres")
+
+        assert_that(builder.literal_prefix, is_(equal_to("")))
+
+    def test_GIVEN_optional_text_THEN_prefix_stops_at_it(self):
+        builder = CmdBuilder("get_pres").escape("P").optional("RES").escape("?")
+
+        assert_that(builder.literal_prefix, is_(equal_to("P")))
+
+    def test_GIVEN_regex_making_last_character_optional_THEN_that_character_is_not_in_prefix(self):
+        builder = CmdBuilder("get_pres").escape("PR").regex("?")
+
+        assert_that(builder.literal_prefix, is_(equal_to("P")))
+
+    def test_GIVEN_top_level_alternation_after_the_prefix_is_complete_THEN_prefix_is_empty(self):
+        builder = CmdBuilder("get_pres").escape("PR").int().regex("|X")
+
+        assert_that(builder.literal_prefix, is_(equal_to("")))
+        assert_that(CmdBuilder("get_pres").escape("PR").int().add_ascii_character(ord("|")).escape("X").literal_prefix,
+                    is_(equal_to("")))
+
+    def test_GIVEN_alternation_inside_a_group_THEN_prefix_is_kept(self):
+        builder = CmdBuilder("get_pres").escape("PR").regex("(?:A|B)").regex("(").regex("C|D").regex(")")
+
+        assert_that(builder.literal_prefix, is_(equal_to("PR")))
+
+    def test_GIVEN_empty_regex_THEN_prefix_is_unchanged(self):
+        builder = CmdBuilder("get_pres").escape("PR").regex("").escape("ES")
+
+        assert_that(builder.literal_prefix, is_(equal_to("PRES")))
+
+    def test_GIVEN_ignored_characters_THEN_prefix_is_empty(self):
+        builder = CmdBuilder("get_pres", ignore=" ").escape("pres?")
+
+        assert_that(builder.literal_prefix, is_(equal_to("")))
+
+    def test_GIVEN_plain_regex_THEN_prefix_is_the_text_before_the_first_special_character(self):
+        assert_that(literal_prefix(r"^BCS(?:\s(\S*))?.*$"), is_(equal_to("BCS")))
+        assert_that(literal_prefix(r"^\?(?:\s.*)?$"), is_(equal_to("?")))
+        assert_that(literal_prefix(r"^ab?c"), is_(equal_to("a")))
+        assert_that(literal_prefix(r"^ab|cd"), is_(equal_to("")))
+
+
+class IndexedCommandDispatcherTests(unittest.TestCase):
+    """
+    Tests that the indexed dispatcher finds the same command lewis would.
+    """
+
+    def setUp(self):
+        self.dispatcher = IndexedCommandDispatcher(bind([
+            CmdBuilder("get_pres").escape("pres?").eos().build(),
+            CmdBuilder("set_pres").escape("pres ").float().eos().build(),
+            CmdBuilder("get_temp").escape("T").digit().escape("?").eos().build(),
+            Cmd("echo", r"^(.*)!$"),
+        ]))
+
+    def test_GIVEN_request_for_an_indexed_command_THEN_only_commands_with_matching_prefix_are_candidates(self):
+        candidates = self.dispatcher.candidates(six.b("pres 1.5"))
+
+        assert_that([c.func.__name__ for c in candidates], is_(equal_to(["set_pres", "echo"])))
+
+    def test_GIVEN_requests_THEN_they_are_processed_by_the_matching_command(self):
+        assert_that(self.dispatcher.process_request(six.b("pres?")), is_(equal_to("pres")))
+        assert_that(self.dispatcher.process_request(six.b("pres 1.5")), is_(equal_to("set 1.5")))
+        assert_that(self.dispatcher.process_request(six.b("T3?")), is_(equal_to("temp 3")))
+        assert_that(self.dispatcher.process_request(six.b("pres!")), is_(equal_to("echo pres")))
+
+    def test_GIVEN_request_matching_no_command_THEN_it_can_not_be_processed(self):
+        assert_that(self.dispatcher.can_process(six.b("volt?")), is_(False))
+        self.assertRaises(RuntimeError, self.dispatcher.process_request, six.b("volt?"))
+
+    def test_GIVEN_request_processed_THEN_matcher_is_that_of_the_matching_command(self):
+        self.dispatcher.can_process(six.b("T3?"))
+
+        assert_that(self.dispatcher.matcher.pattern, is_(equal_to(r"T(\d)\?$")))
+
+    def test_GIVEN_request_shorter_than_all_prefixes_THEN_only_unindexed_commands_are_tried(self):
+        assert_that(self.dispatcher.find_command(six.b("")), is_(none()))
+
+
+class FusedCommandDispatcherTests(unittest.TestCase):
+    """
+    Tests that the fused dispatcher finds the same command, with the same arguments, as lewis would.
+    """
+
+    def setUp(self):
+        self.dispatcher = FusedCommandDispatcher(bind([
+            CmdBuilder("get_pres").escape("pres?").eos().build(),
+            CmdBuilder("set_pres").escape("pres ").float().eos().build(),
+            CmdBuilder("get_temp").escape("T").digit().escape("?").eos().build(),
+            Cmd("echo", r"^(a)\1!$"),
+            Cmd("echo", r"^(.*)!$"),
+        ]))
+
+    def test_GIVEN_commands_with_the_same_flags_THEN_they_are_fused_into_one_regex(self):
+        assert_that(len(self.dispatcher.segments), is_(equal_to(3)))
+
+    def test_GIVEN_requests_THEN_they_are_processed_by_the_matching_command_with_mapped_arguments(self):
+        assert_that(self.dispatcher.process_request(six.b("pres?")), is_(equal_to("pres")))
+        assert_that(self.dispatcher.process_request(six.b("pres 1.5")), is_(equal_to("set 1.5")))
+        assert_that(self.dispatcher.process_request(six.b("T3?")), is_(equal_to("temp 3")))
+        assert_that(self.dispatcher.process_request(six.b("aa!")), is_(equal_to("echo a")))
+        assert_that(self.dispatcher.process_request(six.b("pres!")), is_(equal_to("echo pres")))
+
+    def test_GIVEN_request_matching_no_command_THEN_it_can_not_be_processed(self):
+        assert_that(self.dispatcher.can_process(six.b("volt?")), is_(False))
+        self.assertRaises(RuntimeError, self.dispatcher.process_request, six.b("volt?"))
+
+
+class CommandDispatcherTests(unittest.TestCase):
+    """
+    Tests for the base class of dispatchers.
+    """
+
+    def test_GIVEN_a_dispatcher_without_find_command_THEN_it_can_not_be_created(self):
+        class NoFindCommand(CommandDispatcher):
+            pass
+
+        self.assertRaises(TypeError, NoFindCommand, [])
@@ -0,0 +1,66 @@
+import unittest
+from hamcrest import assert_that, is_, equal_to, close_to, calling, raises
+
+from lewis_emulators.utils.emulator_host import EmulatorHost, CycleTimes, parse_emulator
+
+
+class CycleTimesTests(unittest.TestCase):
+    """
+    Tests for the statistics of a device's cycle times.
+    """
+
+    def test_that_GIVEN_no_cycles_THEN_mean_is_zero(self):
+        assert_that(CycleTimes().mean, is_(0.0))
+
+    def test_that_GIVEN_cycles_THEN_mean_max_and_last_recorded(self):
+        times = CycleTimes()
+
+        for cycle_time in (0.002, 0.006, 0.001):
+            times.record(cycle_time)
+
+        assert_that(times.cycles, is_(3))
+        assert_that(times.mean, close_to(0.003, 1e-12))
+        assert_that(times.max, is_(0.006))
+        assert_that(times.last, is_(0.001))
+
+
+class EmulatorHostTests(unittest.TestCase):
+    """
+    Tests for hosting emulators in one process.
+    """
+
+    def test_that_GIVEN_an_emulator_on_the_command_line_THEN_it_is_parsed(self):
+        assert_that(parse_emulator("rknps:stream:57001"),
+                    equal_to({"device": "rknps", "protocol": "stream", "port": 57001}))
+
+    def test_that_GIVEN_an_emulator_without_a_port_THEN_it_is_rejected(self):
+        assert_that(calling(parse_emulator).with_args("rknps:stream"), raises(Exception))
+
+    def _start_emulator(self):
+        host = EmulatorHost(cycle_delay=0.1)
+        simulation = host.add("rknps", "stream", 0, bind_address="127.0.0.1")
+        simulation.start()
+        self.addCleanup(simulation.shut_down)
+        return simulation
+
+    def test_that_GIVEN_a_hosted_emulator_WHEN_cycles_processed_THEN_device_advanced_by_time_since_last_cycle(self):
+        simulation = self._start_emulator()
+        simulation._last_cycle = 10.0
+
+        assert_that(simulation.next_cycle_due(), close_to(10.1, 1e-12))
+        simulation.process_cycle(10.25)
+        simulation.process_cycle(10.5)
+
+        assert_that(simulation.cycles, is_(2))
+        assert_that(simulation.runtime, close_to(0.5, 1e-12))
+        assert_that(simulation.cycle_times.cycles, is_(2))
+
+    def test_that_GIVEN_a_paused_emulator_WHEN_cycle_due_THEN_device_not_processed(self):
+        simulation = self._start_emulator()
+        simulation._last_cycle = 0.0
+        simulation.pause()
+
+        simulation.process_cycle(1.0)
+
+        assert_that(simulation.cycles, is_(0))
+        assert_that(simulation.next_cycle_due(), close_to(1.1, 1e-12))
@@ -0,0 +1,40 @@
+import unittest
+
+import six
+from hamcrest import assert_that, is_, equal_to
+
+from lewis_emulators.utils.checksum import crc16
+from lewis_emulators.utils.frame_builder import FrameBuilder
+
+
+class FrameBuilderTests(unittest.TestCase):
+    """
+    Tests for the preallocated frame builder.
+    """
+
+    def test_GIVEN_typed_fields_THEN_frame_contains_them_in_order(self):
+        frame = FrameBuilder().add_uint8(0x01).add_uint16(0x0203, low_byte_first=False).add_uint32(0x04050607) \
+            .add_float32(1.0, low_byte_first=False).build()
+
+        assert_that(frame, is_(equal_to(six.b("\x01\x02\x03\x07\x06\x05\x04\x3f\x80\x00\x00"))))
+
+    def test_GIVEN_frame_bigger_than_capacity_THEN_buffer_grows(self):
+        builder = FrameBuilder(capacity=2)
+        for value in range(10):
+            builder.add_uint16(value)
+
+        assert_that(len(builder.build()), is_(equal_to(20)))
+
+    def test_GIVEN_crc_added_THEN_it_is_the_checksum_of_the_preceding_bytes(self):
+        frame = FrameBuilder().add_bytes(six.b("123456789")).add_crc16().build()
+
+        assert_that(frame[-2:], is_(equal_to(six.b("\x37\x4b"))))
+        assert_that(crc16(frame[:-2]), is_(equal_to(0x4B37)))
+
+    def test_GIVEN_builder_reset_THEN_next_frame_does_not_contain_the_previous_one(self):
+        builder = FrameBuilder()
+        builder.add_uint32(0xFFFFFFFF).build()
+
+        frame = builder.reset().add_uint8(0x05).build()
+
+        assert_that(frame, is_(equal_to(six.b("\x05"))))
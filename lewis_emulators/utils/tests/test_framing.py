@@ -0,0 +1,177 @@
+import struct
+import unittest
+from hamcrest import assert_that, is_
+
+from lewis_emulators.utils.framing import IdleGapDeframer, LengthFieldDeframer, FramedStreamInterface
+
+
+def telegram(body):
+    return struct.pack("<I", len(body)) + body
+
+
+class FakeClock(object):
+    def __init__(self):
+        self.time = 100.0
+
+    def __call__(self):
+        return self.time
+
+
+class FakeHandler(object):
+    """
+    Stands in for lewis's stream handler, recording the requests it processes.
+    """
+
+    def __init__(self):
+        self._buffer = []
+        self.requests = []
+
+    def found_terminator(self):
+        self.requests.append(b"".join(self._buffer))
+        self._buffer = []
+
+
+class FakeInterface(FramedStreamInterface):
+    def create_deframer(self):
+        return LengthFieldDeframer(field_size=4, low_byte_first=True, discard_after=1.0)
+
+
+class FakeIdleGapInterface(FramedStreamInterface):
+    def __init__(self, clock):
+        self.clock = clock
+
+    def create_deframer(self):
+        return IdleGapDeframer(0.02, clock=self.clock)
+
+
+class IdleGapDeframerTests(unittest.TestCase):
+    """
+    Tests for framing requests on the line going quiet.
+    """
+
+    def test_that_GIVEN_data_in_pieces_THEN_it_is_one_frame_once_the_line_is_quiet_for_the_gap(self):
+        clock = FakeClock()
+        deframer = IdleGapDeframer(0.1, clock=clock)
+
+        assert_that(deframer.feed(b"\x040011"), is_([]))
+        clock.time += 0.05
+        assert_that(deframer.idle(), is_([]))
+        assert_that(deframer.feed(b"PV\x05"), is_([]))
+        clock.time += 0.05
+        assert_that(deframer.idle(), is_([]))
+        clock.time += 0.06
+        assert_that(deframer.idle(), is_([b"\x040011PV\x05"]))
+        clock.time += 1.0
+        assert_that(deframer.idle(), is_([]))
+
+
+class LengthFieldDeframerTests(unittest.TestCase):
+    """
+    Tests for framing requests on the length field in their header.
+    """
+
+    def test_that_GIVEN_a_message_split_between_reads_THEN_it_is_framed_once_it_has_all_arrived(self):
+        deframer = LengthFieldDeframer(field_size=4, low_byte_first=True)
+        message = telegram(b"\x01\x02\x03\x04\x05\x06")
+
+        assert_that(deframer.feed(message[:2]), is_([]))
+        assert_that(deframer.feed(message[2:7]), is_([]))
+        assert_that(deframer.feed(message[7:]), is_([message]))
+
+    def test_that_GIVEN_several_messages_in_one_read_THEN_each_is_a_frame(self):
+        deframer = LengthFieldDeframer(field_size=4, low_byte_first=True)
+        first, second, third = telegram(b"abc"), telegram(b""), telegram(b"defgh")
+
+        assert_that(deframer.feed(first + second + third[:5]), is_([first, second]))
+        assert_that(deframer.feed(third[5:]), is_([third]))
+
+    def test_that_GIVEN_a_big_endian_length_which_includes_the_header_THEN_messages_are_framed_on_it(self):
+        deframer = LengthFieldDeframer(field_offset=1, field_size=2, length_includes_header=True, adjustment=1)
+        message = b"\xaa\x00\x05xyC"
+
+        assert_that(deframer.feed(message + message[:3]), is_([message]))
+        assert_that(deframer.feed(message[3:]), is_([message]))
+
+    def test_that_GIVEN_a_partial_message_THEN_it_is_discarded_after_the_line_is_quiet(self):
+        clock = FakeClock()
+        deframer = LengthFieldDeframer(field_size=4, low_byte_first=True, discard_after=1.0, clock=clock)
+        message = telegram(b"abc")
+
+        deframer.feed(message[:5])
+        clock.time += 0.5
+        deframer.idle()
+        deframer.feed(message[5:6])
+        clock.time += 0.9
+        deframer.idle()
+        assert_that(deframer.feed(message[6:]), is_([message]))
+
+        deframer.feed(message[:5])
+        clock.time += 1.0
+        deframer.idle()
+
+        assert_that(deframer.feed(message), is_([message]))
+
+    def test_that_GIVEN_a_length_shorter_than_the_header_THEN_it_is_an_error(self):
+        deframer = LengthFieldDeframer(field_size=2, length_includes_header=True)
+
+        with self.assertRaises(ValueError):
+            deframer.feed(b"\x00\x01")
+
+
+class FramedStreamInterfaceTests(unittest.TestCase):
+    """
+    Tests for framing the requests of the connections of a stream interface.
+    """
+
+    def test_that_GIVEN_an_interface_without_create_deframer_THEN_it_can_not_be_created(self):
+        class NoDeframer(FramedStreamInterface):
+            pass
+
+        with self.assertRaises(TypeError):
+            NoDeframer()
+
+    def test_that_GIVEN_a_connection_THEN_each_frame_it_sends_is_processed_as_a_request(self):
+        interface = FakeInterface()
+        handler = FakeHandler()
+        interface.handler = handler
+        first, second = telegram(b"abc"), telegram(b"de")
+
+        handler.collect_incoming_data(first[:3])
+        assert_that(handler.requests, is_([]))
+        handler.collect_incoming_data(first[3:] + second)
+        handler.process(100)
+
+        assert_that(handler.requests, is_([first, second]))
+        assert_that(interface.handler, is_(handler))
+
+    def test_that_GIVEN_two_connections_THEN_their_data_is_framed_separately(self):
+        interface = FakeInterface()
+        handlers = FakeHandler(), FakeHandler()
+        for handler in handlers:
+            interface.handler = handler
+        message = telegram(b"abc")
+
+        handlers[0].collect_incoming_data(message[:4])
+        handlers[1].collect_incoming_data(message)
+        handlers[0].collect_incoming_data(message[4:])
+
+        assert_that([handler.requests for handler in handlers], is_([[message], [message]]))
+
+    def test_that_GIVEN_a_frame_in_two_chunks_closer_than_the_gap_THEN_it_is_one_request_whatever_the_cycle(self):
+        clock = FakeClock()
+        interface = FakeIdleGapInterface(clock)
+        handler = FakeHandler()
+        interface.handler = handler
+
+        handler.collect_incoming_data(b"\x040011")
+        # Lewis processes the connection every cycle, giving the length of the cycle rather than the time since data
+        handler.process(100)
+        clock.time += 0.01
+        handler.collect_incoming_data(b"PV\x05")
+        handler.process(100)
+        assert_that(handler.requests, is_([]))
+
+        clock.time += 0.03
+        handler.process(100)
+
+        assert_that(handler.requests, is_([b"\x040011PV\x05"]))
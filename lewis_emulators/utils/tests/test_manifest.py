@@ -0,0 +1,39 @@
+import unittest
+from collections import OrderedDict
+from hamcrest import assert_that, is_, equal_to, has_item, calling, raises
+from lewis.core.exceptions import LewisException
+
+from lewis_emulators.utils.manifest import LazyDeviceRegistry, generate_manifest, load_manifest
+
+
+class ManifestTests(unittest.TestCase):
+    """
+    Tests for the manifest of the emulators.
+    """
+
+    def test_that_the_manifest_is_up_to_date_with_the_emulators(self):
+        # If this fails, regenerate the manifest with python -m lewis_emulators.utils.manifest
+        assert_that(load_manifest(), equal_to(generate_manifest()))
+
+    def test_that_GIVEN_an_emulator_in_the_manifest_THEN_its_protocols_are_read_from_the_manifest(self):
+        manifest = OrderedDict([("rknps", {"module": "not_a_module", "protocols": ["stream"]})])
+
+        assert_that(LazyDeviceRegistry(manifest=manifest).protocols("rknps"), equal_to(["stream"]))
+
+    def test_that_GIVEN_the_manifest_THEN_device_builder_imports_the_emulator(self):
+        registry = LazyDeviceRegistry()
+
+        builder = registry.device_builder("rknps")
+
+        assert_that(builder.name, is_("rknps"))
+        assert_that(list(registry.devices), has_item("danfysik"))
+
+    def test_that_GIVEN_an_emulator_missing_from_the_manifest_THEN_it_is_still_found(self):
+        registry = LazyDeviceRegistry(manifest=OrderedDict())
+
+        assert_that(registry.device_builder("rknps").protocols, equal_to(["stream"]))
+
+    def test_that_GIVEN_an_unknown_emulator_THEN_device_builder_raises(self):
+        registry = LazyDeviceRegistry()
+
+        assert_that(calling(registry.device_builder).with_args("not_an_emulator"), raises(LewisException))
@@ -0,0 +1,91 @@
+import unittest
+from hamcrest import assert_that, is_, close_to, contains_exactly, none, instance_of
+
+from lewis_emulators.utils.motion import MotionEngine, S_CURVE
+
+
+class MotionEngineTests(unittest.TestCase):
+    """
+    Tests for the motion of axes along trapezoidal and S-curve profiles.
+    """
+
+    def test_that_GIVEN_infinite_acceleration_THEN_axis_moves_at_constant_speed_and_arrives_exactly(self):
+        engine = MotionEngine(["X"], speed=3.0)
+        engine.move("X", -10.0)
+
+        engine.advance(1.0)
+        assert_that(engine.position("X"), close_to(-3.0, 1e-12))
+
+        engine.advance(1e6)
+        assert_that(engine.position("X"), is_(-10.0))
+        assert_that(engine.moving("X"), is_(False))
+
+    def test_that_GIVEN_a_long_move_THEN_axis_ramps_cruises_and_ramps_down(self):
+        engine = MotionEngine(["X"], speed=10.0, acceleration=5.0)
+        engine.move("X", 100.0)
+
+        assert_that(engine.time_to_arrival("X"), close_to(12.0, 1e-12))
+        positions = []
+        for time in (1.0, 2.0, 6.0, 11.0):
+            engine.advance(time - engine.time)
+            positions.append(engine.position("X"))
+        assert_that(positions, contains_exactly(close_to(2.5, 1e-12), close_to(10.0, 1e-12), close_to(50.0, 1e-12),
+                                                close_to(97.5, 1e-12)))
+
+    def test_that_GIVEN_a_short_move_THEN_axis_never_reaches_top_speed(self):
+        engine = MotionEngine(["X"], speed=10.0, acceleration=1.0)
+        engine.move("X", 4.0)
+
+        assert_that(engine.time_to_arrival("X"), close_to(4.0, 1e-12))
+        engine.advance(2.0)
+        assert_that(engine.position("X"), close_to(2.0, 1e-12))
+
+    def test_that_GIVEN_an_s_curve_THEN_move_takes_as_long_as_trapezoidal_and_passes_the_middle_halfway(self):
+        engine = MotionEngine(["X"], speed=10.0, acceleration=5.0, profile=S_CURVE)
+        engine.move("X", 100.0)
+
+        assert_that(engine.time_to_arrival("X"), close_to(12.0, 1e-12))
+        engine.advance(1.0)
+        assert_that(engine.position("X"), close_to(5.0 * (1.0 - 2.0 / 3.141592653589793), 1e-12))
+        engine.advance(5.0)
+        assert_that(engine.position("X"), close_to(50.0, 1e-12))
+
+    def test_that_GIVEN_many_axes_THEN_positions_and_next_arrival_come_from_their_moves(self):
+        engine = MotionEngine(range(32), speed=2.0)
+        for axis in range(32):
+            engine.move(axis, float(axis))
+
+        assert_that(engine.time_to_next_arrival(), close_to(0.5, 1e-12))
+        engine.advance(5.0)
+        assert_that(engine.positions()[:12], contains_exactly(*[float(min(axis, 10)) for axis in range(12)]))
+        assert_that(engine.moving_axes(), is_(list(range(11, 32))))
+
+        engine.advance(20.0)
+        assert_that(engine.time_to_next_arrival(), none())
+
+    def test_that_GIVEN_a_stop_THEN_axis_stays_where_it_is(self):
+        engine = MotionEngine(["X"], speed=1.0, tolerance=0.1, limits=(0.0, 1.0))
+        engine.move("X", 5.0)
+        engine.advance(2.0)
+
+        assert_that(engine.within_limits("X"), is_(False))
+        engine.stop("X")
+        engine.advance(2.0)
+
+        assert_that(engine.position("X"), is_(2.0))
+        assert_that(engine.at_target("X"), is_(True))
+
+    def test_that_GIVEN_integer_positions_and_speed_THEN_they_are_returned_as_integers_while_at_rest(self):
+        engine = MotionEngine(["X"], speed=10)
+        assert_that(engine.position("X"), is_(0))
+        assert_that(engine.position("X"), instance_of(int))
+        assert_that(engine.speed("X"), instance_of(int))
+
+        engine.move("X", 25)
+        assert_that(engine.position("X"), instance_of(int))
+        engine.advance(1.0)
+        assert_that(engine.position("X"), is_(10.0))
+        engine.advance(2.0)
+
+        assert_that(engine.position("X"), instance_of(int))
+        assert_that(engine.positions(), is_([25]))
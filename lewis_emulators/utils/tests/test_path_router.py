@@ -0,0 +1,94 @@
+import unittest
+from hamcrest import assert_that, is_, equal_to, none, calling, raises
+
+from lewis_emulators.utils.path_router import PathRouter, Route, RoutingStreamInterface
+
+
+class FakeChannel(object):
+    def __init__(self, channel_type):
+        self.channel_type = channel_type
+
+
+CHANNELS = {"MB0": FakeChannel("TEMP"), "DB1": FakeChannel("HTR")}
+
+
+def resolve_channel(channel_id, channel_type):
+    if channel_id not in CHANNELS or CHANNELS[channel_id].channel_type != channel_type:
+        raise ValueError("No {} channel {}".format(channel_type, channel_id))
+    return CHANNELS[channel_id]
+
+
+def router(*templates):
+    return PathRouter([Route(template, lambda *args: args) for template in templates], resolve_channel, "@1")
+
+
+class PathRouterTests(unittest.TestCase):
+    """
+    Tests for routing requests through a tree of command paths.
+    """
+
+    def test_that_GIVEN_a_literal_route_THEN_it_matches_only_that_path(self):
+        paths = router("READ:SYS:CAT")
+
+        assert_that(paths.process_request("READ:SYS:CAT"), equal_to(()))
+        assert_that(paths.can_process("READ:SYS:CAT:"), is_(False))
+        assert_that(paths.can_process("READ:SYS"), is_(False))
+
+    def test_that_GIVEN_a_channel_THEN_handler_is_given_its_id_and_the_resolved_channel(self):
+        paths = router("READ:DEV:{channel}:*:NICK")
+
+        assert_that(paths.process_request("READ:DEV:MB0:TEMP:NICK"), equal_to(("MB0", CHANNELS["MB0"])))
+
+    def test_that_GIVEN_a_channel_of_another_type_THEN_processing_raises(self):
+        paths = router("READ:DEV:{channel}:TEMP:SIG:TEMP")
+
+        assert_that(paths.can_process("READ:DEV:DB1:TEMP:SIG:TEMP"), is_(True))
+        assert_that(calling(paths.process_request).with_args("READ:DEV:DB1:TEMP:SIG:TEMP"), raises(ValueError))
+
+    def test_that_GIVEN_arguments_THEN_they_are_converted(self):
+        paths = router("SET:DEV:{channel}:TEMP:LOOP:TSET:{float}K", "SET:DEV:{channel}:*:LOOP:ENAB:{ON|OFF}",
+                       "SET:DEV:{channel}:*:NICK:{}")
+
+        assert_that(paths.process_request("SET:DEV:MB0:TEMP:LOOP:TSET:-1.5K")[2], is_(-1.5))
+        assert_that(paths.process_request("SET:DEV:MB0:TEMP:LOOP:ENAB:OFF")[2], is_("OFF"))
+        assert_that(paths.process_request("SET:DEV:DB1:HTR:NICK:heater")[2], is_("heater"))
+        for request in ("SET:DEV:MB0:TEMP:LOOP:TSET:1.5", "SET:DEV:MB0:TEMP:LOOP:TSET:abcK",
+                        "SET:DEV:MB0:TEMP:LOOP:ENAB:MAYBE"):
+            assert_that(calling(paths.process_request).with_args(request), raises(ValueError))
+
+    def test_that_GIVEN_literal_and_wildcard_routes_THEN_literal_preferred_and_wildcard_tried_if_it_does_not_match(self):
+        paths = PathRouter([Route("READ:DEV:{channel}:TEMP:LOOP:TSET", lambda *args: "tset"),
+                            Route("READ:DEV:{channel}:*:LOOP:P", lambda *args: "p")], resolve_channel)
+
+        assert_that(paths.process_request("READ:DEV:MB0:TEMP:LOOP:TSET"), is_("tset"))
+        assert_that(paths.process_request("READ:DEV:MB0:TEMP:LOOP:P"), is_("p"))
+
+    def test_that_GIVEN_the_prefix_THEN_it_is_ignored(self):
+        paths = router("READ:SYS:CAT")
+
+        assert_that(paths.can_process("@1READ:SYS:CAT"), is_(True))
+        assert_that(paths.can_process(b"@1READ:SYS:CAT"), is_(True))
+        assert_that(paths.matcher.pattern, is_("READ:SYS:CAT"))
+
+    def test_that_GIVEN_conflicting_routes_THEN_router_can_not_be_created(self):
+        for templates in (("SET:P:{float}", "SET:P:{}"), ("READ:P", "READ:P")):
+            assert_that(calling(router).with_args(*templates), raises(ValueError))
+
+    def test_that_GIVEN_no_matching_route_THEN_request_can_not_be_processed(self):
+        paths = router("READ:DEV:{channel}:*:NICK")
+
+        assert_that(paths.can_process("READ:DEV:MB0:TEMP:LOOP:P"), is_(False))
+        assert_that(paths.matcher.pattern, is_("PathRouter over 1 routes"))
+        assert_that(paths.match("WRITE:DEV:MB0:TEMP:NICK"), none())
+
+
+class RoutingStreamInterfaceTests(unittest.TestCase):
+    """
+    Tests for the mixin routing the requests of a stream interface.
+    """
+
+    def test_that_GIVEN_an_interface_without_resolve_channel_THEN_it_can_not_be_created(self):
+        class NoResolveChannel(RoutingStreamInterface):
+            routes = (("READ:DEV:{channel}:TEMP:NICK", "get_nickname"),)
+
+        assert_that(calling(NoResolveChannel), raises(TypeError))
@@ -0,0 +1,104 @@
+import unittest
+from hamcrest import assert_that, is_, equal_to, close_to
+
+from lewis_emulators.utils.ramp import LinearRamp, process_in_steps
+
+
+class LinearRampTests(unittest.TestCase):
+    """
+    Tests for values ramping towards a target.
+    """
+
+    def test_that_GIVEN_a_new_ramp_THEN_it_is_at_its_target(self):
+        ramp = LinearRamp(value=3.0, rate=2.0)
+
+        assert_that(ramp.value, is_(3.0))
+        assert_that(ramp.at_target, is_(True))
+        assert_that(ramp.time_to_target(), is_(0.0))
+
+    def test_that_GIVEN_a_target_WHEN_time_passes_THEN_value_moves_towards_it_at_the_rate(self):
+        ramp = LinearRamp(value=10.0, rate=0.5)
+        ramp.target = 0.0
+
+        ramp.advance(4.0)
+
+        assert_that(ramp.value, close_to(8.0, 1e-12))
+        assert_that(ramp.time_to_target(), close_to(16.0, 1e-12))
+
+    def test_that_GIVEN_a_cycle_longer_than_the_ramp_THEN_value_stops_exactly_at_target(self):
+        ramp = LinearRamp(value=0.0, rate=0.003)
+        ramp.target = 7.0
+
+        ramp.advance(1e6)
+
+        assert_that(ramp.value, is_(7.0))
+        assert_that(ramp.at_target, is_(True))
+
+    def test_that_GIVEN_many_short_steps_THEN_value_is_the_same_as_one_long_step(self):
+        ramp = LinearRamp(value=0.0, rate=0.1)
+        ramp.target = 1000.0
+
+        for _ in range(100000):
+            ramp.advance(0.01)
+
+        assert_that(ramp.value, close_to(100.0, 1e-9))
+
+    def test_that_GIVEN_the_time_to_target_WHEN_advanced_by_it_THEN_ramp_is_at_target(self):
+        ramp = LinearRamp(value=0.1, rate=0.7)
+        ramp.target = 0.3
+
+        ramp.advance(ramp.time_to_target())
+
+        assert_that(ramp.at_target, is_(True))
+        assert_that(ramp.value, is_(0.3))
+
+    def test_that_GIVEN_a_ramp_WHEN_rate_changed_THEN_it_continues_from_where_it_was_at_the_new_rate(self):
+        ramp = LinearRamp(value=0.0, rate=1.0)
+        ramp.target = 10.0
+        ramp.advance(2.0)
+
+        ramp.rate = 4.0
+        ramp.advance(1.0)
+
+        assert_that(ramp.value, close_to(6.0, 1e-12))
+
+    def test_that_GIVEN_a_zero_rate_THEN_target_is_never_reached(self):
+        ramp = LinearRamp(value=1.0, rate=0.0)
+        ramp.target = 2.0
+
+        ramp.advance(100.0)
+
+        assert_that(ramp.value, is_(1.0))
+        assert_that(ramp.time_to_target(), is_(float("inf")))
+
+    def test_that_GIVEN_a_ramp_WHEN_stopped_THEN_value_holds(self):
+        ramp = LinearRamp(value=0.0, rate=1.0)
+        ramp.target = 10.0
+        ramp.advance(3.0)
+
+        ramp.stop()
+        ramp.advance(3.0)
+
+        assert_that(ramp.value, close_to(3.0, 1e-12))
+        assert_that(ramp.at_target, is_(True))
+
+
+class ProcessInStepsTests(unittest.TestCase):
+    """
+    Tests for splitting a cycle at an event.
+    """
+
+    def test_that_GIVEN_an_event_within_the_cycle_THEN_cycle_split_at_the_event(self):
+        steps = []
+
+        process_in_steps(steps.append, 10.0, 4.0)
+
+        assert_that(steps, equal_to([4.0, 6.0]))
+
+    def test_that_GIVEN_no_event_within_the_cycle_THEN_cycle_not_split(self):
+        for time_to_event in (None, 0.0, 10.0, 20.0):
+            steps = []
+
+            process_in_steps(steps.append, 10.0, time_to_event)
+
+            assert_that(steps, equal_to([10.0]))
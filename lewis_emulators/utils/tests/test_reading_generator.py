@@ -0,0 +1,57 @@
+import os
+import tempfile
+import unittest
+from hamcrest import assert_that, is_, equal_to, close_to, calling, raises
+
+from lewis_emulators.utils.reading_generator import ReadingGenerator, RampProfile, ReplayProfile, create_profile
+
+
+class ReadingGeneratorTests(unittest.TestCase):
+    """
+    Tests for generating readings at a fixed rate.
+    """
+
+    def test_that_GIVEN_a_rate_WHEN_time_passes_THEN_readings_produced_at_that_rate_regardless_of_step(self):
+        generator = ReadingGenerator(1000, RampProfile())
+
+        counts = [len(generator.process(dt)[0]) for dt in (0.0004, 0.0004, 0.0004, 0.1, 0.0998)]
+
+        assert_that(counts, equal_to([0, 0, 1, 100, 100]))
+
+    def test_that_GIVEN_a_batch_of_readings_THEN_they_are_one_period_apart_and_end_before_now(self):
+        generator = ReadingGenerator(4, RampProfile())
+
+        times, _ = generator.process(1.1)
+
+        assert_that(len(times), is_(4))
+        for time, expected in zip(times, [0.25, 0.5, 0.75, 1.0]):
+            assert_that(time, close_to(expected, 1e-9))
+
+    def test_that_GIVEN_a_zero_rate_THEN_no_readings_produced(self):
+        generator = ReadingGenerator(0, RampProfile())
+
+        assert_that(generator.process(10), equal_to(([], [])))
+
+    def test_that_GIVEN_a_ramp_with_an_end_THEN_it_starts_again_at_the_end(self):
+        profile = RampProfile(start=10, rate=2, end=14)
+
+        assert_that(profile.values([0, 1, 2, 3]), equal_to([10, 12, 10, 12]))
+
+    def test_that_GIVEN_a_replay_profile_THEN_readings_repeat_in_order(self):
+        profile = ReplayProfile([1, 2, 3])
+
+        assert_that(profile.values([0] * 2) + profile.values([0] * 5), equal_to([1, 2, 3, 1, 2, 3, 1]))
+
+    def test_that_GIVEN_a_replay_file_THEN_readings_read_from_first_field_of_each_line(self):
+        handle, path = tempfile.mkstemp()
+        try:
+            with os.fdopen(handle, "w") as replay_file:
+                replay_file.write("# reading, timestamp\n1.5,0\n\n2.5,1\n")
+            profile = create_profile("replay", path)
+        finally:
+            os.remove(path)
+
+        assert_that(profile.values([0, 0, 0]), equal_to([1.5, 2.5, 1.5]))
+
+    def test_that_WHEN_unknown_profile_created_THEN_error_raised(self):
+        assert_that(calling(create_profile).with_args("sine"), raises(ValueError))
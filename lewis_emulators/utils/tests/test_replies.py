@@ -0,0 +1,132 @@
+import gc
+import unittest
+from hamcrest import assert_that, is_, close_to
+from lewis.core.logging import has_log
+
+from lewis_emulators.utils import replies
+from lewis_emulators.utils.replies import TokenBucket, timed_reply
+
+
+class FakeClock(object):
+    def __init__(self):
+        self.time = 100.0
+
+    def __call__(self):
+        return self.time
+
+
+class FakeDevice(object):
+    def __init__(self):
+        self.crashes = 0
+
+    def crash(self):
+        self.crashes += 1
+
+
+@has_log
+class FakeInterface(object):
+    limited = timed_reply(action="crash", reply="too quick", minimum_time_delay=100)
+
+    def __init__(self, device):
+        self.device = device
+
+    @limited
+    def get_value(self):
+        return "value"
+
+    @limited
+    def set_value(self):
+        return "set"
+
+
+class FakeHandler(object):
+    pass
+
+
+@has_log
+class FakeConnectionInterface(object):
+    handler = None
+
+    def __init__(self, device):
+        self.device = device
+
+    @timed_reply(action="crash", reply="too quick", minimum_time_delay=100, per_connection=True)
+    def get_value(self):
+        return "value"
+
+
+class TokenBucketTests(unittest.TestCase):
+    """
+    Tests for limiting the rate of events with a token bucket.
+    """
+
+    def setUp(self):
+        self.clock = FakeClock()
+
+    def test_that_GIVEN_a_full_bucket_THEN_a_burst_of_its_capacity_is_allowed_and_no_more(self):
+        bucket = TokenBucket(rate=10, capacity=3, clock=self.clock)
+
+        assert_that([bucket.take() for _ in range(4)], is_([True, True, True, False]))
+
+    def test_that_GIVEN_an_empty_bucket_THEN_it_refills_at_its_rate(self):
+        bucket = TokenBucket(rate=10, capacity=1, clock=self.clock)
+        bucket.take()
+
+        self.clock.time += 0.05
+        assert_that(bucket.time_to_token(), close_to(0.05, 1e-9))
+        assert_that(bucket.take(), is_(False))
+
+        self.clock.time += 0.05
+        assert_that(bucket.take(), is_(True))
+
+
+class TimedReplyTests(unittest.TestCase):
+    """
+    Tests for the rate limiting of commands by timed_reply.
+    """
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.original_clock, replies._clock = replies._clock, self.clock
+
+    def tearDown(self):
+        replies._clock = self.original_clock
+
+    def test_that_GIVEN_commands_too_quick_THEN_action_is_called_on_the_device_and_reply_given(self):
+        interface = FakeInterface(FakeDevice())
+
+        assert_that(interface.get_value(), is_("value"))
+        assert_that(interface.set_value(), is_("too quick"))
+        assert_that(interface.device.crashes, is_(1))
+
+        self.clock.time += 0.1
+        assert_that(interface.set_value(), is_("set"))
+
+    def test_that_GIVEN_two_devices_THEN_their_limits_are_independent(self):
+        first, second = FakeInterface(FakeDevice()), FakeInterface(FakeDevice())
+
+        assert_that(first.get_value(), is_("value"))
+        assert_that(second.get_value(), is_("value"))
+        assert_that(second.device.crashes, is_(0))
+
+    def test_that_GIVEN_limits_per_connection_THEN_each_connection_has_its_own_limit(self):
+        interface = FakeConnectionInterface(FakeDevice())
+        interface.handler = first = FakeHandler()
+        assert_that(interface.get_value(), is_("value"))
+
+        interface.handler = FakeHandler()
+        assert_that(interface.get_value(), is_("value"))
+
+        interface.handler = first
+        assert_that(interface.get_value(), is_("too quick"))
+
+    def test_that_GIVEN_limits_per_connection_WHEN_connection_is_gone_THEN_its_bucket_is_dropped(self):
+        device = FakeDevice()
+        interface = FakeConnectionInterface(device)
+        interface.handler = FakeHandler()
+        interface.get_value()
+
+        interface.handler = None
+        gc.collect()
+
+        assert_that(len(replies.rate_limits._connection_buckets[device]), is_(0))
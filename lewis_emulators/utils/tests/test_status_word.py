@@ -0,0 +1,75 @@
+import unittest
+from hamcrest import assert_that, is_
+
+from lewis_emulators.utils.status_word import StatusWord, StatusWordLayout, StatusField, StatusWordSource, \
+    WatchedAttribute, render_characters, render_hexadecimal, render_binary
+
+LAYOUT = StatusWordLayout([
+    StatusField(0, "power", invert=True),
+    StatusField(1, "interlocks", encoding=lambda interlocks: "door" in interlocks),
+    StatusField(2, "mode", width=2, encoding={"local": 0b01, "remote": 0b10}),
+    StatusField(7, "interlocks", encoding=lambda interlocks: len(interlocks) > 0),
+], render=render_characters(8), constant=1 << 5)
+
+
+class Device(StatusWordSource):
+    power = WatchedAttribute("power")
+    mode = WatchedAttribute("mode")
+
+    def __init__(self):
+        self.power = True
+        self.mode = "local"
+        self.interlocks = []
+
+
+class StatusWordTests(unittest.TestCase):
+    """
+    Tests for status words kept up to date from the attributes of a device.
+    """
+
+    def test_that_GIVEN_a_device_THEN_status_word_built_from_its_attributes(self):
+        word = Device().status_word(LAYOUT)
+
+        assert_that(word.value, is_(0b00100100))
+        assert_that(word.render(), is_("..!..!.."))
+
+    def test_that_WHEN_watched_attribute_set_THEN_status_word_updated(self):
+        device = Device()
+        word = device.status_word(LAYOUT)
+
+        device.power = False
+        device.mode = "remote"
+
+        assert_that(word.render(), is_("!..!.!.."))
+
+    def test_that_WHEN_attribute_changed_in_place_and_refreshed_THEN_status_word_updated(self):
+        device = Device()
+        word = device.status_word(LAYOUT)
+
+        device.interlocks.append("door")
+        assert_that(word.value & 0b10, is_(0))
+        device.refresh_status("interlocks")
+
+        assert_that(word.render(), is_(".!!..!.!"))
+
+    def test_that_GIVEN_an_unchanged_word_THEN_it_is_not_rendered_again(self):
+        renders = []
+        layout = StatusWordLayout([StatusField(0, "power")], render=lambda value: renders.append(value) or str(value))
+        device = Device()
+        word = device.status_word(layout)
+
+        word.render()
+        device.power = True
+        word.render()
+
+        assert_that(renders, is_([1]))
+
+    def test_that_GIVEN_a_dictionary_THEN_fields_read_from_its_keys(self):
+        layout = StatusWordLayout([StatusField(0, "ON/OFF"), StatusField(4, "Fault")], render=render_hexadecimal(4))
+
+        assert_that(StatusWord(layout, {"ON/OFF": True, "Fault": True}).render(), is_("0011"))
+
+    def test_that_WHEN_rendered_as_binary_THEN_most_significant_bit_first(self):
+        layout = StatusWordLayout([StatusField(0, "power")], render=render_binary(4), constant=0b1000)
+
+        assert_that(StatusWord(layout, Device()).render(), is_("1001"))
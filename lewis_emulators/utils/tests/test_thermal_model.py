@@ -0,0 +1,91 @@
+import unittest
+from hamcrest import assert_that, is_, close_to, calling, raises, instance_of
+
+from lewis_emulators.utils.thermal_model import ThermalModel, ThermalAttribute
+
+
+class ThermalModelTests(unittest.TestCase):
+    """
+    Tests for the thermal model of temperature channels.
+    """
+
+    def test_that_GIVEN_a_closed_loop_WHEN_time_passes_THEN_temperature_settles_at_setpoint(self):
+        model = ThermalModel()
+        channel = model.add_channel(temperature=4.0, setpoint=50.0)
+
+        for _ in range(600):
+            model.step(0.1)
+
+        assert_that(channel.temperature, close_to(50.0, 1e-3))
+        # At the setpoint the heater balances the heat lost to the base temperature
+        assert_that(channel.heater / 100.0 * channel.max_power, close_to(50.0 * channel.conductance, 1e-3))
+
+    def test_that_GIVEN_long_steps_THEN_temperature_is_the_same_as_with_short_steps(self):
+        short_steps, long_steps = ThermalModel(), ThermalModel()
+        short_channel = short_steps.add_channel(temperature=1.5, setpoint=300.0)
+        long_channel = long_steps.add_channel(temperature=1.5, setpoint=300.0)
+
+        for _ in range(100):
+            short_steps.step(0.1)
+        long_steps.step(10.0)
+
+        assert_that(long_channel.temperature, close_to(short_channel.temperature, 1e-6))
+
+    def test_that_GIVEN_an_open_loop_with_the_heater_off_THEN_temperature_falls_to_base_temperature(self):
+        model = ThermalModel()
+        channel = model.add_channel(closed_loop=False, temperature=300.0, base_temperature=4.0, setpoint=300.0)
+
+        for _ in range(100):
+            model.step(10.0)
+
+        assert_that(channel.temperature, close_to(4.0, 1e-6))
+        assert_that(channel.heater, is_(0.0))
+
+    def test_that_GIVEN_many_channels_THEN_each_follows_its_own_setpoint(self):
+        model = ThermalModel()
+        channels = [model.add_channel(temperature=1.5, setpoint=10.0 * index) for index in range(1, 25)]
+
+        for _ in range(60):
+            model.step(1.0)
+
+        for index, channel in enumerate(channels, 1):
+            assert_that(channel.temperature, close_to(10.0 * index, 1e-3))
+
+    def test_that_GIVEN_an_unknown_quantity_THEN_it_is_rejected(self):
+        model = ThermalModel()
+
+        assert_that(calling(model.add_channel).with_args(colour=1), raises(ValueError))
+        assert_that(calling(setattr).with_args(model.add_channel(), "colour", 1), raises(AttributeError))
+
+    def test_that_GIVEN_a_thermal_attribute_THEN_it_reads_and_writes_the_model(self):
+        class Sensor(object):
+            temperature_sp = ThermalAttribute("setpoint")
+
+            def __init__(self, thermal_channel):
+                self.thermal_channel = thermal_channel
+
+        model = ThermalModel()
+        sensor = Sensor(model.add_channel())
+
+        sensor.temperature_sp = 12
+
+        assert_that(model._setpoint[0], is_(12.0))
+        assert_that(sensor.temperature_sp, is_(12.0))
+
+    def test_that_GIVEN_a_thermal_attribute_set_THEN_it_reads_back_as_given_until_the_model_changes_it(self):
+        class Sensor(object):
+            heater_percent = ThermalAttribute("heater")
+
+            def __init__(self, thermal_channel):
+                self.thermal_channel = thermal_channel
+
+        model = ThermalModel()
+        sensor = Sensor(model.add_channel(setpoint=10.0))
+
+        sensor.heater_percent = 0
+
+        assert_that(sensor.heater_percent, instance_of(int))
+
+        model.step(1.0)
+
+        assert_that(sensor.heater_percent, instance_of(float))
@@ -0,0 +1,172 @@
+"""
+A thermal model of the temperature channels of a controller, e.g. a cryostat's sensors and their heaters.
+
+Each channel is a thermal mass with a heat capacity, linked to a base temperature (e.g. the cold head or bath) by a
+thermal conductance and warmed by a heater. With its loop closed, a PID controller sets the heater's output to bring
+the temperature to the setpoint; with it open the heater stays at the output it is given.
+
+The model keeps each quantity of every channel in one array, rather than in an object per channel, and advances all
+of the channels in one pass over the arrays per step. Devices hold a ThermalChannel for each of their channels, which
+reads and writes the channel's entries in the arrays, e.g.
+
+>>> model = ThermalModel()
+>>> sample = model.add_channel(temperature=4.0, setpoint=10.0)
+>>> model.step(0.1)  # The heater comes on and the sample warms towards 10 K
+"""
+
+import math
+from array import array
+
+
+# Quantities of a channel, with their defaults
+CHANNEL_DEFAULTS = (
+    ("temperature", 0.0),  # K
+    ("setpoint", 0.0),  # K
+    ("heater", 0.0),  # Output of the heater in %
+    ("max_power", 50.0),  # Power of the heater at 100% output in W
+    ("heat_capacity", 1.0),  # J/K
+    ("conductance", 0.05),  # Of the link to the base temperature in W/K
+    ("base_temperature", 0.0),  # K
+    ("p", 10.0),  # Proportional gain in %/K
+    ("i", 2.0),  # Integral gain in %/(K s)
+    ("d", 0.0),  # Derivative gain in % s/K
+)
+
+
+class ThermalChannel(object):
+    """
+    A channel of a thermal model. Its quantities (see CHANNEL_DEFAULTS) and whether its loop is closed are attributes,
+    which read and write the model's arrays.
+    """
+
+    def __init__(self, model, index):
+        """
+        Args:
+            model (ThermalModel): The model the channel is in.
+            index (int): The index of the channel in the model's arrays.
+        """
+        self.__dict__.update(_model=model, _index=index)
+
+    def __getattr__(self, name):
+        try:
+            return getattr(self._model, "_" + name)[self._index]
+        except AttributeError:
+            raise AttributeError(name)
+
+    def __setattr__(self, name, value):
+        if not hasattr(self._model, "_" + name):
+            raise AttributeError("A thermal channel has no {}".format(name))
+        getattr(self._model, "_" + name)[self._index] = bool(value) if name == "closed_loop" else float(value)
+
+
+class ThermalAttribute(object):
+    """
+    Descriptor for an attribute of a device's channel which is a quantity of the thermal channel in the channel's
+    thermal_channel attribute, so the model holds its value.
+
+    The model holds every quantity as a float, so the value last set is read back as it was given, e.g. 0 rather than
+    0.0, for as long as the model still holds that value.
+    """
+
+    def __init__(self, quantity):
+        """
+        Args:
+            quantity (string): The quantity of the thermal channel, e.g. setpoint, or closed_loop.
+        """
+        self.quantity = quantity
+        self._given = "_given_" + quantity
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        value = getattr(instance.thermal_channel, self.quantity)
+        given = instance.__dict__.get(self._given)
+        return given if given is not None and given == value else value
+
+    def __set__(self, instance, value):
+        setattr(instance.thermal_channel, self.quantity, value)
+        instance.__dict__[self._given] = value
+
+
+class ThermalModel(object):
+    """
+    The temperatures of a set of channels, advanced together.
+    """
+
+    def __init__(self, max_step=0.05):
+        """
+        Args:
+            max_step (float): The longest step in seconds the model takes; longer steps are split into several of
+                these, so the controllers stay stable however long the simulation cycle.
+        """
+        self.max_step = max_step
+        for name, _ in CHANNEL_DEFAULTS:
+            setattr(self, "_" + name, array("d"))
+        self._closed_loop = []
+        self._integral = array("d")
+        self._rate = array("d")
+
+    def __len__(self):
+        return len(self._temperature)
+
+    def add_channel(self, closed_loop=True, **quantities):
+        """
+        Adds a channel to the model.
+
+        Args:
+            closed_loop (bool): Whether the PID controller sets the heater output.
+            quantities: Initial values of any of the quantities in CHANNEL_DEFAULTS, e.g. temperature=4.2.
+
+        Returns:
+            ThermalChannel: The channel.
+        """
+        unknown = set(quantities) - set(name for name, _ in CHANNEL_DEFAULTS)
+        if unknown:
+            raise ValueError("Unknown quantities of a thermal channel: {}".format(", ".join(sorted(unknown))))
+        for name, default in CHANNEL_DEFAULTS:
+            getattr(self, "_" + name).append(float(quantities.get(name, default)))
+        self._closed_loop.append(bool(closed_loop))
+        self._integral.append(0.0)
+        self._rate.append(0.0)
+        return ThermalChannel(self, len(self) - 1)
+
+    def step(self, dt):
+        """
+        Advances the temperatures of all of the channels.
+
+        Args:
+            dt (float): The time step in seconds.
+        """
+        if dt <= 0 or not len(self):
+            return
+        steps = int(math.ceil(dt / self.max_step))
+        h = dt / steps
+
+        temperatures, setpoints, heaters = self._temperature, self._setpoint, self._heater
+        integrals, rates = self._integral, self._rate
+        channels = zip(range(len(self)), self._closed_loop, self._max_power, self._heat_capacity, self._conductance,
+                       self._base_temperature, self._p, self._i, self._d)
+
+        for index, closed_loop, max_power, heat_capacity, conductance, base, p, i, d in channels:
+            temperature, setpoint, heater = temperatures[index], setpoints[index], heaters[index]
+            integral, rate = integrals[index], rates[index]
+            leak = conductance * base
+
+            for _ in range(steps):
+                if closed_loop:
+                    error = setpoint - temperature
+                    # Derivative on the measurement, so setpoint changes do not kick the heater
+                    heater = p * error + i * (integral + error * h) - d * rate
+                    if 0.0 <= heater <= 100.0:
+                        # Only integrate while the heater is not saturated, so the integral does not wind up
+                        integral += error * h
+                    heater = min(max(heater, 0.0), 100.0)
+
+                # Backward Euler, which is stable for any step
+                previous = temperature
+                temperature = (temperature * heat_capacity + h * (heater / 100.0 * max_power + leak)) \
+                    / (heat_capacity + h * conductance)
+                rate = (temperature - previous) / h
+
+            temperatures[index], heaters[index] = temperature, heater
+            integrals[index], rates[index] = integral, rate
@@ -1,29 +1,45 @@
 import sys
 import types
-from mock import MagicMock
+import re
 import argparse
+import traceback
 
+try:
+    import asyncio
+except ImportError:
+    # Python 2: only the original threaded server can run
+    asyncio = None
 
-class _FakeQtCore(object):
-    @classmethod
-    def pyqtSignal(cls, *a, **k):
-        return None
 
-fake_qt_module = types.ModuleType("PyQt5")
-fake_qt_module.QtWidgets = MagicMock()
-fake_qt_module.QtCore = _FakeQtCore
-fake_qt_module.QtNetwork = MagicMock()
-sys.modules["PyQt5"] = fake_qt_module
+def _import_signal_server():
+    """
+    Import the original SignalServer, faking the modules it needs which are only available on the flipper's PC.
+    """
+    from mock import MagicMock
+
+    class _FakeQtCore(object):
+        @classmethod
+        def pyqtSignal(cls, *a, **k):
+            return None
+
+    fake_qt_module = types.ModuleType("PyQt5")
+    fake_qt_module.QtWidgets = MagicMock()
+    fake_qt_module.QtCore = _FakeQtCore
+    fake_qt_module.QtNetwork = MagicMock()
+    sys.modules["PyQt5"] = fake_qt_module
 
-fake_qplot_module = types.ModuleType("QPlot")
-fake_qplot_module.QPlot = MagicMock()
-sys.modules["QPlot"] = fake_qplot_module
+    fake_qplot_module = types.ModuleType("QPlot")
+    fake_qplot_module.QPlot = MagicMock()
+    sys.modules["QPlot"] = fake_qplot_module
 
-sys.modules["DAQTasks_2flippers"] = MagicMock()
+    sys.modules["DAQTasks_2flippers"] = MagicMock()
 
-fake_flippr_module = types.ModuleType("flippr_3")
-fake_flippr_module.Ui_Flippr = MagicMock()
-sys.modules["flippr_3"] = fake_flippr_module
+    fake_flippr_module = types.ModuleType("flippr_3")
+    fake_flippr_module.Ui_Flippr = MagicMock()
+    sys.modules["flippr_3"] = fake_flippr_module
+
+    from main_andy_2flippers import SignalServer
+    return SignalServer
 
 
 class _UpdatedValue(object):
@@ -62,15 +78,129 @@ class _Parent(object):
         self.running = _UpdatedValue(0)
 
 
-from main_andy_2flippers import SignalServer
+# Messages end with a colon, except the colon after the drive letter of a Windows path, e.g. file_p C:\data.txt:
+MESSAGE_TERMINATOR = re.compile(r":(?![\\/])")
+# A colon at the end of the data received so far which may be a drive letter's, to be told apart once more arrives
+POSSIBLE_DRIVE_AT_END = re.compile(r"(?:^|\s)[A-Za-z]:$")
+KEYWORD = re.compile(r"\s*(\*?[A-Za-z_]+)(.*)$", re.DOTALL)
+# The number in a message, as the original server finds it
+NUMBER = re.compile(r"[-+]?\d*\.\d+|\d+")
 
-if __name__ == "__main__":
-    parser = argparse.ArgumentParser(
-        description='Test an IOC under emulation by running tests against it')
-    parser.add_argument('-p', '--port', type=int, help="The TCP port to run the server on.")
-    arguments = parser.parse_args()
 
-    parent = _Parent()
+class FlipperProtocol(asyncio.Protocol if asyncio else object):
+    """
+    A connection to the flipper. Messages are framed on colons as they arrive and each is dispatched on its keyword,
+    replying as the original SignalServer does. A colon after a lone letter at the end of the data is held back until
+    the next byte shows whether it is a drive letter's.
+    """
+
+    def __init__(self, parent):
+        self.parent = parent
+        self.transport = None
+        self._buffer = ""
+
+        # Numeric settings: keyword -> the value on the parent
+        self.numbers = {
+            "comp_p": parent.comp_spin_P,
+            "comp_a": parent.comp_spin_A,
+            "amp_p": parent.amplitude_spin_P,
+            "amp_a": parent.amplitude_spin_A,
+            "const_p": parent.decay_spin_P,
+            "const_a": parent.decay_spin_A,
+            "dt_p": parent.DeltaT_P,
+            "dt_a": parent.DeltaT_A,
+        }
+        self.files = {
+            "file_p": parent.filename_P,
+            "file_a": parent.filename_A,
+        }
+
+        self.handlers = {"*IDN": self.identify, "toggle": self.toggle, "exit": self.exit}
+        self.handlers.update((keyword, self.number) for keyword in self.numbers)
+        self.handlers.update((keyword, self.file_name) for keyword in self.files)
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def data_received(self, data):
+        received = self._buffer + data.decode("utf-8", "replace")
+        held_back = ":" if POSSIBLE_DRIVE_AT_END.search(received) else ""
+        messages = MESSAGE_TERMINATOR.split(received[:len(received) - len(held_back)])
+        self._buffer = messages.pop() + held_back
+        for message in messages:
+            try:
+                self.dispatch(message)
+            except Exception:
+                traceback.print_exc()
+                self.transport.close()
+                return
+
+    def dispatch(self, message):
+        match = KEYWORD.match(message)
+        if match is None:
+            return
+        keyword, argument = match.groups()
+        handler = self.handlers.get(keyword)
+        if handler is not None:
+            handler(keyword, argument)
+
+    def reply(self, reply):
+        self.transport.write((reply + ":").encode("utf-8"))
+
+    def identify(self, keyword, argument):
+        self.reply("Flipper Control")
+
+    def number(self, keyword, argument):
+        value = self.numbers[keyword]
+        if "?" in argument:
+            self.reply("{} {}".format(keyword, value.value()))
+        else:
+            value.emit(float(NUMBER.findall(argument)[0]))
+            self.reply(keyword)
+
+    def file_name(self, keyword, argument):
+        value = self.files[keyword]
+        if "?" in argument:
+            self.reply("{} {}".format(keyword, value))
+        else:
+            value.emit(argument.replace(" ", ""))
+            self.reply(keyword)
+
+    def toggle(self, keyword, argument):
+        if "?" in argument:
+            self.reply("toggle {}".format(self.parent.running))
+            return
+        state = next((state for state in "0123" if state in argument), None)
+        self.parent.running.emit(-1 if state is None else int(state))
+        self.reply("toggle" + (state or ""))
+
+    def exit(self, keyword, argument):
+        self.transport.close()
+
+
+def serve(host, port, parent):
+    """
+    Serve any number of clients from one asyncio event loop until interrupted.
+    """
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    server = loop.run_until_complete(loop.create_server(lambda: FlipperProtocol(parent), host, port,
+                                                        reuse_address=True))
+    try:
+        loop.run_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+        loop.run_until_complete(server.wait_closed())
+        loop.close()
+
+
+def serve_threaded(host, port, parent):
+    """
+    Serve clients with the original SignalServer, which starts a thread for each client.
+    """
+    SignalServer = _import_signal_server()
 
     # We don't know what these objects are under the hood (we don't have that piece of code), so monkey-patch
     # the mapping here.
@@ -86,6 +216,20 @@ if __name__ == "__main__":
     SignalServer.fn_p = parent.filename_P
     SignalServer.fn_a = parent.filename_A
 
-    server = SignalServer("localhost", arguments.port, parent)
+    server = SignalServer(host, port, parent)
 
     server.listen()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description='Test an IOC under emulation by running tests against it')
+    parser.add_argument('-p', '--port', type=int, help="The TCP port to run the server on.")
+    parser.add_argument('--threaded', action="store_true",
+                        help="Run the original server from the flipper's control code, with a thread per client.")
+    arguments = parser.parse_args()
+
+    if arguments.threaded or asyncio is None:
+        serve_threaded("localhost", arguments.port, _Parent())
+    else:
+        serve("localhost", arguments.port, _Parent())
@@ -0,0 +1,70 @@
+import unittest
+from hamcrest import assert_that, is_
+
+from other_emulators.mezei_flipper.flipper_emulator import FlipperProtocol, _Parent
+
+
+class FakeTransport(object):
+    def __init__(self):
+        self.written = b""
+        self.closed = False
+
+    def write(self, data):
+        self.written += data
+
+    def close(self):
+        self.closed = True
+
+
+class FlipperProtocolTests(unittest.TestCase):
+    """
+    Tests for framing and answering the messages of a connection to the flipper.
+    """
+
+    def setUp(self):
+        self.parent = _Parent()
+        self.transport = FakeTransport()
+        self.protocol = FlipperProtocol(self.parent)
+        self.protocol.connection_made(self.transport)
+
+    def _receive(self, *chunks):
+        for chunk in chunks:
+            self.protocol.data_received(chunk)
+
+    def test_that_GIVEN_an_identity_query_THEN_the_flipper_identifies_itself(self):
+        self._receive(b"*IDN?:")
+
+        assert_that(self.transport.written, is_(b"Flipper Control:"))
+
+    def test_that_GIVEN_a_message_in_pieces_THEN_it_is_answered_once_complete(self):
+        self._receive(b"amp_", b"p 2.5", b":")
+
+        assert_that(self.parent.amplitude_spin_P.value(), is_(2.5))
+        assert_that(self.transport.written, is_(b"amp_p:"))
+
+    def test_that_GIVEN_several_messages_at_once_THEN_each_is_answered(self):
+        self._receive(b"comp_a 3:comp_a?:toggle?:")
+
+        assert_that(self.transport.written, is_(b"comp_a:comp_a 3.0:toggle 0:"))
+
+    def test_that_GIVEN_a_file_name_split_after_its_drive_letter_THEN_the_whole_path_is_set(self):
+        self._receive(b"file_p C:", b"\\data\\run.txt:")
+
+        assert_that(self.parent.filename_P.value(), is_("C:\\data\\run.txt"))
+        assert_that(self.transport.written, is_(b"file_p:"))
+
+    def test_that_GIVEN_a_colon_after_a_drive_letter_THEN_nothing_is_answered_until_more_arrives(self):
+        self._receive(b"file_a D:")
+
+        assert_that(self.transport.written, is_(b""))
+
+    def test_that_GIVEN_toggle_with_a_state_THEN_the_flipper_runs_in_that_state(self):
+        self._receive(b"toggle 2:")
+
+        assert_that(self.parent.running.value(), is_(2))
+        assert_that(self.transport.written, is_(b"toggle2:"))
+
+    def test_that_GIVEN_exit_THEN_the_connection_is_closed(self):
+        self._receive(b"exit:")
+
+        assert_that(self.transport.closed, is_(True))